@@ -3,17 +3,15 @@ from fastapi.responses import JSONResponse
 
 from account.adapter.input.web.request.update_account_request import UpdateAccountRequest
 from account.adapter.input.web.response.account_response import AccountResponse
-from account.adapter.input.web.session_helper import get_current_user
+from account.adapter.input.web.session_helper import get_current_user, end_session
 from account.application.usecase.account_usecase import AccountUseCase
 from account.infrastructure.orm.account_orm import OAuthProvider
-from config.redis_config import get_redis
+from config.redis_config import get_async_redis
 from sosial_oauth.infrastructure.service.google_oauth2_service import GoogleOAuth2Service
-from util.cache.ai_cache import AICache
 from util.log.log import Log
 
 account_router = APIRouter()
 usecase = AccountUseCase().get_instance()
-redis_client = get_redis()
 logger = Log.get_logger()
 
 @account_router.get("/{oauth_type}/{oauth_id}", response_model=AccountResponse)
@@ -91,16 +89,10 @@ def get_account_by_session_id(session_id: str = Depends(get_current_user)):
     return usecase.get_account_by_session_id(session_id)
 
 @account_router.delete("/session_out")
-def delete_session_by_session_id(session_id: str = Depends(get_current_user)):
-    # 🔥 AI 캐시 삭제
-    logger.info(f"Invalidating cache for session: {session_id}")
-    invalidated_count = AICache.invalidate_user_cache(session_id)
-    logger.info(f"Invalidated {invalidated_count} cache entries")
-    
-    # Redis 세션 삭제
-    delete_result = redis_client.delete(session_id)
+async def delete_session_by_session_id(session_id: str = Depends(get_current_user)):
+    # Redis 세션 삭제 (데이터 버전 증가로 AI 캐시도 함께 무효화)
+    delete_result = await end_session(session_id)
     logger.debug("Redis delete result: %s", delete_result)
-    logger.debug("Redis session exists after delete? %s", redis_client.exists(session_id))
 
     # 쿠키 삭제와 함께 응답 반환
     response = JSONResponse({"success": True, "message": "Account deleted successfully"})
@@ -120,7 +112,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
         return response
 
     # Redis 세션 확인
-    exists = redis_client.exists(session_id)
+    exists = await get_async_redis(session_id).exists(session_id)
     logger.debug("Redis session exists: %s", exists)
 
     if not exists:
@@ -136,7 +128,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
     if not account:
         logger.debug("Account not found for session_id: %s", session_id)
         # 계정이 없어도 세션과 쿠키는 삭제
-        redis_client.delete(session_id)
+        await end_session(session_id)
         response = JSONResponse({"success": False, "message": "Account not found"}, status_code=404)
         response.delete_cookie(key="session_id")
         return response
@@ -147,7 +139,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
 
     if account.oauth_type == OAuthProvider.GOOGLE:
         logger.debug("Google account detected, attempting token revoke")
-        access_token = redis_client.hget(session_id, "USER_TOKEN")
+        access_token = await get_async_redis(session_id).hget(session_id, "USER_TOKEN")
         logger.debug(f"[DEBUG] Access token from Redis (type: {type(access_token)})")
 
         if access_token:
@@ -159,7 +151,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
                 # GUEST 토큰이 아닌 경우에만 revoke 시도
                 if access_token != "GUEST":
                     logger.debug("Calling GoogleOAuth2Service.revoke_token()...")
-                    result = GoogleOAuth2Service.revoke_token(access_token)
+                    result = await GoogleOAuth2Service.revoke_token(access_token)
                     logger.debug(f"Google token revoke result: {result}")
                     logger.debug("Google token revoked successfully")
 
@@ -172,7 +164,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
                 logger.debug(f"[ERROR] Traceback: {traceback.format_exc()}")
         else:
             logger.debug("No access token found in Redis for Google account")
-            logger.debug(f"All Redis keys for session_id: {redis_client.hkeys(session_id)}")
+            logger.debug(f"All Redis keys for session_id: {await get_async_redis(session_id).hkeys(session_id)}")
     else:
         logger.debug("Non-Google account detected, skipping token revoke")
 
@@ -181,9 +173,8 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
     logger.debug("Account deleted: %s", deleted)
 
     # Redis 세션 삭제
-    delete_result = redis_client.delete(session_id)
+    delete_result = await end_session(session_id)
     logger.debug("Redis delete result: %s", delete_result)
-    logger.debug("Redis session exists after delete? %s", redis_client.exists(session_id))
     # 쿠키 삭제와 함께 응답 반환
     response = JSONResponse({"success": True, "message": "Account deleted successfully"})
     response.delete_cookie(key="session_id")
@@ -1,47 +1,133 @@
+import os
+import threading
+import time
 import uuid
 
-from fastapi import Cookie
+from fastapi import Cookie, Depends, HTTPException
 
-from sosial_oauth.adapter.input.web.google_oauth2_router import redis_client
+from account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+from config.database.db_executor import run_db
+from config.redis_config import get_async_redis
 from util.log.log import Log
+from util.session.session_shard_migrator import SessionShardMigrator
+from util.session.session_version import SessionVersion
+
+SESSION_EXPIRE_SECONDS = 24 * 60 * 60
+
+# 최근에 유효성을 확인한 세션 (session_id → 확인 만료 시각)
+# 짧은 시간 동안 Redis 조회 없이 통과시켜 매 요청의 왕복을 줄인다
+VALIDATION_CACHE_TTL = float(os.getenv("SESSION_VALIDATION_CACHE_TTL", "5"))
+VALIDATION_CACHE_MAX_SIZE = 10000
+_validated_sessions: dict[str, float] = {}
+_validated_lock = threading.Lock()
+
+# 운영 통계 등 관리자 전용 엔드포인트에 접근할 수 있는 account.role_id (콤마 구분)
+ADMIN_ROLE_IDS = {role.strip() for role in os.getenv("ADMIN_ROLE_IDS", "ADMIN").split(",") if role.strip()}
 
 # session_id가 없다면 (비 로그인 유저) 
 # GUEST로 redis에 session 생성한다. 
 # 있다면 session_id 반환
 logger = Log.get_logger()
-def get_current_user(session_id: str = Cookie(None)) -> str:
+
+
+async def _create_guest_session() -> str:
+    session_id = str(uuid.uuid4())
+    pipe = get_async_redis(session_id).pipeline()
+    pipe.hset(session_id, "USER_TOKEN", "GUEST")
+    pipe.expire(session_id, SESSION_EXPIRE_SECONDS)
+    await pipe.execute()
+    _remember_session(session_id)
+    logger.debug("Created new session_id")
+    return session_id
+
+
+def _is_recently_validated(session_id: str) -> bool:
+    with _validated_lock:
+        expires_at = _validated_sessions.get(session_id)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del _validated_sessions[session_id]
+            return False
+        return True
+
+
+def _remember_session(session_id: str):
+    if VALIDATION_CACHE_TTL <= 0:
+        return
+    now = time.monotonic()
+    with _validated_lock:
+        if len(_validated_sessions) >= VALIDATION_CACHE_MAX_SIZE:
+            # 만료된 항목 정리 후에도 가득 차 있으면 전체 비움
+            for key in [k for k, v in _validated_sessions.items() if v < now]:
+                del _validated_sessions[key]
+            if len(_validated_sessions) >= VALIDATION_CACHE_MAX_SIZE:
+                _validated_sessions.clear()
+        _validated_sessions[session_id] = now + VALIDATION_CACHE_TTL
+
+
+def forget_session(session_id: str):
+    """로그아웃/탈퇴 시 세션 확인 캐시에서 제거"""
+    with _validated_lock:
+        _validated_sessions.pop(session_id, None)
+
+
+async def end_session(session_id: str) -> int:
+    """
+    세션 삭제 (로그아웃/탈퇴)
+
+    같은 pipeline에서 데이터 버전을 올려 이 세션의 파생 캐시가 더 이상 조회되지 않게 한다.
+    (ai_cache:* 스캔/삭제 불필요, 남은 캐시는 TTL로 만료)
+    """
+    pipe = get_async_redis(session_id).pipeline()
+    pipe.delete(session_id, *SessionShardMigrator.end_session_keys(session_id))
+    SessionVersion.bump(pipe, session_id)
+    deleted, _, _ = await pipe.execute()
+    await SessionShardMigrator.discard_previous(session_id)
+    forget_session(session_id)
+    return deleted
+
+
+async def get_current_user(session_id: str = Cookie(None)) -> str:
 
     logger.debug("Session ID from cookie exists?: %s", session_id is not None)
     # 1. 쿠키에 session_id가 없는 경우 → 새로 생성
     if not session_id:
-        session_id = str(uuid.uuid4())
-        redis_client.hset(
-            session_id,
-            "USER_TOKEN",
-            "GUEST"
-        )
-        redis_client.expire(session_id, 24 * 60 * 60)
-        logger.debug("Created new session_id")
+        return await _create_guest_session()
+
+    # 2. 최근에 확인한 세션이면 Redis 조회 생략
+    if _is_recently_validated(session_id):
         return session_id
 
-    # 2. 쿠키에 session_id가 있는 경우 → Redis 확인
-    user_data_bytes = redis_client.hgetall(session_id)
-    logger.debug("Redis data for session_id is found")
-    
-    # 3. Redis에 데이터가 없는 경우 (만료되었거나 존재하지 않음)
-    if not user_data_bytes:
+    # 3. 쿠키에 session_id가 있는 경우 → Redis 확인
+    # 재무 데이터 전체(HGETALL) 대신 존재 여부만 확인하고, 같은 왕복에서 만료 시간 연장 (sliding expiry)
+    # 데이터 버전 키도 세션과 함께 연장 (버전이 먼저 만료되어 0부터 다시 증가하지 않도록)
+    # 세션 데이터는 session_id 기준 샤드 노드에 저장된다
+    pipe = get_async_redis(session_id).pipeline(transaction=False)
+    pipe.exists(session_id)
+    pipe.expire(session_id, SESSION_EXPIRE_SECONDS)
+    SessionVersion.touch(pipe, session_id)
+    exists, _, _ = await pipe.execute()
+
+    # 샤드 노드 변경(리밸런싱) 중이면 이전 담당 노드에서 세션을 옮겨온다
+    if not exists and await SessionShardMigrator.migrate_session(session_id):
+        exists = True
+
+    # 4. Redis에 데이터가 없는 경우 (만료되었거나 존재하지 않음)
+    if not exists:
         logger.debug("Session expired or not found, creating new one")
         # 에러 대신 새로운 session_id 생성
-        new_session_id = str(uuid.uuid4())
-        redis_client.hset(
-            new_session_id,
-            "USER_TOKEN",
-            "GUEST"
-        )
-        redis_client.expire(new_session_id, 24 * 60 * 60)
-        logger.debug("Created new session_id")
-        return new_session_id
-
-    # 4. Redis에 데이터가 있는 경우 → 기존 session_id 사용
+        return await _create_guest_session()
+
+    # 5. Redis에 데이터가 있는 경우 → 기존 session_id 사용
     logger.debug("Using existing session_id")
+    _remember_session(session_id)
+    return session_id
+
+
+async def get_admin_user(session_id: str = Depends(get_current_user)) -> str:
+    """관리자 계정 세션만 통과 (게스트/일반 회원은 403)"""
+    account = await run_db(AccountRepositoryImpl.get_instance().get_account_by_session_id, session_id)
+    if account is None or account.role_id not in ADMIN_ROLE_IDS:
+        raise HTTPException(status_code=403, detail="관리자만 접근할 수 있습니다.")
     return session_id
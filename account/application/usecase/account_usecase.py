@@ -59,6 +59,9 @@ class AccountUseCase:
         )
         return self.account_repo.update(updated_account)
 
+    async def update_profile(self, session_id: str, name: str, profile_image: str, email: str) -> bool:
+        return await self.account_repo.update_profile(session_id, name, profile_image, email)
+
     def get_account_by_oauth_id(self, oauth_type:str, oauth_id: str) -> Optional[Account]:
         return self.account_repo.get_account_by_oauth_id(oauth_type, oauth_id)
 
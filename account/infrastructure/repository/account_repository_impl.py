@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from account.application.port.account_repository_port import AccountRepositoryPort
 from account.domain.account import Account
 from account.infrastructure.orm.account_orm import AccountORM
+from config.database.db_executor import run_db
 from config.database.session import get_db_session
 
 
@@ -25,12 +26,12 @@ class AccountRepositoryImpl(AccountRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
-
     async def save(self, account: Account) -> Account:
+        return await run_db(self._save, account)
+
+    def _save(self, account: Account) -> Account:
 
+        db: Session = get_db_session()
         try:
             orm_account = AccountORM(
                 session_id=account.session_id,
@@ -48,21 +49,25 @@ class AccountRepositoryImpl(AccountRepositoryPort):
                 target_amount=account.target_amount
             )
 
-            self.db.add(orm_account)
-            self.db.commit()
-            self.db.refresh(orm_account)
+            db.add(orm_account)
+            db.commit()
+            db.refresh(orm_account)
 
             account.created_at = orm_account.created_at
             account.updated_at = orm_account.updated_at
             return account
         finally:
-            self.db.close()
+            db.close()
 
     async def update(self, account: Account) -> Account:
+        return await run_db(self._update, account)
 
+    def _update(self, account: Account) -> Account:
+
+        db: Session = get_db_session()
         try:
             # 기존 레코드 조회 (예: session_id 기준)
-            orm_account = self.db.query(AccountORM).filter_by(session_id=account.session_id).first()
+            orm_account = db.query(AccountORM).filter_by(session_id=account.session_id).first()
             if orm_account is None:
                 raise Exception("Account not found for update")
 
@@ -77,20 +82,37 @@ class AccountRepositoryImpl(AccountRepositoryPort):
             orm_account.target_period = account.target_period
             orm_account.target_amount = account.target_amount
 
-            self.db.add(orm_account)
-            self.db.commit()
-            self.db.refresh(orm_account)
+            db.add(orm_account)
+            db.commit()
+            db.refresh(orm_account)
 
             account.created_at = orm_account.created_at
             account.updated_at = orm_account.updated_at
             return account
         finally:
-            self.db.close()
+            db.close()
+
+    async def update_profile(self, session_id: str, name: str, profile_image: str, email: str) -> bool:
+        return await run_db(self._update_profile, session_id, name, profile_image, email)
+
+    def _update_profile(self, session_id: str, name: str, profile_image: str, email: str) -> bool:
+        """소셜 로그인 프로필(이름/프로필 이미지/이메일)만 갱신 (목표 금액 등 사용자 설정은 유지)"""
+        db: Session = get_db_session()
+        try:
+            updated_count = db.query(AccountORM).filter(AccountORM.session_id == session_id).update(
+                {"name": name, "profile_image": profile_image, "email": email},
+                synchronize_session=False
+            )
+            db.commit()
+            return updated_count > 0
+        finally:
+            db.close()
 
     def get_account_by_oauth_id(self, oauth_type: str, user_oauth_id: str) -> Optional[Account]:
 
+        db: Session = get_db_session()
         try:
-            orm_account = self.db.query(AccountORM).filter(AccountORM.oauth_type == oauth_type,
+            orm_account = db.query(AccountORM).filter(AccountORM.oauth_type == oauth_type,
                                                            AccountORM.oauth_id == user_oauth_id).first()
             if orm_account:
                 account = Account(
@@ -110,12 +132,13 @@ class AccountRepositoryImpl(AccountRepositoryPort):
                 return account
             return None
         finally:
-            self.db.close()
+            db.close()
 
     def get_account_by_session_id(self, session_id: str) -> Optional[Account]:
 
+        db: Session = get_db_session()
         try:
-            orm_account = self.db.query(AccountORM).filter(AccountORM.session_id == session_id).first()
+            orm_account = db.query(AccountORM).filter(AccountORM.session_id == session_id).first()
 
             if orm_account:
                 account = Account(
@@ -135,20 +158,21 @@ class AccountRepositoryImpl(AccountRepositoryPort):
                 return account
             return None
         finally:
-            self.db.close()
+            db.close()
 
     def delete_account_by_oauth_id(self, oauth_type: str, oauth_id: str) -> bool:
 
+        db: Session = get_db_session()
         try:
-            deleted_count = self.db.query(AccountORM).filter(
+            deleted_count = db.query(AccountORM).filter(
                 and_(
                     AccountORM.oauth_type == oauth_type,
                     AccountORM.oauth_id == oauth_id
                 )
             ).delete(synchronize_session=False)
 
-            self.db.commit()
+            db.commit()
 
             return deleted_count > 0
         finally:
-            self.db.close()
\ No newline at end of file
+            db.close()
\ No newline at end of file
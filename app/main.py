@@ -10,8 +10,15 @@ load_dotenv()
 
 from product.adapter.input.web.product_data_router.product_data_router import product_data_router
 from account.adapter.input.web.account_router import account_router
+from config.database.db_executor import shutdown_db_executor
 from config.database.session import Base, engine
-from documents_multi_agents.adapter.input.web.document_multi_agent_router import documents_multi_agents_router
+from config.database.sql_metrics import SqlMetrics
+from config.http_client import close_async_http_client
+from config.redis_config import close_async_redis
+from ieinfo.adapter.input.stream import session_change_consumer  # 세션 변경 이벤트 consumer 등록
+from util.file.request_body_limit import RequestBodyLimitMiddleware
+from util.stream.session_change_stream import SessionChangeStream
+from documents_multi_agents.adapter.input.web.document_multi_agent_router import UPLOAD_BODY_LIMITS, documents_multi_agents_router
 from ecos.adapter.input.web.ecos_data_router.ecos_data_router import ecos_data_router
 from ieinfo.adapter.input.web.ie_info_router import ie_info_router
 from kftc.adapter.input.web.kftc_router import kftc_router
@@ -25,7 +32,7 @@ from news_info.adapter.input.web.news_info_router import news_info_router
 from community.adapter.input.web.community_router import community_router
 from jobs import scheduler as jobs_scheduler
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 CORS_ALLOWED_FRONTEND_URL = os.getenv("CORS_ALLOWED_FRONTEND_URL")
 
@@ -35,10 +42,27 @@ app = FastAPI()
 async def on_startup():
     # .env가 이미 로드되어 있다고 가정
     jobs_scheduler.start_scheduler()
+    # 세션 변경 이벤트 consumer (IE_INFO 저장, 파생 뷰 사전 계산, 통계)
+    await SessionChangeStream.start()
 
 @app.on_event("shutdown")
 async def on_shutdown():
     jobs_scheduler.stop_scheduler()
+    await SessionChangeStream.stop()
+    await close_async_redis()
+    await close_async_http_client()
+    shutdown_db_executor()
+
+@app.middleware("http")
+async def sql_metrics_middleware(request: Request, call_next):
+    # 요청별 쿼리 수/DB 시간 집계 (라우트 경로 템플릿 단위)
+    with SqlMetrics.scope("request", f"{request.method} {request.url.path}") as scope:
+        try:
+            return await call_next(request)
+        finally:
+            route = request.scope.get("route")
+            if route is not None:
+                scope.name = f"{request.method} {route.path}"
 
 origins = [
     CORS_ALLOWED_FRONTEND_URL,  # Next.js 프론트 엔드 URL
@@ -52,6 +76,10 @@ app.add_middleware(
     allow_headers=["*"],         # 모든 헤더 허용
 )
 
+# 요청 본문 크기 제한 (Content-Length 확인 + 수신 바이트 집계, 초과 시 413)
+# 업로드 경로는 경로별 제한 (/analyze: 파일 1개, /analyze/batch: 최대 파일 수), 나머지는 MAX_REQUEST_BODY_SIZE
+app.add_middleware(RequestBodyLimitMiddleware, route_limits=UPLOAD_BODY_LIMITS)
+
 app.include_router(account_router, prefix="/account")
 app.include_router(authentication_router, prefix="/authentication")
 app.include_router(documents_multi_agents_router, prefix="/documents-multi-agents")
@@ -77,86 +105,33 @@ if __name__ == "__main__":
     from ieinfo.infrastructure.orm.ie_rule import IERule
     from ieinfo.infrastructure.orm.ie_info import IEType
     from asset_allocation.infrastructure.orm.analyze_history import AnalyzeHistory  # 🔥 추가
-    from sqlalchemy import select
-    
+    from sqlalchemy import func, select
+    from sqlalchemy.orm import Session
+    from config.database.schema_bootstrap import bootstrap_schema
+    from init_ie_rules import INITIAL_INCOME_KEYWORDS, INITIAL_EXPENSE_KEYWORDS
+
     host = os.getenv("APP_HOST")
     port = int(os.getenv("APP_PORT"))
-    
-    # 🔥 IE_RULE 데이터 백업 (서버 재시작해도 유지)
-    backup_rules = []
-    try:
-        with engine.connect() as conn:
-            # IE_RULE 테이블이 존재하면 데이터 백업
-            result = conn.execute(select(IERule))
-            backup_rules = [
-                {'keyword': row.keyword, 'ie_type': row.ie_type}
-                for row in result
-            ]
-            print(f"📦 IE_RULE 백업: {len(backup_rules)}개 규칙")
-    except Exception as e:
-        print(f"⚠️  IE_RULE 백업 실패 (첫 실행일 수 있음): {str(e)}")
-    
-    # 모든 테이블 삭제 및 재생성
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    
-    # 🔥 IE_RULE 데이터 복구 또는 초기 데이터 삽입
-    from sqlalchemy.orm import Session
+
+    # 없는 테이블 생성 + 마이그레이션 적용 (기존 데이터 유지, 최신 상태면 checksum 확인만 하고 종료)
+    bootstrap_schema(engine, Base.metadata)
+
+    # 🔥 IE_RULE이 비어 있으면 초기 키워드 자동 삽입
     session = Session(bind=engine)
-    
-    if backup_rules:
-        # 백업 데이터가 있으면 복구
-        try:
-            for rule_data in backup_rules:
-                new_rule = IERule(
-                    keyword=rule_data['keyword'],
-                    ie_type=rule_data['ie_type']
-                )
-                session.add(new_rule)
-            
-            session.commit()
-            print(f"✅ IE_RULE 복구 완료: {len(backup_rules)}개 규칙")
-        except Exception as e:
-            session.rollback()
-            print(f"❌ IE_RULE 복구 실패: {str(e)}")
-    else:
-        # 백업 데이터가 없으면 초기 데이터 자동 삽입
-        print("🎯 백업 데이터 없음 → 초기 키워드 자동 삽입")
-        
-        # 초기 소득 키워드
-        INITIAL_INCOME_KEYWORDS = [
-            "급여", "월급", "연봉", "봉급", "임금",
-            "상여", "상여금", "보너스", "성과급", "인센티브",
-            "수당", "식대", "교통비", "주거수당",
-            "이자", "배당", "배당금", "이자소득"
-        ]
-        
-        # 초기 지출 키워드
-        INITIAL_EXPENSE_KEYWORDS = [
-            "보험료", "국민연금", "건강보험", "고용보험", "산재보험",
-            "세금", "소득세", "지방소득세", "주민세",
-            "카드", "신용카드", "체크카드", "카드사용액",
-            "공제", "공제액", "차감"
-        ]
-        
-        try:
-            # 소득 키워드 삽입
-            for keyword in INITIAL_INCOME_KEYWORDS:
-                rule = IERule(keyword=keyword, ie_type=IEType.INCOME)
-                session.add(rule)
-            
-            # 지출 키워드 삽입
-            for keyword in INITIAL_EXPENSE_KEYWORDS:
-                rule = IERule(keyword=keyword, ie_type=IEType.EXPENSE)
-                session.add(rule)
-            
+    try:
+        if not session.scalar(select(func.count()).select_from(IERule)):
+            print("🎯 IE_RULE 비어 있음 → 초기 키워드 자동 삽입")
+            session.add_all(
+                [IERule(keyword=keyword, ie_type=IEType.INCOME) for keyword in INITIAL_INCOME_KEYWORDS]
+                + [IERule(keyword=keyword, ie_type=IEType.EXPENSE) for keyword in INITIAL_EXPENSE_KEYWORDS]
+            )
             session.commit()
             total = len(INITIAL_INCOME_KEYWORDS) + len(INITIAL_EXPENSE_KEYWORDS)
             print(f"✅ 초기 키워드 삽입 완료: {total}개 (소득 {len(INITIAL_INCOME_KEYWORDS)}개, 지출 {len(INITIAL_EXPENSE_KEYWORDS)}개)")
-        except Exception as e:
-            session.rollback()
-            print(f"❌ 초기 키워드 삽입 실패: {str(e)}")
-    
-    session.close()
-    
+    except Exception as e:
+        session.rollback()
+        print(f"❌ 초기 키워드 삽입 실패: {str(e)}")
+    finally:
+        session.close()
+
     uvicorn.run(app, host=host, port=port)
@@ -0,0 +1,86 @@
+"""
+기준일자 조회 벤치마크 스크립트
+DATE_FORMAT(basDt) 비교와 basDt 반열린 구간 조건의 조회 시간/실행 계획 비교
+
+- product_etf와 같은 구조의 임시 테이블(bench_product_etf)에 BENCH_ROWS건(기본 100만 건)을 넣고 측정한 뒤 삭제한다.
+- 운영 DB에서는 실행하지 말 것 (대량 INSERT 발생)
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import MetaData, func, insert, select, text
+
+from config.database.date_range import day_range
+from config.database.session import engine
+from product.infrastructure.orm.product_etf import ProductETFORM
+
+BENCH_ROWS = int(os.getenv("BENCH_ROWS", "1000000"))
+BENCH_CODES = int(os.getenv("BENCH_CODES", "1000"))  # 기준일자당 종목 수
+BENCH_REPEAT = int(os.getenv("BENCH_REPEAT", "5"))
+INSERT_CHUNK = 10000
+
+
+def _seed(table):
+    days = max(1, BENCH_ROWS // BENCH_CODES)
+    first_day = datetime(2020, 1, 1)
+    rows = []
+    with engine.begin() as conn:
+        for day in range(days):
+            bas_dt = first_day + timedelta(days=day)
+            for code in range(BENCH_CODES):
+                rows.append({
+                    "srtnCd": f"{code:06d}", "isinCd": f"KR7{code:09d}", "itmsNm": f"ETF {code}",
+                    "basDt": bas_dt, "clpr": 10000 + code, "mrktTotAmt": code * 1000000
+                })
+                if len(rows) >= INSERT_CHUNK:
+                    conn.execute(insert(table), rows)
+                    rows = []
+        if rows:
+            conn.execute(insert(table), rows)
+    return first_day + timedelta(days=days // 2)
+
+
+def _measure(label, query):
+    timings = []
+    count = 0
+    with engine.connect() as conn:
+        for _ in range(BENCH_REPEAT):
+            started = time.perf_counter()
+            count = len([dict(row) for row in conn.execute(query).mappings()])
+            timings.append((time.perf_counter() - started) * 1000)
+        plan = ""
+        if engine.dialect.name == "mysql":
+            compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+            plan = " | ".join(str(row) for row in conn.execute(text(f"EXPLAIN {compiled}")))
+    print(f"  {label:<22} {count}행, 평균 {sum(timings) / len(timings):8.2f}ms, 최소 {min(timings):8.2f}ms")
+    if plan:
+        print(f"    EXPLAIN: {plan}")
+
+
+def run_benchmark():
+    table = ProductETFORM.__table__.to_metadata(MetaData(), name="bench_product_etf")
+    table.drop(engine, checkfirst=True)
+    table.create(engine)
+
+    print("\n" + "=" * 80)
+    print(f"📊 기준일자 조회 벤치마크 ({BENCH_ROWS:,}건, 일자당 {BENCH_CODES:,}종목)")
+    print("=" * 80 + "\n")
+    try:
+        started = time.perf_counter()
+        target_day = _seed(table)
+        print(f"📥 데이터 생성 완료 ({time.perf_counter() - started:.1f}s)\n")
+
+        date = target_day.strftime("%Y%m%d")
+        start, end = day_range(date)
+        _measure("DATE_FORMAT 비교", select(table).where(func.date_format(table.c.basDt, "%Y%m%d") == date))
+        _measure("반열린 구간 조건", select(table).where(table.c.basDt >= start, table.c.basDt < end))
+    finally:
+        table.drop(engine, checkfirst=True)
+
+    print("\n" + "=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,156 @@
+"""
+업로드 메모리(RSS) 부하 테스트 스크립트
+동시 업로드 중 프로세스 최대 RSS를 기존 방식(await file.read() 후 크기 확인)과
+현재 방식(RequestBodyLimitMiddleware 경로별 제한 + open_upload 임시 파일 직접 사용)으로 비교
+
+- 실제 라우터 대신 /analyze와 같은 제한을 적용한 최소 앱을 사용한다. (GPT/Redis 불필요)
+- 허용 크기 업로드 BENCH_UPLOADS건과 크기 초과 업로드(Content-Length 없는 chunked 전송) BENCH_OVERSIZED건을 동시에 보낸다.
+- Linux 전용 (/proc/self/status의 VmRSS 사용)
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+import httpx
+from fastapi import FastAPI, File, HTTPException, UploadFile
+
+from util.file.request_body_limit import RequestBodyLimitMiddleware
+from util.file.upload_file import open_upload
+
+MAX_FILE_SIZE = 5 * 1024 * 1024
+MULTIPART_OVERHEAD = 64 * 1024
+BENCH_UPLOADS = int(os.getenv("BENCH_UPLOADS", "20"))
+BENCH_OVERSIZED = int(os.getenv("BENCH_OVERSIZED", "5"))
+BENCH_FILE_SIZE = int(os.getenv("BENCH_FILE_SIZE", str(4 * 1024 * 1024)))
+BENCH_OVERSIZED_SIZE = int(os.getenv("BENCH_OVERSIZED_SIZE", str(100 * 1024 * 1024)))
+CHUNK_SIZE = 64 * 1024
+BOUNDARY = "benchboundary"
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+class RssSampler:
+    """백그라운드 스레드에서 RSS를 주기적으로 측정하여 최대값 기록"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _rss_kb())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self.peak = _rss_kb()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _digest_chunks(stream) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+    if legacy:
+        @app.post("/analyze")
+        async def analyze_legacy(file: UploadFile = File(...)):
+            content = await file.read()
+            if len(content) > MAX_FILE_SIZE:
+                raise HTTPException(413, "File too large")
+            return {"digest": hashlib.sha256(content).hexdigest()}
+    else:
+        app.add_middleware(RequestBodyLimitMiddleware,
+                           route_limits={"/analyze": MAX_FILE_SIZE + MULTIPART_OVERHEAD})
+
+        @app.post("/analyze")
+        async def analyze(file: UploadFile = File(...)):
+            async with open_upload(file, MAX_FILE_SIZE) as stream:
+                return {"digest": _digest_chunks(stream)}
+    return app
+
+
+async def _multipart_body(path: str):
+    """디스크의 파일을 청크 단위로 multipart 본문으로 전송 (클라이언트 측 메모리 사용 최소화)"""
+    yield (f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"doc.pdf\"\r\n"
+           f"Content-Type: application/pdf\r\n\r\n").encode()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            yield chunk
+            await asyncio.sleep(0)
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def _make_file(size: int) -> str:
+    handle = tempfile.NamedTemporaryFile(delete=False, suffix=".bin")
+    block = os.urandom(CHUNK_SIZE)
+    with handle:
+        for _ in range(size // CHUNK_SIZE):
+            handle.write(block)
+    return handle.name
+
+
+async def _run_load(app: FastAPI, small_path: str, large_path: str):
+    transport = httpx.ASGITransport(app=app)
+    headers = {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def post(path: str):
+            try:
+                response = await client.post("/analyze", content=_multipart_body(path), headers=headers)
+                return response.status_code
+            except Exception as e:
+                return type(e).__name__
+
+        return await asyncio.gather(
+            *(post(small_path) for _ in range(BENCH_UPLOADS)),
+            *(post(large_path) for _ in range(BENCH_OVERSIZED))
+        )
+
+
+def run_benchmark():
+    small_path = _make_file(BENCH_FILE_SIZE)
+    large_path = _make_file(BENCH_OVERSIZED_SIZE)
+
+    print("\n" + "=" * 80)
+    print(f"📊 업로드 RSS 부하 테스트 ({BENCH_FILE_SIZE // 1024:,}KB × {BENCH_UPLOADS}건 + "
+          f"{BENCH_OVERSIZED_SIZE // (1024 * 1024):,}MB 초과 업로드 × {BENCH_OVERSIZED}건 동시 전송)")
+    print("=" * 80 + "\n")
+    try:
+        for label, legacy in (("기존 (file.read)", True), ("현재 (경로별 제한)", False)):
+            started = time.perf_counter()
+            baseline = _rss_kb()
+            with RssSampler() as sampler:
+                statuses = asyncio.run(_run_load(build_app(legacy), small_path, large_path))
+            elapsed = time.perf_counter() - started
+            summary = {status: statuses.count(status) for status in set(statuses)}
+            print(f"  {label:<18} 최대 RSS +{(sampler.peak - baseline) / 1024:8.1f}MB, "
+                  f"{elapsed:6.2f}s, 응답 {summary}")
+    finally:
+        os.unlink(small_path)
+        os.unlink(large_path)
+
+    print("\n" + "=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    run_benchmark()
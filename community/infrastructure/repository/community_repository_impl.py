@@ -1,13 +1,18 @@
 from typing import List
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
+from config.database.bulk_upsert import bulk_upsert
+from config.database.db_executor import run_db
 from config.database.session import get_db_session
 from community.application.port.community_repository_port import CommunityRepositoryPort
 from community.domain.value_object.community_post import CommunityPost
 from community.infrastructure.orm.community_post_orm import CommunityPostORM
 from datetime import datetime, date, time
+from util.log.log import Log
+
+logger = Log.get_logger()
+
 
 class CommunityRepositoryImpl(CommunityRepositoryPort):
     __instance = None
@@ -23,81 +28,59 @@ class CommunityRepositoryImpl(CommunityRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, "db"):
-            self.db: Session = get_db_session()
-
     def save_post_batch(self, posts: List[CommunityPost]) -> List[CommunityPost]:
-
+        """
+        provider + board_id + external_post_id 기준으로
+        이미 DB에 있는 글은 조회수/추천수/댓글수만 갱신하고, 새로운 글만 insert
+        """
+        if not posts:
+            return []
+
+        rows = [
+            {
+                "provider": p.provider,
+                "board_id": p.board_id,
+                "external_post_id": p.external_post_id,
+                "title": p.title,
+                "author": p.author,
+                "content": p.content,
+                "url": p.url,
+                "view_count": p.view_count,
+                "recommend_count": p.recommend_count,
+                "comment_count": p.comment_count,
+                "posted_at": p.posted_at,
+                "fetched_at": p.fetched_at,
+            }
+            for p in posts
+        ]
+
+        db: Session = get_db_session()
         try:
-            """
-            provider + board_id + external_post_id 기준으로
-            이미 DB에 있는 글은 건너뛰고, 새로운 글만 insert
-            """
-            if not posts:
-                return []
-
-            new_list: List[CommunityPost] = []
-
-            for p in posts:
-                existing = (
-                    self.db.query(CommunityPostORM)
-                    .filter(
-                        and_(
-                            CommunityPostORM.provider == p.provider,
-                            CommunityPostORM.board_id == p.board_id,
-                            CommunityPostORM.external_post_id == p.external_post_id,
-                        )
-                    )
-                    .first()
-                )
-
-                if not existing:
-                    new_list.append(p)
-
-            # 전부 중복이면 그냥 원본 리스트 리턴
-            if not new_list:
-                return posts
-
-            orm_list: List[CommunityPostORM] = []
-            for p in new_list:
-                orm_list.append(
-                    CommunityPostORM(
-                        provider=p.provider,
-                        board_id=p.board_id,
-                        external_post_id=p.external_post_id,
-                        title=p.title,
-                        author=p.author,
-                        content=p.content,
-                        url=p.url,
-                        view_count=p.view_count,
-                        recommend_count=p.recommend_count,
-                        comment_count=p.comment_count,
-                        posted_at=p.posted_at,
-                        fetched_at=p.fetched_at,
-                    )
-                )
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
-
+            result = bulk_upsert(
+                db, CommunityPostORM, rows,
+                key_columns=("provider", "board_id", "external_post_id"),
+                update_columns=("view_count", "recommend_count", "comment_count")
+            )
+            db.commit()
+            logger.info(f"[COMMUNITY] 게시글 저장: {result.to_dict()}")
             return posts
         finally:
-            self.db.close()
+            db.close()
 
     async def get_three_month_community_for_card_news(self) -> List[CommunityPostORM]:
+        return await run_db(self._get_three_month_community_for_card_news)
+
+    def _get_three_month_community_for_card_news(self) -> List[CommunityPostORM]:
 
         target_date = date.today()  # 또는 datetime.utcnow().date()
 
         start = datetime.combine(target_date, time.min)  # 00:00:00
         end = datetime.combine(target_date, time.max)  # 23:59:59.999999
 
+        db: Session = get_db_session()
         try:
             rows = (
-                self.db.query(CommunityPostORM)
+                db.query(CommunityPostORM)
                 .filter(CommunityPostORM.posted_at >= start)
                 .filter(CommunityPostORM.posted_at <= end)
                 .order_by(CommunityPostORM.posted_at.desc())
@@ -107,4 +90,4 @@ class CommunityRepositoryImpl(CommunityRepositoryPort):
             return rows
 
         finally:
-            self.db.close()
\ No newline at end of file
+            db.close()
\ No newline at end of file
@@ -1,12 +1,18 @@
 import base64
+import os
 
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
 from Crypto.Util.Padding import pad, unpad
+from dotenv import load_dotenv
 
-# 1. 키와 IV 생성 (안전을 위해 임의로 생성)
-key = get_random_bytes(16) # 128비트 키
-iv = get_random_bytes(16)  # 128비트 IV
+load_dotenv()
+
+# 1. 키와 IV 생성
+# CRYPTO_KEY / CRYPTO_IV(base64, 16바이트)가 설정되어 있으면 사용하여 여러 워커/재시작 간에 복호화 가능
+# 미설정 시 프로세스마다 임의로 생성 (해당 프로세스에서 암호화한 데이터만 복호화 가능)
+key = base64.b64decode(os.getenv("CRYPTO_KEY")) if os.getenv("CRYPTO_KEY") else get_random_bytes(16)  # 128비트 키
+iv = base64.b64decode(os.getenv("CRYPTO_IV")) if os.getenv("CRYPTO_IV") else get_random_bytes(16)  # 128비트 IV
 
 class Crypto:
     __instance = None
@@ -0,0 +1,134 @@
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum as PyEnum
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import case, not_, or_, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 수집 배치 저장 시 한 INSERT 문에 담을 행 수 (max_allowed_packet을 넘지 않도록 제한)
+DB_BULK_CHUNK_SIZE = int(os.getenv("DB_BULK_CHUNK_SIZE", "1000"))
+
+
+@dataclass
+class UpsertResult:
+    """일괄 저장 결과"""
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0  # 이미 같은 키가 있어 변경하지 않은 행 (+ 입력 안에서 중복된 행)
+    new_keys: List[Tuple] = field(default_factory=list)  # 새로 저장된 행의 키 (key_columns 순서)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"inserted": self.inserted, "updated": self.updated, "skipped": self.skipped}
+
+
+def _normalize(value: Any) -> Any:
+    """DB에서 읽은 값과 입력 값을 같은 형태로 맞춰 키 비교 (Enum 이름, DATETIME 초 단위)"""
+    if isinstance(value, PyEnum):
+        return value.name
+    if isinstance(value, datetime):
+        return value.replace(microsecond=0)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: Iterable[Dict[str, Any]],
+    key_columns: Sequence[str] = (),
+    update_columns: Sequence[str] = (),
+    touch_columns: Sequence[str] = (),
+    chunk_size: int = DB_BULK_CHUNK_SIZE
+) -> UpsertResult:
+    """
+    여러 행을 청크 단위 multi-row INSERT ... ON DUPLICATE KEY UPDATE로 저장 (커밋은 호출자가 수행)
+
+    - key_columns: 중복 판단 키 (테이블의 unique 인덱스와 같아야 ON DUPLICATE KEY가 동작)
+      청크마다 기존 키를 한 번에 조회하여 신규/기존 행을 구분한다. 입력 안에서 키가 같으면 마지막 행을 사용한다.
+    - update_columns: 기존 행에서 갱신할 컬럼 (비어 있으면 기존 행은 건너뜀)
+    - touch_columns: update_columns 값이 실제로 바뀐 기존 행에서만 함께 갱신할 컬럼 (예: modified_at)
+    - key_columns가 없으면 중복 확인 없이 모두 INSERT 한다.
+
+    행마다 SELECT/refresh 하지 않으므로 청크당 왕복은 최대 2회(키 조회 + INSERT)이다.
+    """
+    started = time.perf_counter()
+    table = model.__table__
+    result = UpsertResult()
+
+    if key_columns:
+        unique_rows: Dict[Tuple, Dict[str, Any]] = {}
+        total = 0
+        for row in rows:
+            total += 1
+            unique_rows[tuple(_normalize(row.get(column)) for column in key_columns)] = row
+        result.skipped += total - len(unique_rows)
+        items = list(unique_rows.items())
+    else:
+        items = [((), row) for row in rows]
+
+    key_cols = [table.c[column] for column in key_columns]
+    for offset in range(0, len(items), chunk_size):
+        chunk = items[offset:offset + chunk_size]
+
+        existing = set()
+        if key_cols:
+            keys = [key for key, _ in chunk]
+            if len(key_cols) == 1:
+                query = db.query(key_cols[0]).filter(key_cols[0].in_([key[0] for key in keys]))
+            else:
+                query = db.query(*key_cols).filter(tuple_(*key_cols).in_(keys))
+            existing = {tuple(_normalize(value) for value in found) for found in query.all()}
+
+        if update_columns:
+            values = [row for _, row in chunk]
+        else:
+            # 갱신할 컬럼이 없으면 신규 행만 INSERT
+            values = [row for key, row in chunk if key not in existing]
+        new_keys = [key for key, _ in chunk if key not in existing]
+
+        if values:
+            stmt = mysql_insert(table).values(values)
+            if key_cols:
+                # 조회 이후 다른 작업이 같은 키를 먼저 저장해도 오류 없이 처리 (갱신 컬럼이 없으면 변경 없음)
+                if update_columns:
+                    # touch_columns는 update_columns보다 먼저 SET 해야 갱신 전 값과 비교됨 (MySQL은 왼쪽부터 적용)
+                    # dict는 테이블 컬럼 순서로 바뀌므로 순서가 유지되는 (컬럼, 값) 목록으로 전달
+                    changed = or_(*(not_(table.c[column].op("<=>")(stmt.inserted[column])) for column in update_columns))
+                    assignments = [
+                        (column, case((changed, stmt.inserted[column]), else_=table.c[column]))
+                        for column in touch_columns
+                    ]
+                    assignments += [(column, stmt.inserted[column]) for column in update_columns]
+                else:
+                    assignments = {key_columns[0]: table.c[key_columns[0]]}
+                stmt = stmt.on_duplicate_key_update(assignments)
+            executed = db.execute(stmt)
+
+            if update_columns:
+                # MySQL 드라이버는 CLIENT_FOUND_ROWS로 연결되므로 영향 행 수는
+                # 신규 1, 변경된 기존 행 2, 값이 같은 기존 행 1 → (영향 행 수 - 행 수) = 변경된 기존 행 수
+                updated = max(0, executed.rowcount - len(values))
+                result.updated += updated
+                result.skipped += len(existing) - updated
+
+        if not update_columns:
+            result.skipped += len(existing)
+        result.inserted += len(new_keys)
+        result.new_keys.extend(new_keys)
+
+    elapsed = time.perf_counter() - started
+    total_rows = result.inserted + result.updated + result.skipped
+    logger.info(
+        f"[BULK UPSERT] {table.name}: {result.inserted} inserted, {result.updated} updated, "
+        f"{result.skipped} skipped ({elapsed:.3f}s, {total_rows / elapsed if elapsed else 0:.0f} rows/s)"
+    )
+    return result
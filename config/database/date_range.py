@@ -0,0 +1,21 @@
+from datetime import datetime, timedelta
+from typing import Tuple
+
+
+def day_range(date: str) -> Tuple[datetime, datetime]:
+    """
+    'YYYYMMDD' → 해당 일자의 반열린 구간 [00:00, 다음 날 00:00)
+
+    DATE_FORMAT(col, ...) = 'YYYYMMDD' 비교는 인덱스를 쓰지 못하므로
+    col >= start AND col < end 형태로 조회한다. (형식이 다르면 ValueError)
+    """
+    start = datetime.strptime(date, "%Y%m%d")
+    return start, start + timedelta(days=1)
+
+
+def month_range(month: str) -> Tuple[datetime, datetime]:
+    """'YYYYMM' → 해당 월의 반열린 구간 [1일 00:00, 다음 달 1일 00:00) (형식이 다르면 ValueError)"""
+    start = datetime.strptime(month, "%Y%m")
+    if start.month == 12:
+        return start, start.replace(year=start.year + 1, month=1)
+    return start, start.replace(month=start.month + 1)
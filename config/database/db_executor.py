@@ -0,0 +1,89 @@
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from config.database.session import DB_MAX_OVERFLOW, DB_POOL_SIZE
+
+T = TypeVar("T")
+
+# 동기 SQLAlchemy 호출 전용 스레드풀
+# - async 핸들러에서 DB 조회가 이벤트 루프를 막지 않도록 이 풀에서 실행한다.
+# - 기본 스레드풀(run_in_executor(None))은 GPT 호출/PDF 처리와 공유되므로 DB 작업은 별도 풀로 분리한다.
+# - WORKERS는 커넥션 풀 크기(POOL_SIZE + MAX_OVERFLOW)를 넘지 않게 하여 스레드가 커넥션을 기다리며 쌓이지 않게 한다.
+DB_EXECUTOR_WORKERS = min(
+    int(os.getenv("DB_EXECUTOR_WORKERS", str(DB_POOL_SIZE))),
+    DB_POOL_SIZE + DB_MAX_OVERFLOW
+)
+
+# DB 스레드풀 인스턴스 (Singleton)
+_db_executor = None
+_executor_lock = threading.Lock()
+
+_stats = {"calls": 0, "errors": 0, "in_flight": 0, "max_in_flight": 0, "total_wait_ms": 0.0, "max_wait_ms": 0.0}
+_stats_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        with _executor_lock:
+            if _db_executor is None:
+                _db_executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="db")
+    return _db_executor
+
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    동기 DB 작업을 DB 전용 스레드풀에서 실행하고 결과를 기다림
+
+    대기 시간(큐에서 스레드를 기다린 시간)을 기록하여 풀 크기가 부족한지 확인할 수 있게 한다.
+    """
+    submitted = time.perf_counter()
+
+    def call():
+        wait_ms = (time.perf_counter() - submitted) * 1000
+        with _stats_lock:
+            _stats["calls"] += 1
+            _stats["in_flight"] += 1
+            _stats["max_in_flight"] = max(_stats["max_in_flight"], _stats["in_flight"])
+            _stats["total_wait_ms"] += wait_ms
+            _stats["max_wait_ms"] = max(_stats["max_wait_ms"], wait_ms)
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            with _stats_lock:
+                _stats["errors"] += 1
+            raise
+        finally:
+            with _stats_lock:
+                _stats["in_flight"] -= 1
+
+    # run_in_executor는 컨텍스트를 복사하지 않으므로 직접 복사 (요청별 SQL 계측 scope 유지)
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(context.run, call))
+
+
+def get_db_executor_statistics() -> dict:
+    """DB 스레드풀 사용 현황 (모니터링용)"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["workers"] = DB_EXECUTOR_WORKERS
+    stats["avg_wait_ms"] = round(stats["total_wait_ms"] / stats["calls"], 3) if stats["calls"] else 0.0
+    stats["total_wait_ms"] = round(stats["total_wait_ms"], 3)
+    stats["max_wait_ms"] = round(stats["max_wait_ms"], 3)
+    return stats
+
+
+def shutdown_db_executor():
+    """애플리케이션 종료 시 진행 중인 DB 작업을 마치고 스레드풀 정리"""
+    global _db_executor
+    with _executor_lock:
+        executor, _db_executor = _db_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
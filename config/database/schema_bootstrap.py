@@ -0,0 +1,240 @@
+"""
+스키마 부트스트랩 (Schema Bootstrap)
+시작할 때 테이블을 지우고 다시 만들지 않고, 없는 테이블 생성 + 순서가 정해진 마이그레이션만 적용한다
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import Column, DateTime, Float, Integer, MetaData, String, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 적용된 마이그레이션 기록 (모델 테이블과 별도 MetaData → 모델 create_all 대상이 아님)
+_version_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    _version_metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("checksum", String(64), nullable=False),  # 가장 최근 행 = 현재 DB가 맞춰진 모델 스키마 checksum
+    Column("applied_at", DateTime, nullable=False),
+    Column("elapsed_ms", Float, nullable=False),
+)
+
+# 여러 인스턴스가 동시에 시작해도 마이그레이션은 한 곳에서만 실행 (MySQL GET_LOCK)
+BOOTSTRAP_LOCK_NAME = "nawsol_schema_bootstrap"
+BOOTSTRAP_LOCK_TIMEOUT = 60
+
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[Connection], None]  # 여러 번 실행해도 같은 결과여야 함 (이미 적용된 DB/새 DB 모두 고려)
+
+
+@dataclass
+class BootstrapResult:
+    """시작 시 스키마 점검 결과"""
+    up_to_date: bool
+    version: int
+    created_tables: List[str] = field(default_factory=list)
+    applied: List[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+
+# -----------------------------
+# 마이그레이션 도우미
+# -----------------------------
+def _has_table(conn: Connection, table: str) -> bool:
+    return inspect(conn).has_table(table)
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(found["name"] == column for found in inspect(conn).get_columns(table))
+
+
+def _has_index(conn: Connection, table: str, name: str) -> bool:
+    inspector = inspect(conn)
+    names = {found["name"] for found in inspector.get_indexes(table)}
+    names |= {found["name"] for found in inspector.get_unique_constraints(table)}
+    return name in names
+
+
+def _delete_duplicates(conn: Connection, table: str, key_columns: List[str]):
+    """unique 키를 추가하기 전에 같은 키의 중복 행 정리 (가장 최근 id만 남김)"""
+    condition = " AND ".join(f"t1.`{column}` = t2.`{column}`" for column in key_columns)
+    result = conn.execute(text(
+        f"DELETE t1 FROM `{table}` t1 JOIN `{table}` t2 ON {condition} AND t1.id < t2.id"
+    ))
+    if result.rowcount:
+        logger.warning(f"[SCHEMA] {table}: unique 키 추가 전 중복 행 {result.rowcount}건 정리")
+
+
+def _add_unique(conn: Connection, table: str, name: str, key_columns: List[str]):
+    if not _has_table(conn, table) or _has_index(conn, table, name):
+        return
+    _delete_duplicates(conn, table, key_columns)
+    columns = ", ".join(f"`{column}`" for column in key_columns)
+    conn.execute(text(f"ALTER TABLE `{table}` ADD CONSTRAINT `{name}` UNIQUE ({columns})"))
+
+
+def _add_index(conn: Connection, table: str, name: str, key_columns: List[str]):
+    if not _has_table(conn, table) or _has_index(conn, table, name):
+        return
+    columns = ", ".join(f"`{column}`" for column in key_columns)
+    conn.execute(text(f"CREATE INDEX `{name}` ON `{table}` ({columns})"))
+
+
+def _add_column(conn: Connection, table: str, column: str, definition: str):
+    if not _has_table(conn, table) or _has_column(conn, table, column):
+        return
+    conn.execute(text(f"ALTER TABLE `{table}` ADD COLUMN `{column}` {definition}"))
+
+
+# -----------------------------
+# 마이그레이션 (버전 순서대로 적용, 한 번 배포한 항목은 수정하지 말고 새 버전으로 추가)
+# -----------------------------
+def _m1_ie_info_source(conn: Connection):
+    _add_column(conn, "ie_info", "source", "VARCHAR(20) NOT NULL DEFAULT 'DOCUMENT'")
+
+
+def _m2_ecos_unique_type_date(conn: Connection):
+    _add_unique(conn, "exchange_rate", "uq_exchange_rate_type_date", ["exchange_type", "erm_date"])
+    _add_unique(conn, "interest_rate", "uq_interest_rate_type_date", ["interest_type", "erm_date"])
+
+
+def _m3_product_natural_keys(conn: Connection):
+    # 기존 ETF 행에는 종목 코드가 없으므로 NULL 허용으로 추가 (unique 키에서 NULL은 중복으로 보지 않음)
+    _add_column(conn, "product_etf", "srtnCd", "VARCHAR(32) NULL")
+    _add_column(conn, "product_etf", "isinCd", "VARCHAR(32) NULL")
+    _add_column(conn, "product_etf", "itmsNm", "VARCHAR(255) NULL")
+    _add_unique(conn, "product_etf", "uq_product_etf_date_code", ["basDt", "srtnCd"])
+    _add_unique(conn, "product_fund", "uq_product_fund_date_code", ["basDt", "srtnCd"])
+    _add_unique(conn, "product_bond", "uq_product_bond_date_isin", ["basDt", "isinCd"])
+
+
+def _m4_ecos_erm_date_index(conn: Connection):
+    _add_index(conn, "exchange_rate", "ix_exchange_rate_erm_date", ["erm_date"])
+    _add_index(conn, "interest_rate", "ix_interest_rate_erm_date", ["erm_date"])
+
+
+def _m5_ie_info_unique_key(conn: Connection):
+    _add_unique(conn, "ie_info", "uq_ie_info_session_source_month_key",
+                ["session_id", "source", "year", "month", "ie_type", "key"])
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "ie_info_source", _m1_ie_info_source),
+    Migration(2, "ecos_unique_type_date", _m2_ecos_unique_type_date),
+    Migration(3, "product_natural_keys", _m3_product_natural_keys),
+    Migration(4, "ecos_erm_date_index", _m4_ecos_erm_date_index),
+    Migration(5, "ie_info_unique_key", _m5_ie_info_unique_key),
+]
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def schema_checksum(metadata: MetaData) -> str:
+    """모델 스키마(테이블/컬럼/인덱스/unique 제약) + 마이그레이션 목록의 checksum"""
+    parts = []
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        parts.append(f"T {table.name}")
+        for column in table.columns:
+            try:
+                column_type = str(column.type)
+            except Exception:
+                column_type = type(column.type).__name__
+            parts.append(f"C {column.name} {column_type} {column.nullable}")
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            parts.append(f"I {index.name} {index.unique} {[c.name for c in index.columns]}")
+        for constraint in sorted(table.constraints, key=lambda c: c.name or ""):
+            if constraint.name:
+                parts.append(f"K {constraint.name} {[c.name for c in constraint.columns]}")
+    parts.extend(f"M {migration.version} {migration.name}" for migration in MIGRATIONS)
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _current_state(conn: Connection):
+    if not _has_table(conn, schema_version.name):
+        return 0, None
+    row = conn.execute(
+        schema_version.select().order_by(schema_version.c.version.desc()).limit(1)
+    ).first()
+    return (row.version, row.checksum) if row else (0, None)
+
+
+def bootstrap_schema(engine: Engine, metadata: MetaData) -> BootstrapResult:
+    """
+    애플리케이션 시작 시 스키마를 모델에 맞춤 (기존 데이터는 지우지 않음)
+
+    1) schema_version의 최신 버전/checksum이 현재 코드와 같으면 바로 종료 (조회 1~2회, 데이터 양과 무관)
+    2) 다르면 없는 테이블만 생성하고 (기존 테이블은 건드리지 않음)
+    3) 기록된 버전 이후의 마이그레이션을 순서대로 적용한 뒤 버전/checksum을 기록한다.
+    """
+    started = time.perf_counter()
+    checksum = schema_checksum(metadata)
+
+    with engine.connect() as conn:
+        version, recorded = _current_state(conn)
+    if version == LATEST_VERSION and recorded == checksum:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"⏱️ [SCHEMA] 최신 스키마 v{version} 확인 ({elapsed_ms:.1f}ms)")
+        return BootstrapResult(up_to_date=True, version=version, elapsed_ms=elapsed_ms)
+
+    result = BootstrapResult(up_to_date=False, version=version)
+    with engine.begin() as conn:
+        locked = engine.dialect.name == "mysql"
+        if locked:
+            conn.execute(text("SELECT GET_LOCK(:name, :timeout)"),
+                         {"name": BOOTSTRAP_LOCK_NAME, "timeout": BOOTSTRAP_LOCK_TIMEOUT})
+        try:
+            # 잠금을 기다리는 동안 다른 인스턴스가 적용했을 수 있으므로 다시 확인
+            version, recorded = _current_state(conn)
+
+            existing = set(inspect(conn).get_table_names())
+            result.created_tables = sorted(name for name in metadata.tables if name not in existing)
+            metadata.create_all(bind=conn, checkfirst=True)
+            _version_metadata.create_all(bind=conn, checkfirst=True)
+
+            if version > LATEST_VERSION:
+                logger.warning(f"⚠️ [SCHEMA] DB 스키마 v{version}이 코드(v{LATEST_VERSION})보다 최신 - 마이그레이션 생략")
+
+            for migration in MIGRATIONS:
+                if migration.version <= version:
+                    continue
+                migration_started = time.perf_counter()
+                migration.apply(conn)
+                conn.execute(schema_version.insert().values(
+                    version=migration.version,
+                    name=migration.name,
+                    checksum=checksum,
+                    applied_at=datetime.utcnow(),
+                    elapsed_ms=round((time.perf_counter() - migration_started) * 1000, 3)
+                ))
+                result.applied.append(f"v{migration.version} {migration.name}")
+                logger.info(f"🛠️ [SCHEMA] 마이그레이션 v{migration.version} {migration.name} 적용")
+
+            result.version = max(version, LATEST_VERSION)
+            # 마이그레이션 없이 모델만 바뀐 경우(새 테이블 등)에도 최신 행의 checksum을 갱신
+            conn.execute(
+                schema_version.update()
+                .where(schema_version.c.version == result.version)
+                .values(checksum=checksum)
+            )
+        finally:
+            if locked:
+                conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": BOOTSTRAP_LOCK_NAME})
+
+    result.elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(
+        f"⏱️ [SCHEMA] 스키마 v{result.version} 적용 완료 ({result.elapsed_ms:.1f}ms): "
+        f"생성 테이블 {result.created_tables or '-'}, 마이그레이션 {result.applied or '-'}"
+    )
+    return result
@@ -5,6 +5,8 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+from config.database.sql_metrics import SqlMetrics
+
 load_dotenv()
 
 password = urllib.parse.quote_plus(os.getenv("MYSQL_PASSWORD"))
@@ -14,15 +16,52 @@ DATABASE_URL = (
     f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
 )
 
+# 커넥션 풀 설정
+# - POOL_SIZE / MAX_OVERFLOW: 유지할 커넥션 수 / 일시적으로 추가 허용할 커넥션 수
+#   (스레드풀에서 동시에 실행되는 요청 수 + 백그라운드 작업 수를 감당할 수 있도록 설정)
+# - POOL_TIMEOUT: 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간 (초)
+# - POOL_RECYCLE: MySQL wait_timeout 전에 오래된 커넥션을 교체하는 주기 (초)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# 쿼리 로그 출력 여부 (모든 SQL을 그대로 출력하므로 디버깅 시에만 사용, 평소에는 SqlMetrics 집계로 확인)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True
+    echo=DB_ECHO,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE
 )
 
+SqlMetrics.install(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 def get_db_session():
+    """
+    작업 단위(Repository 메서드 한 번)마다 새 세션 생성
+
+    세션은 스레드/요청 간에 공유하지 않는다. 호출자는 작업이 끝나면 반드시 close() 하여
+    커넥션을 풀에 반환해야 한다.
+    """
     return SessionLocal()
+
+
+def get_db_pool_statistics() -> dict:
+    """DB 커넥션 풀 사용 현황 (모니터링용)"""
+    pool = engine.pool
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow()
+    }
@@ -0,0 +1,207 @@
+"""
+SQL 실행 계측 (SQL Metrics)
+SQLAlchemy 이벤트 훅으로 HTTP 요청/스케줄러 작업 단위의 쿼리 수, DB 시간, 가장 느린 쿼리를 집계하고
+같은 형태의 쿼리가 반복되는 N+1 패턴을 탐지한다
+"""
+
+import contextvars
+import functools
+import os
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+_PARAM_LIST_PATTERN = re.compile(r"\((?:\s*%\(\w+\)s\s*,?)+\)")
+_PARAM_PATTERN = re.compile(r"%\(\w+\)s|%s|\?")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _statement_shape(statement: str) -> str:
+    """파라미터 이름/개수와 공백 차이를 없앤 쿼리 형태 (같은 형태 = 같은 쿼리 반복)"""
+    shape = _PARAM_LIST_PATTERN.sub("(?)", statement)
+    shape = _PARAM_PATTERN.sub("?", shape)
+    return _WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+class SqlScope:
+    """요청/작업 하나의 SQL 실행 기록 (DB 스레드풀의 여러 스레드에서 함께 갱신될 수 있음)"""
+
+    def __init__(self, kind: str, name: str):
+        self.kind = kind
+        self.name = name
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement = ""
+        self.shapes: Counter = Counter()
+        self.lock = threading.Lock()
+
+    def record(self, shape: str, elapsed_ms: float):
+        with self.lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.shapes[shape] += 1
+            if elapsed_ms > self.slowest_ms:
+                self.slowest_ms, self.slowest_statement = elapsed_ms, shape
+
+
+class SqlMetrics:
+    """
+    - 엔진의 before/after_cursor_execute 훅에서 실행 시간을 재고 현재 scope(ContextVar)에 기록한다.
+    - scope는 HTTP 미들웨어(request)와 스케줄러 작업(job)이 연다. scope 밖의 쿼리(consumer, 시작 시 DDL 등)는 unscoped로 집계한다.
+    - scope가 끝날 때 같은 형태의 쿼리가 N_PLUS_ONE_THRESHOLD번 이상 실행되었으면 N+1로 기록하고 경고를 남긴다.
+    - SLOW_QUERY_MS 이상 걸린 쿼리는 실행 즉시 경고를 남긴다.
+    """
+
+    N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+    SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+    MAX_RECENT = 50  # 최근 N+1 탐지 기록 보관 개수
+    MAX_STATEMENT_LENGTH = 300  # 통계/로그에 남길 쿼리 길이
+
+    _current: contextvars.ContextVar = contextvars.ContextVar("sql_metrics_scope", default=None)
+
+    _scopes: Dict[str, Dict[str, Any]] = {}
+    _unscoped = {"queries": 0, "db_ms": 0.0}
+    _recent_n_plus_one: deque = deque(maxlen=MAX_RECENT)
+    _lock = threading.Lock()
+
+    # -----------------------------
+    # 엔진 훅
+    # -----------------------------
+    @classmethod
+    def install(cls, engine):
+        """엔진에 계측 훅 등록 (config.database.session에서 엔진 생성 직후 호출)"""
+        event.listen(engine, "before_cursor_execute", cls._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", cls._after_cursor_execute)
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("sql_metrics_start", []).append(time.perf_counter())
+
+    @classmethod
+    def _after_cursor_execute(cls, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("sql_metrics_start")
+        if not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+        shape = _statement_shape(statement)
+
+        scope: Optional[SqlScope] = cls._current.get()
+        if scope is not None:
+            scope.record(shape, elapsed_ms)
+        else:
+            with cls._lock:
+                cls._unscoped["queries"] += 1
+                cls._unscoped["db_ms"] += elapsed_ms
+
+        if elapsed_ms >= cls.SLOW_QUERY_MS:
+            where = f"{scope.kind} {scope.name}" if scope is not None else "unscoped"
+            logger.warning(f"🐢 [SQL] 느린 쿼리 {elapsed_ms:.1f}ms ({where}): {shape[:cls.MAX_STATEMENT_LENGTH]}")
+
+    # -----------------------------
+    # scope
+    # -----------------------------
+    @classmethod
+    @contextmanager
+    def scope(cls, kind: str, name: str = ""):
+        """
+        요청/작업 단위 계측 범위
+
+        블록 안에서 실행된 쿼리는 (DB 스레드풀에서 실행되어도) 이 scope에 기록된다.
+        이름은 블록 안에서 scope.name으로 바꿀 수 있다. (라우트가 정해진 뒤 경로 템플릿으로 지정)
+        """
+        current = SqlScope(kind, name)
+        token = cls._current.set(current)
+        try:
+            yield current
+        finally:
+            cls._current.reset(token)
+            cls._finish(current)
+
+    @classmethod
+    def track_job(cls, func):
+        """스케줄러 작업(async 함수)을 job scope로 감싸는 데코레이터"""
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with cls.scope("job", func.__name__):
+                return await func(*args, **kwargs)
+        return wrapper
+
+    @classmethod
+    def _finish(cls, scope: SqlScope):
+        if scope.count == 0:
+            return
+
+        repeated = [
+            (shape, count) for shape, count in scope.shapes.most_common()
+            if count >= cls.N_PLUS_ONE_THRESHOLD
+        ]
+        key = f"{scope.kind}:{scope.name}"
+        with cls._lock:
+            stats = cls._scopes.setdefault(key, {
+                "kind": scope.kind, "name": scope.name,
+                "calls": 0, "queries": 0, "db_ms": 0.0, "max_queries": 0,
+                "slowest_ms": 0.0, "slowest_statement": "", "n_plus_one": 0
+            })
+            stats["calls"] += 1
+            stats["queries"] += scope.count
+            stats["db_ms"] += scope.total_ms
+            stats["max_queries"] = max(stats["max_queries"], scope.count)
+            if scope.slowest_ms > stats["slowest_ms"]:
+                stats["slowest_ms"] = scope.slowest_ms
+                stats["slowest_statement"] = scope.slowest_statement[:cls.MAX_STATEMENT_LENGTH]
+            if repeated:
+                stats["n_plus_one"] += 1
+                for shape, count in repeated:
+                    cls._recent_n_plus_one.append({
+                        "scope": key,
+                        "statement": shape[:cls.MAX_STATEMENT_LENGTH],
+                        "count": count,
+                        "at": datetime.now().isoformat(timespec="seconds")
+                    })
+
+        logger.debug(
+            f"[SQL] {scope.kind} {scope.name}: {scope.count}건, {scope.total_ms:.1f}ms "
+            f"(최장 {scope.slowest_ms:.1f}ms)"
+        )
+        for shape, count in repeated:
+            logger.warning(
+                f"⚠️ [SQL] N+1 의심 ({scope.kind} {scope.name}): 같은 쿼리 {count}회 실행 - "
+                f"{shape[:cls.MAX_STATEMENT_LENGTH]}"
+            )
+
+    # -----------------------------
+    # 통계
+    # -----------------------------
+    @classmethod
+    def get_statistics(cls) -> Dict[str, Any]:
+        with cls._lock:
+            scopes = []
+            for stats in cls._scopes.values():
+                entry = dict(stats)
+                entry["avg_queries"] = round(entry["queries"] / entry["calls"], 2)
+                entry["avg_db_ms"] = round(entry["db_ms"] / entry["calls"], 3)
+                entry["db_ms"] = round(entry["db_ms"], 3)
+                entry["slowest_ms"] = round(entry["slowest_ms"], 3)
+                scopes.append(entry)
+            unscoped = {"queries": cls._unscoped["queries"], "db_ms": round(cls._unscoped["db_ms"], 3)}
+            recent = list(cls._recent_n_plus_one)
+
+        scopes.sort(key=lambda entry: entry["db_ms"], reverse=True)
+        return {
+            "n_plus_one_threshold": cls.N_PLUS_ONE_THRESHOLD,
+            "slow_query_ms": cls.SLOW_QUERY_MS,
+            "scopes": scopes,
+            "unscoped": unscoped,
+            "recent_n_plus_one": recent
+        }
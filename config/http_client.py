@@ -0,0 +1,56 @@
+import os
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 외부 API(OAuth, 오픈뱅킹 등) 호출용 공용 HTTP 커넥션 풀 설정
+# - MAX_CONNECTIONS / MAX_KEEPALIVE: 호스트 전체 동시 연결 수 / 재사용을 위해 유지할 유휴 연결 수
+# - CONNECT_TIMEOUT / READ_TIMEOUT / POOL_TIMEOUT: 외부 서버 지연 시 요청이 무한정 멈추지 않도록 제한
+# - RETRIES: 연결 실패(ConnectError)만 재시도 (요청이 전송된 후의 오류는 재시도하지 않음)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "5"))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))
+
+# 비동기 HTTP 클라이언트 인스턴스 (Singleton)
+_async_http_client = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    공용 비동기 HTTP 클라이언트 (FastAPI async 핸들러용)
+
+    같은 호스트로의 TLS 연결을 재사용하므로 요청마다 클라이언트를 만들지 않는다.
+    """
+    global _async_http_client
+    if _async_http_client is None or _async_http_client.is_closed:
+        _async_http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                HTTP_READ_TIMEOUT,
+                connect=HTTP_CONNECT_TIMEOUT,
+                pool=HTTP_POOL_TIMEOUT
+            ),
+            # transport를 직접 지정하면 클라이언트의 limits는 무시되므로 transport에 설정
+            transport=httpx.AsyncHTTPTransport(
+                retries=HTTP_RETRIES,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+                )
+            )
+        )
+    return _async_http_client
+
+
+async def close_async_http_client():
+    """애플리케이션 종료 시 커넥션 풀 정리"""
+    global _async_http_client
+    if _async_http_client is not None:
+        client, _async_http_client = _async_http_client, None
+        await client.aclose()
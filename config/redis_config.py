@@ -1,7 +1,16 @@
 import os
+import threading
+from typing import Dict, List, Optional
 
 import redis
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+from redis.retry import Retry
+
+from config.redis_ring import ConsistentHashRing
 
 load_dotenv()
 
@@ -10,17 +19,248 @@ REDIS_PORT = int(os.getenv("REDIS_PORT"))
 REDIS_DB = int(os.getenv("REDIS_DB"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 
-# Redis 인스턴스 생성 (Singleton)
-_redis_instance = None
-
-def get_redis() -> redis.Redis:
-    global _redis_instance
-    if _redis_instance is None:
-        _redis_instance = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            db=REDIS_DB,
-            password=REDIS_PASSWORD,
-            decode_responses=True
-        )
-    return _redis_instance
+# 커넥션 풀 설정
+# - MAX_CONNECTIONS: 풀 최대 커넥션 수 (초과 요청은 POOL_TIMEOUT 동안 대기)
+# - SOCKET_TIMEOUT / CONNECT_TIMEOUT: Redis 응답 지연 시 요청이 무한정 멈추지 않도록 제한
+# - HEALTH_CHECK_INTERVAL: 유휴 커넥션 재사용 전 PING 확인 주기 (끊어진 커넥션 재사용 방지)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+REDIS_RETRIES = int(os.getenv("REDIS_RETRIES", "2"))
+
+# 일시적인 연결 끊김/타임아웃만 재시도 (명령 오류는 재시도하지 않음)
+_RETRY_ON_ERROR = [RedisConnectionError, RedisTimeoutError]
+
+
+# 샤드 노드 설정 ("host:port/db" 콤마 구분, 미설정 시 REDIS_HOST/PORT/DB 단일 노드)
+# - REDIS_NODES: 세션 키 (session_id, session_version:{sid} 등) 샤드 - session_id 기준 consistent hashing
+# - REDIS_CACHE_NODES: AI 응답/분류/레이아웃 캐시 샤드 - 캐시 키 기준 (미설정 시 REDIS_NODES와 동일)
+# - REDIS_PREVIOUS_NODES: 노드 추가/제거 직전의 세션 노드 목록 (설정 시 이전 담당 노드에서 세션을 옮겨옴)
+# 로컬 테스트: redis-server --port 6380 & redis-server --port 6381 후 REDIS_NODES=localhost:6379,localhost:6380,localhost:6381
+def _parse_nodes(value: Optional[str]) -> List[str]:
+    nodes = []
+    for item in (value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        address, _, db = item.partition("/")
+        host, _, port = address.rpartition(":")
+        if not host:
+            host, port = address, str(REDIS_PORT)
+        nodes.append(f"{host}:{int(port)}/{int(db) if db else REDIS_DB}")
+    return nodes
+
+
+REDIS_NODES = _parse_nodes(os.getenv("REDIS_NODES")) or [f"{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"]
+REDIS_CACHE_NODES = _parse_nodes(os.getenv("REDIS_CACHE_NODES")) or REDIS_NODES
+REDIS_PREVIOUS_NODES = _parse_nodes(os.getenv("REDIS_PREVIOUS_NODES"))
+
+_session_ring = ConsistentHashRing(REDIS_NODES)
+_cache_ring = ConsistentHashRing(REDIS_CACHE_NODES)
+_previous_ring = (
+    ConsistentHashRing(REDIS_PREVIOUS_NODES)
+    if REDIS_PREVIOUS_NODES and REDIS_PREVIOUS_NODES != REDIS_NODES else None
+)
+
+
+def _connection_kwargs(node: str) -> dict:
+    address, _, db = node.partition("/")
+    host, _, port = address.rpartition(":")
+    return {
+        "host": host,
+        "port": int(port),
+        "db": int(db),
+        "password": REDIS_PASSWORD,
+        "decode_responses": True,
+        "max_connections": REDIS_MAX_CONNECTIONS,
+        "timeout": REDIS_POOL_TIMEOUT,
+        "socket_timeout": REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": REDIS_CONNECT_TIMEOUT,
+        "socket_keepalive": True,
+        "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+    }
+
+
+# 노드별 Redis 인스턴스 (Singleton, 노드당 커넥션 풀 1개)
+_redis_instances: Dict[str, redis.Redis] = {}
+_async_redis_instances: Dict[str, aioredis.Redis] = {}
+_instance_lock = threading.Lock()
+
+# 샤드별 라우팅 횟수 (키 분포 모니터링용)
+_route_stats: Dict[str, Dict[str, int]] = {}
+_route_lock = threading.Lock()
+
+
+def _route(ring: ConsistentHashRing, ring_name: str, key: str) -> str:
+    """
+    키를 담당하는 노드
+
+    키 없이 첫 번째 노드로 보내면 전역 데이터가 모두 한 노드에 몰리고, 키를 빠뜨린 세션 데이터가
+    다른 샤드에 조용히 저장되므로 키는 필수이다. (전역 데이터는 자기 키 이름으로 라우팅)
+    """
+    if not key:
+        raise ValueError(f"Redis {ring_name} 샤드 라우팅에는 키가 필요합니다.")
+    node = ring.get_node(key)
+    with _route_lock:
+        counters = _route_stats.setdefault(node, {})
+        counters[ring_name] = counters.get(ring_name, 0) + 1
+    return node
+
+
+def get_redis_for_node(node: str) -> redis.Redis:
+    """특정 노드의 동기 클라이언트 (샤드 마이그레이션/통계용)"""
+    client = _redis_instances.get(node)
+    if client is None:
+        with _instance_lock:
+            client = _redis_instances.get(node)
+            if client is None:
+                pool = redis.BlockingConnectionPool(**_connection_kwargs(node))
+                client = redis.Redis(
+                    connection_pool=pool,
+                    retry=Retry(ExponentialBackoff(cap=0.5, base=0.05), REDIS_RETRIES),
+                    retry_on_error=_RETRY_ON_ERROR
+                )
+                _redis_instances[node] = client
+    return client
+
+
+def get_async_redis_for_node(node: str) -> aioredis.Redis:
+    """
+    특정 노드의 비동기 클라이언트
+
+    커넥션은 첫 명령 실행 시 현재 이벤트 루프에서 생성된다.
+    """
+    client = _async_redis_instances.get(node)
+    if client is None:
+        with _instance_lock:
+            client = _async_redis_instances.get(node)
+            if client is None:
+                pool = aioredis.BlockingConnectionPool(**_connection_kwargs(node))
+                client = aioredis.Redis(
+                    connection_pool=pool,
+                    retry=AsyncRetry(ExponentialBackoff(cap=0.5, base=0.05), REDIS_RETRIES),
+                    retry_on_error=_RETRY_ON_ERROR
+                )
+                _async_redis_instances[node] = client
+    return client
+
+
+def get_redis(shard_key: str) -> redis.Redis:
+    """
+    동기 Redis 클라이언트 (스케줄러, 배치 스크립트, 스레드풀에서 실행되는 코드용)
+
+    shard_key: 세션 데이터는 session_id, 세션과 무관한 전역 데이터(통계 등)는 자기 키 이름을 넘긴다.
+    async 핸들러에서는 이벤트 루프를 막지 않도록 get_async_redis()를 사용한다.
+    """
+    return get_redis_for_node(_route(_session_ring, "session", shard_key))
+
+
+def get_async_redis(shard_key: str) -> aioredis.Redis:
+    """비동기 Redis 클라이언트 (FastAPI async 핸들러용, shard_key는 get_redis와 동일)"""
+    return get_async_redis_for_node(_route(_session_ring, "session", shard_key))
+
+
+def get_cache_redis(key: str) -> redis.Redis:
+    """캐시 샤드 동기 클라이언트 (캐시 키 기준 라우팅)"""
+    return get_redis_for_node(_route(_cache_ring, "cache", key))
+
+
+def get_async_cache_redis(key: str) -> aioredis.Redis:
+    """캐시 샤드 비동기 클라이언트 (캐시 키 기준 라우팅)"""
+    return get_async_redis_for_node(_route(_cache_ring, "cache", key))
+
+
+def get_session_nodes() -> List[str]:
+    """현재 세션 샤드 노드 목록"""
+    return list(_session_ring.nodes)
+
+
+def get_cache_nodes() -> List[str]:
+    """캐시 샤드 노드 목록"""
+    return list(_cache_ring.nodes)
+
+
+def get_previous_session_nodes() -> List[str]:
+    """리밸런싱 중인 이전 세션 노드 목록 (리밸런싱 중이 아니면 빈 목록)"""
+    return list(_previous_ring.nodes) if _previous_ring else []
+
+
+def get_previous_session_node(session_id: str) -> Optional[str]:
+    """리밸런싱 중 이 세션을 이전에 담당하던 노드 (담당 노드가 바뀌지 않았으면 None)"""
+    if _previous_ring is None:
+        return None
+    previous = _previous_ring.get_node(session_id)
+    return previous if previous != _session_ring.get_node(session_id) else None
+
+
+def get_all_nodes() -> List[str]:
+    """세션/캐시/이전 노드 전체 (중복 제거)"""
+    return list(dict.fromkeys(REDIS_NODES + REDIS_CACHE_NODES + get_previous_session_nodes()))
+
+
+async def close_async_redis():
+    """애플리케이션 종료 시 비동기 커넥션 풀 정리"""
+    with _instance_lock:
+        clients = list(_async_redis_instances.values())
+        _async_redis_instances.clear()
+    for client in clients:
+        close = getattr(client, "aclose", None) or client.close  # redis-py 5.0.1 이전 버전 호환
+        await close()
+        await client.connection_pool.disconnect()
+
+
+def _pool_usage(pool) -> dict:
+    """redis-py 버전별 내부 구조 차이를 고려하여 풀 사용량 조회"""
+    if hasattr(pool, "_in_use_connections"):
+        in_use = len(pool._in_use_connections)
+        idle = len(getattr(pool, "_available_connections", []))
+    else:
+        # BlockingConnectionPool (생성된 커넥션 목록 + 대기 큐, 빈 슬롯은 None)
+        created = sum(1 for c in getattr(pool, "_connections", []) if c is not None)
+        queue = getattr(pool, "pool", None)
+        queued = getattr(queue, "queue", None) or getattr(queue, "_queue", None) or []
+        idle = sum(1 for c in list(queued) if c is not None)
+        in_use = created - idle
+    return {"in_use": in_use, "idle": idle}
+
+
+def get_pool_statistics() -> dict:
+    """노드별 커넥션 풀 사용 현황 (모니터링용)"""
+    stats = {"max_connections": REDIS_MAX_CONNECTIONS, "nodes": {}}
+    for name, instances in (("sync", _redis_instances), ("async", _async_redis_instances)):
+        for node, client in list(instances.items()):
+            stats["nodes"].setdefault(node, {})[name] = _pool_usage(client.connection_pool)
+    return stats
+
+
+async def get_shard_statistics() -> dict:
+    """
+    샤드별 키 수/메모리/처리량 + 라우팅 횟수
+
+    노드 하나가 응답하지 않아도 나머지 노드 통계는 반환한다.
+    """
+    with _route_lock:
+        routes = {node: dict(counters) for node, counters in _route_stats.items()}
+
+    shards = {}
+    for node in get_all_nodes():
+        roles = [role for role, nodes in (
+            ("session", REDIS_NODES), ("cache", REDIS_CACHE_NODES), ("previous", get_previous_session_nodes())
+        ) if node in nodes]
+        shard = {"roles": roles, "routes": routes.get(node, {})}
+        try:
+            client = get_async_redis_for_node(node)
+            memory = await client.info("memory")
+            server_stats = await client.info("stats")
+            shard["keys"] = await client.dbsize()
+            shard["used_memory"] = memory.get("used_memory_human")
+            shard["ops_per_sec"] = server_stats.get("instantaneous_ops_per_sec")
+            shard["available"] = True
+        except Exception as e:
+            shard["available"] = False
+            shard["error"] = str(e)
+        shards[node] = shard
+
+    return {"rebalancing": _previous_ring is not None, "shards": shards}
@@ -0,0 +1,51 @@
+"""
+Redis 샤드 라우팅용 Consistent Hash Ring
+노드가 추가/제거되어도 전체 키의 약 1/N만 다른 노드로 이동하도록 가상 노드(virtual node)를 사용한다.
+"""
+
+import bisect
+import hashlib
+from typing import Dict, List, Optional
+
+
+class ConsistentHashRing:
+    """
+    md5 기반 consistent hash ring
+
+    - 노드마다 VIRTUAL_NODES개의 점을 링에 배치하여 키 분포를 고르게 한다.
+    - 같은 노드 목록이면 프로세스/서버가 달라도 항상 같은 노드로 라우팅된다. (파이썬 hash()는 프로세스마다 달라 사용하지 않음)
+    """
+
+    VIRTUAL_NODES = 160
+
+    def __init__(self, nodes: List[str], virtual_nodes: Optional[int] = None):
+        if not nodes:
+            raise ValueError("Redis 노드가 최소 1개 이상 필요합니다.")
+        self.nodes = list(dict.fromkeys(nodes))  # 순서 유지 + 중복 제거
+        self.virtual_nodes = virtual_nodes or self.VIRTUAL_NODES
+
+        ring: Dict[int, str] = {}
+        for node in self.nodes:
+            for i in range(self.virtual_nodes):
+                ring[self._hash(f"{node}#{i}")] = node
+        self._points = sorted(ring)
+        self._owners = [ring[point] for point in self._points]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+    def get_node(self, key: str) -> str:
+        """키를 담당하는 노드 (링에서 키 해시 이후 첫 번째 점의 노드)"""
+        if len(self.nodes) == 1:
+            return self.nodes[0]
+        index = bisect.bisect(self._points, self._hash(key))
+        if index == len(self._points):
+            index = 0
+        return self._owners[index]
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
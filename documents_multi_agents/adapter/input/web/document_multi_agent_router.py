@@ -1,25 +1,43 @@
 import asyncio
 import io
+import json
 import re
+import time
 import uuid
+from datetime import datetime
+from typing import BinaryIO
 
-from fastapi import APIRouter, Depends, UploadFile, HTTPException, Form, Response, Header, Request
+from fastapi import APIRouter, Depends, UploadFile, HTTPException, Form, Response, Header, Request, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from openai import OpenAI
 from pypdf import PdfReader
 
-from account.adapter.input.web.session_helper import get_current_user
+from account.adapter.input.web.session_helper import get_admin_user, get_current_user
 from config.crypto import Crypto
-from config.redis_config import get_redis
+from config.database.db_executor import get_db_executor_statistics, run_db
+from config.database.session import get_db_pool_statistics
+from config.database.sql_metrics import SqlMetrics
+from config.redis_config import get_async_redis, get_pool_statistics, get_shard_statistics
 from documents_multi_agents.adapter.input.web.request.insert_income_request import InsertDocumentRequest
+from documents_multi_agents.domain.service.category_cache import CategoryCache
+from documents_multi_agents.domain.service.derived_view_precomputer import DerivedViewPrecomputer
+from documents_multi_agents.domain.service.document_compactor import DocumentCompactor
+from documents_multi_agents.domain.service.layout_table_extractor import LayoutTableExtractor
+from documents_multi_agents.domain.service.layout_template_store import LayoutTemplateStore
 from documents_multi_agents.domain.service.prompt_templates import PromptTemplates
 from util.cache.ai_cache import AICache
 from util.log.log import Log
+from util.file.upload_file import open_upload
+from util.session.session_data_loader import load_session_data_async
+from util.session.session_shard_migrator import SessionShardMigrator
+from util.session.session_version import SessionVersion
+from util.stream.session_change_stream import SessionChangeStream
 from util.security.crsf import generate_csrf_token, verify_csrf_token, CSRF_COOKIE_NAME
 
 log_util = Log()
 logger = Log.get_logger()
 documents_multi_agents_router = APIRouter(tags=["documents_multi_agents_router"])
-redis_client = get_redis()
 client = OpenAI()
 crypto = Crypto.get_instance()
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
@@ -42,6 +60,14 @@ def extract_text_from_pdf_clean(file_bytes: bytes) -> str:
         raise HTTPException(status_code=400, detail=f"PDF parsing error: {str(e)}")
 
 
+def load_pdf_reader(stream: BinaryIO) -> PdfReader:
+    """Starlette가 받아 둔 업로드 파일(임시 파일 또는 메모리 버퍼)을 복사 없이 PdfReader로 연다"""
+    try:
+        return PdfReader(stream)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"PDF parsing error: {str(e)}")
+
+
 # -----------------------
 # GPT 호출 래퍼 (기존)
 # -----------------------
@@ -78,6 +104,236 @@ async def qa_on_document(document: str, question: str, role: str) -> str:
     return (await ask_gpt(prompt, max_tokens=2500)).strip()
 
 
+# -----------------------
+# 문서 추출 파이프라인
+# -----------------------
+def get_extraction_prompt(type_of_doc: str) -> tuple[str, str]:
+    """type_of_doc에 따라 추출 프롬프트 분기 (question, role)"""
+    if "소득" in type_of_doc or "income" in type_of_doc.lower():
+        extraction_question = (
+            "PDF에서 소득 관련 항목과 금액만 추출해줘. "
+            "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
+            "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
+            "예시: "
+            "급여: 3000000 "
+            "식대: 200000 "
+            "상여: 500000"
+        )
+        extraction_role = (
+            "소득 항목만 포함: 급여, 상여, 식대, 수당, 총급여, 이자소득, 배당소득 "
+            "절대 제외: 보험료, 세금, 공제액 등 차감/지출 항목 "
+            "추론 금지, 문서 내 데이터만 사용 "
+            "월별 구분 있으면 합계만 사용 "
+            "설명문, 주석 절대 금지 - 순수 데이터만 반환"
+        )
+    elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
+        extraction_question = (
+            "PDF에서 지출 관련 항목과 금액만 추출해줘. "
+            "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
+            "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
+            "예시: "
+            "국민연금보험료: 500000 "
+            "신용카드: 1000000 "
+            "건강보험료: 300000"
+        )
+        extraction_role = (
+            "지출 항목만 포함: 보험료, 카드사용액, 세금, 공과금, 대출, 월세, 통신비 "
+            "절대 제외: 급여, 소득, 수당 등 수입 항목 "
+            "추론 금지, 문서 내 데이터만 사용 "
+            "월별 구분 있으면 합계만 사용 "
+            "설명문, 주석 절대 금지 - 순수 데이터만 반환"
+        )
+    else:
+        # 타입을 모를 경우 기본 프롬프트
+        extraction_question = (
+            "PDF의 항목과 금액을 추출해줘. "
+            "형식: 항목명: 금액 (한 줄에 하나씩)"
+        )
+        extraction_role = (
+            "문서 내 모든 금액 찾기 "
+            "월별 구분 있으면 합계만 사용 "
+            "설명문 금지 - 순수 데이터만"
+        )
+    return extraction_question, extraction_role
+
+
+def parse_extraction_answer(answer: str) -> dict[str, str]:
+    """"항목: 금액" 형식 응답을 파싱하고 합계성 중복 항목 제거"""
+    # AI 응답 전처리: 마크다운, 설명문 제거
+    answer = answer.replace("**", "")  # 볼드 제거
+    answer = answer.replace("*", "")  # 이탤릭 제거
+    answer = re.sub(r'※.*', '', answer)  # 주석 제거
+    answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+
+    pattern = re.compile(r'([가-힣\w\s]+)\s*:\s*(-?[\d,]+)')  # 음수 금액(정산 차감 등)은 부호 유지
+    matches = list(pattern.finditer(answer))
+
+    logger.info(f"[DEBUG] Pattern matches found: {len(matches)}")
+
+    extracted_items = {}
+    duplicate_keywords = ["총급여", "총소득", "합계", "총합", "총액"]  # 중복 가능성 있는 키워드
+
+    for match in matches:
+        field, value = match.groups()
+        field_clean = field.strip()
+        value_clean = value.replace(",", "").strip()
+
+        # 중복 체크: 같은 금액의 유사 항목이 이미 있으면 스킵
+        is_duplicate = False
+        for existing_field, existing_value in extracted_items.items():
+            if value_clean == existing_value:  # 금액이 같고
+                # 하나가 다른 하나의 "합계" 버전이면 중복으로 간주
+                if any(keyword in field_clean for keyword in duplicate_keywords) or \
+                        any(keyword in existing_field for keyword in duplicate_keywords):
+                    is_duplicate = True
+                    logger.info(f"[DEBUG] Duplicate found: {field_clean} ")
+                    break
+
+        if is_duplicate:
+            continue
+
+        extracted_items[field_clean] = value_clean
+
+    return extracted_items
+
+
+async def extract_document_items(stream: BinaryIO, type_of_doc: str) -> dict:
+    """
+    PDF 한 건에서 "항목: 금액" 추출
+
+    1. 좌표 기반 표 추출 (신뢰도 충분하면 GPT 생략)
+    2. 학습된 레이아웃 템플릿 적용
+    3. 문서 압축 후 GPT 추출 (추출 성공 시 템플릿 학습)
+
+    Returns:
+        {"items": {...}, "extraction_method": "layout" | "template" | "gpt", "compaction": CompactionResult | None}
+    """
+    loop = asyncio.get_event_loop()
+    reader = load_pdf_reader(stream)
+
+    # 1. 좌표 기반 표 추출 (일반 텍스트 추출과 한 번에 수행, CPU 작업이므로 executor에서 실행)
+    table_extractor = LayoutTableExtractor()
+    try:
+        table = await loop.run_in_executor(None, table_extractor.extract, reader, type_of_doc)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"PDF parsing error: {str(e)}")
+
+    if not any(table.page_texts):
+        raise HTTPException(400, "No text extracted")
+
+    # 표 인식 신뢰도가 충분하면 GPT 추출 생략
+    # 아니면 같은 양식으로 학습된 레이아웃 템플릿이 있는지 확인
+    # (템플릿 저장소는 동기 Redis 클라이언트를 사용하므로 지문 계산과 함께 executor에서 실행)
+    template_store = LayoutTemplateStore(table_extractor)
+    fingerprint = await loop.run_in_executor(None, template_store.fingerprint, table.pages, type_of_doc)
+    template_items = None
+
+    if table_extractor.is_confident(table):
+        extraction_method = "layout"
+    else:
+        template_items = await loop.run_in_executor(None, template_store.match, fingerprint, table.pages)
+        extraction_method = "template" if template_items else "gpt"
+    LayoutTableExtractor.record_outcome(extraction_method)
+
+    compaction = None
+    if extraction_method == "layout":
+        logger.info(f"Layout table extracted: {len(table.items)} items "
+                    f"(confidence {table.confidence:.2f}) - skipping GPT extraction")
+        answer = table.to_answer()
+    elif extraction_method == "template":
+        logger.info(f"Layout template matched: {len(template_items)} items - skipping GPT extraction")
+        answer = "\n".join(f"{label}: {amount}" for label, amount in template_items)
+    else:
+        # 문서 압축 (반복 머리말/꼬리말, 금액·키워드 없는 줄 제거)
+        compaction = await loop.run_in_executor(None, lambda: DocumentCompactor().compact(table.page_texts))
+        text = compaction.text
+
+        logger.info(f"Extracted text length: {len(text)} "
+                    f"(tokens {compaction.tokens_before} → {compaction.tokens_after})")
+
+        # QA (요약 기반)
+        extraction_question, extraction_role = get_extraction_prompt(type_of_doc)
+        answer = await qa_on_document(text, extraction_question, extraction_role)
+
+    extracted_items = parse_extraction_answer(answer)
+
+    # GPT로 추출한 결과는 레이아웃 템플릿으로 학습 (다음 달 같은 양식은 로컬 추출)
+    if extraction_method == "gpt" and extracted_items:
+        try:
+            await loop.run_in_executor(
+                None, template_store.learn, fingerprint, table.pages, type_of_doc, extracted_items
+            )
+        except Exception as e:
+            logger.error(f"Failed to learn layout template (non-critical): {str(e)}")
+
+    return {
+        "items": extracted_items,
+        "extraction_method": extraction_method,
+        "compaction": compaction
+    }
+
+
+async def categorize_in_threads(analyzer, income_items: dict, expense_items: dict) -> tuple[dict, dict]:
+    """
+    소득/지출 카테고리 분류를 스레드에서 동시에 실행
+
+    _categorize_*는 OpenAI/Redis를 동기로 호출하므로 이벤트 루프에서 직접 부르면
+    다른 요청과 /dashboard 섹션 동시 계산이 모두 멈춘다. 항목이 없으면 호출하지 않는다.
+    """
+    async def categorize(func, items: dict) -> dict:
+        return await asyncio.to_thread(func, items) if items else {}
+
+    income_categorized, expense_categorized = await asyncio.gather(
+        categorize(analyzer._categorize_income, income_items),
+        categorize(analyzer._categorize_expense, expense_items)
+    )
+    return income_categorized, expense_categorized
+
+
+async def categorize_by_doc_type(analyzer, type_of_doc: str, items: dict) -> dict:
+    """문서 하나의 항목을 문서 타입(소득/지출)에 맞게 분류 (타입을 모르면 원본 항목만 반환)"""
+    if "소득" in type_of_doc or "income" in type_of_doc.lower():
+        income_categorized, _ = await categorize_in_threads(analyzer, items, {})
+        return income_categorized
+    if "지출" in type_of_doc or "expense" in type_of_doc.lower():
+        _, expense_categorized = await categorize_in_threads(analyzer, {}, items)
+        return expense_categorized
+    return {"raw_items": items}
+
+
+async def save_items_to_redis(session_id: str, documents: list[tuple[str, dict[str, str]]]) -> int:
+    """
+    추출 항목을 암호화하여 한 번의 pipeline으로 Redis에 저장
+
+    같은 pipeline에서 데이터 버전을 올리고 세션 변경 이벤트를 발행한다.
+    IE_INFO 저장과 파생 뷰 사전 계산은 이벤트 consumer가 요청과 별도로 처리한다.
+
+    Args:
+        documents: [(type_of_doc, {항목: 금액}), ...]
+
+    Returns:
+        저장한 항목 수
+    """
+    mapping = {}
+    doc_types = []
+    for type_of_doc, items in documents:
+        doc_types.append(type_of_doc)
+        for field_clean, value_clean in items.items():
+            # 암호화된 키/값 생성
+            encrypted_key = crypto.enc_data(f"{type_of_doc}:{field_clean}")
+            mapping[encrypted_key] = crypto.enc_data(value_clean)
+
+    pipe = get_async_redis(session_id).pipeline()
+    if mapping:
+        pipe.hset(session_id, mapping=mapping)
+    pipe.expire(session_id, 24 * 60 * 60)
+    SessionChangeStream.publish(pipe, session_id, doc_types, list(mapping))
+    await pipe.execute()
+
+    logger.info(f"Saved {len(mapping)} items to Redis in one pipeline")
+    return len(mapping)
+
+
 # -----------------------
 # API 엔드포인트
 # -----------------------
@@ -104,134 +360,22 @@ async def analyze_document(
             samesite="lax"
         )
 
-        content = await file.read()
-        if not content:
-            raise HTTPException(400, "Empty file upload")
-
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(413, "File too large")
-
-        text = extract_text_from_pdf_clean(content)
-        if not text:
-            raise HTTPException(400, "No text extracted")
-
-        logger.info(f"Extracted text length: {len(text)}")
-
-        # 2. QA (요약 기반)
-        # type_of_doc에 따라 프롬프트 분기
-        if "소득" in type_of_doc or "income" in type_of_doc.lower():
-            extraction_question = (
-                "PDF에서 소득 관련 항목과 금액만 추출해줘. "
-                "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
-                "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
-                "예시: "
-                "급여: 3000000 "
-                "식대: 200000 "
-                "상여: 500000"
-            )
-            extraction_role = (
-                "소득 항목만 포함: 급여, 상여, 식대, 수당, 총급여, 이자소득, 배당소득 "
-                "절대 제외: 보험료, 세금, 공제액 등 차감/지출 항목 "
-                "추론 금지, 문서 내 데이터만 사용 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문, 주석 절대 금지 - 순수 데이터만 반환"
-            )
-        elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
-            extraction_question = (
-                "PDF에서 지출 관련 항목과 금액만 추출해줘. "
-                "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
-                "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
-                "예시: "
-                "국민연금보험료: 500000 "
-                "신용카드: 1000000 "
-                "건강보험료: 300000"
-            )
-            extraction_role = (
-                "지출 항목만 포함: 보험료, 카드사용액, 세금, 공과금, 대출, 월세, 통신비 "
-                "절대 제외: 급여, 소득, 수당 등 수입 항목 "
-                "추론 금지, 문서 내 데이터만 사용 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문, 주석 절대 금지 - 순수 데이터만 반환"
-            )
-        else:
-            # 타입을 모를 경우 기본 프롬프트
-            extraction_question = (
-                "PDF의 항목과 금액을 추출해줘. "
-                "형식: 항목명: 금액 (한 줄에 하나씩)"
-            )
-            extraction_role = (
-                "문서 내 모든 금액 찾기 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문 금지 - 순수 데이터만"
-            )
-
-        answer = await qa_on_document(text, extraction_question, extraction_role)
-
-        # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")  # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
-
-        pattern = re.compile(r'([가-힣\w\s]+)\s*:\s*([\d,]+)')
-        matches = list(pattern.finditer(answer))
-
-        logger.info(f"[DEBUG] Pattern matches found: {len(matches)}")
-
-        # 추출된 항목들을 저장하고 동시에 수집
-        extracted_items = {}
-        duplicate_keywords = ["총급여", "총소득", "합계", "총합", "총액"]  # 중복 가능성 있는 키워드
+        # 파일 크기 확인 후 Starlette가 받아 둔 임시 파일을 그대로 사용 (복사 없음)
+        async with open_upload(file, MAX_FILE_SIZE) as stream:
+            extraction = await extract_document_items(stream, type_of_doc)
+        extracted_items = extraction["items"]
+        compaction = extraction["compaction"]
 
+        # 추출된 항목 저장
         try:
-            for match in matches:
-                field, value = match.groups()
-                field_clean = field.strip()
-                value_clean = value.replace(",", "").strip()
-
-                # 중복 체크: 같은 금액의 유사 항목이 이미 있으면 스킵
-                is_duplicate = False
-                for existing_field, existing_value in extracted_items.items():
-                    if value_clean == existing_value:  # 금액이 같고
-                        # 하나가 다른 하나의 "합계" 버전이면 중복으로 간주
-                        if any(keyword in field_clean for keyword in duplicate_keywords) or \
-                                any(keyword in existing_field for keyword in duplicate_keywords):
-                            is_duplicate = True
-                            logger.info(f"[DEBUG] Duplicate found: {field_clean} ")
-                            break
-
-                if is_duplicate:
-                    continue
-
-                # 암호화된 키/값 생성
-                encrypted_key = crypto.enc_data(f"{type_of_doc}:{field_clean}")
-                encrypted_value = crypto.enc_data(value_clean)
-
-                # Redis에 저장
-                redis_client.hset(
-                    session_id,
-                    encrypted_key,
-                    encrypted_value
-                )
-
-                # 저장 확인
-                saved_value = redis_client.hget(session_id, encrypted_key)
-                logger.info(f"Saved successfully: {saved_value is not None}")
-
-                # 응답용 데이터 수집
-                extracted_items[field_clean] = value_clean
-
+            await save_items_to_redis(session_id, [(type_of_doc, extracted_items)])
         except Exception as e:
             logger.error(f"[ERROR] Failed to save to Redis: {str(e)}")
             import traceback
             traceback.print_exc()
+            extracted_items = {}
 
-        redis_client.expire(session_id, 24 * 60 * 60)
-
-        # 🔥 새 문서 업로드 시 기존 캐시 무효화
-        # 사용자 데이터가 변경되었으므로 모든 AI 분석 캐시를 제거
-        logger.info(f"Invalidating cache for session: {session_id}")
-        invalidated_count = AICache.invalidate_user_cache(session_id)
-        logger.info(f"Invalidated {invalidated_count} cache entries")
+        # 기존 AI 분석 캐시는 저장 pipeline에서 올라간 데이터 버전으로 자연히 무효화됨
 
         logger.info(f"[DEBUG] Extracted items: {len(extracted_items)}")
 
@@ -251,42 +395,8 @@ async def analyze_document(
 
         analyzer = FinancialAnalyzerService()
 
-        # type_of_doc에 따라 소득/지출 분류
-        categorized_data = {}
-        if "소득" in type_of_doc or "income" in type_of_doc.lower():
-            categorized_data = analyzer._categorize_income(extracted_items)
-        elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
-            categorized_data = analyzer._categorize_expense(extracted_items)
-        else:
-            # 타입을 모를 경우 원본 데이터만 반환
-            categorized_data = {"raw_items": extracted_items}
-
-        # 🔥 로그인한 사용자인 경우 DB에 자동 저장
-        db_save_result = None
-        try:
-            user_token = redis_client.hget(session_id, "USER_TOKEN")
-            if user_token:
-                if isinstance(user_token, bytes):
-                    user_token = user_token.decode('utf-8')
-                
-                # GUEST가 아닌 로그인 사용자만 DB 저장
-                if user_token != "GUEST":
-                    from datetime import datetime
-                    from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
-                    
-                    ie_usecase = IEInfoUseCase.get_instance()
-                    now = datetime.now()
-                    db_save_result = ie_usecase.save_ie_data_from_redis(
-                        session_id=session_id,
-                        year=now.year,
-                        month=now.month
-                    )
-                    logger.info(f"DB save result: {db_save_result}")
-        except Exception as db_error:
-            logger.error(f"Failed to save to DB (non-critical): {str(db_error)}")
-            # DB 저장 실패해도 API 응답은 정상 반환 (Redis 저장은 성공했으므로)
-            import traceback
-            traceback.print_exc()
+        # type_of_doc에 따라 소득/지출 분류 (타입을 모를 경우 원본 데이터만 반환)
+        categorized_data = await categorize_by_doc_type(analyzer, type_of_doc, extracted_items)
 
         # 성공 응답 반환 (session_id 포함)
         response_data = {
@@ -295,78 +405,202 @@ async def analyze_document(
             "session_id": session_id,  # 프론트엔드에서 사용할 수 있도록 명시적으로 반환
             "document_type": type_of_doc,
             "extracted_count": len(extracted_items),
-            "categorized_data": categorized_data
+            "categorized_data": categorized_data,
+            "extraction_method": extraction["extraction_method"]
         }
-        
-        # DB 저장 결과 추가 (있는 경우)
-        if db_save_result:
-            response_data["db_saved"] = db_save_result["success"]
-            if db_save_result["success"]:
-                response_data["db_save_info"] = {
-                    "saved_count": db_save_result.get("saved_count", 0),
-                    "year": db_save_result.get("year"),
-                    "month": db_save_result.get("month")
-                }
-        
+
+        if compaction:
+            response_data["prompt_tokens"] = {
+                "before_compaction": compaction.tokens_before,
+                "after_compaction": compaction.tokens_after
+            }
+
         return response_data
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
 
 # -----------------------
 # API 엔드포인트
-# 미래 자산 예측 (학습 기반)
+# 여러 문서 일괄 업로드 (동시 추출)
 # -----------------------
-@documents_multi_agents_router.get("/future-assets")
+MAX_BATCH_FILES = 10
+BATCH_CONCURRENCY = 3  # 동시에 추출할 문서 수 (GPT 호출 / PDF 파싱 부하 제한)
+
+# 업로드 경로별 요청 본문 최대 크기 (RequestBodyLimitMiddleware에서 수신 중에 적용)
+# 파일 크기 제한 + multipart 경계/헤더/폼 필드 여유분
+MULTIPART_OVERHEAD = 64 * 1024
+UPLOAD_BODY_LIMITS = {
+    "/analyze": MAX_FILE_SIZE + MULTIPART_OVERHEAD,
+    "/analyze/batch": MAX_BATCH_FILES * (MAX_FILE_SIZE + MULTIPART_OVERHEAD),
+}
+
+
+@documents_multi_agents_router.post("/analyze/batch")
 @log_util.logging_decorator
-async def future_assets_analysis(session_id: str = Depends(get_current_user)):
+async def analyze_documents_batch(
+        request: Request,
+        response: Response,
+        files: list[UploadFile],
+        type_of_docs: list[str] = Form(...),
+        session_id: str = Depends(get_current_user),
+        x_csrf_token: str | None = Header(None)
+):
+    """
+    급여명세서, 카드명세서, 보험 명세서 등 여러 문서를 한 번에 분석
+    files와 type_of_docs는 같은 순서로 전달한다.
+
+    - 문서 추출은 세마포어로 동시 실행 수를 제한하여 병렬 처리
+    - Redis 저장은 한 번의 pipeline으로 처리
+    - 캐시 무효화, 카테고리 분류, IE_INFO 저장은 병합된 데이터로 한 번만 수행
+    """
+    # CSRF 검증
+    verify_csrf_token(request, x_csrf_token)
+
+    if not files:
+        raise HTTPException(400, "Empty file upload")
+    if len(files) != len(type_of_docs):
+        raise HTTPException(400, "files와 type_of_docs의 개수가 일치해야 합니다.")
+    if len(files) > MAX_BATCH_FILES:
+        raise HTTPException(413, f"한 번에 최대 {MAX_BATCH_FILES}개 문서까지 업로드할 수 있습니다.")
+
+    try:
+        # 쿠키에 session_id 명시적으로 설정
+        response.set_cookie(
+            key="session_id",
+            value=session_id,
+            max_age=24 * 60 * 60,
+            httponly=True,
+            samesite="lax"
+        )
+
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def process(file: UploadFile, type_of_doc: str) -> dict:
+            async with semaphore:
+                async with open_upload(file, MAX_FILE_SIZE) as stream:
+                    return await extract_document_items(stream, type_of_doc)
+
+        outcomes = await asyncio.gather(
+            *(process(file, type_of_doc) for file, type_of_doc in zip(files, type_of_docs)),
+            return_exceptions=True
+        )
+
+        # 파일별 결과 정리
+        file_results = []
+        documents = []
+        for file, type_of_doc, outcome in zip(files, type_of_docs, outcomes):
+            if isinstance(outcome, Exception):
+                detail = outcome.detail if isinstance(outcome, HTTPException) else str(outcome)
+                logger.error(f"[BATCH] {file.filename} 추출 실패: {detail}")
+                file_results.append({
+                    "filename": file.filename,
+                    "document_type": type_of_doc,
+                    "success": False,
+                    "message": detail,
+                    "extracted_count": 0
+                })
+                continue
+
+            extracted_items = outcome["items"]
+            file_results.append({
+                "filename": file.filename,
+                "document_type": type_of_doc,
+                "success": bool(extracted_items),
+                "message": "분석 완료" if extracted_items else "PDF에서 데이터를 추출하지 못했습니다.",
+                "extracted_count": len(extracted_items),
+                "extraction_method": outcome["extraction_method"],
+                "items": extracted_items
+            })
+            if extracted_items:
+                documents.append((type_of_doc, extracted_items))
+
+        if not documents:
+            return {
+                "success": False,
+                "message": "업로드한 문서에서 데이터를 추출하지 못했습니다. PDF 형식을 확인해주세요.",
+                "session_id": session_id,
+                "files": file_results,
+                "summary": {}
+            }
+
+        # 모든 문서의 항목을 한 번의 pipeline으로 저장
+        saved_count = await save_items_to_redis(session_id, documents)
+
+        # 소득/지출 항목 병합 후 카테고리 분류 한 번씩
+        income_items = {}
+        expense_items = {}
+        raw_items = {}
+        for type_of_doc, items in documents:
+            if "소득" in type_of_doc or "income" in type_of_doc.lower():
+                income_items.update(items)
+            elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
+                expense_items.update(items)
+            else:
+                raw_items.update(items)
+
+        from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
+        analyzer = FinancialAnalyzerService()
+
+        income_categorized, expense_categorized = await categorize_in_threads(analyzer, income_items, expense_items)
+
+        summary = analyzer._generate_summary(income_categorized, expense_categorized)
+        summary["documents"] = len(files)
+        summary["succeeded_documents"] = len(documents)
+        summary["saved_count"] = saved_count
+
+        categorized_data = {
+            "income": income_categorized,
+            "expense": expense_categorized
+        }
+        if raw_items:
+            categorized_data["raw_items"] = raw_items
+
+        response_data = {
+            "success": True,
+            "message": "분석 완료",
+            "session_id": session_id,
+            "files": file_results,
+            "categorized_data": categorized_data,
+            "summary": summary
+        }
+
+        return response_data
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
+
+
+# -----------------------
+# API 엔드포인트
+# 미래 자산 예측 (학습 기반)
+# -----------------------
+async def compute_future_assets_view(session_id: str, encrypted_data: dict | None = None) -> dict:
+    """학습된 조언 또는 GPT 조언 생성 (encrypted_data: 이미 조회한 세션 데이터, 선택)"""
     try:
         # Redis에서 소득/지출 데이터 가져오기
-        encrypted_data = redis_client.hgetall(session_id)
+        if encrypted_data is None:
+            encrypted_data = await get_async_redis(session_id).hgetall(session_id)
         
         # 🔥 데이터가 없어도 진행 (소득/지출 0원으로 처리)
         # if not encrypted_data or len(encrypted_data) <= 1:
         #     return {"success": False, "message": "저장된 재무 데이터가 없습니다. 문서를 먼저 업로드해주세요."}
         
         # 복호화 및 소득/지출 분리
-        income_items = {}
-        expense_items = {}
-        
-        for key_bytes, value_bytes in encrypted_data.items():
-            try:
-                if isinstance(key_bytes, bytes):
-                    key_str = key_bytes.decode('utf-8')
-                else:
-                    key_str = str(key_bytes)
-                
-                if isinstance(value_bytes, bytes):
-                    value_str = value_bytes.decode('utf-8')
-                else:
-                    value_str = str(value_bytes)
-                
-                if key_str == "USER_TOKEN":
-                    continue
-                
-                key_plain = crypto.dec_data(key_str)
-                value_plain = crypto.dec_data(value_str)
-                
-                if ":" in key_plain:
-                    doc_type, field_name = key_plain.split(":", 1)
-                    
-                    if "소득" in doc_type or "income" in doc_type.lower():
-                        income_items[field_name] = value_plain
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
-                        expense_items[field_name] = value_plain
-            except Exception:
-                continue
-        
+        session = await load_session_data_async(session_id, encrypted_data)
+        income_items = session.income_items
+        expense_items = session.expense_items
+
         # AI로 카테고리 분류
         from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
         analyzer = FinancialAnalyzerService()
         
-        income_categorized = analyzer._categorize_income(income_items) if income_items else {}
-        expense_categorized = analyzer._categorize_expense(expense_items) if expense_items else {}
+        income_categorized, expense_categorized = await categorize_in_threads(analyzer, income_items, expense_items)
         
         # 🔥 데이터가 없으면 기본값 설정 (0원)
         if not income_categorized:
@@ -384,7 +618,7 @@ async def future_assets_analysis(session_id: str = Depends(get_current_user)):
             return {"success": False, "message": "소비 패턴 계산에 실패했습니다."}
         
         # 2. 유사 패턴 검색
-        similar_pattern = FutureAssetsLearningService.find_similar_pattern(pattern)
+        similar_pattern = await run_db(FutureAssetsLearningService.find_similar_pattern, pattern)
         
         if similar_pattern:
             # 유사 패턴 있음 → 저장된 조언 반환
@@ -398,22 +632,7 @@ async def future_assets_analysis(session_id: str = Depends(get_current_user)):
             }
         else:
             # 유사 패턴 없음 → GPT 호출
-            content = redis_client.hgetall(session_id)
-            pairs = []
-            for k_bytes, v_bytes in content.items():
-                try:
-                    if k_bytes == "USER_TOKEN":
-                        continue
-                    
-                    key_plain = crypto.dec_data(k_bytes)
-                    val_plain = crypto.dec_data(v_bytes)
-                    
-                    _, field_name = key_plain.split(':', 1)
-                    pairs.append(f"{field_name}: {val_plain}")
-                except ValueError:
-                    continue
-            
-            data_str = ", ".join(pairs)
+            data_str = session.to_pairs_text()
             
             # 🔥 데이터가 없으면 기본값 설정 (소득/지출 0원)
             if not data_str or data_str.strip() == "":
@@ -430,7 +649,7 @@ async def future_assets_analysis(session_id: str = Depends(get_current_user)):
             gpt_advice = re.sub(r'---.*', '', gpt_advice, flags=re.DOTALL)
             
             # 3. GPT 조언 저장
-            FutureAssetsLearningService.save_gpt_advice(pattern, gpt_advice)
+            await run_db(FutureAssetsLearningService.save_gpt_advice, pattern, gpt_advice)
             
             return {
                 "success": True,
@@ -443,6 +662,12 @@ async def future_assets_analysis(session_id: str = Depends(get_current_user)):
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
 
+@documents_multi_agents_router.get("/future-assets")
+@log_util.logging_decorator
+async def future_assets_analysis(session_id: str = Depends(get_current_user)):
+    return await DerivedViewPrecomputer.get_or_compute(session_id, "future-assets")
+
+
 # -----------------------
 # API 엔드포인트
 # 미래 자산 예측 - AI 상세 분석 (사용자 요청 시)
@@ -456,23 +681,7 @@ async def future_assets_ai_detailed(session_id: str = Depends(get_current_user))
     """
     try:
         # Redis에서 데이터 가져오기
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-                
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-                
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-            except ValueError:
-                continue
-        
-        data_str = ", ".join(pairs)
+        data_str = (await load_session_data_async(session_id)).to_pairs_text()
         
         # 🔥 데이터가 없으면 기본값 설정 (소득/지출 0원)
         if not data_str or data_str.strip() == "":
@@ -502,37 +711,19 @@ async def future_assets_ai_detailed(session_id: str = Depends(get_current_user))
 # API 엔드포인트
 # 세액 공제 확인
 # -----------------------
-@documents_multi_agents_router.get("/tax-credit")
-@log_util.logging_decorator
-async def analyze_document(session_id: str = Depends(get_current_user)):
+async def compute_tax_credit_view(session_id: str, encrypted_data: dict | None = None) -> str:
+    """세액 공제 분석 (GPT)"""
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
-        cache_key = AICache.generate_cache_key(data_str, "tax-credit")
-        cached_response = AICache.get_cached_response(cache_key)
+        # 🔥 캐시 확인 (세션 데이터 버전 기준, 데이터 조회/복호화 전에 확인)
+        version = await SessionVersion.get(session_id)
+        cache_key = AICache.generate_session_cache_key(session_id, version, "tax-credit")
+        cached_response = await AICache.get_cached_response_async(cache_key)
 
         if cached_response:
             return cached_response
 
+        data_str = (await load_session_data_async(session_id, encrypted_data)).to_pairs_text()
+
         # 캐시 미스 - GPT 호출
         question, role = PromptTemplates.get_tax_credit_prompt()
         answer = await qa_on_document(data_str, question, role)
@@ -544,13 +735,19 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
         answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
 
         # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
+        await AICache.set_cached_response_async(cache_key, answer, ttl=86400)
 
         return answer
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
 
+@documents_multi_agents_router.get("/tax-credit")
+@log_util.logging_decorator
+async def analyze_document(session_id: str = Depends(get_current_user)):
+    return await DerivedViewPrecomputer.get_or_compute(session_id, "tax-credit")
+
+
 # -----------------------
 # API 엔드포인트
 # 연말정산 공제 내역 확인
@@ -559,33 +756,16 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
-        cache_key = AICache.generate_cache_key(data_str, "deduction-expectation")
-        cached_response = AICache.get_cached_response(cache_key)
+        # 🔥 캐시 확인 (세션 데이터 버전 기준, 데이터 조회/복호화 전에 확인)
+        version = await SessionVersion.get(session_id)
+        cache_key = AICache.generate_session_cache_key(session_id, version, "deduction-expectation")
+        cached_response = await AICache.get_cached_response_async(cache_key)
 
         if cached_response:
             return cached_response
 
+        data_str = (await load_session_data_async(session_id)).to_pairs_text()
+
         # 캐시 미스 - GPT 호출
         question, role = PromptTemplates.get_deduction_expectation_prompt()
         answer = await qa_on_document(data_str, question, role)
@@ -597,7 +777,7 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
         answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
 
         # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
+        await AICache.set_cached_response_async(cache_key, answer, ttl=86400)
 
         return answer
     except Exception as e:
@@ -612,25 +792,7 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
+        data_str = (await load_session_data_async(session_id)).to_pairs_text()
 
         answer = await qa_on_document(data_str,
                                       "주어진 문서 본문을 활용하여 연말정산에서 받을 수 있는 총 공제 예상 금액을 산출해줘. "
@@ -657,25 +819,7 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(now_mon: int, tar_mon: int, session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
+        data_str = (await load_session_data_async(session_id)).to_pairs_text()
 
         answer = await qa_on_document(data_str,
                                       f"주어진 문서 본문을 활용하여 현재 내 자산이 {now_mon}이고, "
@@ -742,32 +886,15 @@ async def insert_document(
         # 세션 처리
         if not session_id:
             session_id = str(uuid.uuid4())
-            redis_client.hset(session_id, "USER_TOKEN", "GUEST")
-            redis_client.expire(session_id, 24 * 60 * 60)
-
-        # 암호화해서 저장 및 데이터 수집
-        extracted_items = {}
-        for field_key, field_value in request.data.items():
-            value_clean = field_value.replace(",", "").strip()
-
-            # 암호화된 키/값 생성
-            encrypted_key = crypto.enc_data(f"{request.document_type}:{field_key}")
-            encrypted_value = crypto.enc_data(value_clean)
+            await get_async_redis(session_id).hset(session_id, "USER_TOKEN", "GUEST")
+            await get_async_redis(session_id).expire(session_id, 24 * 60 * 60)
 
-            redis_client.hset(
-                session_id,
-                encrypted_key,
-                encrypted_value
-            )
-
-            # 저장 확인
-            saved_value = redis_client.hget(session_id, encrypted_key)
-            logger.debug(f"[DEBUG] Saved successfully: {saved_value is not None}")
-
-            # 응답용 데이터 수집
-            extracted_items[field_key] = value_clean
-
-        redis_client.expire(session_id, session_expire_seconds)
+        # 응답용 데이터 수집 후 암호화하여 한 번의 pipeline으로 저장 (데이터 버전 증가 포함)
+        extracted_items = {
+            field_key: field_value.replace(",", "").strip()
+            for field_key, field_value in request.data.items()
+        }
+        await save_items_to_redis(session_id, [(request.document_type, extracted_items)])
 
         # AI로 카테고리 분류
         from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
@@ -775,40 +902,7 @@ async def insert_document(
         analyzer = FinancialAnalyzerService()
 
         # type에 따라 소득/지출 분류
-        categorized_data = {}
-        if "소득" in request.document_type or "income" in request.document_type.lower():
-            categorized_data = analyzer._categorize_income(extracted_items)
-        elif "지출" in request.document_type or "expense" in request.document_type.lower():
-            categorized_data = analyzer._categorize_expense(extracted_items)
-        else:
-            categorized_data = {"raw_items": extracted_items}
-
-        # 🔥 로그인한 사용자인 경우 DB에 자동 저장
-        db_save_result = None
-        try:
-            user_token = redis_client.hget(session_id, "USER_TOKEN")
-            if user_token:
-                if isinstance(user_token, bytes):
-                    user_token = user_token.decode('utf-8')
-                
-                # GUEST가 아닌 로그인 사용자만 DB 저장
-                if user_token != "GUEST":
-                    from datetime import datetime
-                    from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
-                    
-                    ie_usecase = IEInfoUseCase.get_instance()
-                    now = datetime.now()
-                    db_save_result = ie_usecase.save_ie_data_from_redis(
-                        session_id=session_id,
-                        year=now.year,
-                        month=now.month
-                    )
-                    logger.info(f"DB save result: {db_save_result}")
-        except Exception as db_error:
-            logger.error(f"Failed to save to DB (non-critical): {str(db_error)}")
-            # DB 저장 실패해도 API 응답은 정상 반환 (Redis 저장은 성공했으므로)
-            import traceback
-            traceback.print_exc()
+        categorized_data = await categorize_by_doc_type(analyzer, request.document_type, extracted_items)
 
         response_data = {
             "success": True,
@@ -819,17 +913,7 @@ async def insert_document(
             "categorized_data": categorized_data,
             "expire_in_seconds": session_expire_seconds
         }
-        
-        # DB 저장 결과 추가 (있는 경우)
-        if db_save_result:
-            response_data["db_saved"] = db_save_result["success"]
-            if db_save_result["success"]:
-                response_data["db_save_info"] = {
-                    "saved_count": db_save_result.get("saved_count", 0),
-                    "year": db_save_result.get("year"),
-                    "month": db_save_result.get("month")
-                }
-        
+
         return response_data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -843,7 +927,7 @@ async def insert_document(
 async def debug_redis_data(session_id: str = Depends(get_current_user)):
     """Redis에 저장된 원본 데이터 확인 (디버깅용)"""
     try:
-        raw_data = redis_client.hgetall(session_id)
+        raw_data = await get_async_redis(session_id).hgetall(session_id)
 
         result = {
             "session_id": session_id,
@@ -902,18 +986,17 @@ async def debug_redis_data(session_id: str = Depends(get_current_user)):
 # -----------------------
 # 통합 결과 조회 (소득 + 지출)
 # -----------------------
-@documents_multi_agents_router.get("/result")
-@log_util.logging_decorator
-async def get_combined_result(session_id: str = Depends(get_current_user)):
+async def compute_result_view(session_id: str, encrypted_data: dict | None = None) -> dict:
     """
-    Redis에 저장된 소득+지출 데이터를 복호화하고 카테고리별로 분류하여 반환
-    시각화에 적합한 형태로 데이터 구조화
+    Redis에 저장된 소득+지출 데이터를 복호화하고 카테고리별로 분류
+    시각화에 적합한 형태로 데이터 구조화 (encrypted_data: 이미 조회한 세션 데이터, 선택)
     """
     try:
         logger.debug("[DEBUG] /result called with session_id")
 
         # Redis에서 모든 데이터 가져오기
-        encrypted_data = redis_client.hgetall(session_id)
+        if encrypted_data is None:
+            encrypted_data = await get_async_redis(session_id).hgetall(session_id)
 
         # 🔥 버그 수정: USER_TOKEN만 있는 경우도 빈 데이터로 간주
         if not encrypted_data or len(encrypted_data) <= 1:
@@ -923,45 +1006,9 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
             )
 
         # 복호화 및 소득/지출 분리
-        income_items = {}
-        expense_items = {}
-
-        for key_bytes, value_bytes in encrypted_data.items():
-            try:
-                # bytes를 문자열로 변환
-                if isinstance(key_bytes, bytes):
-                    key_str = key_bytes.decode('utf-8')
-                else:
-                    key_str = str(key_bytes)
-
-                if isinstance(value_bytes, bytes):
-                    value_str = value_bytes.decode('utf-8')
-                else:
-                    value_str = str(value_bytes)
-
-                # USER_TOKEN 제외
-                if key_str == "USER_TOKEN":
-                    logger.debug("[DEBUG] Skipping USER_TOKEN")
-                    continue
-
-                key_plain = crypto.dec_data(key_str)
-                value_plain = crypto.dec_data(value_str)
-
-                # "타입:필드명" 형태 파싱
-                if ":" in key_plain:
-                    doc_type, field_name = key_plain.split(":", 1)
-
-                    if "소득" in doc_type or "income" in doc_type.lower():
-                        income_items[field_name] = value_plain
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
-                        expense_items[field_name] = value_plain
-            except Exception as decrypt_error:
-                logger.error(
-                    f"[ERROR] Decryption failed for key: {key_str[:50] if 'key_str' in locals() else 'unknown'}")
-                logger.error(f"[ERROR] Error: {str(decrypt_error)}")
-                import traceback
-                traceback.print_exc()
-                continue
+        session = await load_session_data_async(session_id, encrypted_data)
+        income_items = session.income_items
+        expense_items = session.expense_items
 
         logger.debug(f"[DEBUG] Total income_items: {len(income_items)}")
         logger.debug(f"[DEBUG] Total expense_items: {len(expense_items)}")
@@ -1002,8 +1049,7 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
 
         analyzer = FinancialAnalyzerService()
 
-        income_categorized = analyzer._categorize_income(income_items) if income_items else {}
-        expense_categorized = analyzer._categorize_expense(expense_items) if expense_items else {}
+        income_categorized, expense_categorized = await categorize_in_threads(analyzer, income_items, expense_items)
 
         # 요약 정보 계산 (안전한 타입 변환) - 한글 키 우선, 없으면 영문 키
         try:
@@ -1054,6 +1100,121 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
         raise HTTPException(status_code=500, detail=f"{type(e).__name__}: {str(e)}")
 
 
+@documents_multi_agents_router.get("/result")
+@log_util.logging_decorator
+async def get_combined_result(session_id: str = Depends(get_current_user)):
+    """
+    Redis에 저장된 소득+지출 데이터를 복호화하고 카테고리별로 분류하여 반환
+    (업로드 후 사전 계산된 결과가 있으면 캐시에서 반환)
+    """
+    return await DerivedViewPrecomputer.get_or_compute(session_id, "result")
+
+
+# 업로드 후 사전 계산 대상 뷰 등록 (EAGER_PRECOMPUTE=true 일 때 백그라운드 실행)
+DerivedViewPrecomputer.register("result", compute_result_view)
+DerivedViewPrecomputer.register("future-assets", compute_future_assets_view)
+DerivedViewPrecomputer.register("tax-credit", compute_tax_credit_view)
+if DerivedViewPrecomputer.ENABLED:
+    SessionChangeStream.register("derived_views", DerivedViewPrecomputer.on_session_change)
+
+
+# -----------------------
+# API 엔드포인트
+# 대시보드 통합 조회 (결과 + 미래 자산 + ETF/펀드/채권 추천)
+# -----------------------
+@documents_multi_agents_router.get("/dashboard")
+@log_util.logging_decorator
+async def get_dashboard(
+        year: int = Query(None, description="조회 연도 (로그인 사용자용)"),
+        month: int = Query(None, description="조회 월 (로그인 사용자용)"),
+        investment_goal: str = Query(None, description="투자 목표 (예: 노후 준비, 단기 수익)"),
+        risk_tolerance: str = Query(None, description="위험 감수도 (낮음/보통/높음)"),
+        session_id: str = Depends(get_current_user)
+):
+    """
+    /result, /future-assets, ETF/펀드/채권 추천을 한 번에 조회
+
+    - 세션 데이터(HGETALL)는 한 번만 조회하여 모든 섹션이 공유
+    - 섹션은 asyncio.gather로 동시에 계산하고, 끝나는 순서대로 NDJSON 한 줄씩 스트리밍
+    - 각 줄: {"section", "success", "elapsed_ms", "data" | "error"}
+    - 마지막 줄: {"section": "summary", "timings": {...}, "total_ms"}
+    """
+    from recommendation.application.usecase.bond_recommendation_usecase import BondRecommendationUseCase
+    from recommendation.application.usecase.etf_recommendation_usecase import ETFRecommendationUseCase
+    from recommendation.application.usecase.fund_recommendation_usecase import FundRecommendationUseCase
+
+    started_at = time.perf_counter()
+    session_data = await get_async_redis(session_id).hgetall(session_id)
+
+    now = datetime.now()
+    year = year or now.year
+    month = month or now.month
+    recommendation_args = {
+        "session_id": session_id,
+        "year": year,
+        "month": month,
+        "investment_goal": investment_goal,
+        "risk_tolerance": risk_tolerance,
+        "session_data": session_data
+    }
+
+    sections = {
+        "result": lambda: DerivedViewPrecomputer.get_or_compute(
+            session_id, "result", encrypted_data=session_data),
+        "future_assets": lambda: DerivedViewPrecomputer.get_or_compute(
+            session_id, "future-assets", encrypted_data=session_data),
+        "etf_recommendation": lambda: ETFRecommendationUseCase.get_instance().get_etf_recommendation(
+            **recommendation_args),
+        "fund_recommendation": lambda: FundRecommendationUseCase.get_instance().get_fund_recommendation(
+            **recommendation_args),
+        "bond_recommendation": lambda: BondRecommendationUseCase.get_instance().get_bond_recommendation(
+            **recommendation_args)
+    }
+
+    finished = asyncio.Queue()
+
+    async def run_section(name: str, compute) -> dict:
+        section_started_at = time.perf_counter()
+        section = {"section": name}
+        try:
+            section["data"] = jsonable_encoder(await compute())
+            section["success"] = True
+        except HTTPException as e:
+            section["success"] = False
+            section["error"] = e.detail
+        except Exception as e:
+            logger.error(f"[DASHBOARD] {name} 실패: {type(e).__name__}: {str(e)}")
+            section["success"] = False
+            section["error"] = f"{type(e).__name__}: {str(e)}"
+        section["elapsed_ms"] = round((time.perf_counter() - section_started_at) * 1000, 1)
+        await finished.put(section)
+        return section
+
+    async def stream():
+        fan_out = asyncio.gather(*(run_section(name, compute) for name, compute in sections.items()))
+        timings = {}
+        try:
+            for _ in sections:
+                section = await finished.get()
+                timings[section["section"]] = section["elapsed_ms"]
+                yield json.dumps(section, ensure_ascii=False) + "\n"
+            await fan_out
+
+            total_ms = round((time.perf_counter() - started_at) * 1000, 1)
+            logger.info(f"[DASHBOARD] total {total_ms}ms, sections {timings}")
+            yield json.dumps({
+                "section": "summary",
+                "timings": timings,
+                "slowest": max(timings, key=timings.get) if timings else None,
+                "total_ms": total_ms
+            }, ensure_ascii=False) + "\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 섹션 계산 취소
+            fan_out.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 # -----------------------
 # AI 기반 자세한 자산 분배 추천 (선택적)
 # -----------------------
@@ -1068,7 +1229,7 @@ async def analyze_with_ai_detailed(session_id: str = Depends(get_current_user)):
         logger.debug("[DEBUG] /analyze-ai-detailed called")
 
         # Redis에서 데이터 가져오기 (동일한 로직)
-        encrypted_data = redis_client.hgetall(session_id)
+        encrypted_data = await get_async_redis(session_id).hgetall(session_id)
 
         if not encrypted_data or len(encrypted_data) <= 1:
             raise HTTPException(
@@ -1077,37 +1238,9 @@ async def analyze_with_ai_detailed(session_id: str = Depends(get_current_user)):
             )
 
         # 복호화 및 소득/지출 분리
-        income_items = {}
-        expense_items = {}
-
-        for key_bytes, value_bytes in encrypted_data.items():
-            try:
-                if isinstance(key_bytes, bytes):
-                    key_str = key_bytes.decode('utf-8')
-                else:
-                    key_str = str(key_bytes)
-
-                if isinstance(value_bytes, bytes):
-                    value_str = value_bytes.decode('utf-8')
-                else:
-                    value_str = str(value_bytes)
-
-                if key_str == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(key_str)
-                value_plain = crypto.dec_data(value_str)
-
-                if ":" in key_plain:
-                    doc_type, field_name = key_plain.split(":", 1)
-
-                    if "소득" in doc_type or "income" in doc_type.lower():
-                        income_items[field_name] = value_plain
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
-                        expense_items[field_name] = value_plain
-            except Exception as decrypt_error:
-                logger.error(f"[ERROR] Decryption failed: {str(decrypt_error)}")
-                continue
+        session = await load_session_data_async(session_id, encrypted_data)
+        income_items = session.income_items
+        expense_items = session.expense_items
 
         # 소득 항목 중 지출성 항목 재분류 (동일한 로직)
         insurance_keywords = ["보험료", "보험", "연금"]
@@ -1136,8 +1269,7 @@ async def analyze_with_ai_detailed(session_id: str = Depends(get_current_user)):
 
         analyzer = FinancialAnalyzerService()
 
-        income_categorized = analyzer._categorize_income(income_items) if income_items else {}
-        expense_categorized = analyzer._categorize_expense(expense_items) if expense_items else {}
+        income_categorized, expense_categorized = await categorize_in_threads(analyzer, income_items, expense_items)
 
         # 요약 정보 계산
         try:
@@ -1186,40 +1318,20 @@ async def analyze_with_ai_detailed(session_id: str = Depends(get_current_user)):
 @documents_multi_agents_router.get("/tax-credit/checklist")
 async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-
-        if not content:
-            return "저장된 재무 데이터가 없습니다."
-
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(
-                    k_bytes.decode("utf-8") if isinstance(k_bytes, bytes) else k_bytes
-                )
-                val_plain = crypto.dec_data(
-                    v_bytes.decode("utf-8") if isinstance(v_bytes, bytes) else v_bytes
-                )
-
-                # "지출:월세" → 월세
-                _, field_name = key_plain.split(":", 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except Exception:
-                continue
-
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
-        cache_key = AICache.generate_cache_key(data_str, "tax-credit-checklist")
-        cached_response = AICache.get_cached_response(cache_key)
+        # 🔥 캐시 확인 (세션 데이터 버전 기준, 데이터 조회/복호화 전에 확인)
+        version = await SessionVersion.get(session_id)
+        cache_key = AICache.generate_session_cache_key(session_id, version, "tax-credit-checklist")
+        cached_response = await AICache.get_cached_response_async(cache_key)
 
         if cached_response:
             return cached_response
 
+        session = await load_session_data_async(session_id)
+        if not session.raw:
+            return "저장된 재무 데이터가 없습니다."
+
+        data_str = session.to_pairs_text()
+
         # 캐시 미스 - GPT 호출
         tax_items_text = """
 1. 자녀 세액공제
@@ -1303,7 +1415,7 @@ async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_us
         )
 
         # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
+        await AICache.set_cached_response_async(cache_key, answer, ttl=86400)
 
         return answer
 
@@ -1316,13 +1428,50 @@ async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_us
 # -----------------------
 @documents_multi_agents_router.get("/cache/stats")
 @log_util.logging_decorator
-async def get_cache_stats(session_id: str = Depends(get_current_user)):
-    """캐시 통계 조회"""
+async def get_cache_stats(session_id: str = Depends(get_admin_user)):
+    """캐시 통계 조회 (관리자 전용, 키 이름 없이 건수/적중률만 반환)"""
     try:
-        stats = AICache.get_cache_stats()
+        stats = await AICache.get_cache_stats()
         return {
             "success": True,
-            "stats": stats
+            "stats": stats,
+            "category_cache": CategoryCache.get_statistics(),
+            "derived_views": DerivedViewPrecomputer.get_statistics(),
+            "redis_pool": get_pool_statistics(),
+            "db_pool": get_db_pool_statistics(),
+            "db_executor": get_db_executor_statistics(),
+            "redis_shards": await get_shard_statistics(),
+            "shard_migration": SessionShardMigrator.get_statistics(),
+            "session_changes": await SessionChangeStream.get_statistics()
+        }
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
+
+
+@documents_multi_agents_router.get("/extraction/stats")
+@log_util.logging_decorator
+async def get_extraction_stats(session_id: str = Depends(get_admin_user)):
+    """표 추출 처리량, GPT 호출 회피율 및 레이아웃 템플릿 적중 통계 조회 (관리자 전용)"""
+    try:
+        return {
+            "success": True,
+            "stats": LayoutTableExtractor.get_statistics(),
+            "templates": await asyncio.to_thread(LayoutTemplateStore().get_statistics)
+        }
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
+
+
+@documents_multi_agents_router.get("/sql/stats")
+@log_util.logging_decorator
+async def get_sql_stats(session_id: str = Depends(get_admin_user)):
+    """요청/스케줄러 작업별 쿼리 수, DB 시간, 가장 느린 쿼리 및 N+1 의심 기록 조회 (관리자 전용, SQL 구조가 노출됨)"""
+    try:
+        return {
+            "success": True,
+            "stats": SqlMetrics.get_statistics(),
+            "db_pool": get_db_pool_statistics(),
+            "db_executor": get_db_executor_statistics()
         }
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
@@ -1331,13 +1480,20 @@ async def get_cache_stats(session_id: str = Depends(get_current_user)):
 @documents_multi_agents_router.delete("/cache/clear")
 @log_util.logging_decorator
 async def clear_user_cache(session_id: str = Depends(get_current_user)):
-    """사용자의 모든 캐시 삭제"""
+    """
+    사용자의 모든 캐시 무효화
+
+    데이터 버전만 올려 이 세션의 AI 응답/파생 뷰 캐시가 더 이상 조회되지 않게 한다.
+    (다른 사용자의 캐시는 건드리지 않으며, 남은 항목은 TTL로 만료)
+    """
     try:
-        deleted_count = AICache.invalidate_user_cache(session_id)
+        pipe = get_async_redis(session_id).pipeline()
+        SessionVersion.bump(pipe, session_id)
+        version, _ = await pipe.execute()
         return {
             "success": True,
-            "message": f"{deleted_count}개의 캐시 항목이 삭제되었습니다.",
-            "deleted_count": deleted_count
+            "message": "캐시가 초기화되었습니다.",
+            "version": version
         }
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
@@ -0,0 +1,190 @@
+"""
+항목 단위 카테고리 캐시 (Category Cache)
+"급여 → 고정소득", "월세 → 고정지출"처럼 항목명별 분류 결과를 저장하여
+항목 하나를 추가/수정해도 이미 분류된 항목은 GPT에 다시 보내지 않는다
+"""
+
+import json
+import re
+import threading
+from typing import Any, Dict, List, Tuple
+
+from config.redis_config import get_cache_redis
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class CategoryCache:
+    """
+    항목명(정규화) + 문서 타입 → (카테고리, 표시 항목명) 캐시
+
+    저장 구조 (Redis):
+    - category_cache:{ie_type} (hash) : 정규화 항목명 → {"category": ..., "label": ...}, 캐시 샤드에 키별로 저장
+
+    금액은 저장하지 않으므로 모든 사용자가 공유한다.
+    (문서 업로드 시 수행되는 ai_cache:* 무효화와 무관하게 유지된다)
+    """
+
+    KEY_PREFIX = "category_cache:"
+    CACHE_TTL = 30 * 24 * 60 * 60  # 30일 (학습될 때마다 갱신)
+
+    INCOME = "income"
+    EXPENSE = "expense"
+
+    _stats = {"hits": 0, "misses": 0, "stored": 0}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def normalize(field_name: str) -> str:
+        """항목명 정규화 (공백/언더스코어/특수문자 제거, 소문자)"""
+        return re.sub(r'[\s_\-·.,()\[\]]+', '', field_name).lower()
+
+    @staticmethod
+    def to_amount(value: Any) -> int:
+        """금액 문자열/숫자를 정수로 변환 (변환 불가 시 0)"""
+        if isinstance(value, (int, float)):
+            return int(value)
+        digits = re.sub(r'[^\d\-]', '', str(value))
+        try:
+            return int(digits) if digits else 0
+        except ValueError:
+            return 0
+
+    @classmethod
+    def _key(cls, ie_type: str) -> str:
+        return f"{cls.KEY_PREFIX}{ie_type}"
+
+    @classmethod
+    def resolve(cls, ie_type: str, items: Dict[str, str]) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+        """
+        캐시로 분류 가능한 항목과 새 항목 분리 (HMGET 1회)
+
+        Returns:
+            (resolved, unknown)
+            resolved: {원본 항목명: {"category": ..., "label": ...}}
+            unknown: {원본 항목명: 금액} - GPT 분류가 필요한 항목
+        """
+        fields = list(items.keys())
+        if not fields:
+            return {}, {}
+
+        try:
+            cached = get_cache_redis(cls._key(ie_type)).hmget(cls._key(ie_type), [cls.normalize(f) for f in fields])
+        except Exception as e:
+            logger.error(f"[CATEGORY CACHE] 조회 실패: {str(e)}")
+            cached = [None] * len(fields)
+
+        resolved = {}
+        unknown = {}
+        for field_name, entry in zip(fields, cached):
+            if entry:
+                try:
+                    resolved[field_name] = json.loads(entry)
+                    continue
+                except json.JSONDecodeError:
+                    pass
+            unknown[field_name] = items[field_name]
+
+        with cls._lock:
+            cls._stats["hits"] += len(resolved)
+            cls._stats["misses"] += len(unknown)
+
+        logger.info(f"[CATEGORY CACHE] {ie_type}: {len(resolved)} hit, {len(unknown)} miss")
+        return resolved, unknown
+
+    @classmethod
+    def assign_from_result(cls, items: Dict[str, str], categorized: Dict[str, Any],
+                           categories: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        GPT 분류 결과에서 각 항목의 카테고리 찾기
+
+        항목명(정규화)이 같은 항목을 우선 찾고, 없으면 같은 금액의 남은 항목으로 매칭한다.
+        (GPT가 "국민연금보험료_총합계" → "국민연금보험료 총합계"처럼 이름을 다듬는 경우)
+        """
+        candidates = []
+        for category in categories:
+            entries = categorized.get(category)
+            if not isinstance(entries, dict):
+                continue
+            for label, amount in entries.items():
+                candidates.append((category, label, cls.normalize(label), cls.to_amount(amount)))
+
+        assignments = {}
+        used = set()
+
+        for field_name in items:
+            target = cls.normalize(field_name)
+            for index, (category, label, normalized, _) in enumerate(candidates):
+                if index not in used and normalized == target:
+                    assignments[field_name] = {"category": category, "label": label}
+                    used.add(index)
+                    break
+
+        for field_name, value in items.items():
+            if field_name in assignments:
+                continue
+            amount = cls.to_amount(value)
+            matches = [i for i, c in enumerate(candidates) if i not in used and c[3] == amount]
+            if len(matches) == 1:
+                category, label, _, _ = candidates[matches[0]]
+                assignments[field_name] = {"category": category, "label": label}
+                used.add(matches[0])
+
+        return assignments
+
+    @classmethod
+    def store(cls, ie_type: str, assignments: Dict[str, Dict[str, str]]):
+        """분류 결과 저장 (pipeline 1회)"""
+        if not assignments:
+            return
+        mapping = {
+            cls.normalize(field_name): json.dumps(entry, ensure_ascii=False)
+            for field_name, entry in assignments.items()
+        }
+        try:
+            pipe = get_cache_redis(cls._key(ie_type)).pipeline()
+            pipe.hset(cls._key(ie_type), mapping=mapping)
+            pipe.expire(cls._key(ie_type), cls.CACHE_TTL)
+            pipe.execute()
+            with cls._lock:
+                cls._stats["stored"] += len(mapping)
+            logger.info(f"[CATEGORY CACHE] STORED {ie_type}: {len(mapping)} items")
+        except Exception as e:
+            logger.error(f"[CATEGORY CACHE] 저장 실패: {str(e)}")
+
+    @staticmethod
+    def assemble(items: Dict[str, str], assignments: Dict[str, Dict[str, str]],
+                 categories: List[str], default_category: str, total_key: str) -> Dict[str, Any]:
+        """
+        항목별 카테고리로 분류 결과를 로컬에서 조립 (카테고리별 합계, 총액 재계산)
+
+        카테고리를 찾지 못한 항목은 default_category에 넣는다.
+        """
+        result = {category: {} for category in categories}
+        for field_name, value in items.items():
+            entry = assignments.get(field_name)
+            category = entry["category"] if entry and entry.get("category") in result else default_category
+            label = entry["label"] if entry and entry.get("label") else field_name.replace("_", " ")
+            result[category][label] = result[category].get(label, 0) + CategoryCache.to_amount(value)
+
+        sums = {category: sum(result[category].values()) for category in categories}
+        result["카테고리별 합계"] = sums
+        result[total_key] = sum(sums.values())
+        return result
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, Any]:
+        """항목 캐시 적중률"""
+        with cls._lock:
+            stats = dict(cls._stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 4) if total else 0.0
+        try:
+            stats["cached_items"] = {
+                cls.INCOME: get_cache_redis(cls._key(cls.INCOME)).hlen(cls._key(cls.INCOME)),
+                cls.EXPENSE: get_cache_redis(cls._key(cls.EXPENSE)).hlen(cls._key(cls.EXPENSE))
+            }
+        except Exception as e:
+            logger.error(f"[CATEGORY CACHE] 통계 조회 실패: {str(e)}")
+        return stats
@@ -0,0 +1,224 @@
+"""
+파생 뷰 사전 계산기 (Derived View Precomputer)
+문서 업로드 직후 /result, /future-assets, /tax-credit 결과를 백그라운드에서 미리 계산하여
+세션 데이터 버전별로 캐시하고, 다음 페이지 로드 시 캐시에서 바로 응답한다
+"""
+
+import asyncio
+import json
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from config.redis_config import get_async_redis
+from util.log.log import Log
+from util.session.session_version import SessionVersion
+
+logger = Log.get_logger()
+
+
+class DerivedViewPrecomputer:
+    """
+    세션 데이터 버전 기반 파생 뷰 캐시 + 업로드 후 사전 계산
+
+    저장 구조 (Redis):
+    - derived_view:{session_id}:{version}:{view} (string) : 뷰 응답(JSON), 세션과 같은 샤드에 저장
+
+    버전(SessionVersion)이 키에 포함되므로 새 업로드가 들어오면 이전 결과는 자연스럽게 사용되지 않는다.
+    같은 세션에 새 업로드가 오면 진행 중인 사전 계산은 취소된다.
+    """
+
+    VIEW_KEY_PREFIX = "derived_view:"
+    VIEW_TTL = 24 * 60 * 60  # 세션 만료 시간과 동일
+
+    # 업로드 후 사전 계산 사용 여부 (기본 비활성화, GPT 호출이 늘어날 수 있음)
+    ENABLED = os.getenv("EAGER_PRECOMPUTE", "false").lower() == "true"
+
+    _views: Dict[str, Callable[..., Awaitable[Any]]] = {}
+    _running: Dict[str, Tuple[int, Dict[str, asyncio.Task]]] = {}
+
+    _stats = {"scheduled": 0, "completed": 0, "cancelled": 0, "failed": 0, "hits": 0, "misses": 0}
+    _lock = threading.Lock()
+
+    # -----------------------
+    # 뷰 등록
+    # -----------------------
+    @classmethod
+    def register(cls, name: str, compute: Callable[..., Awaitable[Any]]):
+        """
+        뷰 계산 함수 등록 (session_id, **kwargs → 응답)
+
+        사전 계산은 요청을 처리하는 이벤트 루프에서 함께 실행되므로, 계산 함수 안의
+        동기 GPT/Redis/DB 호출은 asyncio.to_thread/run_db로 넘겨야 한다.
+        """
+        cls._views[name] = compute
+
+    @classmethod
+    def _view_key(cls, session_id: str, version: int, name: str) -> str:
+        return f"{cls.VIEW_KEY_PREFIX}{session_id}:{version}:{name}"
+
+    @classmethod
+    async def _store(cls, session_id: str, version: int, name: str, value: Any) -> bool:
+        """계산 시작 시점의 버전이 아직 최신일 때만 저장"""
+        if await SessionVersion.get(session_id) != version:
+            logger.info(f"[PRECOMPUTE] {name} 결과 폐기 (버전 {version} 이후 새 데이터 업로드)")
+            return False
+        # 뷰가 버전 키보다 오래 남지 않도록 TTL 제한
+        # (세션이 연장되는 동안 버전 키가 먼저 만료되어 0부터 다시 증가하면 이전 뷰가 재사용될 수 있음)
+        ttl = cls.VIEW_TTL
+        if version > 0:
+            version_ttl = await SessionVersion.remaining_ttl(session_id)
+            if version_ttl is not None and version_ttl > 0:
+                ttl = min(ttl, version_ttl)
+        await get_async_redis(session_id).setex(
+            cls._view_key(session_id, version, name),
+            ttl,
+            json.dumps(value, ensure_ascii=False)
+        )
+        return True
+
+    # -----------------------
+    # 백그라운드 사전 계산
+    # -----------------------
+    @classmethod
+    async def schedule(cls, session_id: str):
+        """
+        업로드 직후 호출 (세션 변경 이벤트) - 등록된 모든 뷰를 백그라운드에서 계산
+        같은 세션의 이전 사전 계산은 취소한다.
+        """
+        cls.cancel(session_id)
+        if not cls.ENABLED or not cls._views:
+            return
+
+        version = await SessionVersion.get(session_id)
+        # 버전 조회 중 같은 세션의 다른 업로드가 먼저 예약했다면 그 계산도 취소
+        cls.cancel(session_id)
+        tasks = {
+            name: asyncio.create_task(cls._run(session_id, version, name, compute))
+            for name, compute in cls._views.items()
+        }
+        cls._running[session_id] = (version, tasks)
+        for task in tasks.values():
+            task.add_done_callback(lambda t: cls._on_done(session_id, version, t))
+
+        with cls._lock:
+            cls._stats["scheduled"] += 1
+        logger.info(f"[PRECOMPUTE] 세션 데이터 버전 {version}: {', '.join(tasks)} 사전 계산 시작")
+
+    @classmethod
+    async def on_session_change(cls, event):
+        """
+        세션 변경 이벤트 consumer (derived_views group)
+
+        이미 더 새로운 데이터가 저장된 이벤트는 건너뛴다. (최신 버전 이벤트에서 계산됨)
+        """
+        if await SessionVersion.get(event.session_id) != event.version:
+            return
+        await cls.schedule(event.session_id)
+
+    @classmethod
+    def cancel(cls, session_id: str):
+        """진행 중인 사전 계산 취소"""
+        running = cls._running.pop(session_id, None)
+        if not running:
+            return
+        version, tasks = running
+        cancelled = 0
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
+                cancelled += 1
+        if cancelled:
+            with cls._lock:
+                cls._stats["cancelled"] += cancelled
+            logger.info(f"[PRECOMPUTE] 버전 {version} 사전 계산 {cancelled}건 취소")
+
+    @classmethod
+    async def _run(cls, session_id: str, version: int, name: str,
+                   compute: Callable[[str], Awaitable[Any]]) -> Any:
+        try:
+            value = await compute(session_id)
+            await cls._store(session_id, version, name, value)
+            with cls._lock:
+                cls._stats["completed"] += 1
+            return value
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            with cls._lock:
+                cls._stats["failed"] += 1
+            logger.warning(f"[PRECOMPUTE] {name} 사전 계산 실패: {type(e).__name__}: {str(e)}")
+            raise
+
+    @classmethod
+    def _on_done(cls, session_id: str, version: int, task: asyncio.Task):
+        """모든 뷰 계산이 끝나면 진행 목록에서 제거"""
+        # 실패한 사전 계산의 예외는 여기서 소비 (조회 시 직접 계산으로 대체)
+        if not task.cancelled():
+            task.exception()
+        running = cls._running.get(session_id)
+        if running and running[0] == version and all(t.done() for t in running[1].values()):
+            cls._running.pop(session_id, None)
+
+    # -----------------------
+    # 조회
+    # -----------------------
+    @classmethod
+    async def get_or_compute(cls, session_id: str, name: str, **kwargs) -> Any:
+        """
+        현재 데이터 버전의 뷰 응답 반환
+
+        1. 캐시된 결과가 있으면 바로 반환
+        2. 같은 버전의 사전 계산이 진행 중이면 그 결과를 기다림 (중복 GPT 호출 방지)
+        3. 없으면 직접 계산 후 저장 (kwargs는 계산 함수에 전달, 예: 이미 조회한 세션 데이터)
+        """
+        version = await SessionVersion.get(session_id)
+        cached = await cls._load(session_id, version, name)
+        if cached is not None:
+            with cls._lock:
+                cls._stats["hits"] += 1
+            logger.info(f"[PRECOMPUTE] HIT {name} (버전 {version})")
+            return cached
+
+        with cls._lock:
+            cls._stats["misses"] += 1
+
+        running = cls._running.get(session_id)
+        if running and running[0] == version and name in running[1]:
+            task = running[1][name]
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise
+                # 사전 계산이 취소된 경우 직접 계산
+            except Exception:
+                # 사전 계산 실패 시 직접 계산하여 원래 오류를 그대로 전달
+                pass
+
+        value = await cls._views[name](session_id, **kwargs)
+        try:
+            await cls._store(session_id, version, name, value)
+        except Exception as e:
+            logger.error(f"[PRECOMPUTE] {name} 저장 실패: {str(e)}")
+        return value
+
+    @classmethod
+    async def _load(cls, session_id: str, version: int, name: str) -> Optional[Any]:
+        try:
+            cached = await get_async_redis(session_id).get(cls._view_key(session_id, version, name))
+            return json.loads(cached) if cached else None
+        except Exception as e:
+            logger.error(f"[PRECOMPUTE] 조회 실패: {str(e)}")
+            return None
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, Any]:
+        """사전 계산 및 뷰 캐시 적중 통계"""
+        with cls._lock:
+            stats = dict(cls._stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 4) if total else 0.0
+        stats["enabled"] = cls.ENABLED
+        stats["running_sessions"] = len(cls._running)
+        return stats
@@ -0,0 +1,241 @@
+"""
+문서 압축기 (Document Compactor)
+GPT 추출 프롬프트에 넣기 전에 금액/키워드가 없는 줄과
+페이지마다 반복되는 머리말·꼬리말을 제거하여 프롬프트 토큰을 줄인다
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from config.database.session import get_db_session
+from ieinfo.infrastructure.orm.ie_info import IEType
+from ieinfo.infrastructure.repository.ie_rule_repository_impl import IERuleRepositoryImpl
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+@dataclass
+class CompactionResult:
+    """압축 결과"""
+    text: str  # 압축된 본문
+    tokens_before: int  # 압축 전 추정 토큰 수
+    tokens_after: int  # 압축 후 추정 토큰 수
+    kept_lines: int  # 유지된 줄 수
+    dropped_lines: int  # 제거된 줄 수
+    dropped_furniture: List[str] = field(default_factory=list)  # 제거된 반복 줄 (머리말/꼬리말)
+
+    @property
+    def saving_rate(self) -> float:
+        if self.tokens_before == 0:
+            return 0.0
+        return 1 - (self.tokens_after / self.tokens_before)
+
+
+class DocumentCompactor:
+    """
+    PDF에서 추출한 페이지 텍스트를 GPT 추출용으로 압축
+
+    처리 흐름:
+    1. 여러 페이지에 반복되는 줄(머리말, 꼬리말, 반복 컬럼 헤더) 제거
+    2. 페이지 번호 줄 제거
+    3. 금액 또는 IE_RULE 키워드를 포함한 줄만 유지
+    4. 유지된 줄이 너무 적으면 원문을 그대로 사용 (정확도 보호)
+    """
+
+    # 금액 패턴: 1,000 / 1000 이상 정수 / 1,000원 (2024년, 2024.01 같은 날짜는 제외)
+    AMOUNT_PATTERN = re.compile(r'\d{1,3}(?:,\d{3})+|\d{4,}(?!\d|\s*[년./\-])|\d+\s*원')
+
+    # 페이지 번호 패턴: "3", "- 3 -", "3 / 10", "3페이지", "Page 3"
+    PAGE_NUMBER_PATTERN = re.compile(
+        r'^(?:-\s*\d+\s*-|\d+\s*/\s*\d+|\d+\s*(?:페이지|쪽)|page\s*\d+(?:\s*of\s*\d+)?|\d{1,3})$',
+        re.IGNORECASE
+    )
+
+    # 숫자만 있는 짧은 줄: 페이지 맨 위/아래면 페이지 번호, 그 외에는 앞 줄 항목의 소액 금액 (예: "지방소득세" 다음 줄 "850")
+    SHORT_NUMBER_PATTERN = re.compile(r'^-?\d{1,3}$')
+
+    # 항목명(문자) 포함 여부 판단용
+    LABEL_PATTERN = re.compile(r'[가-힣A-Za-z]')
+
+    # DB 규칙을 불러오지 못했을 때 사용하는 기본 키워드 (init_ie_rules.py 와 동일)
+    FALLBACK_KEYWORDS = [
+        "급여", "월급", "연봉", "봉급", "임금",
+        "상여", "상여금", "보너스", "성과급", "인센티브",
+        "수당", "식대", "교통비", "주거수당",
+        "이자", "배당", "배당금", "이자소득",
+        "보험료", "국민연금", "건강보험", "고용보험", "산재보험",
+        "세금", "소득세", "지방소득세", "주민세",
+        "카드", "신용카드", "체크카드", "카드사용액",
+        "공제", "공제액", "차감"
+    ]
+
+    # 전체 줄 대비 최소 유지 비율 (이보다 적게 남으면 압축하지 않음)
+    MIN_KEEP_RATIO = 0.05
+
+    # IE_RULE 키워드 재로드 주기 (초) - 업로드마다 새 인스턴스를 만들므로 키워드는 클래스 단위로 보관
+    KEYWORDS_TTL = 5 * 60
+    _keywords: List[str] = []
+    _keywords_loaded_at = 0.0
+    _keywords_lock = threading.Lock()
+
+    def __init__(self, keywords: Optional[List[str]] = None):
+        if keywords is None:
+            keywords = self._get_keywords()
+        self.keywords = [k.lower() for k in keywords if k]
+
+    @classmethod
+    def _get_keywords(cls) -> List[str]:
+        """KEYWORDS_TTL 동안 캐시된 IE_RULE 키워드 (만료 시 한 스레드만 다시 로드)"""
+        if time.time() - cls._keywords_loaded_at < cls.KEYWORDS_TTL:
+            return cls._keywords
+        with cls._keywords_lock:
+            if time.time() - cls._keywords_loaded_at < cls.KEYWORDS_TTL:
+                return cls._keywords
+            cls._keywords = cls._load_keywords_from_db()
+            cls._keywords_loaded_at = time.time()
+            return cls._keywords
+
+    @classmethod
+    def _load_keywords_from_db(cls) -> List[str]:
+        """IE_RULE 테이블에서 소득/지출 키워드 로드"""
+        db_session = get_db_session()
+        try:
+            rule_repo = IERuleRepositoryImpl(db_session)
+            keywords = (
+                rule_repo.find_all_keywords_by_type(IEType.INCOME)
+                + rule_repo.find_all_keywords_by_type(IEType.EXPENSE)
+            )
+            if keywords:
+                return keywords
+            logger.warning("[COMPACT] IE_RULE 키워드가 비어 있어 기본 키워드를 사용합니다.")
+        except Exception as e:
+            logger.error(f"[COMPACT] IE_RULE 키워드 로드 실패, 기본 키워드 사용: {str(e)}")
+        finally:
+            db_session.close()
+        return list(cls.FALLBACK_KEYWORDS)
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """
+        GPT 토큰 수 추정
+
+        한글은 대략 글자당 1토큰, 그 외 문자는 약 4글자당 1토큰으로 계산한다.
+        (tokenizer 의존성 없이 압축 전후 비교용으로 사용)
+        """
+        if not text:
+            return 0
+        hangul = len(re.findall(r'[가-힣]', text))
+        others = len(re.sub(r'[가-힣\s]', '', text))
+        spaces = len(re.findall(r'\s+', text))
+        return hangul + (others + spaces + 3) // 4
+
+    @staticmethod
+    def _normalize_line(line: str) -> str:
+        return re.sub(r'\s+', ' ', line).strip()
+
+    def _is_page_number(self, line: str, index: int, line_count: int) -> bool:
+        if self.SHORT_NUMBER_PATTERN.match(line):
+            return index == 0 or index == line_count - 1
+        return bool(self.PAGE_NUMBER_PATTERN.match(line))
+
+    def _is_relevant(self, line: str) -> bool:
+        if self.AMOUNT_PATTERN.search(line) or self.SHORT_NUMBER_PATTERN.match(line):
+            return True
+        line_lower = line.lower()
+        return any(keyword in line_lower for keyword in self.keywords)
+
+    def _is_amount_only(self, line: str) -> bool:
+        """항목명 없이 금액만 있는 줄 (항목명은 바로 앞 줄에 있음)"""
+        if self.SHORT_NUMBER_PATTERN.match(line):
+            return True
+        return bool(self.AMOUNT_PATTERN.search(line)) and not self.LABEL_PATTERN.search(line.replace("원", ""))
+
+    def _find_page_furniture(self, pages: List[List[str]]) -> set:
+        """두 페이지 이상에서 반복되는 줄 (머리말/꼬리말/컬럼 헤더) 탐지"""
+        if len(pages) < 2:
+            return set()
+
+        counter = Counter()
+        labels = set()
+        for lines in pages:
+            counter.update(set(lines))
+            # 다음 줄이 금액만 있는 줄이면 그 금액의 항목명 (매 페이지 반복되어도 보존)
+            labels.update(line for line, following in zip(lines, lines[1:]) if self._is_amount_only(following))
+
+        # 과반 페이지에 반복되면서 금액이 없는 줄만 반복 요소로 본다
+        # (예: 매 페이지 "합계 1,000,000"이나 매달 같은 소액 공제 "850" 같은 실제 데이터는 보존)
+        threshold = max(2, (len(pages) + 1) // 2)
+        return {
+            line for line, count in counter.items()
+            if count >= threshold and not self.AMOUNT_PATTERN.search(line)
+            and not self.SHORT_NUMBER_PATTERN.match(line) and line not in labels
+        }
+
+    def compact(self, pages: List[str]) -> CompactionResult:
+        """
+        페이지별 텍스트를 압축
+
+        Args:
+            pages: 페이지별 원문 텍스트 (줄바꿈 유지)
+
+        Returns:
+            CompactionResult
+        """
+        page_lines = [
+            [self._normalize_line(line) for line in page.splitlines() if line.strip()]
+            for page in pages
+        ]
+        original_text = "\n".join(line for lines in page_lines for line in lines)
+        tokens_before = self.estimate_tokens(original_text)
+        total_lines = sum(len(lines) for lines in page_lines)
+
+        furniture = self._find_page_furniture(page_lines)
+
+        kept = []
+        for lines in page_lines:
+            previous = None
+            for index, line in enumerate(lines):
+                if line in furniture or self._is_page_number(line, index, len(lines)):
+                    continue
+                if not self._is_relevant(line):
+                    previous = line
+                    continue
+                # 금액만 있는 줄이면 바로 앞 줄을 항목명으로 함께 유지
+                if previous and self._is_amount_only(line):
+                    kept.append(previous)
+                previous = None
+                kept.append(line)
+
+        if total_lines and len(kept) < max(1, int(total_lines * self.MIN_KEEP_RATIO)):
+            # 압축 결과가 지나치게 작으면 정확도 보호를 위해 원문 사용
+            logger.warning(f"[COMPACT] 유지된 줄이 너무 적어 원문을 사용합니다 ({len(kept)}/{total_lines})")
+            return CompactionResult(
+                text=original_text,
+                tokens_before=tokens_before,
+                tokens_after=tokens_before,
+                kept_lines=total_lines,
+                dropped_lines=0
+            )
+
+        compacted_text = "\n".join(kept)
+        result = CompactionResult(
+            text=compacted_text,
+            tokens_before=tokens_before,
+            tokens_after=self.estimate_tokens(compacted_text),
+            kept_lines=len(kept),
+            dropped_lines=total_lines - len(kept),
+            dropped_furniture=sorted(furniture)
+        )
+
+        logger.info(
+            f"[COMPACT] tokens {result.tokens_before} → {result.tokens_after} "
+            f"({result.saving_rate * 100:.1f}% 절감), "
+            f"lines kept={result.kept_lines}, dropped={result.dropped_lines}, "
+            f"furniture={len(result.dropped_furniture)}"
+        )
+        return result
@@ -9,6 +9,7 @@ from openai import OpenAI
 
 from util.cache.ai_cache import AICache
 from util.log.log import Log
+from documents_multi_agents.domain.service.category_cache import CategoryCache
 from documents_multi_agents.domain.service.hybrid_parser import HybridParser
 
 load_dotenv()
@@ -21,6 +22,9 @@ class FinancialAnalyzerService:
     Redis에서 복호화된 재무 데이터를 AI로 분석하고 카테고리별로 분류하는 서비스
     """
 
+    INCOME_CATEGORIES = ["고정소득", "변동소득", "기타소득"]
+    EXPENSE_CATEGORIES = ["고정지출", "변동지출", "저축 및 투자", "기타 및 예비비"]
+
     def __init__(self):
         self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
@@ -123,11 +127,19 @@ class FinancialAnalyzerService:
             except json.JSONDecodeError:
                 logger.warning("[CACHE] Failed to parse cached income data, re-analyzing")
 
+        # 🔥 항목 단위 캐시: 이미 분류된 항목은 GPT에 다시 보내지 않음
+        resolved, new_items = CategoryCache.resolve(CategoryCache.INCOME, income_items)
+        if not new_items:
+            logger.info(f"[CATEGORY CACHE] 모든 소득 항목을 캐시로 분류했습니다. GPT 호출 생략")
+            result = CategoryCache.assemble(income_items, resolved, self.INCOME_CATEGORIES, "기타소득", "총소득")
+            AICache.set_cached_response(cache_key, json.dumps(result, ensure_ascii=False), ttl=86400)
+            return result
+
         # ============================================
         # 🆕 하이브리드 파싱 (규칙 기반 우선)
         # ============================================
         logger.info(f"\n{'='*80}")
-        logger.info(f"📊 [HYBRID PARSING START] 소득 항목 분류 시작 ({len(income_items)}개 항목)")
+        logger.info(f"📊 [HYBRID PARSING START] 소득 항목 분류 시작 ({len(new_items)}개 신규 / 전체 {len(income_items)}개)")
         logger.info(f"{'='*80}")
         
         try:
@@ -142,7 +154,7 @@ class FinancialAnalyzerService:
         uncertain_items = {}  # GPT 필요
         
         if hybrid_parser:
-            for field_name, value in income_items.items():
+            for field_name, value in new_items.items():
                 try:
                     trans_type, category, metadata = hybrid_parser.classify_item(
                         field_name, 
@@ -174,16 +186,16 @@ class FinancialAnalyzerService:
         else:
             # HybridParser 실패 시 모든 항목을 GPT로
             logger.warning("⚠️  HybridParser를 사용할 수 없습니다. 모든 항목을 GPT로 처리합니다.")
-            uncertain_items = income_items.copy()
+            uncertain_items = new_items.copy()
         
         # ============================================
-        # GPT로 전체 재분석 (불확실한 항목 포함)
+        # GPT로 신규 항목 분석 (캐시에 없는 항목만)
         # ============================================
         if uncertain_items:
             logger.warning(f"\n⚠️  [{len(uncertain_items)}개 항목] GPT로 재분석 필요:")
             for field in uncertain_items.keys():
                 logger.warning(f"   - {field}")
-            logger.info(f"\n🤖 [GPT PARSING] 전체 항목을 GPT로 분석합니다...")
+            logger.info(f"\n🤖 [GPT PARSING] 신규 항목만 GPT로 분석합니다...")
         else:
             logger.info(f"\n✅ [100% DB-RULE] 모든 항목을 규칙 기반으로 처리했습니다!")
             logger.info(f"🤖 [GPT PARSING] 정확도 향상을 위해 GPT로 카테고리 분류를 진행합니다...")
@@ -193,7 +205,7 @@ class FinancialAnalyzerService:
 다음 소득 항목들을 분석하여 아래 카테고리로 정확하게 분류해줘:
 
 소득 항목:
-{json.dumps(income_items, ensure_ascii=False, indent=2)}
+{json.dumps(new_items, ensure_ascii=False, indent=2)}
 
 **엄격한 분류 기준:**
 
@@ -273,6 +285,12 @@ class FinancialAnalyzerService:
                 # 🎓 GPT 학습: 불확실했던 항목들을 DB에 저장
                 if uncertain_items:
                     self._learn_from_gpt_income(uncertain_items, cleaned_result)
+
+                # 🔥 신규 항목의 카테고리를 항목 캐시에 저장하고, 합계는 전체 항목으로 로컬 재계산
+                assignments = CategoryCache.assign_from_result(new_items, cleaned_result, self.INCOME_CATEGORIES)
+                CategoryCache.store(CategoryCache.INCOME, assignments)
+                resolved.update(assignments)
+                cleaned_result = CategoryCache.assemble(income_items, resolved, self.INCOME_CATEGORIES, "기타소득", "총소득")
                 
                 # ✅ GPT 분석 완료 로깅
                 logger.info(f"\n✅ [GPT COMPLETED] 소득 분류 완료")
@@ -334,11 +352,19 @@ class FinancialAnalyzerService:
             except json.JSONDecodeError:
                 logger.warning("[CACHE] Failed to parse cached expense data, re-analyzing")
 
+        # 🔥 항목 단위 캐시: 이미 분류된 항목은 GPT에 다시 보내지 않음
+        resolved, new_items = CategoryCache.resolve(CategoryCache.EXPENSE, expense_items)
+        if not new_items:
+            logger.info(f"[CATEGORY CACHE] 모든 지출 항목을 캐시로 분류했습니다. GPT 호출 생략")
+            result = CategoryCache.assemble(expense_items, resolved, self.EXPENSE_CATEGORIES, "기타 및 예비비", "총지출")
+            AICache.set_cached_response(cache_key, json.dumps(result, ensure_ascii=False), ttl=86400)
+            return result
+
         # ============================================
         # 🆕 하이브리드 파싱 (규칙 기반 우선)
         # ============================================
         logger.info(f"\n{'='*80}")
-        logger.info(f"📊 [HYBRID PARSING START] 지출 항목 분류 시작 ({len(expense_items)}개 항목)")
+        logger.info(f"📊 [HYBRID PARSING START] 지출 항목 분류 시작 ({len(new_items)}개 신규 / 전체 {len(expense_items)}개)")
         logger.info(f"{'='*80}")
         
         try:
@@ -353,7 +379,7 @@ class FinancialAnalyzerService:
         uncertain_items = {}  # GPT 필요
         
         if hybrid_parser:
-            for field_name, value in expense_items.items():
+            for field_name, value in new_items.items():
                 try:
                     trans_type, category, metadata = hybrid_parser.classify_item(
                         field_name, 
@@ -385,16 +411,16 @@ class FinancialAnalyzerService:
         else:
             # HybridParser 실패 시 모든 항목을 GPT로
             logger.warning("⚠️  HybridParser를 사용할 수 없습니다. 모든 항목을 GPT로 처리합니다.")
-            uncertain_items = expense_items.copy()
+            uncertain_items = new_items.copy()
         
         # ============================================
-        # GPT로 전체 재분석 (불확실한 항목 포함)
+        # GPT로 신규 항목 분석 (캐시에 없는 항목만)
         # ============================================
         if uncertain_items:
             logger.warning(f"\n⚠️  [{len(uncertain_items)}개 항목] GPT로 재분석 필요:")
             for field in uncertain_items.keys():
                 logger.warning(f"   - {field}")
-            logger.info(f"\n🤖 [GPT PARSING] 전체 항목을 GPT로 분석합니다...")
+            logger.info(f"\n🤖 [GPT PARSING] 신규 항목만 GPT로 분석합니다...")
         else:
             logger.info(f"\n✅ [100% DB-RULE] 모든 항목을 규칙 기반으로 처리했습니다!")
             logger.info(f"🤖 [GPT PARSING] 정확도 향상을 위해 GPT로 카테고리 분류를 진행합니다...")
@@ -405,7 +431,7 @@ class FinancialAnalyzerService:
 다음 지출 항목들을 분석하여 아래 카테고리로 정확하게 분류해줘:
 
 지출 항목:
-{json.dumps(expense_items, ensure_ascii=False, indent=2)}
+{json.dumps(new_items, ensure_ascii=False, indent=2)}
 
 **엄격한 분류 기준:**
 
@@ -506,6 +532,12 @@ class FinancialAnalyzerService:
                 # 🎓 GPT 학습: 불확실했던 항목들을 DB에 저장
                 if uncertain_items:
                     self._learn_from_gpt_expense(uncertain_items, cleaned_result)
+
+                # 🔥 신규 항목의 카테고리를 항목 캐시에 저장하고, 합계는 전체 항목으로 로컬 재계산
+                assignments = CategoryCache.assign_from_result(new_items, cleaned_result, self.EXPENSE_CATEGORIES)
+                CategoryCache.store(CategoryCache.EXPENSE, assignments)
+                resolved.update(assignments)
+                cleaned_result = CategoryCache.assemble(expense_items, resolved, self.EXPENSE_CATEGORIES, "기타 및 예비비", "총지출")
                 
                 # ✅ GPT 분석 완료 로깅
                 logger.info(f"\n✅ [GPT COMPLETED] 지출 분류 완료")
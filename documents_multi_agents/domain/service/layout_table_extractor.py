@@ -0,0 +1,339 @@
+"""
+레이아웃 기반 표 추출기 (Layout Table Extractor)
+pypdf 텍스트 visitor로 글자 좌표를 수집하여 행/열을 복원하고
+"항목 금액" 형태의 표를 GPT 없이 "항목: 금액" 쌍으로 변환한다
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from pypdf import PdfReader
+
+from documents_multi_agents.domain.service.rule_based_parser import RuleBasedParser
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+@dataclass
+class TextRun:
+    """pypdf visitor가 전달한 텍스트 조각과 좌표"""
+    text: str
+    x: float
+    y: float
+    font_size: float
+
+
+@dataclass
+class PageLayout:
+    """페이지 크기, 텍스트 조각 목록, 일반 추출 텍스트"""
+    width: float
+    height: float
+    runs: List[TextRun]
+    text: str
+
+
+@dataclass
+class TableExtractionResult:
+    """표 추출 결과"""
+    items: List[Tuple[str, str]]  # [(항목명, 금액), ...]
+    confidence: float  # 표 인식 신뢰도 (0.0 ~ 1.0)
+    pages: List[PageLayout]
+    amount_cells: int  # 금액으로 인식된 셀 수
+    paired_cells: int  # 항목명과 짝지어진 금액 셀 수
+    elapsed: float  # 처리 시간 (초)
+    item_positions: Dict[str, Tuple[int, float, float]] = field(default_factory=dict)  # 항목명 → (페이지, x, y)
+
+    @property
+    def page_texts(self) -> List[str]:
+        return [page.text for page in self.pages]
+
+    def to_answer(self) -> str:
+        """기존 Redis 저장 경로가 파싱하는 "항목: 금액" 형식으로 변환"""
+        return "\n".join(f"{label}: {amount}" for label, amount in self.items)
+
+
+class LayoutTableExtractor:
+    """
+    좌표 기반 표 추출
+
+    처리 흐름:
+    1. 페이지별로 텍스트 조각과 좌표 수집 (일반 텍스트 추출과 동시에 수행)
+    2. y 좌표로 행 묶기 → x 좌표 순 정렬
+    3. 행 안에서 "항목명 → 금액" 순서로 짝짓기 (2단 명세서도 처리)
+    4. 금액 셀 대비 짝지어진 비율로 신뢰도 계산
+    """
+
+    # 금액 셀: 3,000,000 / 3,000,000원 / 3000000원 / -12,000 / 850
+    # 구분 기호도 "원"도 없는 4자리 이상 숫자(2024, 20240125, 코드 등)는 연도/날짜/식별번호일 수 있으므로 제외
+    AMOUNT_CELL_PATTERN = re.compile(r'^-?\d{1,3}(?:,\d{3})+원?$|^-?\d+원$|^-?\d{1,3}$')
+
+    # 금액처럼 보이지만 식별번호인 항목명 키워드
+    EXCLUDED_LABEL_KEYWORDS = [
+        "사번", "번호", "주민", "전화", "계좌", "사업자", "코드",
+        "일자", "날짜", "기간", "연도", "년도", "귀속", "페이지", "우편",
+        "지급일", "기준일", "입사일", "생년월일"
+    ]
+
+    # 같은 행으로 볼 y 좌표 허용 오차 (폰트 크기 대비)
+    ROW_TOLERANCE_RATIO = 0.5
+
+    # 로컬 추출을 채택하기 위한 기준
+    CONFIDENCE_THRESHOLD = 0.8
+    MIN_PAIRS = 3
+
+    # 처리량 / GPT 호출 회피율 통계 (프로세스 단위)
+    _stats_lock = threading.Lock()
+    _stats = {
+        'documents': 0,
+        'pages': 0,
+        'elapsed': 0.0,
+        'layout_extracted': 0,
+        'template_extracted': 0,
+        'gpt_fallback': 0
+    }
+
+    def __init__(self, confidence_threshold: float = CONFIDENCE_THRESHOLD, min_pairs: int = MIN_PAIRS):
+        self.confidence_threshold = confidence_threshold
+        self.min_pairs = min_pairs
+        self.rule_parser = RuleBasedParser()
+
+    # -----------------------
+    # 좌표 수집
+    # -----------------------
+    @staticmethod
+    def read_layout(reader: PdfReader) -> List[PageLayout]:
+        """페이지별 텍스트 조각 좌표와 일반 텍스트를 한 번에 수집"""
+        pages = []
+        for page in reader.pages:
+            runs: List[TextRun] = []
+
+            def visitor(text, cm, tm, font_dict, font_size):
+                if not text or not text.strip():
+                    return
+                # 텍스트 행렬(tm)과 변환 행렬(cm)을 곱해 페이지 좌표 계산
+                x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+                y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+                scale = abs(tm[3] * cm[3]) or 1.0
+                runs.append(TextRun(text=text, x=x, y=y, font_size=(font_size or 10.0) * scale))
+
+            text = page.extract_text(visitor_text=visitor) or ""
+            lines = [re.sub(r'[ \t　]+', ' ', line).strip() for line in text.splitlines()]
+            pages.append(PageLayout(
+                width=float(page.mediabox.width),
+                height=float(page.mediabox.height),
+                runs=runs,
+                text="\n".join(line for line in lines if line)
+            ))
+        return pages
+
+    def group_rows(self, runs: List[TextRun]) -> List[List[TextRun]]:
+        """y 좌표가 가까운 조각을 같은 행으로 묶고 x 좌표 순으로 정렬"""
+        rows: List[List[TextRun]] = []
+        row_y: List[float] = []
+        for run in sorted(runs, key=lambda r: (-r.y, r.x)):
+            tolerance = max(2.0, run.font_size * self.ROW_TOLERANCE_RATIO)
+            if rows and abs(row_y[-1] - run.y) <= tolerance:
+                rows[-1].append(run)
+            else:
+                rows.append([run])
+                row_y.append(run.y)
+        return [sorted(row, key=lambda r: r.x) for row in rows]
+
+    # -----------------------
+    # 셀 분리 / 짝짓기
+    # -----------------------
+    def _split_cells(self, row: List[TextRun]) -> List[Tuple[str, TextRun]]:
+        """
+        행을 셀 단위로 분리
+        조각 하나가 "급여 3,000,000" 처럼 항목과 금액을 함께 가진 경우도 나눈다
+        """
+        cells = []
+        for run in row:
+            for token in run.text.split():
+                cells.append((token, run))
+
+        merged: List[Tuple[str, TextRun]] = []
+        for token, run in cells:
+            if self._is_amount(token):
+                merged.append((token, run))
+            elif merged and not self._is_amount(merged[-1][0]):
+                # 연속된 문자 조각은 하나의 항목명으로 합침 ("기본", "급" → "기본 급")
+                merged[-1] = (f"{merged[-1][0]} {token}", merged[-1][1])
+            else:
+                merged.append((token, run))
+        return merged
+
+    def _is_amount(self, token: str) -> bool:
+        return bool(self.AMOUNT_CELL_PATTERN.match(token))
+
+    @staticmethod
+    def _clean_label(label: str) -> str:
+        # 기존 "항목: 금액" 파싱 정규식에 맞도록 괄호/기호 제거
+        label = re.sub(r'[^가-힣\w\s]', ' ', label)
+        return re.sub(r'\s+', ' ', label).strip()
+
+    @staticmethod
+    def _clean_amount(amount: str) -> str:
+        # 음수(공제 환급, 정산 차감 등)는 부호를 유지
+        return amount.replace(",", "").replace("원", "").strip()
+
+    def _is_excluded_label(self, label: str) -> bool:
+        return any(keyword in label for keyword in self.EXCLUDED_LABEL_KEYWORDS)
+
+    def _keyword_sides(self, label: str) -> set:
+        """항목명에 포함된 소득/지출 키워드 종류 ('income', 'expense')"""
+        label_lower = label.lower()
+        sides = set()
+        for side, keyword_groups in (('income', self.rule_parser.income_keywords),
+                                     ('expense', self.rule_parser.expense_keywords)):
+            for info in keyword_groups.values():
+                if any(keyword in label_lower for keyword in info['keywords']):
+                    sides.add(side)
+                    break
+        return sides
+
+    def _matches_doc_type(self, label: str, doc_type: Optional[str]) -> bool:
+        """문서 타입과 반대 성격의 항목 제외 (예: 소득 문서의 보험료, 지출 문서의 급여)"""
+        if not doc_type:
+            return True
+        trans_type, _, _ = self.rule_parser._classify_transaction(label, None)
+        sides = self._keyword_sides(label)
+        if "소득" in doc_type or "income" in doc_type.lower():
+            return trans_type != 'expense' and sides != {'expense'}
+        if "지출" in doc_type or "expense" in doc_type.lower():
+            return trans_type != 'income' and sides != {'income'}
+        return True
+
+    def iter_label_cells(self, pages: List[PageLayout]):
+        """
+        행마다 "항목명 + 뒤따르는 금액 셀" 묶음을 순서대로 반환
+
+        Yields:
+            (page_index, label, amounts, run)
+            - label: 정리된 항목명 (항목명 없이 나온 금액이면 "")
+            - amounts: 뒤따르는 금액 문자열 목록
+            - run: 항목명(또는 첫 금액)이 포함된 텍스트 조각 (좌표 참조용)
+        """
+        for page_index, page in enumerate(pages):
+            for row in self.group_rows(page.runs):
+                cells = self._split_cells(row)
+                i = 0
+                while i < len(cells):
+                    token, run = cells[i]
+                    start = i if self._is_amount(token) else i + 1
+                    j = start
+                    while j < len(cells) and self._is_amount(cells[j][0]):
+                        j += 1
+                    amounts = [cell[0] for cell in cells[start:j]]
+                    label = "" if start == i else self._clean_label(token)
+                    yield page_index, label, amounts, run
+                    i = j
+
+    # -----------------------
+    # 추출
+    # -----------------------
+    def extract(self, reader: PdfReader, doc_type: Optional[str] = None,
+                pages: Optional[List[PageLayout]] = None) -> TableExtractionResult:
+        """
+        표 추출 및 신뢰도 계산
+
+        Args:
+            reader: PdfReader
+            doc_type: 문서 타입 ('소득', '지출', None)
+            pages: 이미 수집한 페이지 레이아웃 (없으면 새로 수집)
+
+        Returns:
+            TableExtractionResult
+        """
+        start_time = time.time()
+        if pages is None:
+            pages = self.read_layout(reader)
+
+        items: List[Tuple[str, str]] = []
+        positions: Dict[str, Tuple[int, float, float]] = {}
+        amount_cells = 0
+        paired_cells = 0
+
+        for page_index, label, amounts, run in self.iter_label_cells(pages):
+            if not label:
+                # 항목명 없이 나온 금액 → 짝짓기 실패
+                amount_cells += len(amounts)
+            elif not amounts or self._is_excluded_label(label):
+                continue  # 식별번호 등은 금액 셀로 집계하지 않음
+            elif len(amounts) == 1:
+                amount_cells += 1
+                paired_cells += 1
+                amount = self._clean_amount(amounts[0])
+                if amount and int(amount) != 0 and self._matches_doc_type(label, doc_type):
+                    items.append((label, amount))
+                    positions.setdefault(label, (page_index, run.x, run.y))
+            else:
+                # 월별 컬럼 등 한 항목에 금액이 여러 개 → 합계 열을 판단할 수 없음
+                amount_cells += len(amounts)
+
+        confidence = (paired_cells / amount_cells) if amount_cells else 0.0
+        elapsed = time.time() - start_time
+
+        result = TableExtractionResult(
+            items=items,
+            confidence=confidence,
+            pages=pages,
+            amount_cells=amount_cells,
+            paired_cells=paired_cells,
+            elapsed=elapsed,
+            item_positions=positions
+        )
+
+        with self._stats_lock:
+            self._stats['documents'] += 1
+            self._stats['pages'] += len(pages)
+            self._stats['elapsed'] += elapsed
+
+        logger.info(
+            f"[LAYOUT] pages={len(pages)}, pairs={paired_cells}/{amount_cells}, "
+            f"items={len(items)}, confidence={confidence:.2f}, elapsed={elapsed * 1000:.1f}ms"
+        )
+        return result
+
+    def is_confident(self, result: TableExtractionResult) -> bool:
+        """GPT 없이 로컬 추출 결과를 사용할 수 있는지 판단"""
+        return (
+            result.confidence >= self.confidence_threshold
+            and len(result.items) >= self.min_pairs
+        )
+
+    # -----------------------
+    # 통계
+    # -----------------------
+    @classmethod
+    def record_outcome(cls, method: str):
+        """문서 처리 결과 기록 ('layout', 'template', 'gpt')"""
+        key = {
+            'layout': 'layout_extracted',
+            'template': 'template_extracted'
+        }.get(method, 'gpt_fallback')
+        with cls._stats_lock:
+            cls._stats[key] += 1
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, float]:
+        """페이지당 처리량 및 GPT 호출 회피율"""
+        with cls._stats_lock:
+            stats = dict(cls._stats)
+
+        avoided = stats['layout_extracted'] + stats['template_extracted']
+        decided = avoided + stats['gpt_fallback']
+        return {
+            'documents': stats['documents'],
+            'pages': stats['pages'],
+            'pages_per_second': (stats['pages'] / stats['elapsed']) if stats['elapsed'] else 0.0,
+            'avg_ms_per_page': (stats['elapsed'] * 1000 / stats['pages']) if stats['pages'] else 0.0,
+            'layout_extracted': stats['layout_extracted'],
+            'template_extracted': stats['template_extracted'],
+            'gpt_fallback': stats['gpt_fallback'],
+            'gpt_avoidance_rate': (avoided / decided) if decided else 0.0
+        }
@@ -0,0 +1,241 @@
+"""
+레이아웃 템플릿 저장소 (Layout Template Store)
+같은 회사의 급여명세서, 같은 카드사의 명세서처럼 매달 동일한 양식으로 들어오는 문서를
+레이아웃 지문(fingerprint)으로 식별하고, 성공한 추출 결과의 "항목명 → 좌표" 매핑을
+템플릿으로 저장하여 다음 문서부터 GPT 없이 로컬에서 추출한다
+"""
+
+import hashlib
+import json
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config.redis_config import get_cache_redis
+from documents_multi_agents.domain.service.layout_table_extractor import LayoutTableExtractor, PageLayout
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class LayoutTemplateStore:
+    """
+    레이아웃 지문 기반 추출 템플릿 관리
+
+    저장 구조 (Redis):
+    - layout_template:{fingerprint} (hash)
+        doc_type, entries(JSON), hits, failures, created_at, last_hit_at
+    - layout_template:index (sorted set) : fingerprint → 마지막 사용 시각 (LRU 제거용)
+
+    템플릿에는 항목명과 좌표만 저장하며 금액은 저장하지 않는다.
+    Redis를 동기로 호출하므로 비동기 핸들러에서는 executor에서 실행한다.
+    템플릿과 인덱스를 같은 pipeline에서 갱신하므로 모든 키를 INDEX_KEY 기준 캐시 샤드 한 곳에 저장한다.
+    """
+
+    KEY_PREFIX = "layout_template:"
+    INDEX_KEY = "layout_template:index"
+
+    TEMPLATE_TTL = 90 * 24 * 60 * 60  # 90일 동안 사용되지 않으면 만료
+    MAX_TEMPLATES = 1000  # 최대 템플릿 수 (초과 시 가장 오래 사용되지 않은 템플릿 제거)
+    MAX_FAILURES = 3  # 연속 적용 실패 시 템플릿 제거 (양식 변경으로 간주)
+
+    GRID = 8.0  # 지문 계산 시 좌표 양자화 단위 (pt)
+    POSITION_TOLERANCE = 6.0  # 템플릿 좌표 매칭 허용 오차 (pt)
+
+    def __init__(self, extractor: Optional[LayoutTableExtractor] = None):
+        self.extractor = extractor or LayoutTableExtractor()
+        self.redis_client = get_cache_redis(self.INDEX_KEY)
+
+    # -----------------------
+    # 지문 계산
+    # -----------------------
+    def fingerprint(self, pages: List[PageLayout], doc_type: str) -> str:
+        """
+        레이아웃 지문 계산
+
+        페이지 크기 + 금액이 뒤따르는 항목명 셀(급여 항목, 공제 항목 등)의 양자화 좌표로 구성한다.
+        성명/회사명/주소처럼 금액이 없는 텍스트와 사번·계좌 같은 식별번호 항목은 제외하여
+        같은 양식이면 사용자와 달에 관계없이 같은 지문이 된다.
+        """
+        labels: Dict[int, List[str]] = {}
+        for page_index, label, amounts, run in self.extractor.iter_label_cells(pages):
+            if label and amounts and not self.extractor._is_excluded_label(label):
+                labels.setdefault(page_index, []).append(
+                    f"{self._normalize(label)}@{round(run.x / self.GRID)},{round(run.y / self.GRID)}"
+                )
+
+        parts = [doc_type, str(len(pages))]
+        for page_index, page in enumerate(pages):
+            parts.append(f"P{page_index}:{round(page.width)}x{round(page.height)}")
+            parts.extend(sorted(labels.get(page_index, [])))
+        return hashlib.sha1("\n".join(parts).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _normalize(label: str) -> str:
+        return re.sub(r'\s+', '', label)
+
+    def _collect_pairs(self, pages: List[PageLayout]) -> List[Tuple[int, str, str, float, float]]:
+        """(페이지, 항목명, 금액, x, y) 목록 - 금액이 하나뿐인 셀만 사용"""
+        pairs = []
+        for page_index, label, amounts, run in self.extractor.iter_label_cells(pages):
+            if label and len(amounts) == 1:
+                amount = self.extractor._clean_amount(amounts[0])
+                pairs.append((page_index, label, amount, run.x, run.y))
+        return pairs
+
+    # -----------------------
+    # 템플릿 적용
+    # -----------------------
+    def match(self, fingerprint: str, pages: List[PageLayout]) -> Optional[List[Tuple[str, str]]]:
+        """
+        지문에 해당하는 템플릿이 있으면 로컬 추출
+
+        Returns:
+            [(항목명, 금액), ...] 또는 None (템플릿 없음 / 적용 실패)
+        """
+        key = f"{self.KEY_PREFIX}{fingerprint}"
+        try:
+            template = self.redis_client.hgetall(key)
+        except Exception as e:
+            logger.error(f"[TEMPLATE] 조회 실패: {str(e)}")
+            return None
+
+        if not template:
+            return None
+
+        start_time = time.time()
+        entries = json.loads(template.get("entries", "[]"))
+        pairs = self._collect_pairs(pages)
+
+        items = []
+        for entry in entries:
+            found = None
+            for page_index, label, amount, x, y in pairs:
+                if (page_index == entry["page"]
+                        and self._normalize(label) == entry["layout_label"]
+                        and abs(x - entry["x"]) <= self.POSITION_TOLERANCE
+                        and abs(y - entry["y"]) <= self.POSITION_TOLERANCE):
+                    found = amount
+                    break
+            if found is None:
+                break
+            items.append((entry["label"], found))
+
+        elapsed = time.time() - start_time
+
+        if not entries or len(items) != len(entries):
+            failures = self.redis_client.hincrby(key, "failures", 1)
+            logger.warning(f"[TEMPLATE] 적용 실패 ({len(items)}/{len(entries)}), failures={failures}")
+            if failures >= self.MAX_FAILURES:
+                self.evict(fingerprint)
+            return None
+
+        now = int(time.time())
+        pipe = self.redis_client.pipeline()
+        pipe.hincrby(key, "hits", 1)
+        pipe.hset(key, mapping={"failures": 0, "last_hit_at": now})
+        pipe.expire(key, self.TEMPLATE_TTL)
+        pipe.zadd(self.INDEX_KEY, {fingerprint: now})
+        pipe.execute()
+
+        logger.info(f"[TEMPLATE] HIT {fingerprint[:12]}: {len(items)} items in {elapsed * 1000:.1f}ms")
+        return items
+
+    # -----------------------
+    # 템플릿 학습
+    # -----------------------
+    def learn(self, fingerprint: str, pages: List[PageLayout], doc_type: str,
+              extracted_items: Dict[str, str]) -> bool:
+        """
+        성공한 추출 결과로 템플릿 저장
+
+        추출된 모든 항목이 문서 좌표상의 "항목명 + 금액" 셀과 값까지 일치할 때만 저장한다.
+        (일부만 찾은 템플릿은 이후 추출 정확도를 떨어뜨리므로 저장하지 않음)
+        """
+        if not extracted_items:
+            return False
+
+        pairs = self._collect_pairs(pages)
+        entries = []
+        used = set()
+        for field_name, value in extracted_items.items():
+            target = self._normalize(field_name)
+            match = None
+            for index, (page_index, label, amount, x, y) in enumerate(pairs):
+                if index in used:
+                    continue
+                if self._normalize(label) == target and amount == value:
+                    match = index
+                    break
+            if match is None:
+                logger.debug(f"[TEMPLATE] 좌표를 찾을 수 없는 항목: {field_name}")
+                return False
+            used.add(match)
+            page_index, label, _, x, y = pairs[match]
+            entries.append({
+                "label": field_name,
+                "layout_label": self._normalize(label),
+                "page": page_index,
+                "x": round(x, 1),
+                "y": round(y, 1)
+            })
+
+        key = f"{self.KEY_PREFIX}{fingerprint}"
+        now = int(time.time())
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.hset(key, mapping={
+                "doc_type": doc_type,
+                "entries": json.dumps(entries, ensure_ascii=False),
+                "hits": 0,
+                "failures": 0,
+                "created_at": now,
+                "last_hit_at": now
+            })
+            pipe.expire(key, self.TEMPLATE_TTL)
+            pipe.zadd(self.INDEX_KEY, {fingerprint: now})
+            pipe.execute()
+            self._evict_overflow()
+            logger.info(f"[TEMPLATE] STORED {fingerprint[:12]}: {len(entries)} entries")
+            return True
+        except Exception as e:
+            logger.error(f"[TEMPLATE] 저장 실패: {str(e)}")
+            return False
+
+    # -----------------------
+    # 제거 / 통계
+    # -----------------------
+    def evict(self, fingerprint: str):
+        """템플릿 제거"""
+        pipe = self.redis_client.pipeline()
+        pipe.delete(f"{self.KEY_PREFIX}{fingerprint}")
+        pipe.zrem(self.INDEX_KEY, fingerprint)
+        pipe.execute()
+        logger.info(f"[TEMPLATE] EVICTED {fingerprint[:12]}")
+
+    def _evict_overflow(self):
+        """최대 개수 초과분과 TTL로 만료된 템플릿을 인덱스에서 정리"""
+        expire_before = int(time.time()) - self.TEMPLATE_TTL
+        self.redis_client.zremrangebyscore(self.INDEX_KEY, 0, expire_before)
+
+        overflow = self.redis_client.zcard(self.INDEX_KEY) - self.MAX_TEMPLATES
+        if overflow > 0:
+            for fingerprint in self.redis_client.zrange(self.INDEX_KEY, 0, overflow - 1):
+                self.evict(fingerprint)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """템플릿 수 및 누적 적중 횟수"""
+        try:
+            fingerprints = self.redis_client.zrange(self.INDEX_KEY, 0, -1)
+            pipe = self.redis_client.pipeline()
+            for fingerprint in fingerprints:
+                pipe.hget(f"{self.KEY_PREFIX}{fingerprint}", "hits")
+            hits = [int(h) for h in pipe.execute() if h is not None]
+            return {
+                "templates": len(hits),
+                "total_hits": sum(hits),
+                "max_hits": max(hits) if hits else 0
+            }
+        except Exception as e:
+            logger.error(f"[TEMPLATE] 통계 조회 실패: {str(e)}")
+            return {}
@@ -23,6 +23,12 @@ class ParsedTransaction:
 
 class RuleBasedParser:
     """규칙 기반 소득/지출 분류 파서"""
+
+    # 보험료, 세금 등은 소득 명세서에 있어도 실제론 지출
+    FORCED_EXPENSE_KEYWORDS = ['보험료', '보험', '세금', '소득세', '지방소득세', '공제액']
+    FORCED_EXPENSE_WEIGHT = 0.40
+    CONFIDENCE_THRESHOLD = 0.40  # 신뢰도 임계값: 이 이상이어야 분류
+    DOC_TYPE_HINT_WEIGHT = 0.20
     
     def __init__(self):
         # 소득 키워드 (강도별 분류 - 높을수록 확실)
@@ -184,24 +190,21 @@ class RuleBasedParser:
         # === doc_type 힌트 보너스 (PDF 타입 정보) ===
         if doc_type_hint:
             if "소득" in doc_type_hint or "income" in doc_type_hint.lower():
-                income_score += 0.20
+                income_score += self.DOC_TYPE_HINT_WEIGHT
                 logger.debug(f"[RULE] 문서 타입 힌트: 소득 (+0.20)")
             elif "지출" in doc_type_hint or "expense" in doc_type_hint.lower():
-                expense_score += 0.20
+                expense_score += self.DOC_TYPE_HINT_WEIGHT
                 logger.debug(f"[RULE] 문서 타입 힌트: 지출 (+0.20)")
         
         # === 특정 항목 강제 분류 규칙 ===
-        # 보험료, 세금 등은 소득 명세서에 있어도 실제론 지출
-        forced_expense_keywords = ['보험료', '보험', '세금', '소득세', '지방소득세', '공제액']
-        for keyword in forced_expense_keywords:
+        for keyword in self.FORCED_EXPENSE_KEYWORDS:
             if keyword in field_lower and "공제대상" not in field_lower:
-                expense_score += 0.40
+                expense_score += self.FORCED_EXPENSE_WEIGHT
                 expense_matches.append(f"강제분류:{keyword}")
                 logger.debug(f"[RULE] 강제 지출 분류: '{keyword}' in '{field_name}' (+0.40)")
         
         # === 최종 판단 ===
-        # 신뢰도 임계값: 0.4 이상이어야 분류
-        confidence_threshold = 0.40
+        confidence_threshold = self.CONFIDENCE_THRESHOLD
         
         if income_score > expense_score and income_score >= confidence_threshold:
             final_type = 'income'
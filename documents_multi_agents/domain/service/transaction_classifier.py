@@ -0,0 +1,248 @@
+"""
+거래내역 일괄 분류기 (Transaction Classifier)
+오픈뱅킹 계좌/카드 거래 적요를 RuleBasedParser 가중치와 IE_RULE 키워드로 묶음 단위 분류
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from config.database.session import get_db_session
+from documents_multi_agents.domain.service.rule_based_parser import RuleBasedParser
+from ieinfo.infrastructure.orm.ie_info import IEType
+from ieinfo.infrastructure.repository.ie_rule_repository_impl import IERuleRepositoryImpl
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+@dataclass
+class BankTransaction:
+    """분류 대상 거래 한 건"""
+    tran_date: str  # YYYYMMDD
+    description: str  # 적요/가맹점명
+    amount: int
+    direction: Optional[str] = None  # 'in'(입금) / 'out'(출금·카드승인) / None
+
+
+@dataclass
+class TransactionClass:
+    """분류 결과"""
+    ie_type: Optional[IEType]  # None이면 분류 불가
+    category: str
+    confidence: float
+
+
+class _KeywordGroup:
+    """같은 가중치의 키워드 묶음 → 정규식 하나로 한 번에 매칭"""
+
+    def __init__(self, keywords: Iterable[str], weight: float, category: Optional[str]):
+        keywords = sorted({k.lower() for k in keywords if k}, key=len, reverse=True)
+        self.weight = weight
+        self.category = category
+        # 긴 키워드를 먼저 두어 '급여입금'이 '급여'보다 우선 매칭되도록 함
+        self.pattern: Optional[Pattern] = (
+            re.compile("|".join(re.escape(k) for k in keywords)) if keywords else None
+        )
+
+    def match(self, text: str) -> Optional[str]:
+        if self.pattern is None:
+            return None
+        found = self.pattern.search(text)
+        return found.group(0) if found else None
+
+
+class TransactionClassifier:
+    """
+    RuleBasedParser와 같은 점수 규칙으로 거래를 소득/지출 + 카테고리로 분류
+
+    - 강도별 키워드 목록을 정규식 하나로 미리 컴파일하여 거래마다 키워드 목록을 순회하지 않는다.
+    - IE_RULE 키워드는 DB_RULE_WEIGHT 가중치의 그룹으로 추가하며 RULES_TTL마다 다시 읽는다.
+    - 같은 적요는 반복되는 경우가 많으므로 묶음 안에서는 고유 적요만 한 번씩 분류하고,
+      결과는 CACHE_MAX_SIZE까지 메모리에 보관한다.
+    - 계좌 거래는 입출금 방향이 확실하므로 방향으로 소득/지출을 정하고, 키워드는 카테고리/신뢰도에만 쓴다.
+    """
+    __instance = None
+
+    DB_RULE_WEIGHT = 0.45  # GPT가 학습한 키워드 (RuleBasedParser high~very_high 사이)
+    DIRECTION_WEIGHT = RuleBasedParser.DOC_TYPE_HINT_WEIGHT  # 입출금 방향 힌트
+    RULES_TTL = 5 * 60  # IE_RULE 키워드 재로드 주기 (초)
+    CACHE_MAX_SIZE = 50000
+    BATCH_SIZE = 1000
+
+    DEFAULT_INCOME_CATEGORY = "기타소득"
+    DEFAULT_EXPENSE_CATEGORY = "기타지출"
+
+    _stats = {"classified": 0, "unclassified": 0, "cache_hits": 0, "rule_reloads": 0}
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if hasattr(self, "_parser"):
+            return
+        self._parser = RuleBasedParser()
+        self._income_groups: List[_KeywordGroup] = []
+        self._expense_groups: List[_KeywordGroup] = []
+        self._rules_loaded_at = 0.0
+        self._cache: Dict[Tuple[str, Optional[str]], TransactionClass] = {}
+        self._build_lock = threading.Lock()
+        self._cache_lock = threading.Lock()  # to_thread 작업자 여러 개가 동시에 캐시를 갱신/비움
+
+    # -----------------------------
+    # 규칙 컴파일
+    # -----------------------------
+    def _load_db_keywords(self) -> Tuple[List[str], List[str]]:
+        db_session = get_db_session()
+        try:
+            rule_repo = IERuleRepositoryImpl(db_session)
+            return (
+                rule_repo.find_all_keywords_by_type(IEType.INCOME),
+                rule_repo.find_all_keywords_by_type(IEType.EXPENSE)
+            )
+        except Exception as e:
+            logger.error(f"[CLASSIFIER] IE_RULE 키워드 로드 실패, 기본 규칙만 사용: {str(e)}")
+            return [], []
+        finally:
+            db_session.close()
+
+    def _ensure_rules(self):
+        if time.time() - self._rules_loaded_at < self.RULES_TTL:
+            return
+        with self._build_lock:
+            if time.time() - self._rules_loaded_at < self.RULES_TTL:
+                return
+            income_rules, expense_rules = self._load_db_keywords()
+
+            income_groups = [
+                _KeywordGroup(info["keywords"], info["weight"], info["category"])
+                for info in self._parser.income_keywords.values()
+            ]
+            expense_groups = [
+                _KeywordGroup(info["keywords"], info["weight"], None)
+                for info in self._parser.expense_keywords.values()
+            ]
+            if income_rules:
+                income_groups.append(_KeywordGroup(income_rules, self.DB_RULE_WEIGHT, None))
+            if expense_rules:
+                expense_groups.append(_KeywordGroup(expense_rules, self.DB_RULE_WEIGHT, None))
+
+            self._income_groups, self._expense_groups = income_groups, expense_groups
+            # 규칙이 바뀌었을 수 있으므로 이전 분류 결과는 버림
+            self._cache = {}
+            self._rules_loaded_at = time.time()
+            with self._lock:
+                self._stats["rule_reloads"] += 1
+            logger.info(
+                f"📚 [CLASSIFIER] 규칙 컴파일 완료: IE_RULE 소득 {len(income_rules)}개, 지출 {len(expense_rules)}개"
+            )
+
+    # -----------------------------
+    # 분류
+    # -----------------------------
+    @staticmethod
+    def _score(groups: List[_KeywordGroup], text: str) -> Tuple[float, Optional[str], Optional[str]]:
+        """(점수, 가장 강한 그룹의 카테고리, 가장 강한 그룹에서 매칭된 키워드)"""
+        score, category, keyword, best_weight = 0.0, None, None, -1.0
+        for group in groups:
+            matched = group.match(text)
+            if matched is None:
+                continue
+            score += group.weight
+            if group.weight > best_weight:
+                best_weight, category, keyword = group.weight, group.category, matched
+        return score, category, keyword
+
+    def _classify_one(self, description: str, direction: Optional[str]) -> TransactionClass:
+        text = description.lower()
+        income_score, income_category, income_keyword = self._score(self._income_groups, text)
+        expense_score, _, expense_keyword = self._score(self._expense_groups, text)
+
+        if "공제대상" not in text:
+            for keyword in RuleBasedParser.FORCED_EXPENSE_KEYWORDS:
+                if keyword in text:
+                    expense_score += RuleBasedParser.FORCED_EXPENSE_WEIGHT
+
+        if direction == "in":
+            income_score += self.DIRECTION_WEIGHT
+            ie_type = IEType.INCOME
+        elif direction == "out":
+            expense_score += self.DIRECTION_WEIGHT
+            ie_type = IEType.EXPENSE
+        else:
+            threshold = RuleBasedParser.CONFIDENCE_THRESHOLD
+            if income_score > expense_score and income_score >= threshold:
+                ie_type = IEType.INCOME
+            elif expense_score > income_score and expense_score >= threshold:
+                ie_type = IEType.EXPENSE
+            else:
+                return TransactionClass(None, "", max(income_score, expense_score))
+
+        if ie_type == IEType.INCOME:
+            category = income_category or income_keyword or self.DEFAULT_INCOME_CATEGORY
+            return TransactionClass(ie_type, category, min(income_score, 1.0))
+        category = expense_keyword or self.DEFAULT_EXPENSE_CATEGORY
+        return TransactionClass(ie_type, category, min(expense_score, 1.0))
+
+    def classify_batch(self, transactions: List[BankTransaction]) -> List[TransactionClass]:
+        """
+        거래 목록 분류 (입력과 같은 순서의 결과 목록)
+
+        묶음 안의 고유 (적요, 방향)만 분류하고 나머지는 결과를 재사용한다.
+        """
+        self._ensure_rules()
+        cache = self._cache
+        keys = [(t.description.strip(), t.direction) for t in transactions]
+
+        # 다른 스레드가 캐시를 비울 수 있으므로 이번 묶음의 결과는 따로 모아서 사용
+        classified: Dict[Tuple[str, Optional[str]], TransactionClass] = {}
+        hits = 0
+        for key in set(keys):
+            result = cache.get(key)
+            if result is not None:
+                hits += 1
+            else:
+                result = self._classify_one(*key)
+                with self._cache_lock:
+                    if len(cache) >= self.CACHE_MAX_SIZE:
+                        cache.clear()
+                    cache[key] = result
+            classified[key] = result
+
+        results = [classified[key] for key in keys]
+        unclassified = sum(1 for result in results if result.ie_type is None)
+        with self._lock:
+            self._stats["classified"] += len(results) - unclassified
+            self._stats["unclassified"] += unclassified
+            self._stats["cache_hits"] += hits
+        return results
+
+    def classify(self, transactions: Iterable[BankTransaction]) -> Iterable[Tuple[BankTransaction, TransactionClass]]:
+        """BATCH_SIZE 단위로 나누어 분류 (대량 거래도 메모리에 한 번에 올리지 않음)"""
+        batch: List[BankTransaction] = []
+        for transaction in transactions:
+            batch.append(transaction)
+            if len(batch) >= self.BATCH_SIZE:
+                yield from zip(batch, self.classify_batch(batch))
+                batch = []
+        if batch:
+            yield from zip(batch, self.classify_batch(batch))
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, int]:
+        with cls._lock:
+            stats = dict(cls._stats)
+        instance = cls.__instance
+        stats["cached_descriptions"] = len(instance._cache) if instance is not None else 0
+        return stats
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, HTTPException
 
 from ecos.application.factory.fetch_ecos_data_usecase_factory import FetchEcosDataUsecaseFactory
 
@@ -23,8 +23,10 @@ async def get_exchange_rate():
 @ecos_data_router.get("/exchange_rate_by_date/{date}")
 async def get_exchange_rate_db(date:str):
     usecase = FetchEcosDataUsecaseFactory.create()
-    result = usecase.get_exchange_rate_by_date(date)
-    return result
+    try:
+        return await usecase.get_exchange_rate_by_date(date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="date는 YYYYMM 형식이어야 합니다.")
 
 ## API 호출 횟수 제한이 있으므로, 1년 단위 정도로 제한 할 것
 @ecos_data_router.post("/exchange_rate/save")
@@ -72,8 +74,10 @@ async def get_interest_rate():
 @ecos_data_router.get("/interest_rate_by_date/{date}")
 async def get_interest_rate_db(date:str):
     usecase = FetchEcosDataUsecaseFactory.create()
-    result = usecase.get_interest_rate_by_date(date)
-    return result
+    try:
+        return await usecase.get_interest_rate_by_date(date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="date는 YYYYMM 형식이어야 합니다.")
 
 ## API 호출 횟수 제한이 있으므로, 1년 단위 정도로 제한 할 것
 @ecos_data_router.post("/interest_rate/save")
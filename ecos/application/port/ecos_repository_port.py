@@ -16,7 +16,7 @@ class EcosRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
+    async def get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
         pass
 
     @abstractmethod
@@ -28,5 +28,5 @@ class EcosRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
+    async def get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
         pass
\ No newline at end of file
@@ -19,8 +19,8 @@ class FetchEcosUseCase:
     async def get_exchange_rate(self) -> EcosData:
         return await self.adapter.get_exchange_rate()
 
-    def get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
-        return self.repository.get_exchange_rate_by_date(date)
+    async def get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
+        return await self.repository.get_exchange_rate_by_date(date)
 
     async def fetch_and_save_exchange_rate(self, start:str, end:str) -> List[Ecos]:
         """
@@ -78,8 +78,8 @@ class FetchEcosUseCase:
     async def get_interest_rate(self) -> EcosData:
         return await self.adapter.get_interest_rate()
 
-    def get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
-        return self.repository.get_interest_rate_by_date(date)
+    async def get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
+        return await self.repository.get_interest_rate_by_date(date)
 
     async def fetch_and_save_interest_rate(self, start:str, end:str) -> List[EcosInterest]:
         """
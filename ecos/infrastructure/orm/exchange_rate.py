@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, DateTime, Enum as SAEnum, Integer, Float
+from sqlalchemy import Column, DateTime, Enum as SAEnum, Integer, Float, UniqueConstraint, Index
 
 from config.database.session import Base
 
@@ -20,5 +20,12 @@ class ExchangeRateORM(Base):
     erm_date = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # 통화별 일자당 1건 (배치 저장 시 ON DUPLICATE KEY UPDATE 기준)
+    __table_args__ = (
+        UniqueConstraint("exchange_type", "erm_date", name="uq_exchange_rate_type_date"),
+        # 월 단위 조회(erm_date 범위 조건)용 - unique 키는 종류가 선두 컬럼이라 범위 조회에 쓰이지 않음
+        Index("ix_exchange_rate_erm_date", "erm_date"),
+    )
+
     def __repr__(self):
         return f"<ExchangeRateORM id={self.id} exchange_type={self.exchange_type} exchange_rate={self.exchange_rate} erm_date={self.erm_date}>"
\ No newline at end of file
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, Integer, Float
+from sqlalchemy import Column, String, DateTime, Integer, Float, UniqueConstraint, Index
 
 from config.database.session import Base
 
@@ -14,5 +14,12 @@ class InterestRateORM(Base):
     erm_date = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # 금리 종류별 일자당 1건 (배치 저장 시 ON DUPLICATE KEY UPDATE 기준)
+    __table_args__ = (
+        UniqueConstraint("interest_type", "erm_date", name="uq_interest_rate_type_date"),
+        # 월 단위 조회(erm_date 범위 조건)용 - unique 키는 종류가 선두 컬럼이라 범위 조회에 쓰이지 않음
+        Index("ix_interest_rate_erm_date", "erm_date"),
+    )
+
     def __repr__(self):
         return f"<InterestRateORM id={self.id} interest_type={self.interest_type} interest_rate={self.interest_rate} erm_date={self.erm_date}>"
\ No newline at end of file
@@ -1,15 +1,29 @@
+from datetime import date, datetime, time as datetime_time
 from typing import List
 
-from sqlalchemy import and_
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from config.database.bulk_upsert import bulk_upsert
+from config.database.date_range import month_range
+from config.database.db_executor import run_db
 from config.database.session import get_db_session
 from ecos.application.port.ecos_repository_port import EcosRepositoryPort
 from ecos.domain.ecos import Ecos
 from ecos.domain.ecos_interest import EcosInterest
 from ecos.infrastructure.orm.exchange_rate import ExchangeRateORM
 from ecos.infrastructure.orm.interest_rate import InterestRateORM
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+def _day(value):
+    """erm_date를 일자(자정) 단위로 맞춤 (unique 키가 일자 기준이 되도록)"""
+    if isinstance(value, datetime):
+        return datetime.combine(value.date(), datetime_time.min)
+    if isinstance(value, date):
+        return datetime.combine(value, datetime_time.min)
+    return value
 
 
 class EcosRepositoryImpl(EcosRepositoryPort):
@@ -26,12 +40,12 @@ class EcosRepositoryImpl(EcosRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
-
     async def save_exchange_rate(self, ecos: Ecos) -> Ecos:
+        return await run_db(self._save_exchange_rate, ecos)
+
+    def _save_exchange_rate(self, ecos: Ecos) -> Ecos:
 
+        db: Session = get_db_session()
         try:
             orm_exchange_rate = ExchangeRateORM(
                 exchange_type=ecos.exchange_type,
@@ -40,92 +54,79 @@ class EcosRepositoryImpl(EcosRepositoryPort):
                 created_at=ecos.created_at
             )
 
-            self.db.add(orm_exchange_rate)
-            self.db.commit()
-            self.db.refresh(orm_exchange_rate)
+            db.add(orm_exchange_rate)
+            db.commit()
+            db.refresh(orm_exchange_rate)
 
             # 도메인 엔티티에 id 업데이트 (필요한 경우)
             return ecos
         finally:
-            self.db.close()
+            db.close()
 
     async def save_exchange_rates_batch(self, ecos_list: List[Ecos]) -> List[Ecos]:
+        return await run_db(self._save_exchange_rates_batch, ecos_list)
 
+    def _save_exchange_rates_batch(self, ecos_list: List[Ecos]) -> List[Ecos]:
+        """
+        배치로 환율 데이터를 저장한다.
+        (exchange_type, erm_date 일자)가 같은 레코드가 있으면 환율 값만 갱신한다.
+        """
+        if not ecos_list:
+            return []
+
+        db: Session = get_db_session()
         try:
-            """
-            배치로 환율 데이터를 저장한다.
-            erm_date, exchange_type, exchange_rate가 동일한 레코드는 중복 저장하지 않는다.
-            """
-            if not ecos_list:
-                return []
-
-            # 중복 체크: 각 항목을 개별적으로 조회하여 정확한 비교 수행
-            new_ecos_list = []
-
-            for ecos in ecos_list:
-                # 날짜는 날짜 부분만 비교 (시간 제거)
-
-                erm_date_only = ecos.erm_date.date() if hasattr(ecos.erm_date, 'date') else ecos.erm_date
-
-                # 기존 레코드 조회 (exchange_type, erm_date 일치하는지 확인)
-                # datetime을 날짜만 비교하기 위해 DATE() 함수 사용
-                existing = self.db.query(ExchangeRateORM).filter(
-                    and_(
-                        ExchangeRateORM.exchange_type == ecos.exchange_type,
-                        # datetime을 날짜만 비교
-                        func.DATE(ExchangeRateORM.erm_date) == erm_date_only,
-                    )
-                ).first()
-
-                # 중복이 없으면 추가
-                if not existing:
-                    new_ecos_list.append(ecos)
-
-            if not new_ecos_list:
-                return ecos_list
-
-            # 새로운 항목만 ORM 객체로 변환
-            orm_list = [
-                ExchangeRateORM(
-                    exchange_type=ecos.exchange_type,
-                    exchange_rate=ecos.exchange_rate,
-                    erm_date=ecos.erm_date,
-                    created_at=ecos.created_at
-                )
-                for ecos in new_ecos_list
+            rows = [
+                {
+                    "exchange_type": ecos.exchange_type,
+                    "exchange_rate": ecos.exchange_rate,
+                    "erm_date": _day(ecos.erm_date),
+                    "created_at": ecos.created_at
+                }
+                for ecos in ecos_list
             ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
-
+            result = bulk_upsert(
+                db, ExchangeRateORM, rows,
+                key_columns=("exchange_type", "erm_date"),
+                update_columns=("exchange_rate",)
+            )
+            db.commit()
+            logger.info(f"[ECOS] 환율 저장: {result.to_dict()}")
             return ecos_list
         finally:
-            self.db.close()
+            db.close()
 
-    def get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
+    async def get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
+        return await run_db(self._get_exchange_rate_by_date, date)
 
+    def _get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
+        """해당 월(YYYYMM) 환율 조회 - erm_date 반열린 구간으로 인덱스 범위 스캔, 필요한 컬럼만 조회"""
+        start, end = month_range(date)
+        db: Session = get_db_session()
         try:
-            rows = (self.db.query(ExchangeRateORM).
-                    filter(func.date_format(ExchangeRateORM.erm_date, "%Y%m") == date).
+            rows = (db.query(ExchangeRateORM.exchange_type, ExchangeRateORM.exchange_rate,
+                             ExchangeRateORM.erm_date, ExchangeRateORM.created_at).
+                    filter(ExchangeRateORM.erm_date >= start, ExchangeRateORM.erm_date < end).
                     all())
 
             return [
                 Ecos(
-                    exchange_type=row.exchange_type.name,
-                    exchange_rate=row.exchange_rate,
-                    erm_date=row.erm_date,
-                    created_at=row.created_at
+                    exchange_type=exchange_type.name,
+                    exchange_rate=exchange_rate,
+                    erm_date=erm_date,
+                    created_at=created_at
                 )
-                for row in rows
+                for exchange_type, exchange_rate, erm_date, created_at in rows
             ]
         finally:
-            self.db.close()
+            db.close()
 
     async def save_interest_rate(self, ecos: EcosInterest) -> EcosInterest:
+        return await run_db(self._save_interest_rate, ecos)
+
+    def _save_interest_rate(self, ecos: EcosInterest) -> EcosInterest:
 
+        db: Session = get_db_session()
         try:
             orm_interest_rate = InterestRateORM(
                 interest_type=ecos.interest_type,
@@ -134,86 +135,69 @@ class EcosRepositoryImpl(EcosRepositoryPort):
                 created_at=ecos.created_at
             )
 
-            self.db.add(orm_interest_rate)
-            self.db.commit()
-            self.db.refresh(orm_interest_rate)
+            db.add(orm_interest_rate)
+            db.commit()
+            db.refresh(orm_interest_rate)
 
             # 도메인 엔티티에 id 업데이트 (필요한 경우)
             return ecos
         finally:
-            self.db.close()
+            db.close()
 
     async def save_interest_rates_batch(self, ecos_list: List[EcosInterest]) -> List[EcosInterest]:
+        return await run_db(self._save_interest_rates_batch, ecos_list)
 
+    def _save_interest_rates_batch(self, ecos_list: List[EcosInterest]) -> List[EcosInterest]:
+        """
+        배치로 금리 데이터를 저장한다.
+        (interest_type, erm_date 일자)가 같은 레코드가 있으면 금리 값만 갱신한다.
+        """
+        if not ecos_list:
+            return []
+
+        db: Session = get_db_session()
         try:
-            """
-            배치로 금리 데이터를 저장한다.
-            erm_date, interest_type, interest_rate가 동일한 레코드는 중복 저장하지 않는다.
-            """
-            if not ecos_list:
-                return []
-
-            # 중복 체크: 각 항목을 개별적으로 조회하여 정확한 비교 수행
-            new_ecos_list = []
-
-            for ecos in ecos_list:
-                # 날짜는 날짜 부분만 비교 (시간 제거)
-
-                erm_date_only = ecos.erm_date.date() if hasattr(ecos.erm_date, 'date') else ecos.erm_date
-
-                # 기존 레코드 조회 (interest_type, erm_date 일치하는지 확인)
-                # datetime을 날짜만 비교하기 위해 DATE() 함수 사용
-                existing = self.db.query(InterestRateORM).filter(
-                    and_(
-                        InterestRateORM.interest_type == ecos.interest_type,
-                        # datetime을 날짜만 비교
-                        func.DATE(InterestRateORM.erm_date) == erm_date_only,
-                    )
-                ).first()
-
-                # 중복이 없으면 추가
-                if not existing:
-                    new_ecos_list.append(ecos)
-
-            if not new_ecos_list:
-                return ecos_list
-
-            # 새로운 항목만 ORM 객체로 변환
-            orm_list = [
-                InterestRateORM(
-                    interest_type=ecos.interest_type,
-                    interest_rate=ecos.interest_rate,
-                    erm_date=ecos.erm_date,
-                    created_at=ecos.created_at
-                )
-                for ecos in new_ecos_list
+            rows = [
+                {
+                    "interest_type": ecos.interest_type,
+                    "interest_rate": ecos.interest_rate,
+                    "erm_date": _day(ecos.erm_date),
+                    "created_at": ecos.created_at
+                }
+                for ecos in ecos_list
             ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
-
+            result = bulk_upsert(
+                db, InterestRateORM, rows,
+                key_columns=("interest_type", "erm_date"),
+                update_columns=("interest_rate",)
+            )
+            db.commit()
+            logger.info(f"[ECOS] 금리 저장: {result.to_dict()}")
             return ecos_list
         finally:
-            self.db.close()
+            db.close()
 
-    def get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
+    async def get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
+        return await run_db(self._get_interest_rate_by_date, date)
 
+    def _get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
+        """해당 월(YYYYMM) 금리 조회 - erm_date 반열린 구간으로 인덱스 범위 스캔, 필요한 컬럼만 조회"""
+        start, end = month_range(date)
+        db: Session = get_db_session()
         try:
-            rows = (self.db.query(InterestRateORM).
-                    filter(func.date_format(InterestRateORM.erm_date, "%Y%m") == date).
+            rows = (db.query(InterestRateORM.interest_type, InterestRateORM.interest_rate,
+                             InterestRateORM.erm_date, InterestRateORM.created_at).
+                    filter(InterestRateORM.erm_date >= start, InterestRateORM.erm_date < end).
                     all())
 
             return [
                 EcosInterest(
-                    interest_type=row.interest_type,
-                    interest_rate=row.interest_rate,
-                    erm_date=row.erm_date,
-                    created_at=row.created_at
+                    interest_type=interest_type,
+                    interest_rate=interest_rate,
+                    erm_date=erm_date,
+                    created_at=created_at
                 )
-                for row in rows
+                for interest_type, interest_rate, erm_date, created_at in rows
             ]
         finally:
-            self.db.close()
\ No newline at end of file
+            db.close()
@@ -2,9 +2,12 @@ from typing import List
 
 from finance.application.port.finance_repository_port import FinanceRepositoryPort
 from finance.infrastructure.orm.finance_orm import FinanceORM
+from datetime import datetime
+
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
+from config.database.bulk_upsert import DB_BULK_CHUNK_SIZE, bulk_upsert
 from config.database.session import get_db_session
 
 class FinanceRepositoryImpl(FinanceRepositoryPort):
@@ -21,53 +24,42 @@ class FinanceRepositoryImpl(FinanceRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
+    # 중복 판단 키 (값까지 같아야 같은 행)
+    KEY_COLUMNS = ("user_id", "type", "base_dt", "key", "value")
 
     def save_finance_data(self, finance_data: List[FinanceORM]) -> List[FinanceORM]:
-
+        """
+        (user_id, type, base_dt, key, value)가 모두 같은 행은 건너뛰고 새 행만 일괄 저장
+
+        Returns:
+            새로 저장된 행 (id 포함, 저장된 키로 한 번에 다시 조회)
+        """
+        if not finance_data:
+            return []
+
+        rows = [
+            {
+                "user_id": finance.user_id,
+                "type": finance.type,
+                "base_dt": finance.base_dt or datetime.utcnow(),
+                "key": finance.key,
+                "value": finance.value
+            }
+            for finance in finance_data
+        ]
+
+        db: Session = get_db_session()
         try:
-            if not finance_data:
+            result = bulk_upsert(db, FinanceORM, rows, key_columns=self.KEY_COLUMNS)
+            db.commit()
+            if not result.new_keys:
                 return []
 
-            new_finance_data = []
-
-            for finance in finance_data:
-
-                existing = self.db.query(FinanceORM).filter(
-                    and_(
-                        FinanceORM.user_id == finance.user_id,
-                        FinanceORM.type == finance.type,
-                        FinanceORM.base_dt == finance.base_dt,
-                        FinanceORM.key == finance.key,
-                        FinanceORM.value == finance.value
-                    )
-                ).first()
-
-                if not existing:
-                    new_finance_data.append(finance)
-
-            if not new_finance_data:
-                return []
-
-            orm_list = [
-                FinanceORM(
-                    user_id=finance.user_id,
-                    type=finance.type,
-                    base_dt=finance.base_dt,
-                    key=finance.key,
-                    value=finance.value
-                )
-                for finance in new_finance_data
-            ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
-
-            return orm_list
+            key_cols = [getattr(FinanceORM, column) for column in self.KEY_COLUMNS]
+            saved = []
+            for offset in range(0, len(result.new_keys), DB_BULK_CHUNK_SIZE):
+                chunk = result.new_keys[offset:offset + DB_BULK_CHUNK_SIZE]
+                saved.extend(db.query(FinanceORM).filter(tuple_(*key_cols).in_(chunk)).all())
+            return saved
         finally:
-            self.db.close()
\ No newline at end of file
+            db.close()
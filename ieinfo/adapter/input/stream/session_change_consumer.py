@@ -0,0 +1,66 @@
+import asyncio
+import uuid
+
+from config.redis_config import get_async_redis
+from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
+from util.log.log import Log
+from util.session.session_shard_migrator import SessionShardMigrator
+from util.session.session_version import SessionVersion
+from util.stream.session_change_stream import SessionChangeEvent, SessionChangeStream
+
+logger = Log.get_logger()
+
+# 세션별 마지막으로 IE_INFO에 반영한 데이터 버전
+PERSISTED_KEY_PREFIX = "ie_info_persisted:"
+# 같은 세션의 이벤트를 여러 consumer가 동시에 반영하지 않도록 하는 잠금
+LOCK_KEY_PREFIX = "ie_info_lock:"
+LOCK_TIMEOUT_MS = 30 * 1000
+
+
+async def persist_session_change(event: SessionChangeEvent):
+    """
+    세션 변경 이벤트 → IE_INFO 반영 (ie_info group)
+
+    - 로그인 사용자만 저장한다. (GUEST 세션은 무시)
+    - 이미 더 새로운 버전을 반영했다면 건너뛴다. (재전달/순서 뒤바뀜 대응)
+    - 반영은 Redis의 현재 세션 데이터 전체 기준 멱등 upsert이므로 같은 이벤트를 여러 번 처리해도 결과가 같다.
+    - 실패 시 예외를 그대로 전달하여 이벤트가 ACK 되지 않고 재시도되게 한다.
+    """
+    session_id = event.session_id
+    redis_client = get_async_redis(session_id)  # 세션과 같은 샤드에 잠금/반영 버전 저장
+    user_token = await redis_client.hget(session_id, "USER_TOKEN")
+    if not user_token or user_token == "GUEST":
+        return
+
+    persisted_key = f"{PERSISTED_KEY_PREFIX}{session_id}"
+    lock_key = f"{LOCK_KEY_PREFIX}{session_id}"
+    lock_token = str(uuid.uuid4())
+
+    if not await redis_client.set(lock_key, lock_token, nx=True, px=LOCK_TIMEOUT_MS):
+        # 다른 consumer가 같은 세션을 반영 중 → 재시도 시 최신 데이터로 처리됨
+        raise RuntimeError(f"session {session_id} is being persisted by another consumer")
+
+    try:
+        persisted_version = int(await redis_client.get(persisted_key) or 0)
+        if event.version <= persisted_version:
+            logger.debug(f"[IE_INFO STREAM] 버전 {event.version} 이미 반영됨 (persisted={persisted_version})")
+            return
+
+        # 데이터를 읽기 전 버전 기록 (읽은 데이터는 이 버전 이상을 반영함)
+        current_version = await SessionVersion.get(session_id)
+
+        # 동기 DB 저장은 스레드에서 실행
+        result = await asyncio.to_thread(
+            IEInfoUseCase.get_instance().sync_ie_data_from_redis,
+            session_id, event.year, event.month
+        )
+        logger.info(f"[IE_INFO STREAM] 버전 {event.version} 반영: {result.get('message')}")
+
+        await redis_client.set(persisted_key, max(current_version, event.version), ex=SessionVersion.TTL)
+    finally:
+        if await redis_client.get(lock_key) == lock_token:
+            await redis_client.delete(lock_key)
+
+
+SessionShardMigrator.register_prefix(PERSISTED_KEY_PREFIX)
+SessionChangeStream.register("ie_info", persist_session_change)
@@ -2,14 +2,13 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 
 from account.adapter.input.web.session_helper import get_current_user
-from config.redis_config import get_redis
+from config.redis_config import get_async_redis
 from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
 from util.log.log import Log
 
 logger = Log.get_logger()
 ie_info_router = APIRouter(tags=["ie_info_router"])
 usecase = IEInfoUseCase().get_instance()
-redis_client = get_redis()
 
 
 @ie_info_router.post("/save")
@@ -31,7 +30,7 @@ async def save_ie_data_to_db(
     """
     try:
         # 로그인 여부 확인
-        user_token = redis_client.hget(session_id, "USER_TOKEN")
+        user_token = await get_async_redis(session_id).hget(session_id, "USER_TOKEN")
         
         if not user_token:
             raise HTTPException(
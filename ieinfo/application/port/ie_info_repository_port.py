@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List
 from ieinfo.infrastructure.orm.ie_info import IEInfo
 
 class IEInfoRepositoryPort(ABC):
@@ -14,6 +14,16 @@ class IEInfoRepositoryPort(ABC):
         """특정 세션의 특정 월 데이터 삭제 (중복 방지용)"""
         pass
     
+    @abstractmethod
+    def upsert_month(self, session_id: str, year: int, month: int, ie_info_list: List[IEInfo]) -> Dict[str, int]:
+        """특정 세션의 특정 월 데이터를 주어진 목록과 같아지도록 반영 (멱등)"""
+        pass
+
+    @abstractmethod
+    def replace_source_months(self, session_id: str, source: str, ie_info_list: List[IEInfo]) -> Dict[str, int]:
+        """특정 출처의 데이터를 목록에 포함된 월 단위로 주어진 목록과 같아지도록 반영 (멱등)"""
+        pass
+
     @abstractmethod
     def get_by_session(self, session_id: str, year: int = None, month: int = None) -> List[IEInfo]:
         """세션별 데이터 조회"""
@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, DateTime, Enum as SAEnum, Integer, String, ForeignKey
+from sqlalchemy import Column, DateTime, Enum as SAEnum, Integer, String, ForeignKey, UniqueConstraint
 
 from config.database.session import Base
 
@@ -13,6 +13,10 @@ class IEType(PyEnum):
 class IEInfo(Base):
     __tablename__ = "ie_info"
 
+    # 데이터 출처: 업로드 문서 분석 결과 / 오픈뱅킹(KFTC) 거래내역 분류 결과
+    SOURCE_DOCUMENT = "DOCUMENT"
+    SOURCE_KFTC = "KFTC"
+
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(255), ForeignKey("account.session_id"), nullable=False, index=True)
     ie_type = Column(SAEnum(IEType, native_enum=True), nullable=False, index=True)
@@ -20,6 +24,13 @@ class IEInfo(Base):
     value = Column(Integer, nullable=False)
     year = Column(Integer, nullable=False, index=True)
     month = Column(Integer, nullable=False, index=True)
+    source = Column(String(20), nullable=False, default=SOURCE_DOCUMENT, server_default=SOURCE_DOCUMENT)
     created_at = Column(DateTime, default=datetime.utcnow)
     modified_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # 세션/출처/월별 항목당 1건 (upsert_month/replace_source_months의 ON DUPLICATE KEY UPDATE 기준)
+    __table_args__ = (
+        UniqueConstraint("session_id", "source", "year", "month", "ie_type", "key",
+                         name="uq_ie_info_session_source_month_key"),
+    )
+
@@ -1,7 +1,9 @@
-from typing import List
+from datetime import datetime
+from typing import Dict, List
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, not_, or_, tuple_
 
+from config.database.bulk_upsert import bulk_upsert
 from config.database.session import get_db_session
 from ieinfo.application.port.ie_info_repository_port import IEInfoRepositoryPort
 from ieinfo.infrastructure.orm.ie_info import IEInfo
@@ -24,48 +26,151 @@ class IEInfoRepositoryImpl(IEInfoRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
-    
     def bulk_insert(self, ie_info_list: List[IEInfo]) -> bool:
         """IE_INFO 데이터 일괄 저장"""
+        db: Session = get_db_session()
         try:
-            self.db.add_all(ie_info_list)
-            self.db.commit()
+            db.add_all(ie_info_list)
+            db.commit()
             logger.info(f"Successfully inserted {len(ie_info_list)} IE_INFO records")
             return True
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Failed to insert IE_INFO records: {str(e)}")
             raise
         finally:
-            self.db.close()
+            db.close()
 
     def delete_by_session_and_month(self, session_id: str, year: int, month: int) -> bool:
         """특정 세션의 특정 월 데이터 삭제 (중복 방지용)"""
+        db: Session = get_db_session()
         try:
-            deleted_count = self.db.query(IEInfo).filter(
+            deleted_count = db.query(IEInfo).filter(
                 and_(
                     IEInfo.session_id == session_id,
                     IEInfo.year == year,
                     IEInfo.month == month
                 )
             ).delete()
-            self.db.commit()
+            db.commit()
             logger.info(f"Deleted {deleted_count} IE_INFO records for session {session_id}, {year}-{month}")
             return True
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Failed to delete IE_INFO records: {str(e)}")
             raise
         finally:
-            self.db.close()
+            db.close()
+
+    # unique 키 uq_ie_info_session_source_month_key와 같은 순서
+    UPSERT_KEY_COLUMNS = ("session_id", "source", "year", "month", "ie_type", "key")
+
+    @classmethod
+    def _sync_rows(cls, db: Session, scope, ie_info_list: List[IEInfo], stale_key_columns) -> Dict[str, int]:
+        """
+        scope 조건의 기존 행을 ie_info_list와 같아지도록 반영 (커밋은 호출자가 수행)
+
+        multi-row INSERT ... ON DUPLICATE KEY UPDATE로 새 항목은 INSERT, 값이 다른 행만 UPDATE 한 뒤
+        scope 안에서 목록에 없는 행(stale_key_columns 기준)을 DELETE 한다.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "session_id": ie_info.session_id, "source": ie_info.source,
+                "year": ie_info.year, "month": ie_info.month,
+                "ie_type": ie_info.ie_type, "key": ie_info.key, "value": ie_info.value,
+                "created_at": now, "modified_at": now
+            }
+            for ie_info in ie_info_list
+        ]
+        result = bulk_upsert(
+            db, IEInfo, rows,
+            key_columns=cls.UPSERT_KEY_COLUMNS,
+            update_columns=("value",),
+            touch_columns=("modified_at",)
+        )
+
+        stale = db.query(IEInfo).filter(scope)
+        if rows:
+            columns = [getattr(IEInfo, column) for column in stale_key_columns]
+            keys = {tuple(row[column] for column in stale_key_columns) for row in rows}
+            stale = stale.filter(not_(tuple_(*columns).in_(list(keys))))
+        deleted = stale.delete(synchronize_session=False)
+
+        return {"inserted": result.inserted, "updated": result.updated, "unchanged": result.skipped, "deleted": deleted}
+
+    def upsert_month(self, session_id: str, year: int, month: int, ie_info_list: List[IEInfo]) -> Dict[str, int]:
+        """
+        특정 세션의 특정 월 데이터를 주어진 목록과 같아지도록 한 트랜잭션으로 반영 (멱등)
+
+        (ie_type, key)가 같은 행은 값이 다를 때만 UPDATE, 새 항목은 INSERT, 목록에 없는 행은 DELETE 한다.
+        같은 목록으로 여러 번 호출해도 결과가 같으므로 이벤트 재전달 시에도 안전하다.
+        """
+        db: Session = get_db_session()
+        try:
+            for ie_info in ie_info_list:
+                ie_info.source = IEInfo.SOURCE_DOCUMENT
+            scope = and_(
+                IEInfo.session_id == session_id,
+                IEInfo.year == year,
+                IEInfo.month == month,
+                IEInfo.source == IEInfo.SOURCE_DOCUMENT
+            )
+            counts = self._sync_rows(db, scope, ie_info_list, ("ie_type", "key"))
+            db.commit()
+            logger.info(
+                f"Upserted IE_INFO for session {session_id}, {year}-{month}: "
+                f"{counts['inserted']} inserted, {counts['updated']} updated, "
+                f"{counts['unchanged']} unchanged, {counts['deleted']} deleted"
+            )
+            return counts
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to upsert IE_INFO records: {str(e)}")
+            raise
+        finally:
+            db.close()
+
+    def replace_source_months(self, session_id: str, source: str, ie_info_list: List[IEInfo]) -> Dict[str, int]:
+        """
+        특정 출처(source)의 데이터를 목록에 포함된 월 단위로 한 트랜잭션에 반영 (멱등)
+
+        (year, month, ie_type, key) 기준으로 값이 다를 때만 UPDATE, 새 항목은 INSERT,
+        목록의 (year, month)들에서 목록에 없는 행은 DELETE 한다. 다른 출처의 행은 건드리지 않는다.
+        """
+        months = {(ie_info.year, ie_info.month) for ie_info in ie_info_list}
+        if not months:
+            return {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+
+        db: Session = get_db_session()
+        try:
+            for ie_info in ie_info_list:
+                ie_info.source = source
+            scope = and_(
+                IEInfo.session_id == session_id,
+                IEInfo.source == source,
+                or_(*(and_(IEInfo.year == year, IEInfo.month == month) for year, month in months))
+            )
+            counts = self._sync_rows(db, scope, ie_info_list, ("year", "month", "ie_type", "key"))
+            db.commit()
+            logger.info(
+                f"Replaced {source} IE_INFO for session {session_id}, {len(months)} months: "
+                f"{counts['inserted']} inserted, {counts['updated']} updated, "
+                f"{counts['unchanged']} unchanged, {counts['deleted']} deleted"
+            )
+            return counts
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to replace IE_INFO records: {str(e)}")
+            raise
+        finally:
+            db.close()
 
     def get_by_session(self, session_id: str, year: int = None, month: int = None) -> List[IEInfo]:
         """세션별 데이터 조회"""
+        db: Session = get_db_session()
         try:
-            query = self.db.query(IEInfo).filter(IEInfo.session_id == session_id)
+            query = db.query(IEInfo).filter(IEInfo.session_id == session_id)
             
             if year is not None:
                 query = query.filter(IEInfo.year == year)
@@ -77,4 +182,4 @@ class IEInfoRepositoryImpl(IEInfoRepositoryPort):
             logger.error(f"Failed to fetch IE_INFO records: {str(e)}")
             raise
         finally:
-            self.db.close()
+            db.close()
@@ -5,6 +5,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from dotenv import load_dotenv
 
+from config.database.sql_metrics import SqlMetrics
 from product.application.factory.fetch_product_data_usecase_factory import FetchProductDataUsecaseFactory
 from util.log.log import Log
 
@@ -19,6 +20,8 @@ cron_bond_hour = os.getenv("CRON_BOND_HOUR", "04")
 cron_bond_minute = os.getenv("CRON_BOND_MINUTE", "00")
 cron_fund_hour = os.getenv("CRON_FUND_HOUR", "03")
 cron_fund_minute = os.getenv("CRON_FUND_MINUTE", "30")
+cron_product_integrity_hour = os.getenv("CRON_PRODUCT_INTEGRITY_HOUR", "06")
+cron_product_integrity_minute = os.getenv("CRON_PRODUCT_INTEGRITY_MINUTE", "00")
 
 cron_exchange_hour = os.getenv("CRON_EXCHANGE_HOUR", "05")
 cron_exchange_minute = os.getenv("CRON_EXCHANGE_MINUTE", "30")
@@ -33,19 +36,22 @@ def create_scheduler():
     if scheduler is None:
         scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
         trigger = CronTrigger(hour=cron_exchange_hour, minute=cron_exchange_minute)
-        scheduler.add_job(run_scheduler_ecos_exchange, trigger)
+        scheduler.add_job(SqlMetrics.track_job(run_scheduler_ecos_exchange), trigger)
 
         trigger = CronTrigger(hour=cron_interest_hour, minute=cron_interest_minute)
-        scheduler.add_job(run_scheduler_ecos_interest, trigger)
+        scheduler.add_job(SqlMetrics.track_job(run_scheduler_ecos_interest), trigger)
 
         trigger = CronTrigger(hour=cron_etf_hour, minute=cron_etf_minute)
-        scheduler.add_job(run_scheduler_product_etf, trigger)
+        scheduler.add_job(SqlMetrics.track_job(run_scheduler_product_etf), trigger)
 
         trigger = CronTrigger(hour=cron_fund_hour, minute=cron_fund_minute)
-        scheduler.add_job(run_scheduler_product_fund, trigger)
+        scheduler.add_job(SqlMetrics.track_job(run_scheduler_product_fund), trigger)
 
         trigger = CronTrigger(hour=cron_bond_hour, minute=cron_bond_minute)
-        scheduler.add_job(run_scheduler_product_bond, trigger)
+        scheduler.add_job(SqlMetrics.track_job(run_scheduler_product_bond), trigger)
+
+        trigger = CronTrigger(hour=cron_product_integrity_hour, minute=cron_product_integrity_minute)
+        scheduler.add_job(SqlMetrics.track_job(run_scheduler_product_integrity), trigger)
 
     return scheduler
 
@@ -91,3 +97,8 @@ async def run_scheduler_product_bond():
 
     today = datetime.now().strftime("%Y%m%d")
     await usecase.get_bond_data_by_date(today)
+
+## 상품 데이터 정합성 점검 (수집 작업 이후)
+async def run_scheduler_product_integrity():
+    usecase = FetchProductDataUsecaseFactory.create()
+    await usecase.check_integrity()
@@ -21,9 +21,9 @@ class KakaoOAuthUseCase:
 
         return str(auth_url)
 
-    def get_kakao_user(self, code: str) -> dict:
-        access_token: AccessToken = self.kakao_oauth_port.get_access_token(code)
-        kakao_user: KakaoUser = self.kakao_oauth_port.get_user_info(access_token)
+    async def get_kakao_user(self, code: str) -> dict:
+        access_token: AccessToken = await self.kakao_oauth_port.get_access_token(code)
+        kakao_user: KakaoUser = await self.kakao_oauth_port.get_user_info(access_token)
 
         return {
             "user": kakao_user,
@@ -7,9 +7,9 @@ from kakao_authentication.domain.value_objects.kakao_access_token import KakaoAc
 class KakaoOAuthPort(ABC):
 
     @abstractmethod
-    def get_access_token(self, auth_code: str) -> KakaoAccessToken:
+    async def get_access_token(self, auth_code: str) -> KakaoAccessToken:
         pass
 
     @abstractmethod
-    def get_user_info(self, access_token: KakaoAccessToken) -> KakaoUser:
+    async def get_user_info(self, access_token: KakaoAccessToken) -> KakaoUser:
         pass
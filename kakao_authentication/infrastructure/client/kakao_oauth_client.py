@@ -1,5 +1,8 @@
-import requests
+import asyncio
 
+import httpx
+
+from config.http_client import get_async_http_client
 from kakao_authentication.domain.kakao_user import KakaoUser
 from kakao_authentication.domain.port.kakao_oauth_port import KakaoOAuthPort
 from kakao_authentication.domain.value_objects.kakao_access_token import KakaoAccessToken
@@ -15,11 +18,22 @@ from util.log.log import Log
 KAKAO_TOKEN_URL = "https://kauth.kakao.com/oauth/token"
 KAKAO_USER_URL = "https://kapi.kakao.com/v2/user/me"
 
+# 사용자 정보 조회(GET) 재시도 설정 - 인가 코드는 1회용이므로 토큰 교환(POST)은 재시도하지 않음
+# (연결 실패는 공용 클라이언트 transport에서 재시도)
+USER_INFO_RETRIES = 2
+RETRY_BACKOFF = 0.2  # 초 (재시도마다 2배)
+
 log_util = Log()
 logger = Log.get_logger()
 class KakaoOAuthClient(KakaoOAuthPort):
+    """
+    카카오 OAuth 비동기 클라이언트
 
-    def get_access_token(self, auth_code: str) -> KakaoAccessToken:
+    공용 HTTP 커넥션 풀(config.http_client)을 사용하여 로그인마다 TLS 연결을 새로 맺지 않으며,
+    타임아웃이 적용되어 카카오 서버 지연 시에도 워커가 무한정 멈추지 않는다.
+    """
+
+    async def get_access_token(self, auth_code: str) -> KakaoAccessToken:
         data = {
             "grant_type": "authorization_code",
             "client_id": KAKAO_CLIENT_ID,
@@ -28,7 +42,7 @@ class KakaoOAuthClient(KakaoOAuthPort):
             "client_secret": KAKAO_SECRET_KEY
         }
 
-        response = requests.post(
+        response = await get_async_http_client().post(
             KAKAO_TOKEN_URL,
             data=data,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -39,20 +53,29 @@ class KakaoOAuthClient(KakaoOAuthPort):
         token = response.json()["access_token"]
         return KakaoAccessToken(token)
 
-    def get_user_info(self, token: KakaoAccessToken) -> KakaoUser:
-        url = "https://kapi.kakao.com/v2/user/me"
-
+    async def get_user_info(self, token: KakaoAccessToken) -> KakaoUser:
         headers = {
             "Authorization": f"Bearer {token.value}"
         }
 
-        response = requests.get(url, headers=headers)
+        for attempt in range(USER_INFO_RETRIES + 1):
+            try:
+                response = await get_async_http_client().get(KAKAO_USER_URL, headers=headers)
+                if response.status_code < 500 or attempt == USER_INFO_RETRIES:
+                    break
+                logger.warning(f"[KAKAO] 사용자 정보 조회 {response.status_code}, 재시도 {attempt + 1}/{USER_INFO_RETRIES}")
+            except httpx.TimeoutException as e:
+                if attempt == USER_INFO_RETRIES:
+                    raise
+                logger.warning(f"[KAKAO] 사용자 정보 조회 타임아웃, 재시도 {attempt + 1}/{USER_INFO_RETRIES}: {str(e)}")
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+
+        response.raise_for_status()
         json_data = response.json()
-        print(json_data)
+        logger.debug(f"Kakao user info fetched: {json_data.get('id')}")
 
         user_id = KakaoUserId(json_data["id"])
         email = KakaoEmail(json_data["kakao_account"].get("email"))
         nickname = KakaoNickname(json_data["properties"]["nickname"])
 
         return KakaoUser(user_id, email, nickname)
-
@@ -1,81 +1,91 @@
-from fastapi import APIRouter
+import asyncio
 
+import httpx
+from fastapi import APIRouter, Depends, HTTPException
+
+from account.adapter.input.web.session_helper import get_current_user
+from config.redis_config import get_async_redis
+from kftc.application.usecase.kftc_ie_sync_usecase import KftcIESyncUseCase
 from kftc.infrastructure.service.kftc_service import KftcService
+from kftc.infrastructure.service.kftc_token_store import KftcToken, KftcTokenStore
 from util.log.log import Log
 
 kftc_router = APIRouter()
 svc = KftcService.get_instance()
+sync_usecase = KftcIESyncUseCase.get_instance()
 logger = Log.get_logger()
 
-@kftc_router.get("/redirect")
-def auth_callback(code: str):
-    token_data = svc.get_access_token(code)
-    access_token = token_data["access_token"]
-    user_seq_no = token_data["user_seq_no"]
+# 거래내역 조회 기간
+ACCOUNT_FROM_DATE, ACCOUNT_TO_DATE = "20251001", "20251030"
+CARD_FROM_DATE, CARD_TO_DATE = "20240101", "20240201"
+
+
+async def fetch_transactions(token: KftcToken) -> dict:
+    # 사용자 정보(계좌 목록)/카드 목록 조회 후 계좌별 거래내역, 카드별 승인내역을 동시에 조회
+    # (계좌/카드 목록 조회 실패는 전체 실패, 계좌/카드별 조회 실패는 해당 항목의 error로 반환)
+    try:
+        result = await svc.fetch_all_transactions(
+            access_token=token.access_token,
+            user_seq_no=token.user_seq_no,
+            account_from=ACCOUNT_FROM_DATE,
+            account_to=ACCOUNT_TO_DATE,
+            card_from=CARD_FROM_DATE,
+            card_to=CARD_TO_DATE
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            raise HTTPException(401, "오픈뱅킹 인증이 필요합니다.")
+        raise HTTPException(502, f"KFTC 조회 실패: HTTP {e.response.status_code}")
+
+    logger.debug(f"Account results: {result['accounts']}")
+    logger.debug(f"Card results: {result['cards']}")
+    return result
+
 
-    svc.access_token = access_token
-    svc.user_seq_no = user_seq_no
+@kftc_router.get("/redirect")
+async def auth_callback(code: str, session_id: str = Depends(get_current_user)):
+    try:
+        token_data = await svc.get_access_token(code)
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(502, f"KFTC 토큰 발급 실패: HTTP {e.response.status_code}")
+    if not token_data.get("access_token"):
+        raise HTTPException(400, f"KFTC 토큰 발급 실패: {token_data.get('rsp_message')}")
 
+    # 토큰은 세션별로 암호화하여 저장 (이후 조회는 /transactions에서 OAuth 없이 재사용)
+    token = await KftcTokenStore.save(session_id, token_data)
     logger.debug("Access token fetched")
 
-    # 2) 사용자 정보 조회 → 계좌 목록 포함
-    user_info = svc.get_user_info(access_token, user_seq_no)
-    logger.debug(f"User info: {user_info}")
-    logger.debug("User info fetched")
-
-    # 3) 계좌 목록 기반 거래내역 조회
-    account_results = []
-    for acc in user_info.get("res_list", []):
-        fintech_num = acc["fintech_use_num"]
-        bank_tran_id = svc.generate_bank_tran_id()
-
-        tx_list = svc.get_account_transactions(
-            access_token=access_token,
-            bank_tran_id=bank_tran_id,
-            fintech_use_num=fintech_num,
-            from_date="20251001",
-            to_date="20251030"
-        )
+    return await fetch_transactions(token)
 
-        logger.debug(f"Account transactions: {tx_list}")
-        account_results.append({
-            "bank_name": acc["bank_name"],
-            "account_num": acc["account_num_masked"],
-            "transactions": tx_list
-        })
-
-    logger.debug("Account transactions fetched")
-    logger.debug(f"Account results: {account_results}")
-
-    # 4) 카드 목록 조회
-    card_list = svc.get_card_list(access_token, user_seq_no)
-    logger.debug(f"Card list: {card_list}")
-    logger.debug("Card list fetched")
-
-    # 5) 카드별 승인내역 조회
-    card_results = []
-    for card in card_list.get("card_list", []):
-        org_code = card["org_code"]
-
-        approval_list = svc.get_card_transactions(
-            access_token=access_token,
-            user_seq_no=user_seq_no,
-            org_code=org_code,
-            from_datetime="20240101",
-            to_datetime="20240201"
-        )
 
-        logger.debug(f"Card approval list: {approval_list}")
-        card_results.append({
-            "card_name": card["card_name"],
-            "org_code": org_code,
-            "approvals": approval_list
-        })
-
-    logger.debug("Card approval list fetched")
-    logger.debug(f"Card results: {card_results}")
-    return {
-        "user_info": user_info,
-        "accounts": account_results,
-        "cards": card_results
-    }
+@kftc_router.get("/transactions")
+async def get_transactions(session_id: str = Depends(get_current_user)):
+    """저장된 토큰으로 거래내역 재조회 (만료가 가까우면 리프레시 토큰으로 재발급)"""
+    token = await KftcTokenStore.get_valid_token(session_id)
+    if token is None:
+        raise HTTPException(401, "오픈뱅킹 인증이 필요합니다.")
+    return await fetch_transactions(token)
+
+
+@kftc_router.post("/sync")
+async def sync_transactions(session_id: str = Depends(get_current_user)):
+    """
+    저장된 토큰으로 거래내역을 조회하여 소득/지출로 분류한 뒤 IE_INFO에 반영 (로그인 사용자 전용)
+    """
+    user_token = await get_async_redis(session_id).hget(session_id, "USER_TOKEN")
+    if not user_token:
+        raise HTTPException(401, "세션이 만료되었습니다. 다시 로그인해주세요.")
+    if user_token == "GUEST":
+        raise HTTPException(403, "로그인한 사용자만 데이터를 저장할 수 있습니다.")
+
+    token = await KftcTokenStore.get_valid_token(session_id)
+    if token is None:
+        raise HTTPException(401, "오픈뱅킹 인증이 필요합니다.")
+
+    result = await fetch_transactions(token)
+    try:
+        # 분류/DB 반영은 동기 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        return await asyncio.to_thread(sync_usecase.sync_transactions, session_id, result)
+    except Exception as e:
+        logger.error(f"Error in sync_transactions: {str(e)}")
+        raise HTTPException(500, str(e))
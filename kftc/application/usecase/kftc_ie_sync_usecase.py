@@ -0,0 +1,165 @@
+"""
+오픈뱅킹 거래내역 → IE_INFO 반영 (KFTC IE Sync)
+계좌/카드 거래내역을 일괄 분류하여 월·카테고리별로 합산한 뒤 IE_INFO에 한 번에 반영한다
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional
+
+from documents_multi_agents.domain.service.transaction_classifier import (
+    BankTransaction,
+    TransactionClassifier,
+)
+from ieinfo.infrastructure.orm.ie_info import IEInfo
+from ieinfo.infrastructure.repository.ie_info_repository_impl import IEInfoRepositoryImpl
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+def _first(item: Dict[str, Any], *keys: str) -> Optional[Any]:
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(str(value).replace(",", "").strip())
+    except (TypeError, ValueError):
+        return None
+
+
+class KftcIESyncUseCase:
+    __Instance = None
+
+    # 계좌 거래 입출금 구분 (inout_type)
+    INCOME_INOUT_TYPES = ("입금",)
+    EXPENSE_INOUT_TYPES = ("출금", "지급")
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__Instance is None:
+            cls.__Instance = super().__new__(cls)
+        return cls.__Instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__Instance is None:
+            cls.__Instance = cls()
+        return cls.__Instance
+
+    def __init__(self):
+        if not hasattr(self, 'repository'):
+            self.repository = IEInfoRepositoryImpl.get_instance()
+            self.classifier = TransactionClassifier.get_instance()
+
+    # -----------------------------
+    # 거래내역 정규화
+    # -----------------------------
+    def _iter_transactions(self, result: Dict[str, Any], counts: Dict[str, int]) -> Iterable[BankTransaction]:
+        """fetch_all_transactions 응답의 계좌/카드 내역을 BankTransaction으로 변환 (형식 오류 건은 skipped)"""
+        for account in result.get("accounts", []):
+            for item in (account.get("transactions") or {}).get("res_list") or []:
+                inout_type = str(item.get("inout_type") or "").strip()
+                if inout_type in self.INCOME_INOUT_TYPES:
+                    direction = "in"
+                elif inout_type in self.EXPENSE_INOUT_TYPES:
+                    direction = "out"
+                else:
+                    direction = None
+                transaction = self._build(
+                    _first(item, "tran_date"),
+                    _first(item, "print_content", "branch_name", "tran_type"),
+                    _first(item, "tran_amt"),
+                    direction
+                )
+                if transaction is None:
+                    counts["skipped"] += 1
+                    continue
+                yield transaction
+
+        for card in result.get("cards", []):
+            for item in (card.get("approvals") or {}).get("approval_list") or []:
+                transaction = self._build(
+                    _first(item, "approved_date", "appr_date", "tran_date"),
+                    _first(item, "merchant_name", "merchant_name_masked", "print_content") or card.get("card_name"),
+                    _first(item, "approved_amt", "appr_amt", "tran_amt"),
+                    "out"
+                )
+                if transaction is None:
+                    counts["skipped"] += 1
+                    continue
+                # 승인 취소 건은 지출에서 차감
+                if str(_first(item, "cancel_yn", "cancel_status") or "").upper() in ("Y", "1", "취소"):
+                    transaction.amount = -transaction.amount
+                yield transaction
+
+    @staticmethod
+    def _build(tran_date: Any, description: Any, amount: Any, direction: Optional[str]) -> Optional[BankTransaction]:
+        tran_date = str(tran_date or "").replace("-", "")[:8]
+        amount = _to_int(amount)
+        if len(tran_date) != 8 or not tran_date.isdigit() or amount is None:
+            return None
+        return BankTransaction(
+            tran_date=tran_date,
+            description=str(description or ""),
+            amount=amount,
+            direction=direction
+        )
+
+    # -----------------------------
+    # 분류 + 합산 + 반영
+    # -----------------------------
+    def sync_transactions(self, session_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        오픈뱅킹 거래내역을 분류하여 IE_INFO에 반영
+
+        (연, 월, 소득/지출, 카테고리)별 합계를 출처 KFTC 행으로 저장하며,
+        같은 기간을 다시 동기화해도 결과가 같다. (문서 분석 결과 행은 변경하지 않음)
+        """
+        started = time.perf_counter()
+        counts = {"transactions": 0, "classified": 0, "unclassified": 0, "skipped": 0}
+        totals: Dict[tuple, int] = defaultdict(int)
+
+        for transaction, classification in self.classifier.classify(self._iter_transactions(result, counts)):
+            counts["transactions"] += 1
+            if classification.ie_type is None:
+                counts["unclassified"] += 1
+                continue
+            counts["classified"] += 1
+            year, month = int(transaction.tran_date[:4]), int(transaction.tran_date[4:6])
+            totals[(year, month, classification.ie_type, classification.category)] += transaction.amount
+        classify_elapsed = time.perf_counter() - started
+
+        ie_info_list = [
+            IEInfo(
+                session_id=session_id,
+                ie_type=ie_type,
+                key=category,
+                value=value,
+                year=year,
+                month=month,
+                source=IEInfo.SOURCE_KFTC
+            )
+            for (year, month, ie_type, category), value in totals.items()
+            if value > 0
+        ]
+        db_counts = self.repository.replace_source_months(session_id, IEInfo.SOURCE_KFTC, ie_info_list)
+        elapsed = time.perf_counter() - started
+
+        logger.info(
+            f"✅ [KFTC SYNC] 거래 {counts['transactions']}건 분류 ({classify_elapsed:.3f}s), "
+            f"IE_INFO {len(ie_info_list)}행 반영 ({elapsed:.3f}s)"
+        )
+        return {
+            "success": True,
+            **counts,
+            "rows": len(ie_info_list),
+            "months": sorted({f"{year}-{month:02d}" for year, month, _, _ in totals}),
+            **db_counts,
+            "classify_seconds": round(classify_elapsed, 3),
+            "elapsed_seconds": round(elapsed, 3)
+        }
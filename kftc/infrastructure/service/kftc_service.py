@@ -1,15 +1,33 @@
+import asyncio
 import os
-import uuid
+import random
 from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List
 
-import requests
+import httpx
 
+from config.http_client import get_async_http_client
 from util.log.log import Log
 
 logger = Log.get_logger()
 class KftcService:
+    """
+    오픈뱅킹(KFTC) 비동기 클라이언트
+
+    - 공용 HTTP 커넥션 풀(config.http_client)을 사용하여 계좌/카드별 요청이 연결을 재사용한다.
+    - 계좌/카드별 거래내역은 MAX_CONCURRENCY개씩 동시에 조회한다. (오픈뱅킹 API 호출량 제한 고려)
+    - 다음 페이지가 있으면(next_page_yn == "Y") MAX_PAGES까지 자동으로 이어서 조회한다.
+    - 모든 호출은 HTTP 상태를 먼저 확인한다. (401/5xx 응답 본문을 "계좌/내역 없음"으로 해석하지 않음)
+    - 로컬 테스트 시 KFTC_API_BASE_URL을 스텁 서버로 지정할 수 있다.
+    """
     __instance = None
 
+    BASE_URL = os.getenv("KFTC_API_BASE_URL", "https://testapi.openbanking.or.kr").rstrip("/")
+    MAX_CONCURRENCY = int(os.getenv("KFTC_MAX_CONCURRENCY", "4"))
+    MAX_PAGES = int(os.getenv("KFTC_MAX_PAGES", "20"))
+    # 호출별 타임아웃 (오픈뱅킹 조회는 느릴 수 있어 공용 클라이언트보다 읽기 타임아웃을 길게 설정)
+    TIMEOUT = httpx.Timeout(float(os.getenv("KFTC_READ_TIMEOUT", "15")), connect=3.0, pool=5.0)
+
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
             cls.__instance = super().__new__(cls)
@@ -31,8 +49,8 @@ class KftcService:
         return value
 
     @staticmethod
-    def get_access_token(auth_code: str):
-        url = "https://testapi.openbanking.or.kr/oauth/2.0/token"
+    async def get_access_token(auth_code: str):
+        url = f"{KftcService.BASE_URL}/oauth/2.0/token"
         data = {
             "grant_type": "authorization_code",
             "client_id": KftcService._get_env_var("KFTC_CLIENT_ID"),
@@ -41,28 +59,45 @@ class KftcService:
             "redirect_uri": KftcService._get_env_var("KFTC_REDIRECT_URI")
         }
         logger.debug("[DEBUG] data fetched")
-        resp = requests.post(url, data=data)
+        resp = await get_async_http_client().post(url, data=data, timeout=KftcService.TIMEOUT)
+        resp.raise_for_status()
         return resp.json()  # access_token, refresh_token 등 포함
 
+    @staticmethod
+    async def refresh_access_token(refresh_token: str):
+        """리프레시 토큰으로 액세스 토큰 재발급 (응답 형식은 get_access_token과 동일)"""
+        url = f"{KftcService.BASE_URL}/oauth/2.0/token"
+        data = {
+            "grant_type": "refresh_token",
+            "client_id": KftcService._get_env_var("KFTC_CLIENT_ID"),
+            "client_secret": KftcService._get_env_var("KFTC_CLIENT_SECRET"),
+            "refresh_token": refresh_token,
+            "scope": "login inquiry"
+        }
+        resp = await get_async_http_client().post(url, data=data, timeout=KftcService.TIMEOUT)
+        resp.raise_for_status()
+        return resp.json()
+
     # -----------------------------
     # 2) 사용자 정보 조회 (계좌 목록)
     # -----------------------------
     @staticmethod
-    def get_user_info(access_token: str, user_seq_no: str):
-        url = "https://testapi.openbanking.or.kr/v2.0/user/me"
+    async def get_user_info(access_token: str, user_seq_no: str):
+        url = f"{KftcService.BASE_URL}/v2.0/user/me"
 
         headers = {"Authorization": f"Bearer {access_token}"}
         params = {"user_seq_no": user_seq_no}
 
-        return requests.get(url, headers=headers, params=params).json()
+        resp = await get_async_http_client().get(url, headers=headers, params=params, timeout=KftcService.TIMEOUT)
+        resp.raise_for_status()
+        return resp.json()
 
     # -----------------------------
     # 계좌 거래 내역 조회
     # -----------------------------
     @staticmethod
     def generate_bank_tran_id():
-        org_code = "M202502910"  
-        import random
+        org_code = "M202502910"
         unique_num = str(random.randint(0, 999999999)).zfill(9)
         return f"{org_code}U{unique_num}"
 
@@ -70,10 +105,14 @@ class KftcService:
     # 거래 내역 조회
     # -----------------------------
     @staticmethod
-    def get_account_transactions(access_token, bank_tran_id,
-                                 fintech_use_num, from_date, to_date):
+    async def get_account_transactions(access_token, fintech_use_num, from_date, to_date):
+        """
+        계좌 거래내역 전체 페이지 조회
 
-        url = "https://testapi.openbanking.or.kr/v2.0/account/transaction_list/fin_num"
+        페이지마다 새 거래고유번호(bank_tran_id)를 발급하고,
+        응답의 befor_inquiry_trace_info로 다음 페이지를 요청한다.
+        """
+        url = f"{KftcService.BASE_URL}/v2.0/account/transaction_list/fin_num"
 
         headers = {
             "Authorization": f"Bearer {access_token}",
@@ -81,52 +120,175 @@ class KftcService:
         }
 
         params = {
-            "bank_tran_id": bank_tran_id,
             "fintech_use_num": fintech_use_num,
             "inquiry_type": "A",
             "inquiry_base": "D",
             "from_date": from_date,
             "to_date": to_date,
             "sort_order": "D",
-            "tran_dtime": datetime.now().strftime("%Y%m%d%H%M%S")
         }
 
-        return requests.get(url, headers=headers, params=params).json()
+        async def fetch_page(trace_info):
+            page_params = {
+                **params,
+                "bank_tran_id": KftcService.generate_bank_tran_id(),
+                "tran_dtime": datetime.now().strftime("%Y%m%d%H%M%S")
+            }
+            if trace_info:
+                page_params["befor_inquiry_trace_info"] = trace_info
+            resp = await get_async_http_client().get(url, headers=headers, params=page_params, timeout=KftcService.TIMEOUT)
+            resp.raise_for_status()
+            return resp.json()
+
+        return await KftcService._fetch_pages(fetch_page, "res_list")
 
     # -----------------------------
     # 3) 카드 목록 조회
     # -----------------------------
     @staticmethod
-    def get_card_list(access_token: str, user_seq_no: str):
-        url = "https://testapi.openbanking.or.kr/v2.0/user/card-info"
+    async def get_card_list(access_token: str, user_seq_no: str):
+        url = f"{KftcService.BASE_URL}/v2.0/user/card-info"
 
         headers = {"Authorization": f"Bearer {access_token}"}
         params = {"user_seq_no": user_seq_no}
 
-        return requests.get(url, headers=headers, params=params).json()
+        resp = await get_async_http_client().get(url, headers=headers, params=params, timeout=KftcService.TIMEOUT)
+        resp.raise_for_status()
+        return resp.json()
 
     # -----------------------------
     # 4) 카드 승인 내역 조회
     # -----------------------------
 
     @staticmethod
-    def get_card_transactions(access_token, user_seq_no,
-                              org_code, from_datetime, to_datetime):
+    async def get_card_transactions(access_token, user_seq_no,
+                                    org_code, from_datetime, to_datetime):
+        """카드 승인내역 전체 페이지 조회 (next_page를 1씩 증가)"""
 
-        url = "https://testapi.openbanking.or.kr/v2.0/card/approval_list"
+        url = f"{KftcService.BASE_URL}/v2.0/card/approval_list"
 
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
         }
 
-        payload = {
-            "user_seq_no": user_seq_no,
-            "org_code": org_code,
-            "from_date": from_datetime,
-            "to_date": to_datetime,
-            "tran_dtime": datetime.now().strftime("%Y%m%d%H%M%S"),
-            "next_page": "0001"
-        }
+        page_no = 0
+
+        async def fetch_page(trace_info):
+            nonlocal page_no
+            page_no += 1
+            payload = {
+                "user_seq_no": user_seq_no,
+                "org_code": org_code,
+                "from_date": from_datetime,
+                "to_date": to_datetime,
+                "tran_dtime": datetime.now().strftime("%Y%m%d%H%M%S"),
+                "next_page": str(page_no).zfill(4)
+            }
+            if trace_info:
+                payload["befor_inquiry_trace_info"] = trace_info
+            resp = await get_async_http_client().post(url, json=payload, headers=headers, timeout=KftcService.TIMEOUT)
+            resp.raise_for_status()
+            return resp.json()
+
+        return await KftcService._fetch_pages(fetch_page, "approval_list")
+
+    @staticmethod
+    async def _fetch_pages(fetch_page: Callable[[Any], Awaitable[Dict]], list_key: str) -> Dict:
+        """
+        첫 페이지 응답에 이후 페이지의 목록을 합쳐 반환 (페이지는 순서대로 조회)
 
-        return requests.post(url, json=payload, headers=headers).json()
\ No newline at end of file
+        응답 형식은 첫 페이지와 같으며 list_key 목록만 전체 페이지 합계가 된다.
+        """
+        first = await fetch_page(None)
+        items = list(first.get(list_key) or [])
+        page = first
+        pages = 1
+        while page.get("next_page_yn") == "Y" and pages < KftcService.MAX_PAGES:
+            trace_info = page.get("befor_inquiry_trace_info")
+            page = await fetch_page(trace_info)
+            items.extend(page.get(list_key) or [])
+            pages += 1
+        if page.get("next_page_yn") == "Y":
+            logger.warning(f"[KFTC] {list_key} 최대 페이지({KftcService.MAX_PAGES}) 도달, 이후 내역 생략")
+
+        result = dict(first)
+        result[list_key] = items
+        result["page_count"] = pages
+        result["next_page_yn"] = page.get("next_page_yn", "N")
+        return result
+
+    # -----------------------------
+    # 5) 계좌/카드 거래내역 일괄 조회
+    # -----------------------------
+    @staticmethod
+    async def fetch_all_transactions(access_token: str, user_seq_no: str,
+                                     account_from: str, account_to: str,
+                                     card_from: str, card_to: str) -> Dict[str, Any]:
+        """
+        사용자 정보(계좌 목록)/카드 목록 조회 후 계좌별·카드별 거래내역을 동시에 조회
+
+        동시 요청 수는 MAX_CONCURRENCY로 제한하며, 한 계좌/카드 조회가 실패해도
+        나머지 결과는 반환한다. (실패 항목에는 error 필드)
+        """
+        semaphore = asyncio.Semaphore(KftcService.MAX_CONCURRENCY)
+
+        async def bounded(fetch: Callable[[], Awaitable[Dict]]) -> Dict:
+            async with semaphore:
+                return await fetch()
+
+        user_info, card_list = await asyncio.gather(
+            KftcService.get_user_info(access_token, user_seq_no),
+            KftcService.get_card_list(access_token, user_seq_no)
+        )
+        accounts = user_info.get("res_list", [])
+        cards = card_list.get("card_list", [])
+
+        account_calls = [
+            bounded(lambda acc=acc: KftcService.get_account_transactions(
+                access_token=access_token,
+                fintech_use_num=acc["fintech_use_num"],
+                from_date=account_from,
+                to_date=account_to
+            ))
+            for acc in accounts
+        ]
+        card_calls = [
+            bounded(lambda card=card: KftcService.get_card_transactions(
+                access_token=access_token,
+                user_seq_no=user_seq_no,
+                org_code=card["org_code"],
+                from_datetime=card_from,
+                to_datetime=card_to
+            ))
+            for card in cards
+        ]
+        outcomes = await asyncio.gather(*account_calls, *card_calls, return_exceptions=True)
+        account_outcomes, card_outcomes = outcomes[:len(accounts)], outcomes[len(accounts):]
+
+        account_results: List[Dict] = []
+        for acc, outcome in zip(accounts, account_outcomes):
+            entry = {"bank_name": acc["bank_name"], "account_num": acc["account_num_masked"]}
+            if isinstance(outcome, BaseException):
+                logger.error(f"[KFTC] 계좌 거래내역 조회 실패: {type(outcome).__name__}: {str(outcome)}")
+                entry["error"] = f"{type(outcome).__name__}: {str(outcome)}"
+                outcome = {}
+            entry["transactions"] = outcome
+            account_results.append(entry)
+
+        card_results: List[Dict] = []
+        for card, outcome in zip(cards, card_outcomes):
+            entry = {"card_name": card["card_name"], "org_code": card["org_code"]}
+            if isinstance(outcome, BaseException):
+                logger.error(f"[KFTC] 카드 승인내역 조회 실패: {type(outcome).__name__}: {str(outcome)}")
+                entry["error"] = f"{type(outcome).__name__}: {str(outcome)}"
+                outcome = {}
+            entry["approvals"] = outcome
+            card_results.append(entry)
+
+        logger.info(f"[KFTC] 계좌 {len(accounts)}개, 카드 {len(cards)}개 거래내역 조회 완료")
+        return {
+            "user_info": user_info,
+            "accounts": account_results,
+            "cards": card_results
+        }
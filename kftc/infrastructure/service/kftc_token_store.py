@@ -0,0 +1,175 @@
+"""
+세션별 오픈뱅킹(KFTC) 토큰 저장소 (KFTC Token Store)
+인가 코드로 받은 액세스/리프레시 토큰을 세션 단위로 암호화하여 Redis에 저장하고,
+만료가 가까워지면 리프레시 토큰으로 재발급하여 거래내역 재조회 시 OAuth 왕복을 생략한다
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from config.crypto import Crypto
+from config.redis_config import get_async_redis
+from kftc.infrastructure.service.kftc_service import KftcService
+from util.log.log import Log
+from util.session.session_shard_migrator import SessionShardMigrator
+
+logger = Log.get_logger()
+crypto = Crypto.get_instance()
+
+
+@dataclass
+class KftcToken:
+    """세션에 연결된 오픈뱅킹 토큰"""
+    access_token: str
+    refresh_token: str
+    user_seq_no: str
+    expires_at: float  # epoch 초
+
+    def is_expiring(self, margin: float) -> bool:
+        return self.expires_at - time.time() <= margin
+
+
+class KftcTokenStore:
+    """
+    저장 구조 (Redis, 세션과 같은 샤드):
+    - kftc_token:{session_id} (hash) : access_token, refresh_token, user_seq_no(암호화), expires_at
+
+    - 키 TTL은 세션과 같으며 로그아웃/탈퇴 시 세션과 함께 삭제된다.
+    - 만료 REFRESH_MARGIN 전부터는 조회 시 리프레시 토큰으로 재발급한다.
+      여러 워커가 동시에 재발급하지 않도록 Redis 잠금을 사용하고, 잠금을 얻지 못한 요청은 재발급 결과를 기다린다.
+    """
+
+    KEY_PREFIX = "kftc_token:"
+    LOCK_KEY_PREFIX = "kftc_token_lock:"
+    TTL = 24 * 60 * 60  # 세션 만료 시간과 동일
+    REFRESH_MARGIN = 5 * 60  # 만료 5분 전부터 재발급
+    LOCK_TIMEOUT_MS = 15 * 1000
+    LOCK_WAIT = 0.2  # 다른 워커의 재발급 완료 확인 간격 (초)
+
+    _stats = {"hits": 0, "misses": 0, "refreshed": 0, "refresh_failed": 0}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _key(cls, session_id: str) -> str:
+        return f"{cls.KEY_PREFIX}{session_id}"
+
+    @classmethod
+    async def save(cls, session_id: str, token_data: Dict[str, Any]) -> KftcToken:
+        """
+        토큰 발급/재발급 응답 저장
+
+        재발급 응답에 user_seq_no/refresh_token이 없으면 기존 값을 유지한다.
+        """
+        previous = await cls.get(session_id) if not (
+            token_data.get("user_seq_no") and token_data.get("refresh_token")
+        ) else None
+        token = KftcToken(
+            access_token=token_data["access_token"],
+            refresh_token=token_data.get("refresh_token") or (previous.refresh_token if previous else ""),
+            user_seq_no=str(token_data.get("user_seq_no") or (previous.user_seq_no if previous else "")),
+            expires_at=time.time() + int(token_data.get("expires_in") or 0)
+        )
+
+        pipe = get_async_redis(session_id).pipeline()
+        pipe.hset(cls._key(session_id), mapping={
+            "access_token": crypto.enc_data(token.access_token),
+            "refresh_token": crypto.enc_data(token.refresh_token) if token.refresh_token else "",
+            "user_seq_no": crypto.enc_data(token.user_seq_no),
+            "expires_at": str(token.expires_at)
+        })
+        pipe.expire(cls._key(session_id), cls.TTL)
+        await pipe.execute()
+        return token
+
+    @classmethod
+    async def get(cls, session_id: str) -> Optional[KftcToken]:
+        """저장된 토큰 (없거나 복호화할 수 없으면 None)"""
+        data = await get_async_redis(session_id).hgetall(cls._key(session_id))
+        if not data or not data.get("access_token"):
+            return None
+        try:
+            return KftcToken(
+                access_token=crypto.dec_data(data["access_token"]),
+                refresh_token=crypto.dec_data(data["refresh_token"]) if data.get("refresh_token") else "",
+                user_seq_no=crypto.dec_data(data["user_seq_no"]),
+                expires_at=float(data.get("expires_at") or 0)
+            )
+        except Exception as e:
+            logger.warning(f"[KFTC TOKEN] 토큰 복호화 실패: {str(e)}")
+            return None
+
+    @classmethod
+    async def get_valid_token(cls, session_id: str) -> Optional[KftcToken]:
+        """
+        사용 가능한 토큰 반환 (만료가 가까우면 재발급)
+
+        Returns:
+            토큰 또는 None (저장된 토큰이 없거나 재발급 실패 → 다시 인증 필요)
+        """
+        token = await cls.get(session_id)
+        if token is None:
+            with cls._lock:
+                cls._stats["misses"] += 1
+            return None
+        if not token.is_expiring(cls.REFRESH_MARGIN):
+            with cls._lock:
+                cls._stats["hits"] += 1
+            return token
+        if not token.refresh_token:
+            return None if token.is_expiring(0) else token
+        return await cls._refresh(session_id, token)
+
+    @classmethod
+    async def _refresh(cls, session_id: str, token: KftcToken) -> Optional[KftcToken]:
+        redis_client = get_async_redis(session_id)
+        lock_key = f"{cls.LOCK_KEY_PREFIX}{session_id}"
+        lock_token = str(uuid.uuid4())
+
+        if not await redis_client.set(lock_key, lock_token, nx=True, px=cls.LOCK_TIMEOUT_MS):
+            # 다른 워커가 재발급 중 → 저장된 토큰이 갱신될 때까지 대기
+            deadline = time.monotonic() + cls.LOCK_TIMEOUT_MS / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(cls.LOCK_WAIT)
+                current = await cls.get(session_id)
+                if current and not current.is_expiring(cls.REFRESH_MARGIN):
+                    return current
+                if not await redis_client.exists(lock_key):
+                    break
+            current = await cls.get(session_id)
+            return current if current and not current.is_expiring(0) else None
+
+        try:
+            token_data = await KftcService.refresh_access_token(token.refresh_token)
+            if not token_data.get("access_token"):
+                raise ValueError(f"Access token is missing: {token_data.get('rsp_message')}")
+            refreshed = await cls.save(session_id, token_data)
+            with cls._lock:
+                cls._stats["refreshed"] += 1
+            logger.info("[KFTC TOKEN] 액세스 토큰 재발급 완료")
+            return refreshed
+        except Exception as e:
+            with cls._lock:
+                cls._stats["refresh_failed"] += 1
+            logger.warning(f"[KFTC TOKEN] 재발급 실패: {type(e).__name__}: {str(e)}")
+            # 아직 만료되지 않았으면 기존 토큰 사용
+            return None if token.is_expiring(0) else token
+        finally:
+            if await redis_client.get(lock_key) == lock_token:
+                await redis_client.delete(lock_key)
+
+    @classmethod
+    async def delete(cls, session_id: str):
+        await get_async_redis(session_id).delete(cls._key(session_id))
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, Any]:
+        with cls._lock:
+            return dict(cls._stats)
+
+
+# 세션 샤드 이동 시 함께 이동, 로그아웃/탈퇴 시 세션과 함께 삭제
+SessionShardMigrator.register_prefix(KftcTokenStore.KEY_PREFIX, delete_on_end=True)
@@ -1,13 +1,18 @@
 import hashlib
 from typing import List
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
+from config.database.bulk_upsert import bulk_upsert
+from config.database.db_executor import run_db
 from config.database.session import get_db_session
 from news_info.application.port.news_info_repository_port import NewsInfoRepositoryPort
 from news_info.domain.value_object.news_item import NewsItem
 from news_info.infrastructure.orm.newsInfo_orm import NewsInfoORM, NewsProvider
 from datetime import datetime, date, time
+from util.log.log import Log
+
+logger = Log.get_logger()
+
 
 def _md5_hex(value: str) -> str:
     return hashlib.md5(value.encode("utf-8")).hexdigest()
@@ -27,85 +32,64 @@ class NewsInfoRepositoryImpl(NewsInfoRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, "db"):
-            self.db: Session = get_db_session()
-
     async def save_news_batch(self, news_list: List[NewsItem]) -> List[NewsItem]:
-
+        return await run_db(self._save_news_batch, news_list)
+
+    def _save_news_batch(self, news_list: List[NewsItem]) -> List[NewsItem]:
+        """(provider, canonical_url 해시)가 이미 저장된 기사는 건너뛰고 새 기사만 일괄 저장"""
+        if not news_list:
+            return []
+
+        rows = []
+        for item in news_list:
+            canonical_url = (item.originallink or item.link or "").strip()
+            if not canonical_url:
+                continue
+
+            rows.append({
+                "provider": NewsProvider.NAVER_NEWS,
+                "title": item.title,
+                "description": item.description,
+                "content": getattr(item, "content", None),
+                "link": item.link,
+                "originallink": item.originallink,
+                "canonical_url": canonical_url,
+                "canonical_url_hash": _md5_hex(canonical_url),
+                "published_at": item.published_at.timestamp if item.published_at else None,
+                "fetched_at": datetime.utcnow(),
+                "raw_json": {
+                    "title": item.title,
+                    "description": item.description,
+                    "content": getattr(item, "content", None),
+                    "link": item.link,
+                    "originallink": item.originallink,
+                    "published_at": item.published_at.timestamp.isoformat() if item.published_at else None,
+                },
+            })
+
+        db: Session = get_db_session()
         try:
-            if not news_list:
-                return []
-
-            new_list: List[NewsItem] = []
-
-            for item in news_list:
-                canonical_url = (item.originallink or item.link or "").strip()
-                if not canonical_url:
-                    continue
-
-                canonical_url_hash = _md5_hex(canonical_url)
-
-                existing = self.db.query(NewsInfoORM).filter(
-                    and_(
-                        NewsInfoORM.provider == NewsProvider.NAVER_NEWS,
-                        NewsInfoORM.canonical_url_hash == canonical_url_hash,
-                    )
-                ).first()
-
-                if not existing:
-                    new_list.append(item)
-
-            if not new_list:
-                return news_list
-
-            orm_list = []
-            for item in new_list:
-                canonical_url = (item.originallink or item.link or "").strip()
-                canonical_url_hash = _md5_hex(canonical_url)
-
-                orm_list.append(
-                    NewsInfoORM(
-                        provider=NewsProvider.NAVER_NEWS,
-                        title=item.title,
-                        description=item.description,
-                        content=getattr(item, "content", None),
-                        link=item.link,
-                        originallink=item.originallink,
-                        canonical_url=canonical_url,
-                        canonical_url_hash=canonical_url_hash,
-                        published_at=item.published_at.timestamp if item.published_at else None,
-                        raw_json={
-                            "title": item.title,
-                            "description": item.description,
-                            "content": getattr(item, "content", None),
-                            "link": item.link,
-                            "originallink": item.originallink,
-                            "published_at": item.published_at.timestamp.isoformat() if item.published_at else None,
-                        },
-                    )
-                )
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
-
+            result = bulk_upsert(db, NewsInfoORM, rows, key_columns=("provider", "canonical_url_hash"))
+            db.commit()
+            logger.info(f"[NEWS] 뉴스 저장: {result.to_dict()}")
             return news_list
         finally:
-            self.db.close()
+            db.close()
 
     async def get_three_month_news_for_card_news(self) -> List[NewsInfoORM]:
+        return await run_db(self._get_three_month_news_for_card_news)
+
+    def _get_three_month_news_for_card_news(self) -> List[NewsInfoORM]:
 
         target_date = date.today()  # 또는 datetime.utcnow().date()
 
         start = datetime.combine(target_date, time.min)  # 00:00:00
         end = datetime.combine(target_date, time.max)  # 23:59:59.999999
 
+        db: Session = get_db_session()
         try:
             rows = (
-                self.db.query(NewsInfoORM)
+                db.query(NewsInfoORM)
                 .filter(NewsInfoORM.published_at >= start)
                 .filter(NewsInfoORM.published_at <= end)
                 .order_by(NewsInfoORM.published_at.desc())
@@ -115,6 +99,6 @@ class NewsInfoRepositoryImpl(NewsInfoRepositoryPort):
             return rows
 
         finally:
-            self.db.close()
+            db.close()
 
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, HTTPException, Query
 
 from product.application.factory.fetch_product_data_usecase_factory import FetchProductDataUsecaseFactory
 from util.log.log import Log
@@ -16,6 +16,9 @@ async def get_etf_info():
         "fetched_at": result.fetched_at.timestamp.isoformat(),
         "items": [
             {
+                "srtnCd": item.srtnCd,
+                "isinCd": item.isinCd,
+                "itmsNm": item.itmsNm,
                 "fltRt": item.fltRt,
                 "nav": item.nav,
                 "mkp": item.mkp,
@@ -38,8 +41,10 @@ async def get_etf_info():
 @product_data_router.get("/etf/{date}")
 async def get_etf_info(date:str):
     usecase = FetchProductDataUsecaseFactory.create()
-    result = await usecase.get_etf_data_by_date(date)
-    return result
+    try:
+        return await usecase.get_etf_data_by_date(date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="date는 YYYYMMDD 형식이어야 합니다.")
 
 
 @product_data_router.post("/etf/save")
@@ -56,6 +61,9 @@ async def fetch_and_save_etf(
         "saved_count": len(saved_entities),
         "items": [
             {
+                "srtnCd": entity.srtnCd,
+                "isinCd": entity.isinCd,
+                "itmsNm": entity.itmsNm,
                 "fltRt": entity.fltRt,
                 "nav": entity.nav,
                 "mkp": entity.mkp,
@@ -79,8 +87,10 @@ async def fetch_and_save_etf(
 @product_data_router.get("/fund/{date}")
 async def get_fund_info(date:str):
     usecase = FetchProductDataUsecaseFactory.create()
-    result = await usecase.get_fund_data_by_date(date)
-    return result
+    try:
+        return await usecase.get_fund_data_by_date(date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="date는 YYYYMMDD 형식이어야 합니다.")
 
 @product_data_router.post("/fund/save")
 async def fetch_and_save_fund(
@@ -111,8 +121,10 @@ async def fetch_and_save_fund(
 @product_data_router.get("/bond/{date}")
 async def get_bond_info(date:str):
     usecase = FetchProductDataUsecaseFactory.create()
-    result = await usecase.get_bond_data_by_date(date)
-    return result
+    try:
+        return await usecase.get_bond_data_by_date(date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="date는 YYYYMMDD 형식이어야 합니다.")
 
 @product_data_router.post("/bond/save")
 async def fetch_and_save_bond(
@@ -149,4 +161,16 @@ async def fetch_and_save_bond(
             }
             for entity in saved_entities
         ]
-    }
\ No newline at end of file
+    }
+
+@product_data_router.get("/integrity")
+async def check_product_integrity(
+        start: str | None = Query(None),
+        end: str | None = Query(None)
+):
+    """기준일자별 ETF/펀드/채권 중복·누락 점검 (기본: 최근 7일)"""
+    usecase = FetchProductDataUsecaseFactory.create()
+    try:
+        return await usecase.check_integrity(start, end)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start/end는 YYYYMMDD 형식이어야 합니다.")
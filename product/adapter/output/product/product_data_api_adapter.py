@@ -36,6 +36,9 @@ class ProductDataApiAdapter:
                 basDt=item.get("basDt"),
                 clpr=item.get("clpr"),
                 vs=item.get("vs"),
+                srtnCd=item.get("srtnCd"),
+                isinCd=item.get("isinCd"),
+                itmsNm=item.get("itmsNm"),
             )
             for item in raw_items
         ]
@@ -1,18 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List
 
 from product.domain.product_etf import ProductEtf
 from product.domain.product_fund import ProductFund
 from product.domain.product_bond import ProductBond
-from product.infrastructure.orm.product_bond import ProductBondORM
-from product.infrastructure.orm.product_etf import ProductETFORM
-from product.infrastructure.orm.product_fund import ProductFundORM
 
 
 class ProductRepositoryPort(ABC):
 
     @abstractmethod
-    async def get_etf_data_by_date(self, date:str) -> List[ProductETFORM]:
+    async def get_etf_data_by_date(self, date:str) -> List[Dict[str, Any]]:
         pass
 
     @abstractmethod
@@ -20,7 +17,7 @@ class ProductRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def get_fund_data_by_date(self, date:str) -> List[ProductFundORM]:
+    async def get_fund_data_by_date(self, date:str) -> List[Dict[str, Any]]:
         pass
 
     @abstractmethod
@@ -28,9 +25,13 @@ class ProductRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def get_bond_data_by_date(self, date:str) -> List[ProductBondORM]:
+    async def get_bond_data_by_date(self, date:str) -> List[Dict[str, Any]]:
         pass
 
     @abstractmethod
     async def save_bond_batch(self, etf_list: List[ProductBond]) -> List[ProductBond]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def check_integrity(self, start: str, end: str) -> Dict[str, List[Dict[str, Any]]]:
+        pass
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List
 
 from product.adapter.output.product.product_data_api_adapter import ProductDataApiAdapter
 from product.application.port.product_repository_port import ProductRepositoryPort
@@ -10,9 +10,6 @@ from product.domain.product_bond import ProductBond
 from product.domain.product_etf_data import ProductEtfData
 from datetime import datetime, timedelta
 from product.infrastructure.api.data_go_client import DataGoClient
-from product.infrastructure.orm.product_bond import ProductBondORM
-from product.infrastructure.orm.product_etf import ProductETFORM
-from product.infrastructure.orm.product_fund import ProductFundORM
 from util.log.log import Log
 
 logger = Log.get_logger()
@@ -24,7 +21,7 @@ class FetchProductUseCase:
     async def get_etf_data(self) -> ProductEtfData:
         return await self.adapter.get_etf_data()
 
-    async def get_etf_data_by_date(self, date: str) -> List[ProductETFORM]:
+    async def get_etf_data_by_date(self, date: str) -> List[Dict[str, Any]]:
         return await self.repository.get_etf_data_by_date(date)
 
     async def fetch_and_save_etf_data(self, start:str, end:str) -> List[ProductEtf]:
@@ -51,7 +48,10 @@ class FetchProductUseCase:
                 bssIdxClpr=item.get("bssIdxClpr"),
                 basDt=item.get("basDt"),
                 clpr=item.get("clpr"),
-                vs=item.get("vs")
+                vs=item.get("vs"),
+                srtnCd=item.get("srtnCd"),
+                isinCd=item.get("isinCd"),
+                itmsNm=item.get("itmsNm")
             )
             etf_entities.append(etfs)
         if etf_entities:
@@ -62,7 +62,7 @@ class FetchProductUseCase:
     async def get_fund_data(self) -> ProductFundData:
         return await self.adapter.get_fund_data()
       
-    async def get_fund_data_by_date(self, date:str) -> List[ProductFundORM]:
+    async def get_fund_data_by_date(self, date:str) -> List[Dict[str, Any]]:
         return await self.repository.get_fund_data_by_date(date)
 
     async def fetch_and_save_fund_data(self, start:str = None, end:str = None) -> List[ProductFund]:
@@ -125,7 +125,7 @@ class FetchProductUseCase:
     async def get_bond_data(self) -> ProductBondData:
         return await self.adapter.get_bond_data()
 
-    async def get_bond_data_by_date(self, date:str) -> List[ProductBondORM]:
+    async def get_bond_data_by_date(self, date:str) -> List[Dict[str, Any]]:
 
         return await self.repository.get_bond_data_by_date(date)
 
@@ -205,3 +205,29 @@ class FetchProductUseCase:
             if bond_entities:
                 await self.repository.save_bond_batch(bond_entities)
             return bond_entities
+
+    async def check_integrity(self, start: str = None, end: str = None, days: int = 7) -> dict:
+        """
+        상품 테이블 기준일자별 중복/누락 점검 (기본: 최근 days일)
+
+        중복 행, 코드 누락 행, 직전 기준일자 대비 누락 종목이 있는 날짜는 경고 로그를 남긴다.
+        """
+        if start in (None, "") or end in (None, ""):
+            today = datetime.now()
+            end = today.strftime("%Y%m%d")
+            start = (today - timedelta(days=days)).strftime("%Y%m%d")
+
+        report = await self.repository.check_integrity(start, end)
+
+        issues = 0
+        for name, entries in report.items():
+            for entry in entries:
+                if entry["duplicates"] or entry["missing_code"] or entry["missing"]:
+                    issues += 1
+                    logger.warning(
+                        f"⚠️ [PRODUCT INTEGRITY] {name} {entry['date']}: {entry['rows']}행, "
+                        f"중복 {entry['duplicates']}, 코드 누락 {entry['missing_code']}, "
+                        f"직전 대비 누락 종목 {entry['missing']} {entry['missing_sample']}"
+                    )
+        logger.info(f"[PRODUCT INTEGRITY] {start}~{end} 점검 완료: 이상 {issues}건")
+        return {"start": start, "end": end, "issues": issues, "tables": report}
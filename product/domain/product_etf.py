@@ -3,7 +3,8 @@ from datetime import datetime
 class ProductEtf:
     def __init__(self, fltRt: float, nav: float, mkp: int, hipr: int, lopr: int,
                  trqu: int, trPrc: int, mrktTotAmt: int, nPptTotAmt: int, stLstgCnt: int,
-                 bssIdxIdxNm: str, bssIdxClpr: float, basDt: datetime, clpr: int, vs: int):
+                 bssIdxIdxNm: str, bssIdxClpr: float, basDt: datetime, clpr: int, vs: int,
+                 srtnCd: str = None, isinCd: str = None, itmsNm: str = None):
         self.fltRt = fltRt
         self.nav = nav
         self.mkp = mkp
@@ -19,3 +20,6 @@ class ProductEtf:
         self.basDt = basDt
         self.clpr = clpr
         self.vs = vs
+        self.srtnCd = srtnCd
+        self.isinCd = isinCd
+        self.itmsNm = itmsNm
@@ -1,12 +1,16 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Float
+from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Float, UniqueConstraint
 
 from config.database.session import Base
 
 
 class ProductBondORM(Base):
     __tablename__ = "product_bond"
+    __table_args__ = (
+        # 기준일자별 채권 종목 1행 (수집 시 중복 판단 키)
+        UniqueConstraint("basDt", "isinCd", name="uq_product_bond_date_isin"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     basDt = Column(DateTime, default=datetime.utcnow)       # 기준일자
     crno = Column(String(255), nullable=True)               # 법인등록번호
@@ -1,13 +1,20 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Float
+from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Float, UniqueConstraint
 
 from config.database.session import Base
 
 
 class ProductETFORM(Base):
     __tablename__ = "product_etf"
+    __table_args__ = (
+        # 기준일자별 종목 1행 (수집 시 중복 판단 키)
+        UniqueConstraint("basDt", "srtnCd", name="uq_product_etf_date_code"),
+    )
     id = Column(Integer, primary_key=True, index=True)
+    srtnCd = Column(String(32), nullable=True)         # 단축코드 (기존 행에는 없어 NULL 허용, 마이그레이션 v3와 동일)
+    isinCd = Column(String(32), nullable=True)         # ISIN코드
+    itmsNm = Column(String(255), nullable=True)        # 종목명
     fltRt = Column(Float, nullable=True)               # 등락율
     nav = Column(Float, nullable=True)                 # 순자산가치(NAV)
     mkp = Column(Integer, nullable=True)               # 시가
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, UniqueConstraint
 
 
 from config.database.session import Base
@@ -7,6 +7,10 @@ from config.database.session import Base
 
 class ProductFundORM(Base):
     __tablename__ = "product_fund"
+    __table_args__ = (
+        # 기준일자별 펀드 1행 (수집 시 중복 판단 키)
+        UniqueConstraint("basDt", "srtnCd", name="uq_product_fund_date_code"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     basDt = Column(DateTime, default=datetime.utcnow)       # 기준일자
     srtnCd = Column(String(255), nullable=True)             # 단축코드
@@ -1,15 +1,21 @@
-from typing import List
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
 
-from sqlalchemy import and_
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from config.database.bulk_upsert import UpsertResult, bulk_upsert
+from config.database.date_range import day_range
+from config.database.db_executor import run_db
 from config.database.session import get_db_session
 from product.application.port.product_repository_port import ProductRepositoryPort
 from product.domain.product_etf import ProductEtf
 from product.infrastructure.orm.product_bond import ProductBondORM
 from product.infrastructure.orm.product_etf import ProductETFORM
 from product.infrastructure.orm.product_fund import ProductFundORM
+from util.log.log import Log
+
+logger = Log.get_logger()
 
 
 class ProductRepositoryImpl(ProductRepositoryPort):
@@ -26,97 +32,98 @@ class ProductRepositoryImpl(ProductRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
+    # 저장 컬럼 (도메인/ORM 객체 → INSERT 행 변환용)
+    ETF_COLUMNS = (
+        "srtnCd", "isinCd", "itmsNm", "fltRt", "nav", "mkp", "hipr", "lopr", "trqu", "trPrc", "mrktTotAmt", "nPptTotAmt",
+        "stLstgCnt", "bssIdxIdxNm", "bssIdxClpr", "basDt", "clpr", "vs"
+    )
+    FUND_COLUMNS = ("basDt", "srtnCd", "fndNm", "ctg", "setpDt", "fndTp", "prdClsfCd", "asoStdCd")
+    BOND_COLUMNS = (
+        "basDt", "crno", "bondIsurNm", "bondIssuDt", "scrsItmsKcd", "scrsItmsKcdNm", "isinCd",
+        "isinCdNm", "bondIssuFrmtNm", "bondExprDt", "bondIssuCurCd", "bondIssuCurCdNm",
+        "bondPymtAmt", "bondIssuAmt", "bondSrfcInrt", "irtChngDcd", "irtChngDcdNm", "bondIntTcd",
+        "bondIntTcdNm"
+    )
+
+    # 상품별 자연키 (기준일자 + 종목 코드) - 테이블의 unique 제약과 같음
+    ETF_KEY = ("basDt", "srtnCd")
+    FUND_KEY = ("basDt", "srtnCd")
+    BOND_KEY = ("basDt", "isinCd")
+
+    # 정합성 점검 시 누락 종목 예시 개수
+    INTEGRITY_SAMPLE_SIZE = 10
+
+    @staticmethod
+    def _date_key(value) -> str:
+        # 기준일자는 API 문자열("20251017")/datetime 모두 올 수 있으므로 YYYYMMDD로 맞춰 비교
+        if hasattr(value, "strftime"):
+            return value.strftime("%Y%m%d")
+        return "".join(ch for ch in str(value) if ch.isdigit())[:8]
+
+    @classmethod
+    def _upsert_by_key(cls, db: Session, model, items: list, columns: tuple, key_columns: tuple) -> UpsertResult:
+        """
+        (기준일자, 종목 코드) 키로 일괄 저장 - 새 종목은 INSERT, 이미 저장된 종목은 시세/속성 갱신
 
-    async def get_etf_data_by_date(self, date:str) -> List[ProductETFORM]:
+        기준일자를 datetime으로 맞춰 DB 값과 같은 키로 비교하고, 기준일자나 코드가 없는 행은 저장하지 않는다.
+        """
+        rows, invalid = [], 0
+        for item in items:
+            row = {column: getattr(item, column) for column in columns}
+            date_key = cls._date_key(row["basDt"]) if row["basDt"] is not None else ""
+            if len(date_key) != 8 or any(not row.get(column) for column in key_columns[1:]):
+                invalid += 1
+                continue
+            row["basDt"] = datetime.strptime(date_key, "%Y%m%d")
+            rows.append(row)
+        if invalid:
+            logger.warning(f"[PRODUCT] {model.__tablename__}: 기준일자/종목 코드가 없는 행 {invalid}건 제외")
+
+        update_columns = [column for column in columns if column not in key_columns]
+        result = bulk_upsert(db, model, rows, key_columns=key_columns, update_columns=update_columns)
+        result.skipped += invalid
+        return result
+
+    @staticmethod
+    def _select_by_date(model, date: str) -> List[Dict[str, Any]]:
+        """
+        기준일자(YYYYMMDD) 하루치 행을 dict 목록으로 조회
 
+        basDt 반열린 구간 조건으로 (basDt, 코드) unique 인덱스를 범위 스캔하고,
+        ORM 객체를 만들지 않고 컬럼 값만 읽는다.
+        """
+        start, end = day_range(date)
+        table = model.__table__
+        db: Session = get_db_session()
         try:
-            rows = (self.db.query(ProductETFORM).
-                    filter(func.date_format(ProductETFORM.basDt, "%Y%m%d") == date).
-                    all())
-
-            return [
-                ProductETFORM(
-                    id=row.id,
-                    fltRt=row.fltRt,
-                    nav=row.nav,
-                    mkp=row.mkp,
-                    hipr=row.hipr,
-                    lopr=row.lopr,
-                    trqu=row.trqu,
-                    trPrc=row.trPrc,
-                    mrktTotAmt=row.mrktTotAmt,
-                    nPptTotAmt=row.nPptTotAmt,
-                    stLstgCnt=row.stLstgCnt,
-                    bssIdxIdxNm=row.bssIdxIdxNm,
-                    bssIdxClpr=row.bssIdxClpr,
-                    basDt=row.basDt,
-                    clpr=row.clpr,
-                    vs=row.vs
-                )
-                for row in rows
-            ]
+            result = db.execute(
+                select(table).where(table.c.basDt >= start, table.c.basDt < end)
+            )
+            return [dict(row) for row in result.mappings()]
         finally:
-            self.db.close()
+            db.close()
 
-    async def save_etf_batch(self, etf_list: List[ProductEtf]) -> List[ProductEtf]:
-        try:
-            if not etf_list:
-                return []
-
-            new_etf_list = []
-
-            for etfs in etf_list:
-
-                etfs_date_only = etfs.basDt.date() if hasattr(etfs.basDt, 'basDt') else etfs.basDt
-
-                existing = self.db.query(ProductETFORM).filter(
-                    and_(
-                        ProductETFORM.basDt == etfs.basDt,
-                        # datetime을 날짜만 비교
-                        func.DATE(ProductETFORM.basDt) == etfs_date_only,
-                    )
-                ).first()
-
-                # 중복이 없으면 추가
-                if not existing:
-                    new_etf_list.append(etfs)
-
-            if not new_etf_list:
-                return etf_list
-
-            orm_list = [
-                ProductETFORM(
-                    fltRt=etf.fltRt,
-                    nav=etf.nav,
-                    mkp=etf.mkp,
-                    hipr=etf.hipr,
-                    lopr=etf.lopr,
-                    trqu=etf.trqu,
-                    trPrc=etf.trPrc,
-                    mrktTotAmt=etf.mrktTotAmt,
-                    nPptTotAmt=etf.nPptTotAmt,
-                    stLstgCnt=etf.stLstgCnt,
-                    bssIdxIdxNm=etf.bssIdxIdxNm,
-                    bssIdxClpr=etf.bssIdxClpr,
-                    basDt=etf.basDt,
-                    clpr=etf.clpr,
-                    vs=etf.vs
-                )
-                for etf in new_etf_list
-            ]
+    async def get_etf_data_by_date(self, date:str) -> List[Dict[str, Any]]:
+        return await run_db(self._get_etf_data_by_date, date)
 
-            self.db.add_all(orm_list)
-            self.db.commit()
+    def _get_etf_data_by_date(self, date:str) -> List[Dict[str, Any]]:
+        return self._select_by_date(ProductETFORM, date)
 
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
+    async def save_etf_batch(self, etf_list: List[ProductEtf]) -> List[ProductEtf]:
+        return await run_db(self._save_etf_batch, etf_list)
 
+    def _save_etf_batch(self, etf_list: List[ProductEtf]) -> List[ProductEtf]:
+        if not etf_list:
+            return []
+
+        db: Session = get_db_session()
+        try:
+            result = self._upsert_by_key(db, ProductETFORM, etf_list, self.ETF_COLUMNS, self.ETF_KEY)
+            db.commit()
+            logger.info(f"[PRODUCT] ETF 저장: {result.to_dict()}")
             return etf_list
         finally:
-            self.db.close()
+            db.close()
 
     def get_all_etf(self, limit: int = 50) -> List[ProductETFORM]:
         """
@@ -128,206 +135,81 @@ class ProductRepositoryImpl(ProductRepositoryPort):
         Returns:
             ETF 상품 리스트
         """
+        db: Session = get_db_session()
         try:
             # 최신 데이터 기준으로 정렬하여 조회
-            etf_list = self.db.query(ProductETFORM).order_by(
+            etf_list = db.query(ProductETFORM).order_by(
                 ProductETFORM.basDt.desc(),
                 ProductETFORM.mrktTotAmt.desc()  # 시가총액 큰 순서
             ).limit(limit).all()
             
             return etf_list
         except Exception as e:
-            from util.log.log import Log
-            logger = Log.get_logger()
             logger.error(f"Failed to get ETF list: {str(e)}")
             return []
         finally:
-            self.db.close()
+            db.close()
 
-    async def get_fund_data_by_date(self, date:str) -> List[ProductFundORM]:
+    async def get_fund_data_by_date(self, date:str) -> List[Dict[str, Any]]:
+        return await run_db(self._get_fund_data_by_date, date)
 
-        try:
-            rows = (self.db.query(ProductFundORM).
-                    filter(func.date_format(ProductFundORM.basDt, "%Y%m%d") == date).
-                    all())
-            return [
-                ProductFundORM(
-                    id=row.id,
-                    basDt = row.basDt,
-                    srtnCd = row.srtnCd,
-                    fndNm = row.fndNm,
-                    ctg = row.ctg,
-                    setpDt = row.setpDt,
-                    fndTp = row.fndTp,
-                    prdClsfCd = row.prdClsfCd,
-                    asoStdCd = row.asoStdCd,
-                )
-                for row in rows
-            ]
-        finally:
-            self.db.close()
+    def _get_fund_data_by_date(self, date:str) -> List[Dict[str, Any]]:
+        return self._select_by_date(ProductFundORM, date)
 
     async def save_fund_batch(self, fund_list: List[ProductFundORM]) -> List[ProductFundORM]:
+        return await run_db(self._save_fund_batch, fund_list)
 
-        try:
-            if not fund_list:
-                return []
-
-            new_fund_list = []
-
-            for fund in fund_list:
-
-                fund_date_only = fund.basDt.date() if hasattr(fund.basDt, 'date') else fund.basDt
-
-                existing = self.db.query(ProductFundORM).filter(
-                    and_(
-                        ProductFundORM.basDt == fund.basDt,
-                        func.DATE(ProductFundORM.basDt) == fund_date_only,
-                    )
-                ).first()
-
-                if not existing:
-                    new_fund_list.append(fund)
-
-            # 신규 없으면 입력 필요 없음
-            if not new_fund_list:
-                return fund_list
-
-            orm_list = [
-                ProductFundORM(
-                    basDt=f.basDt,
-                    srtnCd=f.srtnCd,
-                    fndNm=f.fndNm,
-                    ctg=f.ctg,
-                    setpDt=f.setpDt,
-                    fndTp=f.fndTp,
-                    prdClsfCd=f.prdClsfCd,
-                    asoStdCd=f.asoStdCd
-                )
-                for f in new_fund_list
-            ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
+    def _save_fund_batch(self, fund_list: List[ProductFundORM]) -> List[ProductFundORM]:
+        if not fund_list:
+            return []
 
+        db: Session = get_db_session()
+        try:
+            result = self._upsert_by_key(db, ProductFundORM, fund_list, self.FUND_COLUMNS, self.FUND_KEY)
+            db.commit()
+            logger.info(f"[PRODUCT] 펀드 저장: {result.to_dict()}")
             return fund_list
         finally:
-            self.db.close()
+            db.close()
 
     # fund 상품 목록 조회
     def get_all_fund(self, limit: int = 50) -> List[ProductFundORM]:
+        db: Session = get_db_session()
         try:
             # 최신 데이터 기준으로 정렬하여 조회
-            etf_list = self.db.query(ProductFundORM).order_by(
+            etf_list = db.query(ProductFundORM).order_by(
                 ProductFundORM.basDt.desc(),
                 ProductFundORM.fndNm.desc()
             ).limit(limit).all()
             
             return etf_list
         except Exception as e:
-            from util.log.log import Log
-            logger = Log.get_logger()
             logger.error(f"Failed to get Fund list: {str(e)}")
             return []
         finally:
-            self.db.close()
+            db.close()
 
-    async def get_bond_data_by_date(self, date:str) -> List[ProductBondORM]:
-        try:
-            rows = (self.db.query(ProductBondORM).
-                    filter(func.date_format(ProductBondORM.basDt, "%Y%m%d") == date).
-                    all())
-
-            return [
-                ProductBondORM(
-                    id = row.id,
-                    basDt = row.basDt,
-                    crno = row.crno,
-                    bondIsurNm = row.bondIsurNm,
-                    bondIssuDt = row.bondIssuDt,
-                    scrsItmsKcd = row.scrsItmsKcd,
-                    scrsItmsKcdNm = row.scrsItmsKcdNm,
-                    isinCd = row.isinCd,
-                    isinCdNm = row.isinCdNm,
-                    bondIssuFrmtNm = row.bondIssuFrmtNm,
-                    bondExprDt = row.bondExprDt,
-                    bondIssuCurCd = row.bondIssuCurCd,
-                    bondIssuCurCdNm = row.bondIssuCurCdNm,
-                    bondPymtAmt = row.bondPymtAmt,
-                    bondIssuAmt = row.bondIssuAmt,
-                    bondSrfcInrt = row.bondSrfcInrt,
-                    irtChngDcd = row.irtChngDcd,
-                    irtChngDcdNm = row.irtChngDcdNm,
-                    bondIntTcd = row.bondIntTcd,
-                    bondIntTcdNm = row.bondIntTcdNm,
-                )
-                for row in rows
-            ]
-        finally:
-            self.db.close()
+    async def get_bond_data_by_date(self, date:str) -> List[Dict[str, Any]]:
+        return await run_db(self._get_bond_data_by_date, date)
 
-    async def save_bond_batch(self, bond_list: List[ProductBondORM]) -> List[ProductBondORM]:
+    def _get_bond_data_by_date(self, date:str) -> List[Dict[str, Any]]:
+        return self._select_by_date(ProductBondORM, date)
 
-        try:
-            if not bond_list:
-                return []
-
-            new_bond_list = []
-
-            for bond in bond_list:
-
-                bond_date_only = bond.basDt.date() if hasattr(bond.basDt, 'date') else bond.basDt
-
-                existing = self.db.query(ProductBondORM).filter(
-                    and_(
-                        ProductBondORM.basDt == bond.basDt,
-                        func.DATE(ProductBondORM.basDt) == bond_date_only,
-                    )
-                ).first()
-
-                if not existing:
-                    new_bond_list.append(bond)
-
-            if not new_bond_list:
-                return bond_list
-
-            orm_list = [
-                ProductBondORM(
-                    basDt=b.basDt,
-                    crno=b.crno,
-                    bondIsurNm=b.bondIsurNm,
-                    bondIssuDt=b.bondIssuDt,
-                    scrsItmsKcd=b.scrsItmsKcd,
-                    scrsItmsKcdNm=b.scrsItmsKcdNm,
-                    isinCd=b.isinCd,
-                    isinCdNm=b.isinCdNm,
-                    bondIssuFrmtNm=b.bondIssuFrmtNm,
-                    bondExprDt=b.bondExprDt,
-                    bondIssuCurCd=b.bondIssuCurCd,
-                    bondIssuCurCdNm=b.bondIssuCurCdNm,
-                    bondPymtAmt=b.bondPymtAmt,
-                    bondIssuAmt=b.bondIssuAmt,
-                    bondSrfcInrt=b.bondSrfcInrt,
-                    irtChngDcd=b.irtChngDcd,
-                    irtChngDcdNm=b.irtChngDcdNm,
-                    bondIntTcd=b.bondIntTcd,
-                    bondIntTcdNm=b.bondIntTcdNm
-                )
-                for b in new_bond_list
-            ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
+    async def save_bond_batch(self, bond_list: List[ProductBondORM]) -> List[ProductBondORM]:
+        return await run_db(self._save_bond_batch, bond_list)
 
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
+    def _save_bond_batch(self, bond_list: List[ProductBondORM]) -> List[ProductBondORM]:
+        if not bond_list:
+            return []
 
+        db: Session = get_db_session()
+        try:
+            result = self._upsert_by_key(db, ProductBondORM, bond_list, self.BOND_COLUMNS, self.BOND_KEY)
+            db.commit()
+            logger.info(f"[PRODUCT] 채권 저장: {result.to_dict()}")
             return bond_list
         finally:
-            self.db.close()
+            db.close()
 
     def get_all_bond(self, limit: int = 50) -> List[ProductBondORM]:
         """
@@ -339,18 +221,84 @@ class ProductRepositoryImpl(ProductRepositoryPort):
         Returns:
             ETF 상품 리스트
         """
+        db: Session = get_db_session()
         try:
             # 최신 데이터 기준으로 정렬하여 조회
-            bond_list = self.db.query(ProductBondORM).order_by(
+            bond_list = db.query(ProductBondORM).order_by(
                 ProductBondORM.basDt.desc(),
                 ProductBondORM.bondIssuAmt.desc()  # 채권발행금액 큰 순서
             ).limit(limit).all()
 
             return bond_list
         except Exception as e:
-            from util.log.log import Log
-            logger = Log.get_logger()
             logger.error(f"Failed to get Bond list: {str(e)}")
             return []
         finally:
-            self.db.close()
\ No newline at end of file
+            db.close()
+
+    async def check_integrity(self, start: str, end: str) -> Dict[str, List[Dict[str, Any]]]:
+        return await run_db(self._check_integrity, start, end)
+
+    def _check_integrity(self, start: str, end: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        기준일자별 상품 데이터 정합성 점검 (start ~ end, YYYYMMDD)
+
+        - duplicates: 같은 (기준일자, 코드)가 2행 이상인 초과 행 수 (unique 제약 적용 전 데이터)
+        - missing_code: 종목 코드가 비어 있는 행 수
+        - missing: 직전 기준일자에 있던 종목 중 해당 일자에 없는 종목 수 (수집 누락 의심)
+        - new: 직전 기준일자에 없던 신규 종목 수
+
+        테이블마다 (기준일자, 코드)만 한 번에 조회하여 메모리에서 비교한다.
+        """
+        start_dt = datetime.strptime(start, "%Y%m%d")
+        end_dt = datetime.strptime(end, "%Y%m%d") + timedelta(days=1)
+
+        db: Session = get_db_session()
+        try:
+            report = {}
+            for name, model, key in (
+                ("etf", ProductETFORM, self.ETF_KEY),
+                ("fund", ProductFundORM, self.FUND_KEY),
+                ("bond", ProductBondORM, self.BOND_KEY)
+            ):
+                code_column = getattr(model, key[1])
+                # 범위 첫 날짜도 비교할 수 있도록 직전 기준일자부터 조회
+                previous = db.query(func.max(model.basDt)).filter(model.basDt < start_dt).scalar()
+                rows = (
+                    db.query(model.basDt, code_column)
+                    .filter(model.basDt >= (previous or start_dt), model.basDt < end_dt)
+                    .all()
+                )
+
+                by_date: Dict[str, List[Any]] = {}
+                for bas_dt, code in rows:
+                    by_date.setdefault(self._date_key(bas_dt), []).append(code)
+
+                entries = []
+                previous_codes = None
+                for date_key in sorted(by_date):
+                    codes = by_date[date_key]
+                    code_set = {code for code in codes if code}
+                    missing_code = len(codes) - sum(1 for code in codes if code)
+                    entry = {
+                        "date": date_key,
+                        "rows": len(codes),
+                        "codes": len(code_set),
+                        "duplicates": len(codes) - missing_code - len(code_set),
+                        "missing_code": missing_code,
+                        "missing": 0,
+                        "new": 0,
+                        "missing_sample": []
+                    }
+                    if previous_codes is not None:
+                        missing = previous_codes - code_set
+                        entry["missing"] = len(missing)
+                        entry["new"] = len(code_set - previous_codes)
+                        entry["missing_sample"] = sorted(missing)[:self.INTEGRITY_SAMPLE_SIZE]
+                    previous_codes = code_set
+                    if date_key >= start:
+                        entries.append(entry)
+                report[name] = entries
+            return report
+        finally:
+            db.close()
@@ -5,7 +5,8 @@
 from typing import Dict, List
 from datetime import datetime, timedelta
 from config.crypto import Crypto
-from config.redis_config import get_redis
+from config.database.db_executor import run_db
+from config.redis_config import get_async_redis
 from ieinfo.infrastructure.repository.ie_info_repository_impl import IEInfoRepositoryImpl
 from ieinfo.infrastructure.orm.ie_info import IEType
 from product.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
@@ -35,7 +36,6 @@ class BondRecommendationUseCase:
         if not hasattr(self, 'initialized'):
             self.ie_repository = IEInfoRepositoryImpl.get_instance()
             self.product_repository = ProductRepositoryImpl.get_instance()
-            self.redis_client = get_redis()
             self.crypto = Crypto.get_instance()
             self.initialized = True
 
@@ -75,10 +75,11 @@ class BondRecommendationUseCase:
             logger.error(f"Error loading data from DB: {str(e)}")
             return None
 
-    def _get_financial_data_from_redis(self, session_id: str) -> Dict:
+    async def _get_financial_data_from_redis(self, session_id: str, session_data: Dict = None) -> Dict:
         """Redis에서 자산 정보 가져오기 (비로그인 사용자)"""
         try:
-            encrypted_data = self.redis_client.hgetall(session_id)
+            # 이미 조회한 세션 스냅샷이 있으면 재사용
+            encrypted_data = session_data if session_data is not None else await get_async_redis(session_id).hgetall(session_id)
 
             if not encrypted_data:
                 logger.warning(f"No data found in Redis for session: {session_id}")
@@ -151,7 +152,8 @@ class BondRecommendationUseCase:
             year: int = None,
             month: int = None,
             investment_goal: str = None,
-            risk_tolerance: str = None
+            risk_tolerance: str = None,
+            session_data: Dict = None
     ) -> Dict:
         """
         채권 추천 메인 메서드
@@ -162,13 +164,17 @@ class BondRecommendationUseCase:
             month: 조회 월 (DB용, 선택)
             investment_goal: 투자 목표
             risk_tolerance: 위험 감수도
+            session_data: 이미 조회한 세션 Redis 데이터 (대시보드 등에서 재사용, 선택)
 
         Returns:
             추천 결과 딕셔너리
         """
         try:
             # 1. 로그인 여부 확인
-            user_token = self.redis_client.hget(session_id, "USER_TOKEN")
+            if session_data is not None:
+                user_token = session_data.get("USER_TOKEN")
+            else:
+                user_token = await get_async_redis(session_id).hget(session_id, "USER_TOKEN")
 
             if isinstance(user_token, bytes):
                 user_token = user_token.decode('utf-8')
@@ -182,14 +188,14 @@ class BondRecommendationUseCase:
 
             if is_logged_in and year and month:
                 # 로그인 사용자 - DB에서 조회
-                financial_data = self._get_financial_data_from_db(session_id, year, month)
+                financial_data = await run_db(self._get_financial_data_from_db, session_id, year, month)
                 if not financial_data:
                     # DB에 데이터가 없으면 Redis 시도
                     logger.warning("No data in DB, trying Redis...")
-                    financial_data = self._get_financial_data_from_redis(session_id)
+                    financial_data = await self._get_financial_data_from_redis(session_id, session_data)
             else:
                 # 비로그인 사용자 또는 연도/월 미지정 - Redis에서 조회
-                financial_data = self._get_financial_data_from_redis(session_id)
+                financial_data = await self._get_financial_data_from_redis(session_id, session_data)
 
             if not financial_data:
                 return {
@@ -198,7 +204,7 @@ class BondRecommendationUseCase:
                 }
 
             # 3. 채권 데이터 가져오기
-            bond_records = self.product_repository.get_all_bond()
+            bond_records = await run_db(self.product_repository.get_all_bond)
 
             # 3-1. 채권 데이터가 없으면 자동으로 외부 API에서 가져와 저장
             if not bond_records:
@@ -233,7 +239,7 @@ class BondRecommendationUseCase:
                     if bond_entities and len(bond_entities) > 0:
                         logger.info(f"Successfully auto-saved {len(bond_entities)} Bond records")
                         # 다시 DB에서 조회
-                        bond_records = self.product_repository.get_all_bond()
+                        bond_records = await run_db(self.product_repository.get_all_bond)
                     else:
                         logger.error("Failed to auto-fetch Bond data - no data found for the past 7 days")
                 except Exception as fetch_error:
@@ -7,7 +7,8 @@ from datetime import datetime, timedelta
 
 from community.infrastructure.repository.community_repository_impl import CommunityRepositoryImpl
 from config.crypto import Crypto
-from config.redis_config import get_redis
+from config.database.db_executor import run_db
+from config.redis_config import get_async_redis
 from ieinfo.infrastructure.repository.ie_info_repository_impl import IEInfoRepositoryImpl
 from ieinfo.infrastructure.orm.ie_info import IEType
 from news_info.infrastructure.repository.news_info_repository_impl import NewsInfoRepositoryImpl
@@ -37,7 +38,6 @@ class CardNewsRecommendationUseCase:
             self.ie_repository = IEInfoRepositoryImpl.get_instance()
             self.news_repository = NewsInfoRepositoryImpl.get_instance()
             self.community_repository = CommunityRepositoryImpl.get_instance()
-            self.redis_client = get_redis()
             self.crypto = Crypto.get_instance()
             self.initialized = True
 
@@ -77,10 +77,10 @@ class CardNewsRecommendationUseCase:
             logger.error(f"Error loading data from DB: {str(e)}")
             return None
 
-    def _get_financial_data_from_redis(self, session_id: str) -> Dict:
+    async def _get_financial_data_from_redis(self, session_id: str) -> Dict:
         """Redis에서 자산 정보 가져오기 (비로그인 사용자)"""
         try:
-            encrypted_data = self.redis_client.hgetall(session_id)
+            encrypted_data = await get_async_redis(session_id).hgetall(session_id)
 
             if not encrypted_data:
                 logger.warning(f"No data found in Redis for session: {session_id}")
@@ -166,7 +166,7 @@ class CardNewsRecommendationUseCase:
         """
         try:
             # 1. 로그인 여부 확인
-            user_token = self.redis_client.hget(session_id, "USER_TOKEN")
+            user_token = await get_async_redis(session_id).hget(session_id, "USER_TOKEN")
 
             if isinstance(user_token, bytes):
                 user_token = user_token.decode('utf-8')
@@ -180,14 +180,14 @@ class CardNewsRecommendationUseCase:
 
             if is_logged_in and year and month:
                 # 로그인 사용자 - DB에서 조회
-                financial_data = self._get_financial_data_from_db(session_id, year, month)
+                financial_data = await run_db(self._get_financial_data_from_db, session_id, year, month)
                 if not financial_data:
                     # DB에 데이터가 없으면 Redis 시도
                     logger.warning("No data in DB, trying Redis...")
-                    financial_data = self._get_financial_data_from_redis(session_id)
+                    financial_data = await self._get_financial_data_from_redis(session_id)
             else:
                 # 비로그인 사용자 또는 연도/월 미지정 - Redis에서 조회
-                financial_data = self._get_financial_data_from_redis(session_id)
+                financial_data = await self._get_financial_data_from_redis(session_id)
 
             if not financial_data:
                 return {
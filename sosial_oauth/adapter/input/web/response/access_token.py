@@ -5,4 +5,5 @@ class AccessToken(BaseModel):
     access_token: str
     token_type: str
     expires_in: int
-    refresh_token: str | None = None
\ No newline at end of file
+    refresh_token: str | None = None
+    id_token: str | None = None
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+Google ID 토큰 로컬 검증 (Google ID Token Verifier)
+토큰 교환 응답에 포함된 ID 토큰(JWT)을 캐시된 Google 공개키(JWKS)로 직접 검증하여
+로그인마다 tokeninfo/userinfo를 호출하는 외부 왕복을 없앤다
+"""
+
+import asyncio
+import base64
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from config.http_client import get_async_http_client
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+def _b64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+class GoogleIdTokenVerifier:
+    """
+    RS256 ID 토큰 서명/클레임 검증
+
+    - 공개키는 JWKS 응답의 Cache-Control max-age 동안 메모리에 캐시한다.
+    - 캐시에 없는 kid(키 교체)가 들어오면 JWKS를 즉시 다시 받는다. (MIN_REFRESH_INTERVAL 이내 재요청은 생략)
+    - 로컬 테스트 시 GOOGLE_JWKS_URL / GOOGLE_ISSUERS를 스텁 발급자로 지정할 수 있다.
+    """
+
+    JWKS_URL = os.getenv("GOOGLE_JWKS_URL", "https://www.googleapis.com/oauth2/v3/certs")
+    ISSUERS = tuple(
+        issuer.strip()
+        for issuer in os.getenv("GOOGLE_ISSUERS", "https://accounts.google.com,accounts.google.com").split(",")
+        if issuer.strip()
+    )
+
+    DEFAULT_KEYS_TTL = 60 * 60  # Cache-Control이 없을 때 공개키 캐시 시간
+    MIN_REFRESH_INTERVAL = 60  # 알 수 없는 kid로 인한 JWKS 재요청 최소 간격 (위조 토큰으로 인한 과도한 요청 방지)
+    CLOCK_SKEW = 60  # exp/iat 검증 허용 오차 (초)
+
+    _keys: Dict[str, rsa.RSAPublicKey] = {}
+    _keys_expire_at = 0.0
+    _last_fetch = 0.0
+    _refresh_lock: Optional[asyncio.Lock] = None
+
+    _stats = {"verified": 0, "rejected": 0, "jwks_fetches": 0}
+    _lock = threading.Lock()
+
+    @classmethod
+    async def verify(cls, id_token: str, audience: str) -> Dict[str, Any]:
+        """
+        ID 토큰 검증 후 클레임 반환 (sub, email, name, picture 등)
+
+        Raises:
+            ValueError: 형식/서명/발급자/대상/만료 검증 실패
+        """
+        try:
+            claims = await cls._verify(id_token, audience)
+        except ValueError:
+            with cls._lock:
+                cls._stats["rejected"] += 1
+            raise
+        with cls._lock:
+            cls._stats["verified"] += 1
+        return claims
+
+    @classmethod
+    async def _verify(cls, id_token: str, audience: str) -> Dict[str, Any]:
+        try:
+            header_b64, payload_b64, signature_b64 = id_token.split(".")
+            header = json.loads(_b64url_decode(header_b64))
+            claims = json.loads(_b64url_decode(payload_b64))
+            signature = _b64url_decode(signature_b64)
+        except Exception as e:
+            raise ValueError(f"Malformed ID token: {str(e)}")
+
+        if header.get("alg") != "RS256":
+            raise ValueError(f"Unsupported ID token algorithm: {header.get('alg')}")
+
+        key = await cls._get_key(header.get("kid"))
+        try:
+            key.verify(
+                signature,
+                f"{header_b64}.{payload_b64}".encode("ascii"),
+                padding.PKCS1v15(),
+                hashes.SHA256()
+            )
+        except InvalidSignature:
+            raise ValueError("Invalid ID token signature")
+
+        now = time.time()
+        if claims.get("iss") not in cls.ISSUERS:
+            raise ValueError(f"Invalid ID token issuer: {claims.get('iss')}")
+        aud = claims.get("aud")
+        if audience not in (aud if isinstance(aud, list) else [aud]):
+            raise ValueError("ID token audience mismatch")
+        if float(claims.get("exp", 0)) < now - cls.CLOCK_SKEW:
+            raise ValueError("ID token expired")
+        if float(claims.get("iat", 0)) > now + cls.CLOCK_SKEW:
+            raise ValueError("ID token issued in the future")
+        return claims
+
+    @classmethod
+    async def _get_key(cls, kid: Optional[str]) -> rsa.RSAPublicKey:
+        key = cls._keys.get(kid) if time.time() < cls._keys_expire_at else None
+        if key is not None:
+            return key
+
+        if cls._refresh_lock is None:
+            cls._refresh_lock = asyncio.Lock()
+        async with cls._refresh_lock:
+            # 대기 중 다른 요청이 이미 갱신했을 수 있음
+            expired = time.time() >= cls._keys_expire_at
+            if expired or (kid not in cls._keys and time.time() - cls._last_fetch >= cls.MIN_REFRESH_INTERVAL):
+                try:
+                    await cls._refresh_keys()
+                except Exception as e:
+                    # 갱신 실패 시 만료된 키라도 있으면 계속 사용 (Google 키는 만료 후에도 한동안 유효)
+                    if not cls._keys:
+                        raise
+                    logger.warning(f"[GOOGLE JWKS] 공개키 갱신 실패, 기존 키 사용: {str(e)}")
+
+        key = cls._keys.get(kid)
+        if key is None:
+            raise ValueError(f"Unknown ID token key id: {kid}")
+        return key
+
+    @classmethod
+    async def _refresh_keys(cls):
+        cls._last_fetch = time.time()
+        resp = await get_async_http_client().get(cls.JWKS_URL)
+        resp.raise_for_status()
+
+        keys = {}
+        for jwk in resp.json().get("keys", []):
+            if jwk.get("kty") != "RSA" or "kid" not in jwk:
+                continue
+            keys[jwk["kid"]] = rsa.RSAPublicNumbers(
+                e=int.from_bytes(_b64url_decode(jwk["e"]), "big"),
+                n=int.from_bytes(_b64url_decode(jwk["n"]), "big")
+            ).public_key()
+
+        match = re.search(r"max-age=(\d+)", resp.headers.get("cache-control", ""))
+        ttl = int(match.group(1)) if match else cls.DEFAULT_KEYS_TTL
+
+        cls._keys = keys
+        cls._keys_expire_at = time.time() + ttl
+        with cls._lock:
+            cls._stats["jwks_fetches"] += 1
+        logger.info(f"[GOOGLE JWKS] 공개키 {len(keys)}개 갱신 (TTL {ttl}s)")
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, Any]:
+        with cls._lock:
+            stats = dict(cls._stats)
+        stats["cached_keys"] = len(cls._keys)
+        stats["keys_ttl_remaining"] = max(0, int(cls._keys_expire_at - time.time()))
+        return stats
@@ -1,8 +1,7 @@
 import os
 from urllib.parse import urlencode, quote
 
-import requests
-
+from config.http_client import get_async_http_client
 from sosial_oauth.adapter.input.web.request.get_access_token_request import GetAccessTokenRequest
 from sosial_oauth.adapter.input.web.response.access_token import AccessToken
 from util.log.log import Log
@@ -56,7 +55,7 @@ class GoogleOAuth2Service:
         return f"{google_auth_url}?{query_string}"
 
     @staticmethod
-    def refresh_access_token(request: GetAccessTokenRequest) -> AccessToken:
+    async def refresh_access_token(request: GetAccessTokenRequest) -> AccessToken:
         # OAuth 인증 코드를 사용하여 액세스 토큰을 획득
         google_token_url = GoogleOAuth2Service._get_env_var("GOOGLE_TOKEN_URL")
         client_id = GoogleOAuth2Service._get_env_var("GOOGLE_CLIENT_ID")
@@ -72,7 +71,7 @@ class GoogleOAuth2Service:
         }
 
         try:
-            resp = requests.post(google_token_url, data=data, timeout=10)
+            resp = await get_async_http_client().post(google_token_url, data=data)
             resp.raise_for_status()
             token_data = resp.json()
 
@@ -87,11 +86,12 @@ class GoogleOAuth2Service:
             access_token=access_token,
             token_type=token_data.get("token_type", "Bearer"),
             expires_in=token_data.get("expires_in"),
-            refresh_token=token_data.get("refresh_token")
+            refresh_token=token_data.get("refresh_token"),
+            id_token=token_data.get("id_token")
         )
 
     @staticmethod
-    def fetch_user_profile(access_token: AccessToken) -> dict:
+    async def fetch_user_profile(access_token: AccessToken) -> dict:
         # 액세스 토큰을 사용하여 사용자 프로필을 조회
         if not access_token or not access_token.access_token:
             raise ValueError("Access token is required to fetch user profile")
@@ -100,7 +100,7 @@ class GoogleOAuth2Service:
         headers = {"Authorization": f"Bearer {access_token.access_token}"}
 
         try:
-            resp = requests.get(google_userinfo_url, headers=headers, timeout=10)
+            resp = await get_async_http_client().get(google_userinfo_url, headers=headers)
             resp.raise_for_status()
             user_profile = resp.json()
             return user_profile
@@ -108,7 +108,7 @@ class GoogleOAuth2Service:
             raise Exception(f"Failed to fetch Google user profile: {str(e)}")
 
     @staticmethod
-    def revoke_token(access_token: str) -> bool:
+    async def revoke_token(access_token: str) -> bool:
         # Google 액세스 토큰을 revoke (회원탈퇴 시 사용)
         if not access_token:
             raise ValueError("Access token is required to revoke")
@@ -116,11 +116,10 @@ class GoogleOAuth2Service:
         revoke_url = "https://oauth2.googleapis.com/revoke"
 
         try:
-            resp = requests.post(
+            resp = await get_async_http_client().post(
                 revoke_url,
                 params={"token": access_token},
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                timeout=10
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
             )
             resp.raise_for_status()
             logger.debug(f"Google token revoked successfully: {resp.status_code}")
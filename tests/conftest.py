@@ -0,0 +1,17 @@
+import os
+import sys
+
+# 테스트는 실제 Redis/MySQL 없이 실행 (config 모듈이 import 시점에 읽는 환경 변수 기본값)
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("REDIS_PORT", "6379")
+os.environ.setdefault("REDIS_DB", "0")
+os.environ.setdefault("MYSQL_USER", "test")
+os.environ.setdefault("MYSQL_PASSWORD", "test")
+os.environ.setdefault("MYSQL_HOST", "localhost")
+os.environ.setdefault("MYSQL_PORT", "3306")
+os.environ.setdefault("MYSQL_DATABASE", "test")
+os.environ.setdefault("KAKAO_CLIENT_ID", "test")
+os.environ.setdefault("KAKAO_REDIRECT_URI", "http://localhost/kakao-authentication/redirection")
+os.environ.setdefault("KAKAO_SECRET_KEY", "test")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,46 @@
+import asyncio
+
+import fakeredis
+
+from util.cache import ai_cache
+from util.cache.ai_cache import AICache
+
+
+def test_async_cache_round_trip(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(ai_cache, "get_async_cache_redis", lambda key=None: client)
+
+    async def run():
+        key = AICache.generate_cache_key("data", "tax-credit")
+        assert await AICache.set_cached_response_async(key, "response", ttl=60) is True
+        assert await AICache.get_cached_response_async(key) == "response"
+        assert 0 < await client.ttl(key) <= 60
+
+    asyncio.run(run())
+
+
+def test_session_cache_key_does_not_expose_session_id():
+    session_id = "3f1c2a9e-7b7d-4a55-9d0e-2f7c1b6e8a10"
+    key = AICache.generate_session_cache_key(session_id, 3, "tax-credit")
+
+    assert session_id not in key
+    assert key.startswith("ai_cache:tax-credit:") and key.endswith(":v3")
+    assert key == AICache.generate_session_cache_key(session_id, 3, "tax-credit")
+    assert key != AICache.generate_session_cache_key("other-session", 3, "tax-credit")
+
+
+def test_cache_stats_returns_counts_only(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(ai_cache, "get_async_cache_redis", lambda key=None: client)
+    monkeypatch.setattr(ai_cache, "get_cache_nodes", lambda: ["node"])
+    monkeypatch.setattr(ai_cache, "get_async_redis_for_node", lambda node: client)
+
+    async def run():
+        key = AICache.generate_session_cache_key("session-1", 1, "tax-credit")
+        await AICache.set_cached_response_async(key, "response")
+        await AICache.get_cached_response_async(key)
+        return await AICache.get_cache_stats()
+
+    stats = asyncio.run(run())
+    assert stats["hits"] >= 1 and stats["writes"] >= 1
+    assert "session-1" not in str(stats) and "ai_cache:" not in str(stats)
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from config.database.db_executor import DB_EXECUTOR_WORKERS, get_db_executor_statistics, run_db
+
+QUERY_SECONDS = 0.05  # 느린 쿼리 한 건의 소요 시간
+CALLS = DB_EXECUTOR_WORKERS * 4  # 스레드풀/커넥션 풀보다 많은 동시 요청
+
+
+async def _measure_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """이벤트 루프가 예정보다 늦게 깨어난 최대 시간 (초)"""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+def test_run_db_keeps_loop_responsive_while_pool_is_saturated(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'lag.db'}", poolclass=QueuePool,
+                           pool_size=DB_EXECUTOR_WORKERS, max_overflow=0,
+                           connect_args={"check_same_thread": False})
+
+    def slow_query(i: int) -> int:
+        with engine.connect() as conn:
+            time.sleep(QUERY_SECONDS)
+            return conn.execute(text("SELECT :i"), {"i": i}).scalar()
+
+    async def run():
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(_measure_loop_lag(stop))
+        started = time.perf_counter()
+        results = await asyncio.gather(*(run_db(slow_query, i) for i in range(CALLS)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        return results, elapsed, await lag_task
+
+    before = get_db_executor_statistics()
+    try:
+        results, elapsed, worst_lag = asyncio.run(run())
+    finally:
+        engine.dispose()
+    after = get_db_executor_statistics()
+
+    assert results == list(range(CALLS))
+    # 루프에서 직접 실행했다면 CALLS × QUERY_SECONDS 동안 멈춤 → 스레드풀에서는 한 틱 정도의 지연만 허용
+    assert worst_lag < QUERY_SECONDS
+    # 처리량: 작업자 수만큼 동시에 실행 (직렬 실행 시간의 절반 미만)
+    assert elapsed < CALLS * QUERY_SECONDS / 2
+    assert after["calls"] - before["calls"] == CALLS
+    assert after["max_in_flight"] <= DB_EXECUTOR_WORKERS
+    assert after["in_flight"] == 0
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from account.domain.account import Account
+from account.infrastructure.orm.account_orm import AccountORM
+from account.infrastructure.repository import account_repository_impl
+from account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+from config.database import session as db_session_module
+from config.database.db_executor import run_db
+from config.database.session import SessionLocal, get_db_pool_statistics
+
+
+def test_concurrent_repository_calls_use_their_own_sessions(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'isolation.db'}",
+        poolclass=QueuePool, pool_size=5, max_overflow=10,
+        connect_args={"check_same_thread": False}
+    )
+    AccountORM.__table__.create(engine)
+    monkeypatch.setattr(db_session_module, "engine", engine)
+    original_bind = SessionLocal.kw["bind"]
+    SessionLocal.configure(bind=engine)
+
+    opened = []  # (세션, 생성 스레드) - 세션 객체를 보관하여 id 재사용 없이 비교
+    opened_lock = threading.Lock()
+
+    def tracking_session():
+        session = SessionLocal()
+        with opened_lock:
+            opened.append((session, threading.get_ident()))
+        return session
+
+    monkeypatch.setattr(account_repository_impl, "get_db_session", tracking_session)
+    repo = AccountRepositoryImpl.get_instance()
+
+    async def run():
+        def account(i: int) -> Account:
+            return Account(session_id=f"s{i}", oauth_id=f"o{i}", oauth_type="GOOGLE", nickname=f"n{i}",
+                           name=f"user{i}", profile_image="", email=f"u{i}@example.com", phone_number="",
+                           active_status="Y", role_id="")
+
+        await asyncio.gather(*(repo.save(account(i)) for i in range(40)))
+        return await asyncio.gather(*(run_db(repo.get_account_by_session_id, f"s{i}") for i in range(40)))
+
+    try:
+        found = asyncio.run(run())
+        stats = get_db_pool_statistics()
+    finally:
+        SessionLocal.configure(bind=original_bind)
+        engine.dispose()
+
+    # 각 호출이 자기 세션의 결과를 받음 (다른 스레드의 상태가 섞이지 않음)
+    assert [a.name for a in found] == [f"user{i}" for i in range(40)]
+    # 호출마다 새 세션 (같은 세션 객체를 두 호출이 공유하지 않음)
+    assert len(opened) == 80
+    assert len({id(session) for session, _ in opened}) == 80
+    assert len({thread for _, thread in opened}) > 1  # 여러 DB 스레드에서 동시에 실행
+    # 세션은 작업이 끝나면 닫혀 어떤 스레드에도 상태가 남지 않음
+    assert all(not session.in_transaction() and not session.identity_map for session, _ in opened)
+    # 모든 커넥션이 풀에 반환됨
+    assert stats["checked_out"] == 0
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+import fakeredis
+
+from documents_multi_agents.domain.service import derived_view_precomputer
+from documents_multi_agents.domain.service.derived_view_precomputer import DerivedViewPrecomputer
+from util.session import session_version
+from util.session.session_version import SessionVersion
+from util.stream.session_change_stream import SessionChangeStream
+
+
+def test_precompute_runs_off_loop_and_serves_follow_up_reads(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(derived_view_precomputer, "get_async_redis", lambda key: client)
+    monkeypatch.setattr(session_version, "get_async_redis", lambda key: client)
+    monkeypatch.setattr(DerivedViewPrecomputer, "ENABLED", True)
+    monkeypatch.setattr(DerivedViewPrecomputer, "_views", {})
+    monkeypatch.setattr(DerivedViewPrecomputer, "_running", {})
+
+    calls = []
+
+    def blocking_categorize(session_id):
+        time.sleep(0.2)  # 동기 GPT/Redis 호출 대역
+        calls.append(session_id)
+        return {"session": session_id}
+
+    async def compute(session_id):
+        return await asyncio.to_thread(blocking_categorize, session_id)
+
+    DerivedViewPrecomputer.register("result", compute)
+
+    async def run():
+        session_id = "session-1"
+        pipe = client.pipeline()
+        SessionChangeStream.publish(pipe, session_id, ["급여명세서"], [])
+        await pipe.execute()
+        assert await SessionVersion.get(session_id) == 1
+
+        await DerivedViewPrecomputer.schedule(session_id)
+
+        # 사전 계산 중에도 이벤트 루프는 다른 요청을 처리할 수 있어야 함
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        assert time.perf_counter() - started < 0.1
+
+        # 진행 중인 사전 계산 결과를 기다려 받고, 이후 조회는 캐시에서 응답
+        assert await DerivedViewPrecomputer.get_or_compute(session_id, "result") == {"session": session_id}
+        assert await DerivedViewPrecomputer.get_or_compute(session_id, "result") == {"session": session_id}
+        assert calls == [session_id]
+
+    asyncio.run(run())
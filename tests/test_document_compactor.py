@@ -0,0 +1,138 @@
+from documents_multi_agents.domain.service.document_compactor import DocumentCompactor
+
+# 월별 명세가 한 페이지씩 이어지는 급여명세서: 항목명과 금액이 서로 다른 줄에 있고
+# 항목명 줄은 모든 페이지에 반복된다
+PAGES = [
+    "\n".join([
+        "가나상사 급여명세서",
+        f"2024년 {month}월분",
+        "기본급",
+        base_pay,
+        "국민연금",
+        pension,
+        "본 명세서는 참고용입니다",
+        f"- {month} -",
+    ])
+    for month, base_pay, pension in [(1, "3,000,000", "135,000"), (2, "3,100,000", "139,500"),
+                                     (3, "3,200,000", "144,000")]
+]
+
+
+def test_repeated_label_lines_with_amounts_on_next_line_are_kept():
+    result = DocumentCompactor(keywords=["연금"]).compact(PAGES)
+    lines = result.text.splitlines()
+
+    # 반복되는 항목명이라도 바로 다음 줄의 금액과 짝이면 유지
+    for base_pay, pension in [("3,000,000", "135,000"), ("3,100,000", "139,500"), ("3,200,000", "144,000")]:
+        assert lines[lines.index(base_pay) - 1] == "기본급"
+        assert lines[lines.index(pension) - 1] == "국민연금"
+
+    # 금액과 짝이 아닌 반복 줄(머리말/꼬리말)과 페이지 번호는 제거
+    assert "가나상사 급여명세서" in result.dropped_furniture
+    assert "본 명세서는 참고용입니다" in result.dropped_furniture
+    assert "기본급" not in result.dropped_furniture
+    assert "- 1 -" not in lines
+
+
+def test_keywords_are_loaded_once_per_ttl(monkeypatch):
+    calls = []
+
+    def load(cls):
+        calls.append(1)
+        return ["급여"]
+
+    monkeypatch.setattr(DocumentCompactor, "_load_keywords_from_db", classmethod(load))
+    monkeypatch.setattr(DocumentCompactor, "_keywords_loaded_at", 0.0)
+
+    assert DocumentCompactor().keywords == ["급여"]
+    assert DocumentCompactor().keywords == ["급여"]
+    assert len(calls) == 1
+
+    monkeypatch.setattr(DocumentCompactor, "_keywords_loaded_at", 0.0)  # TTL 경과
+    DocumentCompactor()
+    assert len(calls) == 2
+
+
+# 문서 유형별 샘플: (페이지 목록, 반드시 남아야 하는 (항목명, 금액))
+CORPUS = {
+    # 항목명과 금액이 한 줄, 매 페이지 회사명/안내 문구 반복
+    "inline_payslip": (
+        [
+            "\n".join([
+                "가나상사 급여명세서",
+                f"2024년 {month}월분 | 사번 1024",
+                f"기본급 {base_pay}원",
+                "식대 200,000원",
+                f"소득세 {income_tax}",
+                "지방소득세 8,480",
+                "국민연금 135,000",
+                "실수령액은 공제 후 금액입니다",
+                f"{month}",
+            ])
+            for month, base_pay, income_tax in [(1, "3,000,000", "84,850"), (2, "3,000,000", "84,850")]
+        ],
+        [("기본급", "3,000,000원"), ("식대", "200,000원"), ("소득세", "84,850"),
+         ("지방소득세", "8,480"), ("국민연금", "135,000")],
+    ),
+    # 항목명 다음 줄에 금액, 소액(세 자리 이하) 금액 포함
+    "next_line_with_small_amounts": (
+        [
+            "\n".join([
+                "원천징수영수증",
+                "총급여",
+                "36,000,000",
+                "지방소득세",
+                "850",
+                "이자소득",
+                "350원",
+                "경조사비",
+                "500",
+                "귀속연도 2024",
+                f"{page} / 2",
+            ])
+            for page in (1, 2)
+        ],
+        [("총급여", "36,000,000"), ("지방소득세", "850"), ("이자소득", "350원"), ("경조사비", "500")],
+    ),
+    # 카드 이용내역: 날짜/가맹점/금액이 한 줄, 공백이 섞인 금액
+    "card_statement": (
+        [
+            "\n".join([
+                "하나카드 이용대금명세서",
+                "이용일 가맹점 금액",
+                "2024.01.05 스타벅스 강남점 4,500",
+                "2024.01.06 GS25 역삼점 1,200 원",
+                "2024.01.07 교통카드 충전 50000",
+                "2024.01.09 넷플릭스 -13,500",
+                "- 1 -",
+            ]),
+            "\n".join([
+                "하나카드 이용대금명세서",
+                "이용일 가맹점 금액",
+                "2024.01.12 보험료 자동이체 120,000",
+                "2024.01.15 관리비 250,000원",
+                "- 2 -",
+            ]),
+        ],
+        [("스타벅스 강남점", "4,500"), ("GS25 역삼점", "1,200 원"), ("교통카드 충전", "50000"),
+         ("넷플릭스", "-13,500"), ("보험료 자동이체", "120,000"), ("관리비", "250,000원")],
+    ),
+}
+
+
+def _count_labelled(lines, label, amount):
+    """금액이 항목명과 같은 줄 또는 항목명 바로 다음 줄에 남아 있는 횟수"""
+    return sum(
+        1 for index, line in enumerate(lines)
+        if amount in line and (label in line or (index > 0 and label in lines[index - 1]))
+    )
+
+
+def test_corpus_labelled_amounts_survive_compaction():
+    for name, (pages, labelled) in CORPUS.items():
+        result = DocumentCompactor(keywords=DocumentCompactor.FALLBACK_KEYWORDS).compact(pages)
+        lines = result.text.splitlines()
+        for label, amount in labelled:
+            expected = sum(_count_labelled(page.splitlines(), label, amount) for page in pages)
+            assert _count_labelled(lines, label, amount) == expected, (name, label, amount, result.text)
+        assert result.dropped_lines > 0, name  # 머리말/페이지 번호 등은 실제로 제거됨
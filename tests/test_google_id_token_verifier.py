@@ -0,0 +1,147 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from sosial_oauth.infrastructure.service import google_id_token_verifier
+from sosial_oauth.infrastructure.service.google_id_token_verifier import GoogleIdTokenVerifier
+
+AUDIENCE = "client-id.apps.googleusercontent.com"
+ISSUER = "https://accounts.google.com"
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _segment(value: dict) -> str:
+    return _b64(json.dumps(value).encode("utf-8"))
+
+
+def _jwk(kid: str, key: rsa.RSAPrivateKey) -> dict:
+    numbers = key.public_key().public_numbers()
+    return {
+        "kty": "RSA", "alg": "RS256", "use": "sig", "kid": kid,
+        "n": _b64(numbers.n.to_bytes((numbers.n.bit_length() + 7) // 8, "big")),
+        "e": _b64(numbers.e.to_bytes(3, "big")),
+    }
+
+
+def _claims(**overrides) -> dict:
+    now = int(time.time())
+    claims = {"iss": ISSUER, "aud": AUDIENCE, "sub": "1234567890", "email": "user@example.com",
+              "iat": now, "exp": now + 3600}
+    claims.update(overrides)
+    return claims
+
+
+def _sign(key: rsa.RSAPrivateKey, kid: str, claims: dict) -> str:
+    signing_input = f"{_segment({'alg': 'RS256', 'kid': kid, 'typ': 'JWT'})}.{_segment(claims)}"
+    signature = key.sign(signing_input.encode("ascii"), padding.PKCS1v15(), hashes.SHA256())
+    return f"{signing_input}.{_b64(signature)}"
+
+
+class StubIssuer:
+    """JWKS를 제공하는 로컬 스텁 발급자 (httpx MockTransport)"""
+
+    def __init__(self):
+        self.keys = {}
+        self.fetches = 0
+
+    def add_key(self, kid: str) -> rsa.RSAPrivateKey:
+        self.keys[kid] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        return self.keys[kid]
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.fetches += 1
+        return httpx.Response(
+            200,
+            json={"keys": [_jwk(kid, key) for kid, key in self.keys.items()]},
+            headers={"cache-control": "public, max-age=3600"}
+        )
+
+
+@pytest.fixture
+def issuer(monkeypatch):
+    stub = StubIssuer()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(stub.handler))
+    monkeypatch.setattr(google_id_token_verifier, "get_async_http_client", lambda: client)
+    monkeypatch.setattr(GoogleIdTokenVerifier, "_keys", {})
+    monkeypatch.setattr(GoogleIdTokenVerifier, "_keys_expire_at", 0.0)
+    monkeypatch.setattr(GoogleIdTokenVerifier, "_last_fetch", 0.0)
+    monkeypatch.setattr(GoogleIdTokenVerifier, "_refresh_lock", None)
+    return stub
+
+
+def _verify(token: str):
+    return asyncio.run(GoogleIdTokenVerifier.verify(token, AUDIENCE))
+
+
+def test_valid_token_returns_claims(issuer):
+    key = issuer.add_key("k1")
+    claims = _verify(_sign(key, "k1", _claims()))
+    assert claims["sub"] == "1234567890"
+    assert claims["email"] == "user@example.com"
+
+
+def test_bad_signature_is_rejected(issuer):
+    issuer.add_key("k1")
+    forged = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    with pytest.raises(ValueError, match="signature"):
+        _verify(_sign(forged, "k1", _claims()))
+
+    # 서명 후 클레임을 바꾼 토큰
+    header, _, signature = _sign(issuer.keys["k1"], "k1", _claims()).split(".")
+    with pytest.raises(ValueError, match="signature"):
+        _verify(f"{header}.{_segment(_claims(sub='attacker'))}.{signature}")
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"aud": "other-client"}, "audience"),
+    ({"iss": "https://evil.example.com"}, "issuer"),
+    ({"exp": int(time.time()) - 3600}, "expired"),
+])
+def test_claims_are_checked(issuer, overrides, message):
+    key = issuer.add_key("k1")
+    with pytest.raises(ValueError, match=message):
+        _verify(_sign(key, "k1", _claims(**overrides)))
+
+
+def test_none_and_hs256_algorithms_are_rejected(issuer):
+    issuer.add_key("k1")
+    payload = _segment(_claims())
+
+    unsigned = f"{_segment({'alg': 'none', 'kid': 'k1'})}.{payload}."
+    with pytest.raises(ValueError, match="algorithm"):
+        _verify(unsigned)
+
+    # 공개키(n)를 HMAC 비밀키로 사용하는 알고리즘 혼동 공격
+    signing_input = f"{_segment({'alg': 'HS256', 'kid': 'k1'})}.{payload}"
+    secret = _jwk("k1", issuer.keys["k1"])["n"].encode("ascii")
+    signature = hmac.new(secret, signing_input.encode("ascii"), hashlib.sha256).digest()
+    with pytest.raises(ValueError, match="algorithm"):
+        _verify(f"{signing_input}.{_b64(signature)}")
+    assert issuer.fetches == 0  # 서명 알고리즘 검사는 JWKS 조회 전에 수행
+
+
+def test_unknown_kid_refetches_jwks(issuer, monkeypatch):
+    monkeypatch.setattr(GoogleIdTokenVerifier, "MIN_REFRESH_INTERVAL", 0)
+    first = issuer.add_key("k1")
+    _verify(_sign(first, "k1", _claims()))
+    _verify(_sign(first, "k1", _claims()))
+    assert issuer.fetches == 1  # 캐시된 공개키 사용
+
+    # Google 키 교체: 새 kid로 서명된 토큰이 오면 JWKS를 다시 받음
+    rotated = issuer.add_key("k2")
+    assert _verify(_sign(rotated, "k2", _claims()))["sub"] == "1234567890"
+    assert issuer.fetches == 2
+
+    with pytest.raises(ValueError, match="key id"):
+        _verify(_sign(rotated, "unknown", _claims()))
@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+import pytest
+
+from kakao_authentication.domain.value_objects.kakao_access_token import KakaoAccessToken
+from kakao_authentication.infrastructure.client import kakao_oauth_client
+from kakao_authentication.infrastructure.client.kakao_oauth_client import KakaoOAuthClient, USER_INFO_RETRIES
+
+USER_INFO = {
+    "id": 1234567890,
+    "kakao_account": {"email": "user@example.com"},
+    "properties": {"nickname": "테스트"}
+}
+
+
+class StubKakao:
+    """카카오 사용자 정보 API 스텁 (httpx MockTransport) - 응답을 순서대로 반환"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.headers["authorization"] == "Bearer token"
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def stub_kakao(monkeypatch):
+    monkeypatch.setattr(kakao_oauth_client, "RETRY_BACKOFF", 0)
+
+    def install(*responses):
+        stub = StubKakao(*responses)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(stub.handler))
+        monkeypatch.setattr(kakao_oauth_client, "get_async_http_client", lambda: client)
+        return stub
+    return install
+
+
+def _get_user_info():
+    return asyncio.run(KakaoOAuthClient().get_user_info(KakaoAccessToken("token")))
+
+
+def test_user_info_retries_5xx_and_timeout(stub_kakao):
+    stub = stub_kakao(
+        httpx.Response(503),
+        httpx.ReadTimeout("timed out"),
+        httpx.Response(200, json=USER_INFO)
+    )
+
+    user = _get_user_info()
+
+    assert stub.calls == 3
+    assert user.user_id.value == 1234567890
+    assert user.email.value == "user@example.com"
+    assert user.nickname.value == "테스트"
+
+
+def test_user_info_gives_up_after_retries(stub_kakao):
+    stub = stub_kakao(*[httpx.Response(502)] * (USER_INFO_RETRIES + 1))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _get_user_info()
+    assert stub.calls == USER_INFO_RETRIES + 1
+
+
+def test_user_info_timeout_is_raised_after_retries(stub_kakao):
+    stub = stub_kakao(*[httpx.ReadTimeout("timed out")] * (USER_INFO_RETRIES + 1))
+
+    with pytest.raises(httpx.ReadTimeout):
+        _get_user_info()
+    assert stub.calls == USER_INFO_RETRIES + 1
+
+
+def test_user_info_4xx_is_not_retried(stub_kakao):
+    stub = stub_kakao(httpx.Response(401), httpx.Response(200, json=USER_INFO))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _get_user_info()
+    assert stub.calls == 1
@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from kftc.infrastructure.service import kftc_service
+from kftc.infrastructure.service.kftc_service import KftcService
+
+ACCOUNT_COUNT = 10
+
+
+class StubOpenBanking:
+    """오픈뱅킹 API 스텁 (httpx MockTransport)"""
+
+    def __init__(self, pages: int = 1, failing: set = frozenset(), user_info_status: int = 200):
+        self.pages = pages
+        self.failing = failing
+        self.user_info_status = user_info_status
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.trace_infos = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v2.0/user/me":
+            if self.user_info_status != 200:
+                return httpx.Response(self.user_info_status, json={"rsp_code": "O0001"})
+            return httpx.Response(200, json={"res_list": [
+                {"fintech_use_num": f"fin{i}", "bank_name": "테스트은행", "account_num_masked": f"000-{i}-***"}
+                for i in range(ACCOUNT_COUNT)
+            ]})
+        if path == "/v2.0/user/card-info":
+            return httpx.Response(200, json={"card_list": [{"card_name": "테스트카드", "org_code": "C001"}]})
+
+        if path == "/v2.0/account/transaction_list/fin_num":
+            fintech_use_num = request.url.params["fintech_use_num"]
+            trace_info = request.url.params.get("befor_inquiry_trace_info")
+        else:
+            fintech_use_num = None
+            trace_info = json.loads(request.content).get("befor_inquiry_trace_info")
+        self.trace_infos.append((fintech_use_num, trace_info))
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        if fintech_use_num in self.failing:
+            return httpx.Response(500, json={"rsp_code": "A0007"})
+        page = int(trace_info) if trace_info else 1
+        list_key = "res_list" if fintech_use_num else "approval_list"
+        return httpx.Response(200, json={
+            list_key: [{"page": page, "fintech_use_num": fintech_use_num}],
+            "next_page_yn": "Y" if page < self.pages else "N",
+            "befor_inquiry_trace_info": str(page + 1)
+        })
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    def install(stub: StubOpenBanking):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(stub.handler))
+        monkeypatch.setattr(kftc_service, "get_async_http_client", lambda: client)
+        return stub
+    return install
+
+
+def _fetch_all():
+    return asyncio.run(KftcService.fetch_all_transactions(
+        access_token="token", user_seq_no="U1",
+        account_from="20250101", account_to="20250131",
+        card_from="20250101", card_to="20250131"
+    ))
+
+
+def test_concurrency_is_bounded(stub_client, monkeypatch):
+    monkeypatch.setattr(KftcService, "MAX_CONCURRENCY", 3)
+    stub = stub_client(StubOpenBanking())
+
+    result = _fetch_all()
+
+    assert len(result["accounts"]) == ACCOUNT_COUNT
+    assert stub.max_in_flight == 3
+
+
+def test_pages_are_followed_with_trace_info(stub_client):
+    stub = stub_client(StubOpenBanking(pages=3))
+
+    result = _fetch_all()
+
+    account = result["accounts"][0]["transactions"]
+    assert [item["page"] for item in account["res_list"]] == [1, 2, 3]
+    assert account["page_count"] == 3
+    assert account["next_page_yn"] == "N"
+    assert [trace for fin, trace in stub.trace_infos if fin == "fin0"] == [None, "2", "3"]
+    assert [item["page"] for item in result["cards"][0]["approvals"]["approval_list"]] == [1, 2, 3]
+
+
+def test_page_limit_stops_pagination(stub_client, monkeypatch):
+    monkeypatch.setattr(KftcService, "MAX_PAGES", 2)
+    stub_client(StubOpenBanking(pages=5))
+
+    account = _fetch_all()["accounts"][0]["transactions"]
+
+    assert account["page_count"] == 2
+    assert account["next_page_yn"] == "Y"
+
+
+def test_account_failure_is_isolated(stub_client):
+    stub_client(StubOpenBanking(failing={"fin3"}))
+
+    result = _fetch_all()
+
+    failed = result["accounts"][3]
+    assert "HTTPStatusError" in failed["error"]
+    assert failed["transactions"] == {}
+    assert all("error" not in entry for i, entry in enumerate(result["accounts"]) if i != 3)
+    assert "error" not in result["cards"][0]
+
+
+def test_user_info_error_is_raised(stub_client):
+    stub_client(StubOpenBanking(user_info_status=401))
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        _fetch_all()
+    assert exc_info.value.response.status_code == 401
@@ -0,0 +1,71 @@
+from documents_multi_agents.domain.service.layout_table_extractor import (
+    LayoutTableExtractor, PageLayout, TextRun
+)
+
+
+def _page(*rows) -> PageLayout:
+    """rows: [(y, [(x, text), ...]), ...] → 한 페이지 레이아웃"""
+    runs = [TextRun(text, x, y, 10) for y, cells in rows for x, text in cells]
+    return PageLayout(width=595, height=842, runs=runs, text="")
+
+
+def _extract(*pages, doc_type=None):
+    return LayoutTableExtractor().extract(reader=None, doc_type=doc_type, pages=list(pages))
+
+
+def test_two_column_rows_are_paired_by_position():
+    page = _page(
+        (800, [(50, "급여명세서")]),
+        (700, [(50, "기본급"), (200, "3,000,000"), (300, "국민연금"), (450, "135,000")]),
+        (680, [(50, "식대"), (200, "200,000원"), (300, "건강보험"), (450, "106,350")]),
+        (660, [(50, "직책 수당"), (200, "150,000"), (300, "지방소득세"), (450, "850")]),
+    )
+    result = _extract(page)
+
+    assert dict(result.items) == {
+        "기본급": "3000000", "국민연금": "135000", "식대": "200000",
+        "건강보험": "106350", "직책 수당": "150000", "지방소득세": "850",
+    }
+    assert result.confidence == 1.0
+    assert result.item_positions["국민연금"] == (0, 300, 700)
+
+
+def test_identifiers_years_and_dates_are_not_amounts():
+    page = _page(
+        (760, [(50, "사번"), (120, "20231234")]),
+        (740, [(50, "지급일"), (120, "2024")]),
+        (720, [(50, "귀속연월"), (120, "202401")]),
+        (710, [(50, "계좌번호"), (120, "110-123-456789")]),
+        (700, [(50, "기본급"), (200, "3,000,000")]),
+    )
+    result = _extract(page)
+
+    assert result.items == [("기본급", "3000000")]
+    # 식별번호/날짜 행은 금액 셀로 집계하지 않으므로 신뢰도에 영향 없음
+    assert result.confidence == 1.0
+
+
+def test_negative_deductions_keep_their_sign():
+    page = _page(
+        (700, [(50, "기본급"), (200, "3,000,000")]),
+        (680, [(50, "연말정산 소득세"), (200, "-120,000")]),
+        (660, [(50, "조정액"), (200, "0")]),
+    )
+    result = _extract(page)
+
+    assert ("연말정산 소득세", "-120000") in result.items
+    assert ("조정액", "0") not in result.items  # 0원 항목은 제외
+    assert "연말정산 소득세: -120000" in result.to_answer()
+
+
+def test_label_without_amount_and_multi_amount_rows_lower_confidence():
+    page = _page(
+        (700, [(50, "기본급"), (200, "3,000,000")]),
+        (680, [(200, "500,000")]),  # 항목명 없는 금액
+        (660, [(50, "상여"), (200, "100,000"), (300, "200,000")]),  # 월별 컬럼
+    )
+    result = _extract(page)
+
+    assert result.items == [("기본급", "3000000")]
+    assert result.paired_cells == 1
+    assert result.amount_cells == 4
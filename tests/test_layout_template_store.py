@@ -0,0 +1,26 @@
+from documents_multi_agents.domain.service.layout_table_extractor import PageLayout, TextRun
+from documents_multi_agents.domain.service.layout_template_store import LayoutTemplateStore
+
+
+def _payslip(name: str, company: str, base_pay: str, pension: str, label: str = "국민연금") -> list:
+    runs = [
+        TextRun("급여명세서", 250, 800, 14),
+        TextRun(f"성명 {name}", 50, 760, 10),
+        TextRun(company, 300, 760, 10),
+        TextRun("사번", 50, 740, 10), TextRun("20231234", 120, 740, 10),
+        TextRun("기본급", 50, 700, 10), TextRun(base_pay, 200, 700, 10),
+        TextRun(label, 50, 680, 10), TextRun(pension, 200, 680, 10),
+    ]
+    return [PageLayout(width=595, height=842, runs=runs, text="")]
+
+
+def test_fingerprint_ignores_names_and_amounts():
+    store = LayoutTemplateStore()  # 지문 계산은 Redis에 접근하지 않음
+
+    first = store.fingerprint(_payslip("홍길동", "가나상사", "3,000,000", "135,000"), "소득")
+    second = store.fingerprint(_payslip("김철수", "다라물산", "3,200,000", "144,000"), "소득")
+    assert first == second
+
+    # 항목명 행이 다르면 다른 양식
+    other = store.fingerprint(_payslip("홍길동", "가나상사", "3,000,000", "135,000", label="건강보험"), "소득")
+    assert other != first
@@ -0,0 +1,125 @@
+import asyncio
+import uuid
+
+import fakeredis
+import pytest
+
+from account.adapter.input.web import session_helper
+from config import redis_config
+from config.redis_ring import ConsistentHashRing
+from util.session import session_shard_migrator
+from util.session.session_shard_migrator import SessionShardMigrator
+from util.session.session_version import SessionVersion
+
+PREVIOUS_NODES = ["redis-a:6379/0", "redis-b:6379/0", "redis-c:6379/0"]
+CURRENT_NODES = PREVIOUS_NODES + ["redis-d:6379/0"]
+SESSION_COUNT = 1000
+
+
+@pytest.fixture
+def fake_nodes(monkeypatch):
+    """노드마다 별도의 fakeredis 서버 (노드 주소 → 클라이언트)"""
+    clients = {}
+
+    def client_for(node):
+        if node not in clients:
+            clients[node] = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+        return clients[node]
+
+    monkeypatch.setattr(redis_config, "get_async_redis_for_node", client_for)
+    monkeypatch.setattr(session_shard_migrator, "get_async_redis_for_node", client_for)
+    monkeypatch.setattr(session_helper, "_validated_sessions", {})
+    return client_for
+
+
+def _use_rings(monkeypatch, nodes, previous_nodes=None):
+    monkeypatch.setattr(redis_config, "_session_ring", ConsistentHashRing(nodes))
+    monkeypatch.setattr(redis_config, "_previous_ring",
+                        ConsistentHashRing(previous_nodes) if previous_nodes else None)
+
+
+def test_keys_spread_across_nodes(fake_nodes, monkeypatch):
+    _use_rings(monkeypatch, CURRENT_NODES)
+    session_ids = [str(uuid.uuid4()) for _ in range(SESSION_COUNT)]
+
+    async def run():
+        for session_id in session_ids:
+            await redis_config.get_async_redis(session_id).hset(session_id, "USER_TOKEN", "GUEST")
+        return {node: await fake_nodes(node).dbsize() for node in CURRENT_NODES}
+
+    counts = asyncio.run(run())
+
+    assert sum(counts.values()) == SESSION_COUNT
+    share = SESSION_COUNT / len(CURRENT_NODES)
+    assert all(0.6 * share < count < 1.4 * share for count in counts.values()), counts
+
+
+def test_adding_a_node_moves_only_its_share():
+    before = ConsistentHashRing(PREVIOUS_NODES)
+    after = ConsistentHashRing(CURRENT_NODES)
+    keys = [str(uuid.uuid4()) for _ in range(SESSION_COUNT)]
+
+    moved = [key for key in keys if before.get_node(key) != after.get_node(key)]
+
+    # 새 노드로 옮겨지는 키만 이동 (약 1/N)
+    assert all(after.get_node(key) == "redis-d:6379/0" for key in moved)
+    assert len(moved) < SESSION_COUNT * 0.4
+
+
+def test_missing_shard_key_is_rejected():
+    with pytest.raises(ValueError):
+        redis_config.get_async_redis(None)
+    with pytest.raises(ValueError):
+        redis_config.get_cache_redis("")
+
+
+def test_reads_fall_back_to_previous_ring_during_migration(fake_nodes, monkeypatch):
+    previous_ring = ConsistentHashRing(PREVIOUS_NODES)
+    current_ring = ConsistentHashRing(CURRENT_NODES)
+    session_id = next(
+        sid for sid in (str(uuid.uuid4()) for _ in range(SESSION_COUNT))
+        if previous_ring.get_node(sid) != current_ring.get_node(sid)
+    )
+    old_node = fake_nodes(previous_ring.get_node(session_id))
+    new_node = fake_nodes(current_ring.get_node(session_id))
+
+    async def run():
+        # 노드 추가 전: 이전 링의 담당 노드에 세션 저장
+        await old_node.hset(session_id, mapping={"USER_TOKEN": "GUEST", "급여명세서": "encrypted"})
+        await old_node.expire(session_id, 3600)
+        await old_node.set(SessionVersion.key(session_id), 7)
+
+        # 노드 추가 후 (REDIS_PREVIOUS_NODES 설정): 새 담당 노드에는 세션이 없음
+        _use_rings(monkeypatch, CURRENT_NODES, PREVIOUS_NODES)
+        assert not await new_node.exists(session_id)
+
+        # 요청 시점에 이전 노드에서 옮겨와 같은 세션 유지
+        assert await session_helper.get_current_user(session_id) == session_id
+        assert await new_node.hgetall(session_id) == {"USER_TOKEN": "GUEST", "급여명세서": "encrypted"}
+        assert 0 < await new_node.ttl(session_id) <= session_helper.SESSION_EXPIRE_SECONDS
+        assert await new_node.get(SessionVersion.key(session_id)) == "7"
+        assert not await old_node.exists(session_id, SessionVersion.key(session_id))
+
+    asyncio.run(run())
+
+
+def test_rebalance_moves_only_reassigned_sessions(fake_nodes, monkeypatch):
+    previous_ring = ConsistentHashRing(PREVIOUS_NODES)
+    current_ring = ConsistentHashRing(CURRENT_NODES)
+    session_ids = [str(uuid.uuid4()) for _ in range(200)]
+    reassigned = {sid for sid in session_ids if previous_ring.get_node(sid) != current_ring.get_node(sid)}
+
+    async def run():
+        for session_id in session_ids:
+            await fake_nodes(previous_ring.get_node(session_id)).hset(session_id, "USER_TOKEN", "GUEST")
+
+        _use_rings(monkeypatch, CURRENT_NODES, PREVIOUS_NODES)
+        result = await SessionShardMigrator.rebalance()
+
+        assert result["migrated"] == len(reassigned)
+        for session_id in session_ids:
+            assert await fake_nodes(current_ring.get_node(session_id)).exists(session_id)
+            if session_id in reassigned:
+                assert not await fake_nodes(previous_ring.get_node(session_id)).exists(session_id)
+
+    asyncio.run(run())
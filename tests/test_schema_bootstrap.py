@@ -0,0 +1,30 @@
+from config.database import schema_bootstrap
+from config.database.schema_bootstrap import MIGRATIONS
+from config.database.session import Base
+from ecos.infrastructure.orm import exchange_rate, interest_rate  # noqa: F401 (모델 등록)
+from ieinfo.infrastructure.orm import ie_info  # noqa: F401
+from product.infrastructure.orm import product_bond, product_etf, product_fund  # noqa: F401
+
+
+def test_migrations_match_model_schema(monkeypatch):
+    """마이그레이션으로 올린 DB와 create_all로 만든 새 DB의 컬럼/제약이 같아야 함"""
+    added_columns, added_keys = [], []
+    monkeypatch.setattr(schema_bootstrap, "_add_column",
+                        lambda conn, table, column, definition: added_columns.append((table, column, definition)))
+    monkeypatch.setattr(schema_bootstrap, "_add_unique",
+                        lambda conn, table, name, columns: added_keys.append((table, name, columns, True)))
+    monkeypatch.setattr(schema_bootstrap, "_add_index",
+                        lambda conn, table, name, columns: added_keys.append((table, name, columns, False)))
+
+    for migration in MIGRATIONS:
+        migration.apply(None)
+
+    for table, column, definition in added_columns:
+        model_column = Base.metadata.tables[table].columns[column]
+        assert model_column.nullable == ("NOT NULL" not in definition.upper()), (table, column, definition)
+
+    for table, name, columns, unique in added_keys:
+        model_table = Base.metadata.tables[table]
+        declared = {c.name: [col.name for col in c.columns] for c in model_table.constraints if c.name}
+        declared.update({i.name: [col.name for col in i.columns] for i in model_table.indexes})
+        assert declared.get(name) == columns, (table, name)
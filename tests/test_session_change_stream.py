@@ -0,0 +1,38 @@
+import asyncio
+import json
+
+import fakeredis
+
+from util.session.session_version import SessionVersion
+from util.stream.session_change_stream import SessionChangeStream
+
+
+def test_publish_bumps_version_and_appends_event_in_pipeline():
+    async def run():
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        session_id = "session-1"
+
+        pipe = client.pipeline()
+        pipe.hset(session_id, mapping={"k": "v"})
+        SessionChangeStream.publish(pipe, session_id, ["급여명세서"], ["k"])
+        results = await pipe.execute()
+
+        assert results[-1] == 1  # 스크립트 반환값 = 증가된 버전
+        assert await client.get(SessionVersion.key(session_id)) == "1"
+        assert 0 < await client.ttl(SessionVersion.key(session_id)) <= SessionVersion.TTL
+
+        entries = await client.xrange(SessionChangeStream.STREAM_KEY)
+        assert len(entries) == 1
+        _, fields = entries[0]
+        assert fields["session_id"] == session_id
+        assert fields["version"] == "1"
+        assert json.loads(fields["doc_types"]) == ["급여명세서"]
+
+        # 두 번째 저장은 버전 2 이벤트를 추가
+        pipe = client.pipeline()
+        SessionChangeStream.publish(pipe, session_id, ["원천징수영수증"], [])
+        await pipe.execute()
+        assert await client.get(SessionVersion.key(session_id)) == "2"
+        assert await client.xlen(SessionChangeStream.STREAM_KEY) == 2
+
+    asyncio.run(run())
@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from documents_multi_agents.domain.service.transaction_classifier import BankTransaction, TransactionClassifier
+
+
+def test_classify_batch_survives_concurrent_cache_clears(monkeypatch):
+    classifier = TransactionClassifier.get_instance()
+    monkeypatch.setattr(classifier, "_load_db_keywords", lambda: ([], []))
+    monkeypatch.setattr(classifier, "_rules_loaded_at", 0.0)
+    # 캐시가 자주 가득 차서 다른 스레드가 비우는 상황
+    monkeypatch.setattr(TransactionClassifier, "CACHE_MAX_SIZE", 5)
+
+    batches = [
+        [BankTransaction("20240101", f"가맹점{worker}-{i % 20}", 1000, "out") for i in range(200)]
+        + [BankTransaction("20240101", "급여", 3000000, "in")]
+        for worker in range(8)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outcomes = list(executor.map(classifier.classify_batch, batches * 5))
+
+    for transactions, results in zip(batches * 5, outcomes):
+        assert len(results) == len(transactions)
+        assert results[-1].ie_type is not None
@@ -0,0 +1,57 @@
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from util.file.request_body_limit import RequestBodyLimitMiddleware
+from util.file.upload_file import open_upload
+
+
+def _client(max_body: int, max_file: int, route_limits: dict = None) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestBodyLimitMiddleware, max_size=max_body, route_limits=route_limits)
+
+    @app.post("/upload")
+    @app.post("/flow/analyze")
+    @app.post("/flow/analyze/batch")
+    async def upload(file: UploadFile = File(...)):
+        async with open_upload(file, max_file) as stream:
+            return {"size": len(stream.read())}
+
+    return TestClient(app)
+
+
+def test_upload_within_limits_is_read_in_place():
+    response = _client(10_000, 1_000).post("/upload", files={"file": ("a.pdf", b"x" * 500)})
+    assert response.status_code == 200
+    assert response.json() == {"size": 500}
+
+
+def test_file_size_and_empty_file_are_checked_before_reading():
+    client = _client(10_000, 1_000)
+    assert client.post("/upload", files={"file": ("a.pdf", b"x" * 2_000)}).status_code == 413
+    assert client.post("/upload", files={"file": ("a.pdf", b"")}).status_code == 400
+
+
+def test_body_limit_rejects_content_length_and_streamed_bodies():
+    client = _client(1_000, 100_000)
+    assert client.post("/upload", files={"file": ("a.pdf", b"x" * 5_000)}).status_code == 413
+
+    # Content-Length 없이 청크로 전송된 본문도 수신 중에 중단
+    def chunks():
+        for _ in range(10):
+            yield b"x" * 500
+
+    response = client.post("/upload", content=chunks(),
+                           headers={"content-type": "multipart/form-data; boundary=b"})
+    assert response.status_code == 413
+
+
+def test_route_limits_apply_per_upload_path():
+    client = _client(1_000, 100_000, route_limits={"/analyze": 5_000, "/analyze/batch": 50_000})
+    body = {"file": ("a.pdf", b"x" * 10_000)}
+
+    # 단일 업로드 경로는 파일 하나 크기로 제한 (수신 단계에서 거부)
+    assert client.post("/flow/analyze", files=body).status_code == 413
+    # 일괄 업로드 경로는 더 큰 본문 허용
+    assert client.post("/flow/analyze/batch", files=body).status_code == 200
+    # 그 외 경로는 기본 제한
+    assert client.post("/upload", files=body).status_code == 413
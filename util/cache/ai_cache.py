@@ -1,18 +1,33 @@
 import hashlib
+import threading
 from functools import wraps
 from typing import Optional, Callable
 
-from config.redis_config import get_redis
+from redis.exceptions import RedisError
+
+from config.redis_config import get_async_cache_redis, get_async_redis_for_node, get_cache_nodes, get_cache_redis
 from util.log.log import Log
 
 logger = Log.get_logger()
-redis_client = get_redis()
 
 
 class AICache:
-    """AI 응답 캐싱을 위한 유틸리티 클래스"""
+    """
+    AI 응답 캐싱을 위한 유틸리티 클래스
+
+    캐시 키 기준으로 캐시 샤드(REDIS_CACHE_NODES)에 분산 저장된다.
+    """
     
     DEFAULT_TTL = 86400  # 24시간
+    SESSION_HASH_LENGTH = 32  # 캐시 키에 넣는 세션 ID 해시 길이 (원본 세션 ID는 키에 남기지 않음)
+
+    _stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _count(cls, name: str):
+        with cls._lock:
+            cls._stats[name] += 1
     
     @staticmethod
     def generate_cache_key(data_str: str, endpoint_name: str) -> str:
@@ -28,6 +43,26 @@ class AICache:
         """
         data_hash = hashlib.md5(data_str.encode('utf-8')).hexdigest()
         return f"ai_cache:{endpoint_name}:{data_hash}"
+
+    @staticmethod
+    def generate_session_cache_key(session_id: str, version: int, endpoint_name: str) -> str:
+        """
+        세션 데이터 버전 기반 캐시 키 생성
+
+        세션 데이터가 바뀌면 버전이 올라가므로 이전 키는 더 이상 조회되지 않고 TTL로 만료된다.
+        데이터를 읽고 복호화하기 전에 캐시를 확인할 수 있다.
+        키가 노출되어도 세션을 탈취할 수 없도록 세션 ID는 해시로만 넣는다.
+
+        Args:
+            session_id: 세션 ID
+            version: 세션 데이터 버전 (SessionVersion)
+            endpoint_name: API 엔드포인트명
+
+        Returns:
+            캐시 키 (예: "ai_cache:tax-credit:{sha256(session_id)[:32]}:v3")
+        """
+        session_hash = hashlib.sha256(session_id.encode('utf-8')).hexdigest()[:AICache.SESSION_HASH_LENGTH]
+        return f"ai_cache:{endpoint_name}:{session_hash}:v{version}"
     
     @staticmethod
     def get_cached_response(cache_key: str) -> Optional[str]:
@@ -40,15 +75,20 @@ class AICache:
         Returns:
             캐시된 응답 또는 None
         """
+        client = get_cache_redis(cache_key)
         try:
-            cached_data = redis_client.get(cache_key)
+            cached_data = client.get(cache_key)
             if cached_data:
+                AICache._count("hits")
                 logger.info(f"✅ Cache HIT: {cache_key}")
                 return cached_data
             else:
+                AICache._count("misses")
                 logger.info(f"❌ Cache MISS: {cache_key}")
                 return None
-        except Exception as e:
+        except RedisError as e:
+            # Redis 장애만 캐시 미스/실패로 처리 (코드 오류는 그대로 전파)
+            AICache._count("errors")
             logger.error(f"Cache read error: {e}")
             return None
     
@@ -65,14 +105,50 @@ class AICache:
         Returns:
             성공 여부
         """
+        client = get_cache_redis(cache_key)
         try:
-            redis_client.setex(cache_key, ttl, response)
+            client.setex(cache_key, ttl, response)
+            AICache._count("writes")
             logger.info(f"💾 Cache STORED: {cache_key} (TTL: {ttl}s)")
             return True
-        except Exception as e:
+        except RedisError as e:
+            AICache._count("errors")
             logger.error(f"Cache write error: {e}")
             return False
     
+    @staticmethod
+    async def get_cached_response_async(cache_key: str) -> Optional[str]:
+        """get_cached_response의 async 핸들러용 버전"""
+        client = get_async_cache_redis(cache_key)
+        try:
+            cached_data = await client.get(cache_key)
+            if cached_data:
+                AICache._count("hits")
+                logger.info(f"✅ Cache HIT: {cache_key}")
+                return cached_data
+            else:
+                AICache._count("misses")
+                logger.info(f"❌ Cache MISS: {cache_key}")
+                return None
+        except RedisError as e:
+            AICache._count("errors")
+            logger.error(f"Cache read error: {e}")
+            return None
+
+    @staticmethod
+    async def set_cached_response_async(cache_key: str, response: str, ttl: int = DEFAULT_TTL) -> bool:
+        """set_cached_response의 async 핸들러용 버전"""
+        client = get_async_cache_redis(cache_key)
+        try:
+            await client.setex(cache_key, ttl, response)
+            AICache._count("writes")
+            logger.info(f"💾 Cache STORED: {cache_key} (TTL: {ttl}s)")
+            return True
+        except RedisError as e:
+            AICache._count("errors")
+            logger.error(f"Cache write error: {e}")
+            return False
+
     @staticmethod
     def invalidate_cache(cache_key: str) -> bool:
         """
@@ -84,61 +160,45 @@ class AICache:
         Returns:
             성공 여부
         """
+        client = get_cache_redis(cache_key)
         try:
-            result = redis_client.delete(cache_key)
+            result = client.delete(cache_key)
             logger.info(f"🗑️ Cache INVALIDATED: {cache_key}")
             return result > 0
-        except Exception as e:
+        except RedisError as e:
             logger.error(f"Cache invalidation error: {e}")
             return False
     
-    @staticmethod
-    def invalidate_user_cache(session_id: str) -> int:
-        """
-        특정 사용자의 모든 캐시 무효화
-        
-        Args:
-            session_id: 세션 ID
-            
-        Returns:
-            삭제된 캐시 개수
-        """
-        try:
-            # ai_cache:* 패턴의 모든 키 찾기
-            pattern = f"ai_cache:*"
-            keys = redis_client.keys(pattern)
-            
-            if keys:
-                deleted = redis_client.delete(*keys)
-                logger.info(f"🗑️ User cache INVALIDATED: {deleted} keys deleted")
-                return deleted
-            return 0
-        except Exception as e:
-            logger.error(f"User cache invalidation error: {e}")
-            return 0
-    
-    @staticmethod
-    def get_cache_stats() -> dict:
+    @classmethod
+    async def get_cache_stats(cls) -> dict:
         """
         캐시 통계 조회
-        
+
+        이 프로세스의 적중/미스/저장 횟수와 캐시 샤드별 메모리 사용량만 반환한다.
+        (키 이름은 반환하지 않으며, 전체 키를 훑는 KEYS/SCAN도 실행하지 않음)
+
         Returns:
             캐시 통계 딕셔너리
         """
-        try:
-            pattern = "ai_cache:*"
-            keys = redis_client.keys(pattern)
-            
-            stats = {
-                "total_cached_items": len(keys),
-                "cache_keys": keys[:10] if keys else [],  # 처음 10개만
-                "redis_info": redis_client.info("memory")
-            }
-            return stats
-        except Exception as e:
-            logger.error(f"Cache stats error: {e}")
-            return {}
+        with cls._lock:
+            stats = dict(cls._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
 
+        memory = {}
+        for node in get_cache_nodes():
+            client = get_async_redis_for_node(node)
+            try:
+                info = await client.info("memory")
+                memory[node] = {
+                    "used_memory_human": info.get("used_memory_human"),
+                    "maxmemory_human": info.get("maxmemory_human")
+                }
+            except RedisError as e:
+                logger.error(f"Cache stats error ({node}): {e}")
+                memory[node] = None
+        stats["memory"] = memory
+        return stats
 
 def with_cache(endpoint_name: str, ttl: int = AICache.DEFAULT_TTL):
     """
@@ -160,7 +220,7 @@ def with_cache(endpoint_name: str, ttl: int = AICache.DEFAULT_TTL):
             cache_key = AICache.generate_cache_key(data_str, endpoint_name)
             
             # 캐시 조회
-            cached_response = AICache.get_cached_response(cache_key)
+            cached_response = await AICache.get_cached_response_async(cache_key)
             if cached_response:
                 return cached_response
             
@@ -168,7 +228,7 @@ def with_cache(endpoint_name: str, ttl: int = AICache.DEFAULT_TTL):
             response = await func(data_str, *args, **kwargs)
             
             # 캐시 저장
-            AICache.set_cached_response(cache_key, response, ttl)
+            await AICache.set_cached_response_async(cache_key, response, ttl)
             
             return response
         return wrapper
@@ -0,0 +1,84 @@
+import os
+from typing import Dict, Optional
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 업로드 경로가 아닌 요청의 본문 최대 크기 (JSON/폼 요청용, 경로별 제한은 route_limits로 지정)
+MAX_REQUEST_BODY_SIZE = int(os.getenv("MAX_REQUEST_BODY_SIZE", str(1024 * 1024)))
+
+
+class RequestBodyLimitMiddleware:
+    """
+    요청 본문 크기 제한 (ASGI 미들웨어)
+
+    - 경로별 제한: route_limits의 경로로 끝나는 요청은 그 값, 나머지는 max_size
+      (라우터가 여러 prefix로 등록되므로 경로 끝부분으로 비교, 가장 긴 경로가 우선)
+    - Content-Length가 제한을 넘으면 본문을 읽지 않고 바로 413 반환
+    - Content-Length가 없거나(chunked) 실제 본문이 더 긴 경우 수신한 바이트를 세다가
+      제한을 넘는 순간 수신을 중단하고 413 반환 (업로드 전체를 임시 파일에 받지 않음)
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int = MAX_REQUEST_BODY_SIZE,
+                 route_limits: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.max_size = max_size
+        self.route_limits = sorted((route_limits or {}).items(), key=lambda item: len(item[0]), reverse=True)
+
+    def limit_for(self, path: str) -> int:
+        path = path.rstrip("/")
+        for route, limit in self.route_limits:
+            if path.endswith(route):
+                return limit
+        return self.max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        max_size = self.limit_for(scope["path"])
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > max_size:
+            logger.warning(f"[UPLOAD] 요청 본문 크기 초과: {int(content_length)} bytes ({scope['path']})")
+            await self._reject(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_size:
+                    exceeded = True
+                    logger.warning(f"[UPLOAD] 요청 본문 크기 초과: {received} bytes 이상 ({scope['path']})")
+                    raise HTTPException(413, "Request body too large")
+            return message
+
+        async def tracked_send(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except HTTPException:
+            # 라우터 밖(다른 미들웨어 등)에서 본문을 읽다가 초과한 경우
+            if not exceeded or response_started:
+                raise
+            await self._reject(scope, receive, send)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send):
+        response = JSONResponse({"detail": "Request body too large"}, status_code=413)
+        await response(scope, receive, send)
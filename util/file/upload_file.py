@@ -0,0 +1,33 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, BinaryIO
+
+from fastapi import HTTPException, UploadFile
+
+
+# -----------------------
+# 업로드 파일 열기 (크기 제한)
+# -----------------------
+@asynccontextmanager
+async def open_upload(file: UploadFile, max_size: int) -> AsyncIterator[BinaryIO]:
+    """
+    Starlette가 이미 SpooledTemporaryFile에 받아 둔 업로드 파일을 복사 없이 그대로 반환
+
+    - 파일 크기가 max_size를 넘으면 413, 빈 파일은 400 반환 (내용을 읽기 전에 확인)
+    - 이 함수가 호출될 때는 업로드가 이미 모두 수신된 상태이므로, 큰 업로드를 수신 중에 중단하는 것은
+      RequestBodyLimitMiddleware의 경로별 제한이 담당한다. (여기서는 일괄 업로드의 파일별 제한 확인)
+
+    반환된 스트림은 with 블록 안에서만 사용한다. (pypdf는 페이지를 지연 로딩하므로
+    추출이 끝날 때까지 블록 안에서 사용해야 하며, 파일은 요청이 끝날 때 Starlette가 닫는다)
+    """
+    size = file.size
+    if size is None:
+        # 크기 정보가 없는 경우(직접 생성한 UploadFile 등) 파일 끝으로 이동하여 확인
+        size = file.file.seek(0, 2)
+
+    if size > max_size:
+        raise HTTPException(413, "File too large")
+    if size == 0:
+        raise HTTPException(400, "Empty file upload")
+
+    await file.seek(0)
+    yield file.file
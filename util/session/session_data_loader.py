@@ -0,0 +1,139 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from config.crypto import Crypto
+from config.redis_config import get_async_redis, get_redis
+from util.log.log import Log
+from util.session.session_version import SessionVersion
+
+logger = Log.get_logger()
+crypto = Crypto.get_instance()
+
+# 복호화된 세션 스냅샷 (session_id → (데이터 버전, SessionData))
+# 세션당 최신 버전 하나만 보관하며, 버전이 바뀌면 다음 조회에서 다시 읽는다
+SNAPSHOT_CACHE_MAX_SIZE = 1000
+_snapshots: "OrderedDict[str, Tuple[int, SessionData]]" = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+
+@dataclass
+class SessionData:
+    """세션 Redis 데이터 (복호화 완료)"""
+    session_id: str
+    user_token: Optional[str]
+    entries: List[Tuple[str, str, str]] = field(default_factory=list)  # (문서 타입, 항목명, 금액)
+    raw: Dict[str, str] = field(default_factory=dict)  # 암호화된 원본 (다른 로더에 그대로 전달용)
+
+    @property
+    def is_member(self) -> bool:
+        return bool(self.user_token) and self.user_token != "GUEST"
+
+    @property
+    def has_financial_data(self) -> bool:
+        return bool(self.entries)
+
+    @property
+    def income_items(self) -> Dict[str, str]:
+        return {
+            field_name: value for doc_type, field_name, value in self.entries
+            if "소득" in doc_type or "income" in doc_type.lower()
+        }
+
+    @property
+    def expense_items(self) -> Dict[str, str]:
+        return {
+            field_name: value for doc_type, field_name, value in self.entries
+            if ("지출" in doc_type or "expense" in doc_type.lower())
+            and not ("소득" in doc_type or "income" in doc_type.lower())
+        }
+
+    def to_pairs_text(self) -> str:
+        """GPT 프롬프트용 "항목: 금액, 항목: 금액" 문자열"""
+        return ", ".join(f"{field_name}: {value}" for _, field_name, value in self.entries)
+
+
+def load_session_data(session_id: str, encrypted_data: Optional[Dict[str, str]] = None) -> SessionData:
+    """
+    세션 데이터를 한 번 조회(HGETALL)하여 복호화
+
+    Args:
+        session_id: 세션 ID
+        encrypted_data: 이미 조회한 Redis 데이터 (있으면 재조회하지 않음)
+    """
+    if encrypted_data is None:
+        encrypted_data = get_redis(session_id).hgetall(session_id)
+    return decrypt_session_data(session_id, encrypted_data)
+
+
+async def load_session_data_async(session_id: str, encrypted_data: Optional[Dict[str, str]] = None) -> SessionData:
+    """
+    load_session_data의 async 핸들러용 버전 (이벤트 루프를 막지 않는 비동기 Redis 조회)
+
+    데이터 버전이 같으면 이전에 복호화한 스냅샷을 재사용한다. (HGETALL + 복호화 생략)
+    반환된 SessionData는 여러 요청이 공유하므로 수정하지 않는다.
+    """
+    if encrypted_data is not None:
+        return decrypt_session_data(session_id, encrypted_data)
+
+    # 버전 0은 재무 데이터를 저장한 적 없는 세션 (스냅샷 캐시 사용 안 함)
+    version = await SessionVersion.get(session_id)
+    if version > 0:
+        cached = _get_snapshot(session_id, version)
+        if cached is not None:
+            return cached
+
+    encrypted_data = await get_async_redis(session_id).hgetall(session_id)
+    session = decrypt_session_data(session_id, encrypted_data)
+    if version > 0:
+        _put_snapshot(session_id, version, session)
+    return session
+
+
+def _get_snapshot(session_id: str, version: int) -> Optional[SessionData]:
+    with _snapshots_lock:
+        cached = _snapshots.get(session_id)
+        if cached is None or cached[0] != version:
+            return None
+        _snapshots.move_to_end(session_id)
+        return cached[1]
+
+
+def _put_snapshot(session_id: str, version: int, session: SessionData):
+    with _snapshots_lock:
+        # 조회 도중 더 새로운 버전이 저장되었다면 덮어쓰지 않음
+        current = _snapshots.get(session_id)
+        if current is not None and current[0] > version:
+            return
+        _snapshots[session_id] = (version, session)
+        _snapshots.move_to_end(session_id)
+        while len(_snapshots) > SNAPSHOT_CACHE_MAX_SIZE:
+            _snapshots.popitem(last=False)
+
+
+def decrypt_session_data(session_id: str, encrypted_data: Dict[str, str]) -> SessionData:
+    """조회한 세션 Redis 데이터 복호화"""
+    user_token = None
+    entries = []
+    for key, value in encrypted_data.items():
+        if isinstance(key, bytes):
+            key = key.decode('utf-8')
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+
+        if key == "USER_TOKEN":
+            user_token = value
+            continue
+
+        try:
+            key_plain = crypto.dec_data(key)
+            value_plain = crypto.dec_data(value)
+            # key_plain은 "type:field" 형태
+            doc_type, field_name = key_plain.split(":", 1)
+        except Exception:
+            # 복호화 실패 / 형식 불일치 항목은 무시
+            continue
+        entries.append((doc_type, field_name, value_plain))
+
+    return SessionData(session_id=session_id, user_token=user_token, entries=entries, raw=encrypted_data)
@@ -0,0 +1,167 @@
+"""
+세션 샤드 마이그레이션 (Session Shard Migrator)
+Redis 세션 노드를 추가/제거하면 consistent hashing으로 일부 세션의 담당 노드가 바뀐다.
+REDIS_PREVIOUS_NODES에 변경 전 노드 목록을 설정해 두면 이전 담당 노드의 세션을 새 담당 노드로 옮긴다.
+
+- 요청 시점 (lazy): get_current_user에서 새 노드에 세션이 없으면 이전 노드에서 옮겨온 후 계속 진행
+- 일괄 (bulk): python -m util.session.session_shard_migrator 로 이전 노드 전체를 SCAN하여 이동
+모든 세션을 옮긴 후 REDIS_PREVIOUS_NODES 설정을 제거한다.
+"""
+
+import asyncio
+import threading
+import uuid
+from typing import Any, Dict, List
+
+from config.redis_config import (
+    get_async_redis,
+    get_async_redis_for_node,
+    get_previous_session_node,
+    get_previous_session_nodes,
+)
+from util.log.log import Log
+from util.session.session_version import SessionVersion
+
+logger = Log.get_logger()
+
+
+class SessionShardMigrator:
+    """
+    세션과 함께 이동해야 하는 키:
+    - {session_id} (hash) : 세션 데이터
+    - session_version:{session_id} (string) : 데이터 버전 (이동하지 않으면 0부터 다시 증가하여 이전 캐시가 재사용될 수 있음)
+    - register_prefix()로 등록된 세션별 키 (hash/string, 예: ie_info_persisted:{session_id})
+
+    파생 뷰(derived_view:*)는 버전별 캐시이므로 옮기지 않는다. (새 노드에서 다시 계산)
+    """
+
+    SCAN_COUNT = 500
+
+    _prefixes: List[str] = [SessionVersion.KEY_PREFIX]
+    _end_prefixes: List[str] = []  # 로그아웃/탈퇴 시 세션과 함께 삭제할 prefix
+
+    _stats = {"migrated": 0, "skipped": 0, "failed": 0}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register_prefix(cls, prefix: str, delete_on_end: bool = False):
+        """
+        세션과 함께 이동할 키 prefix 등록 ({prefix}{session_id})
+
+        delete_on_end: 로그아웃/탈퇴(end_session) 시 세션 해시와 함께 삭제 (예: 외부 서비스 토큰)
+        """
+        if prefix not in cls._prefixes:
+            cls._prefixes.append(prefix)
+        if delete_on_end and prefix not in cls._end_prefixes:
+            cls._end_prefixes.append(prefix)
+
+    @classmethod
+    def end_session_keys(cls, session_id: str) -> List[str]:
+        """end_session에서 세션 해시와 함께 삭제할 키"""
+        return [f"{prefix}{session_id}" for prefix in cls._end_prefixes]
+
+    @classmethod
+    def _session_keys(cls, session_id: str) -> List[str]:
+        return [session_id] + [f"{prefix}{session_id}" for prefix in cls._prefixes]
+
+    @classmethod
+    async def migrate_session(cls, session_id: str) -> bool:
+        """
+        이전 담당 노드에서 현재 담당 노드로 세션 이동
+
+        Returns:
+            세션을 옮겼으면 True (이전 노드에 없거나 담당 노드가 바뀌지 않았으면 False)
+        """
+        previous_node = get_previous_session_node(session_id)
+        if previous_node is None:
+            return False
+
+        source = get_async_redis_for_node(previous_node)
+        target = get_async_redis(session_id)
+        try:
+            if await target.exists(session_id):
+                # 새 노드에 이미 세션이 있으면 새 노드 데이터가 최신 (이전 노드의 사본만 정리)
+                await source.delete(*cls._session_keys(session_id))
+                with cls._lock:
+                    cls._stats["skipped"] += 1
+                return False
+
+            keys = cls._session_keys(session_id)
+            # 키 타입(hash/string)을 미리 알 수 없으므로 두 방식으로 모두 읽고 TYPE에 맞는 결과 사용
+            # (타입이 다른 명령은 오류 결과로 반환됨)
+            pipe = source.pipeline(transaction=True)
+            for key in keys:
+                pipe.type(key)
+                pipe.pttl(key)
+                pipe.get(key)
+                pipe.hgetall(key)
+            results = await pipe.execute(raise_on_error=False)
+            if results[0] == "none":
+                return False
+
+            pipe = target.pipeline(transaction=True)
+            for index, key in enumerate(keys):
+                key_type, pttl, string_value, hash_value = results[index * 4: index * 4 + 4]
+                value = hash_value if key_type == "hash" else string_value
+                if key_type not in ("hash", "string") or isinstance(value, Exception) or not value:
+                    continue
+                pipe.delete(key)
+                if key_type == "hash":
+                    pipe.hset(key, mapping=value)
+                else:
+                    pipe.set(key, value)
+                if pttl and pttl > 0:
+                    pipe.pexpire(key, pttl)
+            await pipe.execute()
+            await source.delete(*keys)
+
+            with cls._lock:
+                cls._stats["migrated"] += 1
+            logger.info(f"[SHARD MIGRATION] 세션 이동: {previous_node} → 현재 담당 노드")
+            return True
+        except Exception as e:
+            with cls._lock:
+                cls._stats["failed"] += 1
+            logger.error(f"[SHARD MIGRATION] 세션 이동 실패: {str(e)}")
+            return False
+
+    @classmethod
+    async def discard_previous(cls, session_id: str):
+        """로그아웃/탈퇴 시 이전 노드에 남은 사본 삭제 (이후 요청에서 다시 옮겨와 세션이 되살아나지 않도록)"""
+        previous_node = get_previous_session_node(session_id)
+        if previous_node is not None:
+            await get_async_redis_for_node(previous_node).delete(*cls._session_keys(session_id))
+
+    @classmethod
+    def _is_session_key(cls, key: str) -> bool:
+        try:
+            uuid.UUID(key)
+            return True
+        except ValueError:
+            return False
+
+    @classmethod
+    async def rebalance(cls) -> Dict[str, Any]:
+        """이전 노드 전체를 SCAN하여 담당 노드가 바뀐 세션을 일괄 이동"""
+        result = {"scanned": 0, "migrated": 0}
+        for node in get_previous_session_nodes():
+            client = get_async_redis_for_node(node)
+            async for key in client.scan_iter(count=cls.SCAN_COUNT, _type="hash"):
+                if not cls._is_session_key(key):
+                    continue
+                result["scanned"] += 1
+                if get_previous_session_node(key) == node and await cls.migrate_session(key):
+                    result["migrated"] += 1
+            logger.info(f"[SHARD MIGRATION] {node} 완료: {result}")
+        return result
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, Any]:
+        with cls._lock:
+            stats = dict(cls._stats)
+        stats["rebalancing"] = bool(get_previous_session_nodes())
+        return stats
+
+
+if __name__ == "__main__":
+    print(asyncio.run(SessionShardMigrator.rebalance()))
@@ -0,0 +1,67 @@
+"""
+세션 데이터 버전 (Session Data Version)
+세션의 재무 데이터가 바뀔 때마다 같은 pipeline 안에서 1씩 증가하는 카운터.
+파생 캐시(AI 응답, 파생 뷰, 복호화 스냅샷)는 (session_id, version)을 키로 사용하므로
+데이터가 바뀌면 이전 캐시는 더 이상 조회되지 않고 TTL로 자연 만료된다 (KEYS 스캔/삭제 불필요).
+"""
+
+from config.redis_config import get_async_redis, get_redis
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class SessionVersion:
+    """
+    저장 구조 (Redis):
+    - session_version:{session_id} (string) : 재무 데이터 쓰기마다 INCR
+
+    세션 해시와 같은 샤드(session_id 기준)에 저장되어 같은 pipeline/MULTI로 함께 갱신된다.
+    세션 해시와 같은 TTL을 유지한다. (get_current_user에서 세션 만료 연장 시 함께 연장)
+    버전 키가 세션보다 먼저 만료되어 0부터 다시 증가하면 이전 캐시가 재사용될 수 있기 때문.
+    """
+
+    KEY_PREFIX = "session_version:"
+    TTL = 24 * 60 * 60  # 세션 만료 시간과 동일
+
+    @classmethod
+    def key(cls, session_id: str) -> str:
+        return f"{cls.KEY_PREFIX}{session_id}"
+
+    @classmethod
+    def bump(cls, pipe, session_id: str):
+        """
+        세션 데이터 쓰기 pipeline에 버전 증가 명령 추가 (동기/비동기 pipeline 모두 사용 가능)
+
+        데이터 변경과 같은 MULTI/EXEC 안에서 실행되므로 버전과 데이터가 어긋나지 않는다.
+        """
+        pipe.incr(cls.key(session_id))
+        pipe.expire(cls.key(session_id), cls.TTL)
+
+    @classmethod
+    def touch(cls, pipe, session_id: str):
+        """세션 만료 연장 pipeline에 버전 키 만료 연장 추가 (키가 없으면 무시됨)"""
+        pipe.expire(cls.key(session_id), cls.TTL)
+
+    @classmethod
+    async def get(cls, session_id: str) -> int:
+        """현재 버전 (재무 데이터를 저장한 적 없으면 0)"""
+        try:
+            return int(await get_async_redis(session_id).get(cls.key(session_id)) or 0)
+        except Exception as e:
+            logger.error(f"[SESSION VERSION] 조회 실패: {str(e)}")
+            return 0
+
+    @classmethod
+    def get_sync(cls, session_id: str) -> int:
+        """get의 동기 버전 (스레드풀/스케줄러용)"""
+        try:
+            return int(get_redis(session_id).get(cls.key(session_id)) or 0)
+        except Exception as e:
+            logger.error(f"[SESSION VERSION] 조회 실패: {str(e)}")
+            return 0
+
+    @classmethod
+    async def remaining_ttl(cls, session_id: str) -> int:
+        """버전 키의 남은 TTL (초, 키가 없거나 만료 시간이 없으면 -1 이하)"""
+        return await get_async_redis(session_id).ttl(cls.key(session_id))
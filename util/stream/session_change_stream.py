@@ -0,0 +1,324 @@
+"""
+세션 재무 데이터 변경 로그 (Session Change Stream)
+문서 업로드/직접 입력으로 세션 데이터가 바뀔 때마다 Redis Stream에 변경 이벤트를 남기고,
+IE_INFO 저장, 파생 뷰 사전 계산, 통계 집계는 consumer group이 요청과 분리하여 비동기로 처리한다
+"""
+
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config.redis_config import (
+    REDIS_SOCKET_TIMEOUT,
+    get_async_redis,
+    get_async_redis_for_node,
+    get_previous_session_nodes,
+    get_session_nodes,
+)
+from util.log.log import Log
+from util.session.session_version import SessionVersion
+
+logger = Log.get_logger()
+
+
+@dataclass
+class SessionChangeEvent:
+    """세션 데이터 변경 이벤트"""
+    event_id: str
+    session_id: str
+    version: int
+    doc_types: List[str] = field(default_factory=list)
+    changed_keys: List[str] = field(default_factory=list)  # 변경된 필드 (암호화된 키 그대로)
+    year: int = 0
+    month: int = 0
+    created_at: float = 0.0
+
+    @classmethod
+    def from_fields(cls, event_id: str, fields: Dict[str, str]) -> "SessionChangeEvent":
+        return cls(
+            event_id=event_id,
+            session_id=fields["session_id"],
+            version=int(fields.get("version", 0)),
+            doc_types=json.loads(fields.get("doc_types", "[]")),
+            changed_keys=json.loads(fields.get("keys", "[]")),
+            year=int(fields.get("year", 0)),
+            month=int(fields.get("month", 0)),
+            created_at=float(fields.get("created_at", 0))
+        )
+
+
+class SessionChangeStream:
+    """
+    세션 변경 이벤트 발행 + consumer group 처리
+
+    저장 구조 (Redis):
+    - session_changes (stream) : session_id, version, doc_types, keys, year, month, created_at
+    - session_changes:dead (stream) : 재시도 횟수를 넘긴 이벤트 (원본 필드 + group, error)
+    - session_changes:metrics (hash) : 이벤트/문서 타입별 변경 건수 (analytics group)
+
+    - 발행은 데이터 저장 pipeline(MULTI) 안에서 버전 증가와 함께 실행되므로 데이터/버전/이벤트가 어긋나지 않는다.
+    - 처리 목적(group)마다 별도의 consumer group을 사용하여 서로의 진행/실패에 영향을 주지 않는다.
+    - 처리 성공 시에만 XACK 하므로 최소 한 번(at-least-once) 전달된다. 핸들러는 멱등해야 한다.
+    - 처리 중 죽은 consumer의 이벤트는 CLAIM_IDLE_MS 이후 다른 consumer가 가져가 재시도한다.
+    - 이벤트는 세션과 같은 샤드 노드의 스트림에 발행된다. (버전 키와 같은 노드여야 Lua로 함께 갱신 가능)
+      consumer는 (group, 노드)마다 실행하며, 리밸런싱 중에는 이전 노드의 남은 이벤트도 처리한다.
+    - dead letter는 이벤트가 발행된 노드에, 집계(metrics)는 METRICS_KEY 담당 노드 한 곳에 저장한다.
+    """
+
+    STREAM_KEY = "session_changes"
+    DEAD_LETTER_KEY = "session_changes:dead"
+    METRICS_KEY = "session_changes:metrics"
+    MAX_LEN = int(os.getenv("SESSION_STREAM_MAXLEN", "100000"))  # 근사 길이 제한 (MAXLEN ~)
+
+    BATCH_SIZE = 50
+    # 블로킹 대기 시간은 소켓 타임아웃보다 짧아야 함 (길면 읽기 타임아웃 발생)
+    BLOCK_MS = max(100, min(5000, int(REDIS_SOCKET_TIMEOUT * 1000 / 2)))
+    CLAIM_IDLE_MS = 60 * 1000  # 이 시간 동안 ACK 되지 않은 이벤트는 재시도 대상
+    CLAIM_INTERVAL = 30  # 재시도 대상 확인 주기 (초)
+    MAX_DELIVERIES = 5  # 초과 시 dead letter로 이동
+
+    # 이 프로세스에서 consumer를 실행할지 여부 (별도 워커 프로세스에서만 실행하려면 false)
+    CONSUMERS_ENABLED = os.getenv("SESSION_STREAM_CONSUMERS", "true").lower() == "true"
+
+    # 버전 증가 + 이벤트 발행을 원자적으로 수행 (이벤트에 증가된 버전을 넣기 위해 Lua 사용)
+    _PUBLISH_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], '*',
+    'session_id', ARGV[3], 'version', version, 'doc_types', ARGV[4], 'keys', ARGV[5],
+    'year', ARGV[6], 'month', ARGV[7], 'created_at', ARGV[8])
+return version
+"""
+
+    _handlers: Dict[str, Callable[[SessionChangeEvent], Awaitable[None]]] = {}
+    _tasks: Dict[str, asyncio.Task] = {}
+
+    _stats = {"published": 0, "processed": 0, "failed": 0, "reclaimed": 0, "dead_lettered": 0}
+    _lock = threading.Lock()
+
+    # -----------------------
+    # 발행
+    # -----------------------
+    @classmethod
+    def publish(cls, pipe, session_id: str, doc_types: List[str], changed_keys: List[str]):
+        """
+        세션 데이터 저장 pipeline에 "버전 증가 + 변경 이벤트 발행" 추가
+
+        SessionVersion.bump 대신 사용한다. pipeline 실행 결과에는 증가된 버전이 들어간다.
+        """
+        # EVAL은 pipeline에 명령으로 쌓이므로 await 하지 않는다. (MULTI 안에서 데이터 저장과 함께 실행)
+        # 버전 키와 스트림은 세션과 같은 샤드 노드에 있어야 하므로 pipe는 get_async_redis(session_id)로 만든 것이어야 함
+        now = datetime.now()
+        pipe.eval(
+            cls._PUBLISH_SCRIPT,
+            2,
+            SessionVersion.key(session_id),
+            cls.STREAM_KEY,
+            SessionVersion.TTL,
+            cls.MAX_LEN,
+            session_id,
+            json.dumps(sorted(set(doc_types)), ensure_ascii=False),
+            json.dumps(changed_keys),
+            now.year,
+            now.month,
+            now.timestamp()
+        )
+        with cls._lock:
+            cls._stats["published"] += 1
+
+    # -----------------------
+    # consumer 등록 / 실행
+    # -----------------------
+    @classmethod
+    def register(cls, group: str, handler: Callable[[SessionChangeEvent], Awaitable[None]]):
+        """처리 목적별 consumer group 핸들러 등록 (예외 발생 시 ACK 하지 않고 재시도)"""
+        cls._handlers[group] = handler
+
+    @classmethod
+    async def start(cls):
+        """애플리케이션 시작 시 등록된 consumer group 처리 시작"""
+        if not cls.CONSUMERS_ENABLED:
+            logger.info("[STREAM] 이 프로세스에서는 consumer를 실행하지 않음")
+            return
+        nodes = list(dict.fromkeys(get_session_nodes() + get_previous_session_nodes()))
+        for group, handler in cls._handlers.items():
+            for node in nodes:
+                name = f"{group}@{node}"
+                if name not in cls._tasks or cls._tasks[name].done():
+                    cls._tasks[name] = asyncio.create_task(cls._consume(group, handler, node))
+        logger.info(f"[STREAM] consumer 시작: {', '.join(cls._handlers)} (노드 {len(nodes)}개)")
+
+    @classmethod
+    async def stop(cls):
+        """애플리케이션 종료 시 consumer 중단 (처리 중이던 이벤트는 ACK 되지 않아 재시도됨)"""
+        tasks = list(cls._tasks.values())
+        cls._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _consumer_name() -> str:
+        return f"{socket.gethostname()}-{os.getpid()}"
+
+    @classmethod
+    async def _ensure_group(cls, client, group: str):
+        try:
+            await client.xgroup_create(cls.STREAM_KEY, group, id="0", mkstream=True)
+            logger.info(f"[STREAM] consumer group 생성: {group}")
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    @classmethod
+    async def _consume(cls, group: str, handler: Callable[[SessionChangeEvent], Awaitable[None]], node: str):
+        client = get_async_redis_for_node(node)
+        consumer = cls._consumer_name()
+        last_claim = 0.0
+        while True:
+            try:
+                if not last_claim:
+                    await cls._ensure_group(client, group)
+
+                # 1. 오래 ACK 되지 않은 이벤트 회수 (실패했거나 처리 중 죽은 consumer)
+                if time.monotonic() - last_claim >= cls.CLAIM_INTERVAL:
+                    await cls._reclaim(client, group, consumer, handler)
+                    last_claim = time.monotonic()
+
+                # 2. 새 이벤트 처리
+                response = await client.xreadgroup(
+                    group, consumer, {cls.STREAM_KEY: ">"}, count=cls.BATCH_SIZE, block=cls.BLOCK_MS
+                )
+                for _, messages in response or []:
+                    for message_id, fields in messages:
+                        await cls._handle(client, group, handler, message_id, fields)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[STREAM] {group}@{node} 처리 루프 오류: {type(e).__name__}: {str(e)}")
+                last_claim = 0.0  # 스트림/그룹이 삭제된 경우 다시 생성
+                await asyncio.sleep(1)
+
+    @classmethod
+    async def _reclaim(cls, client, group: str, consumer: str,
+                       handler: Callable[[SessionChangeEvent], Awaitable[None]]):
+        """재시도 대상 이벤트 처리 (재시도 횟수 초과 시 dead letter로 이동)"""
+        pending = await client.xpending_range(
+            cls.STREAM_KEY, group, min="-", max="+", count=cls.BATCH_SIZE, idle=cls.CLAIM_IDLE_MS
+        )
+        for entry in pending:
+            if entry["times_delivered"] >= cls.MAX_DELIVERIES:
+                await cls._dead_letter(client, group, entry["message_id"], "max deliveries exceeded")
+
+        claimed = await client.xautoclaim(
+            cls.STREAM_KEY, group, consumer, min_idle_time=cls.CLAIM_IDLE_MS, start_id="0-0", count=cls.BATCH_SIZE
+        )
+        messages = claimed[1] if len(claimed) > 1 else []
+        # MAXLEN으로 잘려 나간 이벤트는 처리할 수 없으므로 ACK (Redis 7: 세 번째 항목, 6.2: 필드가 비어 있음)
+        trimmed = list(claimed[2]) if len(claimed) > 2 else []
+        trimmed += [message_id for message_id, fields in messages if not fields]
+        if trimmed:
+            await client.xack(cls.STREAM_KEY, group, *trimmed)
+        for message_id, fields in messages:
+            if not fields:
+                continue
+            with cls._lock:
+                cls._stats["reclaimed"] += 1
+            await cls._handle(client, group, handler, message_id, fields)
+
+    @classmethod
+    async def _handle(cls, client, group: str, handler: Callable[[SessionChangeEvent], Awaitable[None]],
+                      message_id: str, fields: Dict[str, str]):
+        try:
+            event = SessionChangeEvent.from_fields(message_id, fields)
+        except Exception as e:
+            # 형식이 잘못된 이벤트는 재시도해도 실패하므로 바로 dead letter
+            await cls._dead_letter(client, group, message_id, f"invalid event: {str(e)}", fields)
+            return
+
+        try:
+            await handler(event)
+            await client.xack(cls.STREAM_KEY, group, message_id)
+            with cls._lock:
+                cls._stats["processed"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # ACK 하지 않음 → CLAIM_IDLE_MS 이후 재시도
+            with cls._lock:
+                cls._stats["failed"] += 1
+            logger.warning(f"[STREAM] {group} 이벤트 {message_id} 처리 실패 (재시도 예정): {type(e).__name__}: {str(e)}")
+
+    @classmethod
+    async def _dead_letter(cls, client, group: str, message_id: str, error: str,
+                           fields: Optional[Dict[str, str]] = None):
+        if fields is None:
+            entries = await client.xrange(cls.STREAM_KEY, min=message_id, max=message_id)
+            fields = entries[0][1] if entries else {}
+        pipe = client.pipeline()
+        pipe.xadd(cls.DEAD_LETTER_KEY, {**fields, "event_id": message_id, "group": group, "error": error},
+                  maxlen=cls.MAX_LEN, approximate=True)
+        pipe.xack(cls.STREAM_KEY, group, message_id)
+        await pipe.execute()
+        with cls._lock:
+            cls._stats["dead_lettered"] += 1
+        logger.error(f"[STREAM] {group} 이벤트 {message_id} dead letter 이동: {error}")
+
+    # -----------------------
+    # 통계
+    # -----------------------
+    @classmethod
+    async def get_statistics(cls) -> Dict[str, Any]:
+        """발행/처리 통계 + group별 미처리(pending) 이벤트 수 (샤드 노드 합계 + 노드별)"""
+        with cls._lock:
+            stats = dict(cls._stats)
+        stats["consumers_enabled"] = cls.CONSUMERS_ENABLED
+        stats["stream_length"] = 0
+        stats["dead_letters"] = 0
+        stats["groups"] = {}
+        stats["shards"] = {}
+        for node in dict.fromkeys(get_session_nodes() + get_previous_session_nodes()):
+            client = get_async_redis_for_node(node)
+            try:
+                length = await client.xlen(cls.STREAM_KEY)
+                dead_letters = await client.xlen(cls.DEAD_LETTER_KEY)
+                groups = await client.xinfo_groups(cls.STREAM_KEY) if length else []
+            except Exception as e:
+                logger.error(f"[STREAM] {node} 통계 조회 실패: {str(e)}")
+                continue
+            stats["stream_length"] += length
+            stats["dead_letters"] += dead_letters
+            stats["shards"][node] = {"stream_length": length, "dead_letters": dead_letters}
+            for g in groups:
+                total = stats["groups"].setdefault(g["name"], {"pending": 0, "lag": 0})
+                total["pending"] += g["pending"]
+                total["lag"] += g.get("lag") or 0
+        try:
+            stats["metrics"] = await get_async_redis(cls.METRICS_KEY).hgetall(cls.METRICS_KEY)
+        except Exception as e:
+            logger.error(f"[STREAM] 통계 조회 실패: {str(e)}")
+        return stats
+
+
+async def record_change_metrics(event: SessionChangeEvent):
+    """
+    변경 통계 집계 (analytics group)
+
+    재전달 시 중복 집계될 수 있는 근사치이다. 모든 샤드의 이벤트를 METRICS_KEY 담당 노드 한 곳에 집계한다.
+    """
+    pipe = get_async_redis(SessionChangeStream.METRICS_KEY).pipeline(transaction=False)
+    pipe.hincrby(SessionChangeStream.METRICS_KEY, "events", 1)
+    pipe.hincrby(SessionChangeStream.METRICS_KEY, "changed_keys", len(event.changed_keys))
+    for doc_type in event.doc_types:
+        pipe.hincrby(SessionChangeStream.METRICS_KEY, f"doc_type:{doc_type}", 1)
+    pipe.hset(SessionChangeStream.METRICS_KEY, "last_event_lag_ms", int((time.time() - event.created_at) * 1000))
+    await pipe.execute()
+
+
+SessionChangeStream.register("analytics", record_change_metrics)